@@ -0,0 +1,16 @@
+"""
+Knight Online Otomatik İyileştirme ve Buff Sistemi - Performans Ölçümleri
+Bu paket, yakalama, analiz, zamanlama ve girdi yollarının benchmark'larını içerir.
+
+Çalıştırma (proje kök dizininden):
+    python -m benchmarks                # Tüm benchmark'lar
+    python -m benchmarks --quick        # Kısa sürüm
+    python -m benchmarks --suite analyzers --suite frames
+
+İki çalıştırmayı karşılaştırma (gerileme varsa çıkış kodu 1):
+    python -m benchmarks.compare onceki.json simdiki.json
+
+Analizcilerin etiketli derlem üzerinde doğruluk puanlaması:
+    python -m benchmarks.corpus generate derlem/        # Sentetik derlem üret
+    python -m benchmarks.score_analyzers derlem/
+"""
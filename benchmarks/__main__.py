@@ -0,0 +1,72 @@
+"""
+Knight Online Otomatik İyileştirme ve Buff Sistemi - Benchmark Çalıştırıcı
+Kullanım: python -m benchmarks [--quick] [--suite AD ...] [--output DOSYA] [--real-capture]
+"""
+
+import os
+import sys
+import time
+import logging
+import argparse
+
+from benchmarks import bench_analyzers, bench_frames, bench_capture, bench_scheduler, bench_reaction, score_analyzers
+from benchmarks.common import BenchmarkResults
+
+# Benchmark adı -> modül (çalıştırılma sırasıyla)
+SUITES = {
+    "analyzers": bench_analyzers,
+    "accuracy": score_analyzers,
+    "frames": bench_frames,
+    "capture": bench_capture,
+    "scheduler": bench_scheduler,
+    "reaction": bench_reaction
+}
+
+DEFAULT_OUTPUT_DIR = os.path.join("benchmarks", "results")
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Performans benchmark'larını çalıştırır.")
+    parser.add_argument("--quick", action="store_true", help="Kısa sürüm (daha az durum ve tekrar)")
+    parser.add_argument("--suite", action="append", choices=sorted(SUITES),
+                        help="Yalnızca belirtilen benchmark'ı çalıştır (birden fazla verilebilir)")
+    parser.add_argument("--output", help="Sonuç JSON dosyası (varsayılan: benchmarks/results/bench_<zaman>.json)")
+    parser.add_argument("--real-capture", action="store_true",
+                        help="Gerçek ekran yakalamasını da ölç (masaüstü oturumu gerekir)")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    """
+    Seçilen benchmark'ları çalıştırır ve sonuçları JSON dosyasına yazar.
+    
+    Returns:
+        int: Çıkış kodu.
+    """
+    args = parse_args(argv)
+    logging.basicConfig(level=logging.WARNING, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    
+    results = BenchmarkResults(quick=args.quick)
+    suites = args.suite or list(SUITES)
+    failed = []
+    
+    for name in suites:
+        print(f"[{name}]")
+        start_time = time.perf_counter()
+        try:
+            if name == "capture":
+                SUITES[name].run(results, quick=args.quick, real_capture=args.real_capture)
+            else:
+                SUITES[name].run(results, quick=args.quick)
+        except Exception as e:
+            logging.exception(f"{name} benchmark'ı başarısız: {e}")
+            failed.append(name)
+        print(f"  ({time.perf_counter() - start_time:.1f} sn)")
+    
+    results.meta["suites"] = suites
+    output = args.output or os.path.join(DEFAULT_OUTPUT_DIR, f"bench_{time.strftime('%Y%m%d_%H%M%S')}.json")
+    results.write(output)
+    print(f"Sonuçlar yazıldı: {output}")
+    
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,57 @@
+"""
+Knight Online Otomatik İyileştirme ve Buff Sistemi - Analizci Benchmark'ları
+Bu modül, core/hp_analyzer.py içindeki her analizcinin farklı bar boyutları ve doluluk oranlarında
+satır başına süresini ölçer.
+"""
+
+import statistics
+
+from benchmarks.common import time_call
+from core.hp_analyzer import ANALYZERS
+from services.synthetic_screen import SyntheticScreen
+
+# (genişlik, yükseklik) bar boyutları: oyundaki parti barı yaklaşık 93x15 pikseldir
+BAR_SIZES = [(60, 8), (93, 15), (200, 24)]
+FILL_LEVELS = [0, 10, 50, 90, 100]
+
+def make_bar(width, height, fill, noise=0):
+    """
+    Sentetik bir HP barı görüntüsü oluşturur.
+    
+    Args:
+        width (int): Bar genişliği.
+        height (int): Bar yüksekliği.
+        fill (float): HP yüzdesi.
+        noise (int): Renk gürültüsü.
+    
+    Returns:
+        numpy.ndarray: RGB bar görüntüsü.
+    """
+    screen = SyntheticScreen(width, height, noise=noise)
+    screen.add_bar([0, 0, width, height], fill)
+    return screen.grab()
+
+def run(results, quick=False):
+    """
+    Analizci benchmark'larını çalıştırır.
+    
+    Args:
+        results (BenchmarkResults): Sonuçların ekleneceği nesne.
+        quick (bool): Kısa sürüm.
+    """
+    sizes = BAR_SIZES[1:2] if quick else BAR_SIZES
+    fills = [10, 90] if quick else FILL_LEVELS
+    repeat = 3 if quick else 5
+    
+    for name, analyzer in ANALYZERS.items():
+        per_case = {}
+        for width, height in sizes:
+            for fill in fills:
+                bar = make_bar(width, height, fill)
+                per_case[f"{width}x{height}@{fill}"] = time_call(analyzer, (bar,), repeat=repeat) * 1e6
+        
+        for width, height in sizes:
+            values = [value for case, value in per_case.items() if case.startswith(f"{width}x{height}@")]
+            results.add(f"analyzer.{name}.{width}x{height}.us_per_row", statistics.median(values), "us")
+        
+        results.add(f"analyzer.{name}.us_per_row", statistics.median(per_case.values()), "us", cases=per_case)
@@ -0,0 +1,40 @@
+"""
+Knight Online Otomatik İyileştirme ve Buff Sistemi - Yakalama Benchmark'ları
+Bu modül, ScreenService yakalama yolunun ek yükünü sentetik ekran arka ucuyla ölçer.
+İstenirse gerçek arka uç (MSS / PyAutoGUI) da ölçülür; bunun için masaüstü oturumu gerekir.
+"""
+
+from benchmarks.common import time_call
+from services.screen_service import ScreenService
+from services.synthetic_screen import SyntheticScreen
+
+ROW_COORDS = (1030, 464, 1123, 479)
+
+def run(results, quick=False, real_capture=False):
+    """
+    Yakalama benchmark'larını çalıştırır.
+    
+    Args:
+        results (BenchmarkResults): Sonuçların ekleneceği nesne.
+        quick (bool): Kısa sürüm.
+        real_capture (bool): Gerçek ekran yakalaması da ölçülsün mü?
+    """
+    repeat = 3 if quick else 5
+    screen = SyntheticScreen()
+    screen.add_bar(list(ROW_COORDS), 75)
+    service = ScreenService(backend=screen)
+    
+    results.add("capture.synthetic.full.ms",
+                time_call(service.take_screenshot, repeat=repeat) * 1e3, "ms")
+    results.add("capture.synthetic.region.us",
+                time_call(service.take_screenshot, (ROW_COORDS,), repeat=repeat) * 1e6, "us")
+    results.add("capture.synthetic.frame.ms",
+                time_call(service.capture_frame, repeat=repeat) * 1e3, "ms")
+    
+    if real_capture:
+        real_service = ScreenService()
+        backend = "mss" if real_service.use_mss else "pyautogui"
+        results.add(f"capture.{backend}.full.ms",
+                    time_call(real_service.take_screenshot, repeat=repeat, min_time=0.5) * 1e3, "ms")
+        results.add(f"capture.{backend}.region.ms",
+                    time_call(real_service.take_screenshot, (ROW_COORDS,), repeat=repeat, min_time=0.5) * 1e3, "ms")
@@ -0,0 +1,50 @@
+"""
+Knight Online Otomatik İyileştirme ve Buff Sistemi - Kare Dönüşümü Benchmark'ları
+Bu modül, kırpma ve PIL <-> NumPy dönüşümlerinin maliyetini ölçer.
+"""
+
+import numpy as np
+from PIL import Image
+
+from benchmarks.common import time_call
+from core.heal_logic import HealHelper
+from services.synthetic_screen import SyntheticScreen
+
+# settings.ini'deki örnek satır koordinatları
+ROW_COORDS = [1030, 464, 1123, 479]
+
+def _heal_row_path(helper, screenshot, coords):
+    # İyileştirme döngüsündeki satır yolu: NumPy görünümü olarak kırp ve doğrudan analiz et
+    x1, y1, x2, y2 = coords
+    return helper._read_hp(screenshot[y1:y2, x1:x2])
+
+def run(results, quick=False):
+    """
+    Kare dönüşümü benchmark'larını çalıştırır.
+    
+    Args:
+        results (BenchmarkResults): Sonuçların ekleneceği nesne.
+        quick (bool): Kısa sürüm.
+    """
+    repeat = 3 if quick else 5
+    screen = SyntheticScreen()
+    screen.add_bar(ROW_COORDS, 60)
+    screenshot = screen.grab()
+    x1, y1, x2, y2 = ROW_COORDS
+    crop = screenshot[y1:y2, x1:x2]
+    
+    results.add("frame.numpy_slice.us",
+                time_call(lambda: screenshot[y1:y2, x1:x2], repeat=repeat) * 1e6, "us")
+    results.add("frame.pil_roundtrip.us",
+                time_call(lambda: np.array(Image.fromarray(crop)), repeat=repeat) * 1e6, "us")
+    
+    helper = HealHelper(lambda x, y: None, lambda key: None, lambda: None)
+    results.add("heal.row_path.us",
+                time_call(_heal_row_path, (helper, screenshot, ROW_COORDS), repeat=repeat) * 1e6, "us")
+    
+    # Tam ekran dönüşümleri (PyAutoGUI yakalaması PIL görüntüsü döndürür)
+    full_image = Image.fromarray(screenshot)
+    results.add("frame.full_pil_to_numpy.ms",
+                time_call(np.array, (full_image,), repeat=repeat) * 1e3, "ms")
+    results.add("frame.full_copy.ms",
+                time_call(screenshot.copy, repeat=repeat) * 1e3, "ms")
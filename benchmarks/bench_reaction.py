@@ -0,0 +1,129 @@
+"""
+Knight Online Otomatik İyileştirme ve Buff Sistemi - Uçtan Uca Tepki Benchmark'ı
+Bu modül, sentetik ekranda bir parti üyesinin HP'si düştüğü andan iyileştirme tuşunun
+kayıt arka ucuna ulaştığı ana kadar geçen süreyi ve girdi yolunun ek yükünü ölçer.
+"""
+
+import time
+import random
+import logging
+
+from benchmarks.common import summarize, time_call
+from core.heal_logic import HealHelper
+from services.input_backends import RecordingBackend, NullBackend
+from services.input_sender import InputSender
+from services.keyboard_mouse_service import KeyboardMouseService, InputTimingProfile
+from services.common.rate_governor import InputRateGovernor
+from services.screen_service import ScreenService
+from services.synthetic_screen import SyntheticScreen
+
+ROW_COORDS = [1030, 464, 1123, 479]
+HEAL_KEY = "F1"
+SELECT_KEY = "F2"
+
+# Deneme sayısı: gecikme, HP düşüşünün döngü adımının hangi anına denk geldiğine göre 0 ile kontrol aralığı
+# arasında dağılır; az denemede ortanca çalıştırmadan çalıştırmaya belirgin oynar
+QUICK_TRIALS = 24
+FULL_TRIALS = 60
+
+# HP düşüş zamanlaması için sabit tohum: iki çalıştırma aynı düşüş anlarını dener
+REACTION_SEED = 1
+
+# Benchmark sırasında hız denetleyicisi ölçümü sınırlamasın
+UNLIMITED_RATE = {"global_rate": 1e6, "global_burst": 1e6, "key_rate": 1e6, "key_burst": 1e6}
+
+def _wait_for_key(backend, key, since, timeout=2.0):
+    # Kayıt arka ucunda since'ten sonra basılan tuşu bekler
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        for event in reversed(backend.events):
+            if event.timestamp < since:
+                break
+            if event.action == "key_down" and event.detail == key:
+                return event.timestamp
+        time.sleep(0.0005)
+    return None
+
+def _measure_reaction(results, quick):
+    trials = QUICK_TRIALS if quick else FULL_TRIALS
+    rng = random.Random(REACTION_SEED)
+    screen = SyntheticScreen()
+    bar = screen.add_bar(ROW_COORDS, 100)
+    backend = RecordingBackend()
+    service = KeyboardMouseService(InputTimingProfile.immediate(), backend=backend)
+    sender = InputSender(service, InputRateGovernor(**UNLIMITED_RATE))
+    helper = HealHelper(sender.click, sender.press_key, ScreenService(backend=screen).capture_frame)
+    helper.set_heal_key(HEAL_KEY)
+    helper.set_heal_percentage(50)
+    helper.set_active(True)
+    helper.set_row_active(0, True)
+    helper.set_row_coords(0, ROW_COORDS)
+    helper.set_row_select_key(0, SELECT_KEY)
+    helper.heal_cooldown = 0.2
+    
+    latencies = []
+    missed = 0
+    sender.start()
+    helper.start()
+    try:
+        for _ in range(trials):
+            # HP düşüşünü döngünün farklı bir anına denk getir
+            time.sleep(helper.heal_cooldown + rng.uniform(0.0, helper.check_interval))
+            drop_time = time.monotonic()
+            screen.set_hp(bar, 30)
+            key_time = _wait_for_key(backend, HEAL_KEY, drop_time)
+            screen.set_hp(bar, 100)
+            if key_time is None:
+                missed += 1
+            else:
+                latencies.append(key_time - drop_time)
+    finally:
+        helper.stop()
+        sender.stop()
+    
+    summary = summarize(latencies)
+    if summary:
+        results.add("reaction.p50_ms", summary["p50"] * 1e3, "ms", check_interval=helper.check_interval, trials=trials)
+        results.add("reaction.p99_ms", summary["p99"] * 1e3, "ms")
+        results.add("reaction.max_ms", summary["max"] * 1e3, "ms")
+    results.add("reaction.missed", missed, "count", trials=trials)
+
+def _measure_input_path(results, quick):
+    count = 500 if quick else 2000
+    service = KeyboardMouseService(InputTimingProfile.immediate(), backend=NullBackend())
+    sender = InputSender(service, InputRateGovernor(**UNLIMITED_RATE))
+    sender.start()
+    try:
+        # Kuyruğa alma ve gönderici iş parçacığında gönderme dahil tuş başına süre
+        def burst():
+            future = None
+            for _ in range(count):
+                future = sender.press_key(HEAL_KEY)
+            future.result(timeout=10.0)
+        
+        results.add("input.sender_key.us",
+                    time_call(burst, repeat=3, min_time=0.0) / count * 1e6, "us")
+        results.add("input.service_key.us",
+                    time_call(service.press_key, (HEAL_KEY,), repeat=3) * 1e6, "us")
+    finally:
+        sender.stop()
+
+def run(results, quick=False):
+    """
+    Uçtan uca tepki ve girdi yolu benchmark'larını çalıştırır.
+    
+    Args:
+        results (BenchmarkResults): Sonuçların ekleneceği nesne.
+        quick (bool): Kısa sürüm.
+    """
+    # İyileştirme ve girdi logları ölçümü etkilemesin
+    loggers = [logging.getLogger(name) for name in ("HealLogic", "InputSender", "KeyboardMouseService")]
+    previous_levels = [logger.level for logger in loggers]
+    for logger in loggers:
+        logger.setLevel(logging.WARNING)
+    try:
+        _measure_reaction(results, quick)
+        _measure_input_path(results, quick)
+    finally:
+        for logger, level in zip(loggers, previous_levels):
+            logger.setLevel(level)
@@ -0,0 +1,66 @@
+"""
+Knight Online Otomatik İyileştirme ve Buff Sistemi - Buff Zamanlayıcı Benchmark'ı
+Bu modül, BuffHelper'ın buff'ları aralıkları dolduğunda ne kadar geç bastığını ölçer.
+"""
+
+import time
+import logging
+import threading
+
+from benchmarks.common import summarize
+from core.buff_logic import BuffHelper
+
+# (tuş, aralık saniye)
+BUFFS = [("F1", 1.0), ("F2", 1.5), ("F3", 2.5)]
+
+def run(results, quick=False):
+    """
+    Buff zamanlayıcı dakikliği benchmark'ını çalıştırır.
+    
+    Args:
+        results (BenchmarkResults): Sonuçların ekleneceği nesne.
+        quick (bool): Kısa sürüm.
+    """
+    duration = 4.0 if quick else 10.0
+    casts = []
+    lock = threading.Lock()
+    
+    def record(key):
+        with lock:
+            casts.append((key, time.monotonic()))
+    
+    # Döngü logları ölçümü etkilemesin
+    buff_logger = logging.getLogger("BuffLogic")
+    previous_level = buff_logger.level
+    buff_logger.setLevel(logging.WARNING)
+    try:
+        helper = BuffHelper(record)
+        start_time = time.monotonic()
+        for index, (key, interval) in enumerate(BUFFS):
+            helper.set_buff_key(index, key)
+            helper.set_buff_interval(index, interval)
+            helper.set_buff_active(index, True)
+        helper.set_active(True)
+        helper.start()
+        time.sleep(duration)
+        helper.stop()
+    finally:
+        buff_logger.setLevel(previous_level)
+    
+    # Her buff için beklenen zaman: bir önceki basış (ilk basışta başlangıç) + aralık
+    intervals = dict(BUFFS)
+    last_cast = {key: start_time for key, _ in BUFFS}
+    lateness = []
+    for key, cast_time in casts:
+        lateness.append(max(0.0, cast_time - (last_cast[key] + intervals[key])))
+        last_cast[key] = cast_time
+    
+    summary = summarize(lateness)
+    if not summary:
+        results.add("scheduler.buff_casts", 0, "count", better="higher")
+        return
+    
+    results.add("scheduler.buff_lateness.p50_ms", summary["p50"] * 1e3, "ms")
+    results.add("scheduler.buff_lateness.p99_ms", summary["p99"] * 1e3, "ms")
+    results.add("scheduler.buff_lateness.max_ms", summary["max"] * 1e3, "ms")
+    results.add("scheduler.buff_casts", summary["count"], "count", better="higher", duration=duration)
@@ -0,0 +1,135 @@
+"""
+Knight Online Otomatik İyileştirme ve Buff Sistemi - Benchmark Yardımcıları
+Bu modül, süre ölçümü ve sonuçların JSON olarak yazılması için ortak yardımcıları içerir.
+"""
+
+import os
+import sys
+import json
+import time
+import platform
+import statistics
+
+import numpy as np
+
+# Sonuç dosyası biçim sürümü (compare aracı bu sürümü kontrol eder)
+RESULTS_FORMAT_VERSION = 1
+
+class BenchmarkResults:
+    """
+    Benchmark ölçümlerini düz bir ad -> değer tablosunda toplayan sınıf.
+    
+    Her ölçüm birimi ve hangi yönün daha iyi olduğu ("lower" veya "higher") ile kaydedilir,
+    böylece iki çalıştırma birbirine göre karşılaştırılabilir.
+    """
+    
+    def __init__(self, quick=False):
+        """
+        BenchmarkResults sınıfını başlatır.
+        
+        Args:
+            quick (bool): Kısa sürüm çalıştırılıyorsa True (sonuç dosyasına yazılır).
+        """
+        self.metrics = {}
+        self.meta = {
+            "format": RESULTS_FORMAT_VERSION,
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "quick": quick,
+            "python": sys.version.split()[0],
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "machine": platform.machine()
+        }
+    
+    def add(self, name, value, unit, better="lower", **details):
+        """
+        Bir ölçüm ekler.
+        
+        Args:
+            name (str): Ölçüm adı (ör. "analyzer.red_pixel_ratio.us_per_row").
+            value (float): Ölçülen değer.
+            unit (str): Birim ("us", "ms", "ops/s" ...).
+            better (str): Daha iyi yön ("lower" veya "higher").
+            **details: Ölçümle birlikte saklanacak ek bilgiler.
+        """
+        metric = {"value": float(value), "unit": unit, "better": better}
+        if details:
+            metric["details"] = details
+        self.metrics[name] = metric
+        print(f"  {name:<60} {value:>12.3f} {unit}")
+    
+    def to_dict(self):
+        """Sonuçları sözlük olarak döndürür."""
+        return {"meta": self.meta, "metrics": self.metrics}
+    
+    def write(self, path):
+        """
+        Sonuçları JSON dosyasına yazar.
+        
+        Args:
+            path (str): Hedef dosya yolu.
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, indent=2)
+
+def time_call(func, args=(), repeat=5, min_time=0.05):
+    """
+    Bir işlevin çağrı başına süresini ölçer.
+    
+    Çağrı sayısı, her tekrar en az min_time saniye sürecek şekilde otomatik seçilir.
+    Gürültüden en az etkilenen değer olduğu için tekrarların en küçüğü kullanılır.
+    
+    Args:
+        func (function): Ölçülecek işlev.
+        args (tuple): İşlev argümanları.
+        repeat (int): Tekrar sayısı.
+        min_time (float): Bir tekrarın en kısa süresi (saniye).
+    
+    Returns:
+        float: Çağrı başına süre (saniye).
+    """
+    perf_counter = time.perf_counter
+    
+    # Çağrı sayısını ayarla
+    number = 1
+    while True:
+        start = perf_counter()
+        for _ in range(number):
+            func(*args)
+        elapsed = perf_counter() - start
+        if elapsed >= min_time or number >= 1000000:
+            break
+        number *= 2 if elapsed <= 0 else max(2, min(10, int(min_time / elapsed) + 1))
+    
+    best = elapsed / number
+    for _ in range(repeat - 1):
+        start = perf_counter()
+        for _ in range(number):
+            func(*args)
+        best = min(best, (perf_counter() - start) / number)
+    return best
+
+def summarize(samples):
+    """
+    Gecikme örneklerinin özetini döndürür.
+    
+    Args:
+        samples (list): Örnekler (saniye).
+    
+    Returns:
+        dict: p50, p99, max ve mean değerleri (saniye); örnek yoksa boş sözlük.
+    """
+    if not samples:
+        return {}
+    ordered = sorted(samples)
+    p99_index = min(len(ordered) - 1, int(round(len(ordered) * 0.99)) - 1)
+    return {
+        "p50": statistics.median(ordered),
+        "p99": ordered[max(0, p99_index)],
+        "max": ordered[-1],
+        "mean": statistics.fmean(ordered),
+        "count": len(ordered)
+    }
@@ -0,0 +1,294 @@
+"""
+Knight Online Otomatik İyileştirme ve Buff Sistemi - Benchmark Karşılaştırma
+İki benchmark sonuç dosyasını ölçüm başına toleranslarla karşılaştırır, rapor yazar ve
+gerileme varsa sıfırdan farklı kodla çıkar.
+
+Kullanım:
+    python -m benchmarks.compare ONCEKI.json SIMDIKI.json [--tolerances DOSYA] [--strict]
+
+Sonuçlardan biri --quick ile alınmışsa [tolerances.quick] bölümündeki desenler önce denenir,
+eşleşmeyen ölçümler için [tolerances] bölümüne düşülür.
+
+Çıkış kodları: 0 gerileme yok, 1 gerileme var, 2 dosya veya ayar hatası.
+"""
+
+import os
+import sys
+import json
+import fnmatch
+import argparse
+import configparser
+
+from benchmarks.common import RESULTS_FORMAT_VERSION
+
+DEFAULT_TOLERANCES_FILE = os.path.join(os.path.dirname(__file__), "tolerances.ini")
+
+# Hiçbir ayar yoksa kullanılan tolerans: %10 göreli, mutlak pay yok
+FALLBACK_TOLERANCE = (0.10, 0.0)
+
+# --quick sonuçları için önce denenen bölüm
+QUICK_SECTION = "tolerances.quick"
+
+class Tolerance:
+    """Bir ölçüm için izin verilen sapma."""
+    
+    __slots__ = ("pattern", "relative", "absolute", "ignore")
+    
+    def __init__(self, pattern, relative=0.0, absolute=0.0, ignore=False):
+        """
+        Tolerance sınıfını başlatır.
+        
+        Args:
+            pattern (str): Ölçüm adı deseni.
+            relative (float): Göreli tolerans (0.15 = %15).
+            absolute (float): Ölçümün biriminde mutlak tolerans.
+            ignore (bool): Ölçüm karşılaştırılmayacaksa True.
+        """
+        self.pattern = pattern
+        self.relative = relative
+        self.absolute = absolute
+        self.ignore = ignore
+    
+    @classmethod
+    def parse(cls, pattern, text):
+        """
+        "15%, 2" veya "ignore" biçimindeki toleransı ayrıştırır.
+        
+        Args:
+            pattern (str): Ölçüm adı deseni.
+            text (str): Tolerans metni.
+        
+        Returns:
+            Tolerance: Ayrıştırılan tolerans.
+        
+        Raises:
+            ValueError: Metin geçersizse.
+        """
+        text = text.strip()
+        if text.lower() == "ignore":
+            return cls(pattern, ignore=True)
+        
+        parts = [part.strip() for part in text.split(",")]
+        if not parts[0].endswith("%") or len(parts) > 2:
+            raise ValueError(f"Geçersiz tolerans '{pattern} = {text}' (ör. 15% veya 15%, 2 yazın)")
+        relative = float(parts[0][:-1]) / 100.0
+        absolute = float(parts[1]) if len(parts) == 2 else 0.0
+        if relative < 0 or absolute < 0:
+            raise ValueError(f"Tolerans negatif olamaz: '{pattern} = {text}'")
+        return cls(pattern, relative, absolute)
+    
+    def limit(self, baseline, better):
+        """
+        Önceki değere göre kabul edilebilir en kötü değeri döndürür.
+        
+        Args:
+            baseline (float): Önceki değer.
+            better (str): Daha iyi yön ("lower" veya "higher").
+        
+        Returns:
+            float: Sınır değer.
+        """
+        if better == "higher":
+            return baseline * (1.0 - self.relative) - self.absolute
+        return baseline * (1.0 + self.relative) + self.absolute
+
+def load_tolerances(path, quick=False):
+    """
+    Tolerans dosyasını yükler.
+    
+    Args:
+        path (str): .ini dosyası yolu.
+        quick (bool): True ise [tolerances.quick] desenleri [tolerances] desenlerinden önce gelir.
+    
+    Returns:
+        tuple: (dosya sırasına göre desen toleransları, varsayılan tolerans).
+    """
+    config = configparser.ConfigParser(interpolation=None, inline_comment_prefixes=(";", "#"))
+    # Ölçüm adları olduğu gibi korunur
+    config.optionxform = str
+    if not config.read(path, encoding="utf-8"):
+        raise ValueError(f"Tolerans dosyası okunamadı: {path}")
+    if not config.has_section("tolerances"):
+        raise ValueError(f"Tolerans dosyasında [tolerances] bölümü yok: {path}")
+    
+    sections = ["tolerances"]
+    if quick and config.has_section(QUICK_SECTION):
+        sections.insert(0, QUICK_SECTION)
+    
+    patterns = []
+    default = None
+    for section in sections:
+        for pattern, text in config.items(section):
+            tolerance = Tolerance.parse(pattern, text)
+            if pattern != "default":
+                patterns.append(tolerance)
+            elif default is None:
+                default = tolerance
+    if default is None:
+        default = Tolerance("default", *FALLBACK_TOLERANCE)
+    return patterns, default
+
+def find_tolerance(name, patterns, default):
+    """
+    Ölçüm adına uyan ilk toleransı döndürür (tam eşleşme önceliklidir).
+    
+    Args:
+        name (str): Ölçüm adı.
+        patterns (list): Desen toleransları.
+        default (Tolerance): Varsayılan tolerans.
+    
+    Returns:
+        Tolerance: Uygulanacak tolerans.
+    """
+    for tolerance in patterns:
+        if tolerance.pattern == name:
+            return tolerance
+    for tolerance in patterns:
+        if fnmatch.fnmatchcase(name, tolerance.pattern):
+            return tolerance
+    return default
+
+def load_results(path):
+    """
+    Benchmark sonuç dosyasını yükler.
+    
+    Args:
+        path (str): JSON dosyası yolu.
+    
+    Returns:
+        dict: Sonuç sözlüğü ("meta" ve "metrics").
+    
+    Raises:
+        ValueError: Dosya biçimi desteklenmiyorsa.
+    """
+    with open(path, encoding="utf-8") as f:
+        results = json.load(f)
+    if not isinstance(results, dict) or "metrics" not in results:
+        raise ValueError(f"Geçersiz benchmark sonuç dosyası: {path}")
+    version = results.get("meta", {}).get("format")
+    if version != RESULTS_FORMAT_VERSION:
+        raise ValueError(f"Desteklenmeyen sonuç biçimi ({version}): {path}")
+    return results
+
+def compare(baseline, current, patterns, default):
+    """
+    İki sonuç kümesini karşılaştırır.
+    
+    Args:
+        baseline (dict): Önceki sonuçlar.
+        current (dict): Şimdiki sonuçlar.
+        patterns (list): Desen toleransları.
+        default (Tolerance): Varsayılan tolerans.
+    
+    Returns:
+        list: (ad, önceki, şimdiki, sınır, birim, durum) satırları.
+            Durum: "OK", "IMPROVED", "REGRESSION", "IGNORED", "MISSING" veya "NEW".
+    """
+    rows = []
+    base_metrics = baseline["metrics"]
+    current_metrics = current["metrics"]
+    
+    for name in sorted(set(base_metrics) | set(current_metrics)):
+        base = base_metrics.get(name)
+        now = current_metrics.get(name)
+        unit = (now or base).get("unit", "")
+        
+        if now is None:
+            rows.append((name, base["value"], None, None, unit, "MISSING"))
+            continue
+        if base is None:
+            rows.append((name, None, now["value"], None, unit, "NEW"))
+            continue
+        
+        tolerance = find_tolerance(name, patterns, default)
+        if tolerance.ignore:
+            rows.append((name, base["value"], now["value"], None, unit, "IGNORED"))
+            continue
+        
+        better = now.get("better", "lower")
+        limit = tolerance.limit(base["value"], better)
+        if better == "higher":
+            regressed = now["value"] < limit
+            improved = now["value"] > base["value"]
+        else:
+            regressed = now["value"] > limit
+            improved = now["value"] < base["value"]
+        
+        status = "REGRESSION" if regressed else ("IMPROVED" if improved else "OK")
+        rows.append((name, base["value"], now["value"], limit, unit, status))
+    return rows
+
+def _format_value(value):
+    return "-" if value is None else f"{value:.3f}"
+
+def print_report(rows, baseline, current, out=sys.stdout):
+    """
+    Karşılaştırma raporunu yazar.
+    
+    Args:
+        rows (list): compare() çıktısı.
+        baseline (dict): Önceki sonuçlar.
+        current (dict): Şimdiki sonuçlar.
+        out: Çıktı akışı.
+    """
+    base_meta = baseline.get("meta", {})
+    current_meta = current.get("meta", {})
+    out.write(f"Önceki : {base_meta.get('timestamp', '?')} ({base_meta.get('platform', '?')})\n")
+    out.write(f"Şimdiki: {current_meta.get('timestamp', '?')} ({current_meta.get('platform', '?')})\n")
+    for key in ("quick", "platform", "machine", "python"):
+        if base_meta.get(key) != current_meta.get(key):
+            out.write(f"UYARI: '{key}' farklı ({base_meta.get(key)} -> {current_meta.get(key)}), "
+                      f"sonuçlar doğrudan karşılaştırılamayabilir.\n")
+    out.write("\n")
+    
+    out.write(f"{'Ölçüm':<50} {'Önceki':>12} {'Şimdiki':>12} {'Değişim':>9} {'Sınır':>12}  Durum\n")
+    for name, base, now, limit, unit, status in rows:
+        change = "-"
+        if base is not None and now is not None and base != 0:
+            change = f"{(now - base) / abs(base) * 100:+.1f}%"
+        out.write(f"{name:<50} {_format_value(base):>12} {_format_value(now):>12} {change:>9} "
+                  f"{_format_value(limit):>12}  {status} {unit}\n")
+    
+    counts = {}
+    for row in rows:
+        counts[row[5]] = counts.get(row[5], 0) + 1
+    out.write("\n" + ", ".join(f"{status}: {count}" for status, count in sorted(counts.items())) + "\n")
+
+def main(argv=None):
+    """
+    Komut satırından karşılaştırmayı çalıştırır.
+    
+    Returns:
+        int: Çıkış kodu (0 başarılı, 1 gerileme, 2 hata).
+    """
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.compare",
+                                     description="İki benchmark sonucunu karşılaştırır.")
+    parser.add_argument("baseline", help="Önceki sonuç dosyası")
+    parser.add_argument("current", help="Şimdiki sonuç dosyası")
+    parser.add_argument("--tolerances", default=DEFAULT_TOLERANCES_FILE, help="Tolerans .ini dosyası")
+    parser.add_argument("--strict", action="store_true", help="Şimdiki sonuçta eksik ölçümleri de gerileme say")
+    args = parser.parse_args(argv)
+    
+    try:
+        baseline = load_results(args.baseline)
+        current = load_results(args.current)
+        quick = bool(baseline["meta"].get("quick") or current["meta"].get("quick"))
+        patterns, default = load_tolerances(args.tolerances, quick)
+    except (OSError, ValueError, configparser.Error) as e:
+        sys.stderr.write(f"Hata: {e}\n")
+        return 2
+    
+    rows = compare(baseline, current, patterns, default)
+    if quick:
+        sys.stdout.write(f"--quick sonuçları: [{QUICK_SECTION}] toleransları uygulanıyor.\n")
+    print_report(rows, baseline, current)
+    
+    failing = {"REGRESSION", "MISSING"} if args.strict else {"REGRESSION"}
+    regressions = [row[0] for row in rows if row[5] in failing]
+    if regressions:
+        sys.stdout.write(f"\nGERİLEME: {', '.join(regressions)}\n")
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
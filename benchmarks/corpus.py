@@ -0,0 +1,168 @@
+"""
+Knight Online Otomatik İyileştirme ve Buff Sistemi - Etiketli HP Barı Derlemi
+Bu modül, gerçek HP değeriyle etiketlenmiş HP barı kırpıntılarından oluşan derlemi (golden corpus)
+okur, yazar ve sentetik olarak üretir.
+
+Derlem biçimi: bir klasör içinde PNG kırpıntılar ve bunları listeleyen labels.json:
+    {"format": 1, "samples": [{"file": "bar_0000.png", "hp": 57.0, "source": "synthetic"}, ...]}
+
+Kullanım:
+    python -m benchmarks.corpus generate KLASOR [--count 400] [--seed 1]
+    python -m benchmarks.corpus add KLASOR kirpinti.png --hp 43    # Kayıtlı oturumdan kırpıntı ekle
+"""
+
+import os
+import sys
+import json
+import argparse
+
+import numpy as np
+from PIL import Image
+
+from services.synthetic_screen import SyntheticScreen
+
+LABELS_FILE = "labels.json"
+CORPUS_FORMAT_VERSION = 1
+
+# Sentetik derlemde kullanılan bar boyutları, kenar payları ve gürültü seviyeleri
+SYNTHETIC_SIZES = [(60, 8), (93, 15), (120, 12), (200, 24)]
+SYNTHETIC_MARGINS = [0, 1, 2]
+SYNTHETIC_NOISE = [0, 10, 25]
+
+class GoldenSample:
+    """Gerçek HP değeriyle etiketlenmiş tek bir HP barı kırpıntısı."""
+    
+    __slots__ = ("name", "image", "hp", "source")
+    
+    def __init__(self, name, image, hp, source="recorded"):
+        """
+        GoldenSample sınıfını başlatır.
+        
+        Args:
+            name (str): Örnek adı (dosya adı).
+            image (numpy.ndarray): RGB kırpıntı.
+            hp (float): Gerçek HP yüzdesi.
+            source (str): Örneğin kaynağı ("synthetic" veya "recorded").
+        """
+        self.name = name
+        self.image = image
+        self.hp = float(hp)
+        self.source = source
+
+def load_corpus(path):
+    """
+    Derlemi klasörden yükler.
+    
+    Args:
+        path (str): Derlem klasörü.
+    
+    Returns:
+        list: GoldenSample nesneleri.
+    
+    Raises:
+        ValueError: labels.json yoksa veya biçimi desteklenmiyorsa.
+    """
+    labels_path = os.path.join(path, LABELS_FILE)
+    if not os.path.exists(labels_path):
+        raise ValueError(f"Derlem etiket dosyası bulunamadı: {labels_path}")
+    
+    with open(labels_path, encoding="utf-8") as f:
+        labels = json.load(f)
+    if labels.get("format") != CORPUS_FORMAT_VERSION:
+        raise ValueError(f"Desteklenmeyen derlem biçimi: {labels.get('format')}")
+    
+    samples = []
+    for entry in labels["samples"]:
+        image = np.array(Image.open(os.path.join(path, entry["file"])).convert("RGB"))
+        samples.append(GoldenSample(entry["file"], image, entry["hp"], entry.get("source", "recorded")))
+    return samples
+
+def save_corpus(samples, path):
+    """
+    Derlemi klasöre yazar (mevcut labels.json üzerine yazılır).
+    
+    Args:
+        samples (list): GoldenSample nesneleri.
+        path (str): Derlem klasörü.
+    """
+    os.makedirs(path, exist_ok=True)
+    entries = []
+    for sample in samples:
+        Image.fromarray(sample.image).save(os.path.join(path, sample.name))
+        entries.append({"file": sample.name, "hp": sample.hp, "source": sample.source})
+    
+    with open(os.path.join(path, LABELS_FILE), "w", encoding="utf-8") as f:
+        json.dump({"format": CORPUS_FORMAT_VERSION, "samples": entries}, f, indent=1)
+
+def generate_synthetic(count=400, seed=1):
+    """
+    Farklı boyut, kenar payı ve gürültüde sentetik etiketli kırpıntılar üretir.
+    
+    Etiket, çizilen dolu sütun sayısından hesaplanır; böylece yuvarlama etikete yansır
+    ve analizci hatası yalnızca analizciden kaynaklanır. Aynı tohum her zaman aynı derlemi üretir.
+    
+    Args:
+        count (int): Örnek sayısı.
+        seed (int): Rastgele sayı tohumu.
+    
+    Returns:
+        list: GoldenSample nesneleri.
+    """
+    rng = np.random.default_rng(seed)
+    samples = []
+    for index in range(count):
+        width, height = SYNTHETIC_SIZES[rng.integers(len(SYNTHETIC_SIZES))]
+        margin = SYNTHETIC_MARGINS[rng.integers(len(SYNTHETIC_MARGINS))]
+        noise = SYNTHETIC_NOISE[rng.integers(len(SYNTHETIC_NOISE))]
+        hp = float(rng.uniform(0.0, 100.0))
+        
+        screen = SyntheticScreen(width + 2 * margin, height + 2 * margin, noise=noise, seed=seed + index)
+        screen.add_bar([margin, margin, margin + width, margin + height], hp)
+        filled_columns = int(round(width * hp / 100.0))
+        
+        samples.append(GoldenSample(
+            f"bar_{index:04d}.png", screen.grab(), filled_columns * 100.0 / width, "synthetic"
+        ))
+    return samples
+
+def main(argv=None):
+    """
+    Komut satırından derlem üretir veya derleme örnek ekler.
+    
+    Returns:
+        int: Çıkış kodu.
+    """
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.corpus", description="Etiketli HP barı derlemi araçları.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    
+    generate = commands.add_parser("generate", help="Sentetik derlem üret")
+    generate.add_argument("path", help="Derlem klasörü")
+    generate.add_argument("--count", type=int, default=400, help="Örnek sayısı")
+    generate.add_argument("--seed", type=int, default=1, help="Rastgele sayı tohumu")
+    
+    add = commands.add_parser("add", help="Kayıtlı oturumdan etiketli kırpıntı ekle")
+    add.add_argument("path", help="Derlem klasörü")
+    add.add_argument("image", help="HP barı kırpıntısı (PNG)")
+    add.add_argument("--hp", type=float, required=True, help="Gerçek HP yüzdesi")
+    
+    args = parser.parse_args(argv)
+    
+    if args.command == "generate":
+        samples = generate_synthetic(args.count, args.seed)
+        save_corpus(samples, args.path)
+        print(f"{len(samples)} sentetik örnek yazıldı: {args.path}")
+        return 0
+    
+    if not 0 <= args.hp <= 100:
+        sys.stderr.write("Hata: --hp 0 ile 100 arasında olmalı\n")
+        return 2
+    samples = load_corpus(args.path) if os.path.exists(os.path.join(args.path, LABELS_FILE)) else []
+    image = np.array(Image.open(args.image).convert("RGB"))
+    name = f"recorded_{len(samples):04d}.png"
+    samples.append(GoldenSample(name, image, args.hp, "recorded"))
+    save_corpus(samples, args.path)
+    print(f"Örnek eklendi: {name} (HP: {args.hp:g})")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
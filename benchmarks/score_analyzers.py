@@ -0,0 +1,187 @@
+"""
+Knight Online Otomatik İyileştirme ve Buff Sistemi - HP Analizci Doğruluk Puanlaması
+Bu modül, etiketli derlem (bkz. benchmarks/corpus.py) üzerinde iyileştirme döngüsünün HP hesabını ve
+core/hp_analyzer.py içindeki her analizciyi doğruluk ve hız açısından puanlar.
+
+Raporlanan değerler:
+    - Ortalama mutlak hata ve en kötü hata (yüzde puanı)
+    - heal_percentage eşiğinde iyileştirme kararının doğruluğu (gereksiz ve kaçırılan iyileştirmeler)
+    - Kırpıntı başına süre (mikrosaniye)
+
+Kullanım:
+    python -m benchmarks.score_analyzers [KLASOR] [--heal-percentage 80] [--output DOSYA]
+
+Klasör verilmezse sabit tohumlu sentetik derlem bellekte üretilir. Sonuç dosyası benchmark
+sonuçlarıyla aynı biçimdedir ve python -m benchmarks.compare ile karşılaştırılabilir.
+"""
+
+import sys
+import logging
+import argparse
+import configparser
+
+import numpy as np
+
+from benchmarks.common import BenchmarkResults, time_call
+from benchmarks.corpus import load_corpus, generate_synthetic
+from core.heal_logic import HealHelper
+from core.hp_analyzer import ANALYZERS
+
+DEFAULT_HEAL_PERCENTAGE = 80
+SETTINGS_FILE = "settings.ini"
+
+# Süre ölçümü: derlem küçük olduğundan tek tekrar birkaç milisaniye sürer ve gürültüye açıktır.
+# Her tekrar en az TIMING_MIN_TIME saniye sürer, tekrarların en küçüğü raporlanır.
+QUICK_TIMING_REPEAT = 7
+FULL_TIMING_REPEAT = 9
+TIMING_MIN_TIME = 0.1
+
+def _read_heal_percentage(path=SETTINGS_FILE):
+    # Ayar dosyasındaki iyileştirme eşiğini okur, yoksa varsayılanı döndürür
+    config = configparser.ConfigParser()
+    config.read(path, encoding="utf-8")
+    return config.getint("AutoHealBuff", "heal_percentage", fallback=DEFAULT_HEAL_PERCENTAGE)
+
+def get_candidates():
+    """
+    Puanlanacak HP hesaplama yöntemlerini döndürür.
+    
+    Returns:
+        dict: Ad -> işlev. "heal_loop", iyileştirme döngüsünün kullandığı
+            HealHelper._calculate_hp_percentage yöntemidir.
+    """
+    helper = HealHelper(None, None, None)
+    candidates = {"heal_loop": helper._calculate_hp_percentage}
+    candidates.update(ANALYZERS)
+    return candidates
+
+def score(samples, analyzer, heal_percentage, repeat=FULL_TIMING_REPEAT):
+    """
+    Bir analizciyi derlem üzerinde puanlar.
+    
+    Args:
+        samples (list): GoldenSample nesneleri.
+        analyzer (function): Görüntüden HP yüzdesi hesaplayan işlev.
+        heal_percentage (float): İyileştirme eşiği.
+        repeat (int): Süre ölçümü tekrar sayısı.
+    
+    Returns:
+        dict: mae, max_error, worst_sample, threshold_accuracy, false_heals,
+            missed_heals ve us_per_crop değerleri.
+    """
+    images = [sample.image for sample in samples]
+    truth = np.array([sample.hp for sample in samples])
+    predicted = np.array([analyzer(image) for image in images], dtype=float)
+    errors = np.abs(predicted - truth)
+    worst = int(np.argmax(errors))
+    
+    # İyileştirme döngüsündeki karar: hp <= heal_percentage
+    should_heal = truth <= heal_percentage
+    would_heal = predicted <= heal_percentage
+    
+    def run_all():
+        for image in images:
+            analyzer(image)
+    
+    return {
+        "mae": float(errors.mean()),
+        "max_error": float(errors[worst]),
+        "worst_sample": samples[worst].name,
+        "threshold_accuracy": float(np.mean(should_heal == would_heal) * 100.0),
+        "false_heals": int(np.count_nonzero(would_heal & ~should_heal)),
+        "missed_heals": int(np.count_nonzero(should_heal & ~would_heal)),
+        "us_per_crop": time_call(run_all, repeat=repeat, min_time=TIMING_MIN_TIME) / len(images) * 1e6
+    }
+
+def score_all(samples, heal_percentage, results, repeat=FULL_TIMING_REPEAT):
+    """
+    Tüm adayları puanlar ve sonuçları ekler.
+    
+    Args:
+        samples (list): GoldenSample nesneleri.
+        heal_percentage (float): İyileştirme eşiği.
+        results (BenchmarkResults): Sonuçların ekleneceği nesne.
+        repeat (int): Süre ölçümü tekrar sayısı.
+    
+    Returns:
+        dict: Aday adı -> score() çıktısı.
+    """
+    scores = {}
+    for name, analyzer in get_candidates().items():
+        scores[name] = result = score(samples, analyzer, heal_percentage, repeat)
+        results.add(f"accuracy.{name}.mae", result["mae"], "pp")
+        results.add(f"accuracy.{name}.max_error", result["max_error"], "pp", worst_sample=result["worst_sample"])
+        results.add(f"accuracy.{name}.threshold_accuracy", result["threshold_accuracy"], "%", better="higher",
+                    heal_percentage=heal_percentage, false_heals=result["false_heals"],
+                    missed_heals=result["missed_heals"])
+        results.add(f"accuracy.{name}.us_per_crop", result["us_per_crop"], "us", repeat=repeat)
+    return scores
+
+def print_table(scores, samples, heal_percentage, out=sys.stdout):
+    """
+    Puanları tablo olarak yazar.
+    
+    Args:
+        scores (dict): score_all() çıktısı.
+        samples (list): Puanlanan örnekler.
+        heal_percentage (float): İyileştirme eşiği.
+        out: Çıktı akışı.
+    """
+    out.write(f"\n{len(samples)} örnek, iyileştirme eşiği %{heal_percentage:g}\n")
+    out.write(f"{'Analizci':<22} {'MAE':>7} {'En kötü':>8} {'Eşik doğr.':>11} {'Gereksiz':>9} "
+              f"{'Kaçan':>6} {'us/kırp.':>9}  En kötü örnek\n")
+    for name, result in scores.items():
+        out.write(f"{name:<22} {result['mae']:>7.2f} {result['max_error']:>8.2f} "
+                  f"{result['threshold_accuracy']:>10.1f}% {result['false_heals']:>9} "
+                  f"{result['missed_heals']:>6} {result['us_per_crop']:>9.2f}  {result['worst_sample']}\n")
+
+def run(results, quick=False):
+    """
+    Sabit tohumlu sentetik derlem üzerinde doğruluk puanlamasını çalıştırır (benchmark paketi için).
+    
+    Args:
+        results (BenchmarkResults): Sonuçların ekleneceği nesne.
+        quick (bool): Kısa sürüm.
+    """
+    samples = generate_synthetic(count=100 if quick else 400)
+    score_all(samples, DEFAULT_HEAL_PERCENTAGE, results, repeat=QUICK_TIMING_REPEAT if quick else FULL_TIMING_REPEAT)
+
+def main(argv=None):
+    """
+    Komut satırından puanlamayı çalıştırır.
+    
+    Returns:
+        int: Çıkış kodu (0 başarılı, 2 hata).
+    """
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.score_analyzers",
+                                     description="HP analizcilerini etiketli derlem üzerinde puanlar.")
+    parser.add_argument("corpus", nargs="?", help="Derlem klasörü (verilmezse sentetik derlem üretilir)")
+    parser.add_argument("--heal-percentage", type=float,
+                        help="İyileştirme eşiği (varsayılan: settings.ini içindeki heal_percentage)")
+    parser.add_argument("--output", help="Sonuç JSON dosyası")
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.WARNING, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    
+    try:
+        samples = load_corpus(args.corpus) if args.corpus else generate_synthetic()
+    except (OSError, ValueError) as e:
+        sys.stderr.write(f"Hata: {e}\n")
+        return 2
+    if not samples:
+        sys.stderr.write("Hata: derlem boş\n")
+        return 2
+    
+    heal_percentage = args.heal_percentage if args.heal_percentage is not None else _read_heal_percentage()
+    results = BenchmarkResults()
+    results.meta["corpus"] = args.corpus or "synthetic"
+    results.meta["samples"] = len(samples)
+    scores = score_all(samples, heal_percentage, results)
+    print_table(scores, samples, heal_percentage)
+    
+    if args.output:
+        results.write(args.output)
+        print(f"Sonuçlar yazıldı: {args.output}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,374 @@
+"""
+Knight Online Otomatik İyileştirme ve Buff Sistemi - Ayar Şeması
+Bu modül, settings.ini içindeki [AutoHealBuff] bölümünü bir kez ayrıştırıp doğrulanmış,
+değiştirilemez (frozen) veri sınıflarına dönüştürür.
+
+Motor ve arayüz dizge değerleri yeniden ayrıştırmak yerine bu nesneleri kullanır. Türetilen değerler
+(doğrulanmış tuş kombinasyonları) nesne oluşturulurken bir kez hesaplanır; satır kırpma dilimleri ve
+merkezleri pencere dönüşümüyle birlikte core/row_table.py içinde hesaplanır.
+"""
+
+import logging
+from dataclasses import dataclass, field
+from typing import Optional, Tuple
+
+from services.common.keycodes import parse_key, migrate_key, InvalidKeyError, KeyChord
+
+# Logging yapılandırması
+logger = logging.getLogger("SettingsSchema")
+
+# Varsayılan satır sayısı (parti) ve buff adları
+ROW_COUNT = 8
+DEFAULT_BUFF_NAMES = ("Normal Buff", "AC (Anti-Cheat)")
+
+# Sayısal ayarların izin verilen aralıkları (en küçük, en büyük)
+PERCENTAGE_RANGE = (1, 99)
+CHECK_INTERVAL_RANGE = (100, 1000)  # milisaniye
+FRAME_AGE_RANGE = (0, 2000)  # milisaniye
+BUFF_DURATION_RANGE = (1, 3600)  # saniye
+ROW_COUNT_RANGE = (1, 40)  # parti veya raid boyutu
+ROW_PITCH_RANGE = (0, 200)  # piksel, 0 ise satır şablonu tanımsız
+ROW_PERCENTAGE_RANGE = (0, 99)  # 0 ise genel iyileştirme eşiği kullanılır
+SMOOTHING_RANGE = (10, 100)  # yeni okumanın yüzde ağırlığı, 100 ise yumuşatma kapalı
+HYSTERESIS_RANGE = (0, 20)  # HP yüzdesi
+
+class SettingsError(ValueError):
+    """Geçersiz ayar değeri için fırlatılan hata."""
+
+def _check_range(name, value, value_range):
+    low, high = value_range
+    if not low <= value <= high:
+        raise SettingsError(f"{name} {low} ile {high} arasında olmalı: {value}")
+
+def _chord_or_none(spec):
+    # Geçersiz veya boş tuşlar için None döndürür; hata start sırasında validate_keys ile bildirilir
+    try:
+        return parse_key(spec) if spec and spec.strip() else None
+    except InvalidKeyError:
+        return None
+
+def parse_key_setting(text):
+    """
+    Ayar dosyasındaki tuş değerini okur; eski sayısal sanal tuş kodları tuş adına taşınır.
+    
+    Taşınamayan değerler olduğu gibi bırakılır: kullanıcının girdiği tuş hiçbir zaman varsayılan
+    (oyunda gerçekten basılan) bir tuşla değiştirilmez, hata start sırasında validate_keys ile bildirilir.
+    
+    Args:
+        text (str): Tuş değeri (ör. "F11", "CTRL+2" veya eski "122").
+    
+    Returns:
+        str: Tuş tanımı veya taşınamayan ham değer.
+    """
+    try:
+        migrated = migrate_key(text)
+    except InvalidKeyError as e:
+        logger.warning(f"Tuş değeri '{text.strip()}' taşınamadı: {e}")
+        return text
+    if migrated != text:
+        logger.info(f"Sayısal tuş kodu '{text.strip()}' '{migrated}' olarak taşındı")
+    return migrated
+
+def parse_coords(text):
+    """
+    "[x1, y1, x2, y2]" biçimindeki koordinat metnini ayrıştırır.
+    
+    Args:
+        text (str): Koordinat metni ("[]" veya boş ise tanımsız).
+    
+    Returns:
+        tuple: (x1, y1, x2, y2) veya tanımsızsa None.
+    
+    Raises:
+        SettingsError: Metin geçersizse.
+    """
+    text = text.strip().strip("[]").strip()
+    if not text:
+        return None
+    try:
+        coords = tuple(int(part.strip()) for part in text.split(","))
+    except ValueError:
+        raise SettingsError(f"koordinatlar tam sayı olmalı: [{text}]")
+    if len(coords) != 4:
+        raise SettingsError(f"4 koordinat bekleniyordu, {len(coords)} bulundu: [{text}]")
+    return coords
+
+def roi_from_coords(coords):
+    """
+    Koordinatlardan ekran görüntüsünü kırpmak için kullanılacak dilimleri hesaplar.
+    
+    Args:
+        coords (tuple): (x1, y1, x2, y2).
+    
+    Returns:
+        tuple: (satır dilimi, sütun dilimi); görüntü[roi] ile kırpılır.
+    """
+    x1, y1, x2, y2 = coords
+    return (slice(y1, y2), slice(x1, x2))
+
+@dataclass(frozen=True)
+class RowSettings:
+    """Bir HP barı satırının ayarları."""
+    
+    index: int
+    active: bool = False
+    coords: Optional[Tuple[int, int, int, int]] = None  # (x1, y1, x2, y2), tanımsızsa None
+    select_key: str = ""  # Parti üyesini seçen tuş, boşsa HP barına tıklanır
+    heal_percentage: int = 0  # Satıra özel iyileştirme eşiği, 0 ise genel eşik
+    
+    # Türetilen değer
+    select_chord: Optional[KeyChord] = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        _check_range("Satır iyileştirme eşiği", self.heal_percentage, ROW_PERCENTAGE_RANGE)
+        coords = self.coords
+        if coords is not None:
+            coords = tuple(int(value) for value in coords)
+            if len(coords) != 4 or min(coords) < 0:
+                raise SettingsError(f"geçersiz koordinatlar: {list(coords)}")
+            # Noktalar ters sırayla alınmış olabilir: sol üst ve sağ alt köşeye çevir
+            x1, y1, x2, y2 = coords
+            coords = (min(x1, x2), min(y1, y2), max(x1, x2), max(y1, y2))
+            if coords[2] == coords[0] or coords[3] == coords[1]:
+                raise SettingsError(f"koordinatlar boş bir bölge tanımlıyor: {list(coords)}")
+            object.__setattr__(self, "coords", coords)
+        
+        object.__setattr__(self, "select_key", (self.select_key or "").strip())
+        object.__setattr__(self, "select_chord", _chord_or_none(self.select_key))
+    
+    @property
+    def enabled(self):
+        """Satır aktif ve koordinatları tanımlıysa True."""
+        return self.active and self.coords is not None
+
+@dataclass(frozen=True)
+class BuffSettings:
+    """Bir buff'ın ayarları."""
+    
+    index: int
+    name: str = "Buff"
+    active: bool = False
+    key: str = ""
+    duration: int = 300  # saniye
+    
+    # Türetilen değer
+    chord: Optional[KeyChord] = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        _check_range("Buff süresi", self.duration, BUFF_DURATION_RANGE)
+        object.__setattr__(self, "chord", _chord_or_none(self.key))
+    
+    @property
+    def enabled(self):
+        """Buff aktif ve tuşu tanımlıysa True."""
+        return self.active and bool(self.key.strip())
+
+@dataclass(frozen=True)
+class AutoHealBuffSettings:
+    """[AutoHealBuff] bölümünün doğrulanmış anlık görüntüsü."""
+    
+    heal_percentage: int = 80
+    heal_key: str = "1"
+    heal_active: bool = False
+    mass_heal_percentage: int = 60
+    mass_heal_key: str = "2"
+    mass_heal_active: bool = False
+    party_check_enabled: bool = False
+    heal_check_interval: int = 100  # milisaniye, iyileştirme tepki süresini doğrudan belirler
+    buff_check_interval: int = 500  # milisaniye
+    max_frame_age: int = 250  # milisaniye, 0 ise kontrol kapalı
+    row_count: int = ROW_COUNT
+    row_pitch: int = 0  # piksel, satırlar arası dikey aralık (bkz. core/party_layout.py)
+    hp_smoothing: int = 50  # yüzde, küçük HP değişimlerinde yeni okumanın ağırlığı
+    hysteresis_band: int = 4  # yüzde, eşik çevresindeki bant: eşik - bant/2 altında düşük, eşik + bant/2 üstünde normal
+    rows: Tuple[RowSettings, ...] = tuple(RowSettings(i) for i in range(ROW_COUNT))
+    buffs: Tuple[BuffSettings, ...] = tuple(BuffSettings(i, name) for i, name in enumerate(DEFAULT_BUFF_NAMES))
+    
+    # Türetilen değerler
+    heal_chord: Optional[KeyChord] = field(init=False, repr=False, compare=False)
+    mass_heal_chord: Optional[KeyChord] = field(init=False, repr=False, compare=False)
+    
+    # Ayar anahtarı -> (tür, aralık); satır ve buff anahtarları ayrıca işlenir
+    FIELDS = {
+        "heal_percentage": (int, PERCENTAGE_RANGE),
+        "heal_key": (parse_key_setting, None),
+        "heal_active": (bool, None),
+        "mass_heal_percentage": (int, PERCENTAGE_RANGE),
+        "mass_heal_key": (parse_key_setting, None),
+        "mass_heal_active": (bool, None),
+        "party_check_enabled": (bool, None),
+        "heal_check_interval": (int, CHECK_INTERVAL_RANGE),
+        "buff_check_interval": (int, CHECK_INTERVAL_RANGE),
+        "max_frame_age": (int, FRAME_AGE_RANGE),
+        "row_count": (int, ROW_COUNT_RANGE),
+        "row_pitch": (int, ROW_PITCH_RANGE),
+        "hp_smoothing": (int, SMOOTHING_RANGE),
+        "hysteresis_band": (int, HYSTERESIS_RANGE)
+    }
+    
+    def __post_init__(self):
+        for name, (value_type, value_range) in self.FIELDS.items():
+            if value_range is not None:
+                _check_range(name, getattr(self, name), value_range)
+        # Satır listesi satır sayısına göre kırpılır veya boş satırlarla tamamlanır
+        rows = tuple(self.rows)[:self.row_count]
+        rows += tuple(RowSettings(i) for i in range(len(rows), self.row_count))
+        object.__setattr__(self, "rows", rows)
+        object.__setattr__(self, "buffs", tuple(self.buffs))
+        object.__setattr__(self, "heal_chord", _chord_or_none(self.heal_key))
+        object.__setattr__(self, "mass_heal_chord", _chord_or_none(self.mass_heal_key))
+    
+    @property
+    def active_rows(self):
+        """Aktif ve koordinatları tanımlı satırlar."""
+        return tuple(row for row in self.rows if row.enabled)
+    
+    @property
+    def active_buffs(self):
+        """Aktif ve tuşu tanımlı buff'lar."""
+        return tuple(buff for buff in self.buffs if buff.enabled)
+    
+    @classmethod
+    def from_config(cls, config_section):
+        """
+        Yapılandırma bölümünden ayarları oluşturur.
+        
+        Geçersiz değerler anahtar ve değerle birlikte loglanır ve varsayılan değerle değiştirilir.
+        Tanımsız koordinatlar ("[]") geçerlidir.
+        
+        Args:
+            config_section: [AutoHealBuff] bölümü (anahtar -> dizge).
+        
+        Returns:
+            AutoHealBuffSettings: Doğrulanmış ayarlar.
+        """
+        defaults = cls()
+        values = {}
+        for name, (value_type, value_range) in cls.FIELDS.items():
+            if name not in config_section:
+                continue
+            text = config_section[name]
+            try:
+                value = _parse_value(text, value_type)
+                if value_range is not None:
+                    _check_range(name, value, value_range)
+                values[name] = value
+            except ValueError as e:
+                logger.warning(f"Geçersiz ayar '{name} = {text}': {e}")
+        
+        rows = []
+        for index in range(values.get("row_count", defaults.row_count)):
+            rows.append(_parse_item(RowSettings, f"row_{index}", config_section, RowSettings(index), {
+                "active": bool, "coords": parse_coords, "select_key": parse_key_setting, "heal_percentage": int}))
+        
+        buffs = []
+        for buff in defaults.buffs:
+            buffs.append(_parse_item(BuffSettings, f"buff_{buff.index}", config_section, buff, {
+                "name": str, "active": bool, "key": parse_key_setting, "duration": int}))
+        
+        return cls(rows=tuple(rows), buffs=tuple(buffs), **values)
+    
+    def to_config(self):
+        """
+        Ayarları settings.ini biçiminde dizge sözlüğüne dönüştürür.
+        
+        Returns:
+            dict: Anahtar -> dizge değer.
+        """
+        config = {name: str(getattr(self, name)) for name in self.FIELDS}
+        for row in self.rows:
+            config[f"row_{row.index}_active"] = str(row.active)
+            config[f"row_{row.index}_coords"] = str(list(row.coords) if row.coords else [])
+            config[f"row_{row.index}_select_key"] = row.select_key
+            config[f"row_{row.index}_heal_percentage"] = str(row.heal_percentage)
+        for buff in self.buffs:
+            config[f"buff_{buff.index}_active"] = str(buff.active)
+            config[f"buff_{buff.index}_key"] = buff.key
+            config[f"buff_{buff.index}_duration"] = str(buff.duration)
+            config[f"buff_{buff.index}_name"] = buff.name
+        return config
+    
+    def validate_keys(self):
+        """
+        Etkin özelliklerde kullanılacak tüm tuşları doğrular.
+        
+        Raises:
+            InvalidKeyError: Etkin bir özellikte geçersiz tuş varsa (mesaj tuşun yerini belirtir).
+        """
+        def check(spec, label):
+            try:
+                parse_key(spec)
+            except InvalidKeyError as e:
+                raise InvalidKeyError(f"{label}: {e}")
+        
+        if self.heal_active:
+            check(self.heal_key, "İyileştirme tuşu")
+        if self.mass_heal_active:
+            check(self.mass_heal_key, "Toplu iyileştirme tuşu")
+        for row in self.active_rows:
+            if row.select_key:
+                check(row.select_key, f"Satır {row.index + 1} seçim tuşu")
+        for buff in self.active_buffs:
+            check(buff.key, f"{buff.name} tuşu")
+    
+    def changed_fields(self, other):
+        """
+        Bu anlık görüntüden farklı olan alanları döndürür.
+        
+        Args:
+            other (AutoHealBuffSettings): Karşılaştırılacak ayarlar.
+        
+        Returns:
+            dict: Alan adı -> other içindeki yeni değer. Satır ve buff'lar "rows"/"buffs" altında
+                indeks -> yeni nesne olarak verilir.
+        """
+        changes = {name: getattr(other, name) for name in self.FIELDS if getattr(self, name) != getattr(other, name)}
+        # Satır sayısı arttıysa yeni satırlar da değişmiş sayılır
+        rows = {row.index: row for row in other.rows
+                if row.index >= len(self.rows) or self.rows[row.index] != row}
+        buffs = {buff.index: buff for old, buff in zip(self.buffs, other.buffs) if old != buff}
+        if rows:
+            changes["rows"] = rows
+        if buffs:
+            changes["buffs"] = buffs
+        return changes
+
+def _parse_value(text, value_type):
+    # Dizge değeri verilen türe (veya ayrıştırıcı işlevle) dönüştürür
+    if value_type is bool:
+        lowered = text.strip().lower()
+        if lowered in ("true", "1", "yes", "on"):
+            return True
+        if lowered in ("false", "0", "no", "off", ""):
+            return False
+        raise SettingsError(f"True veya False bekleniyordu: {text}")
+    if value_type is int:
+        try:
+            return int(text.strip())
+        except ValueError:
+            raise SettingsError(f"tam sayı bekleniyordu: {text}")
+    if value_type is str:
+        return text
+    return value_type(text)
+
+def _parse_item(item_class, prefix, config_section, default, parsers):
+    # Bir satırın veya buff'ın alanlarını ayrıştırır, geçersiz alanlar varsayılanda kalır
+    values = {}
+    for name, parser in parsers.items():
+        key = f"{prefix}_{name}"
+        if key not in config_section:
+            continue
+        try:
+            values[name] = _parse_value(config_section[key], parser)
+        except ValueError as e:
+            logger.warning(f"Geçersiz ayar '{key} = {config_section[key]}': {e}")
+    
+    # Alanlar tek tek geçerli olsa da birlikte geçersiz olabilir (ör. boş bölge)
+    fields = {"index": default.index, **{name: getattr(default, name) for name in parsers}}
+    for name, value in values.items():
+        try:
+            item_class(**{**fields, name: value})
+            fields[name] = value
+        except ValueError as e:
+            logger.warning(f"Geçersiz ayar '{prefix}_{name} = {config_section[f'{prefix}_{name}']}': {e}")
+    return item_class(**fields)
@@ -3,30 +3,98 @@ Knight Online Otomatik İyileştirme ve Buff Sistemi - Ayarlar Yöneticisi
 Bu modül, sistemin ayarlarını yönetir ve yapılandırma dosyalarını işler.
 """
 
+import io
 import os
+import json
+import shutil
 import logging
+import threading
 import configparser
-import json
 from typing import Dict, Any, Optional, List, Tuple
 
+from config.schema import AutoHealBuffSettings
+
 # Logging yapılandırması
 logger = logging.getLogger("SettingsManager")
 
+# Arayüz değişikliklerinden sonra kaydetmeden önce beklenecek süre (saniye)
+SAVE_DEBOUNCE_SECONDS = 1.0
+
+# Profiller: etkin profil [AutoHealBuff] bölümünde, diğerleri [Profile:<ad>] bölümlerinde tutulur
+PROFILES_SECTION = 'Profiles'
+PROFILE_SECTION_PREFIX = 'Profile:'
+DEFAULT_PROFILE = 'Varsayılan'
+
+# Son buff zamanları dosyasının biçim sürümü
+BUFF_TIMERS_FORMAT_VERSION = 1
+
+def _snapshot(config: configparser.ConfigParser) -> Dict[str, Dict[str, str]]:
+    # Yapılandırmanın bölüm -> (anahtar -> değer) kopyası
+    return {section: dict(config[section]) for section in config.sections()}
+
+def _atomic_write(path: str, content: str, backup_path: Optional[str] = None) -> None:
+    """
+    Dosyayı önce geçici dosyaya yazıp os.replace ile yer değiştirerek yazar.
+    
+    Yazma sırasında çökme olursa eski dosya bozulmadan kalır.
+    
+    Args:
+        path: Hedef dosya.
+        content: Dosya içeriği.
+        backup_path: Verilirse mevcut dosya önce buraya kopyalanır.
+    """
+    temp_path = f"{path}.tmp"
+    with open(temp_path, "w", encoding="utf-8") as f:
+        f.write(content)
+        f.flush()
+        os.fsync(f.fileno())
+    
+    if backup_path and os.path.exists(path):
+        try:
+            shutil.copyfile(path, backup_path)
+        except OSError as backup_err:
+            logger.warning(f"Dosya yedeklenirken hata: {backup_err}")
+    
+    os.replace(temp_path, path)
+
 class SettingsManager:
     """Ayarlar ve yapılandırma dosyaları için yönetici sınıf."""
     
-    def __init__(self, config_file: str = "settings.ini", buffs_file: str = "buffs.json"):
+    def __init__(self, config_file: str = "settings.ini", buffs_file: str = "buffs.json",
+                 timers_file: str = "buff_timers.json"):
         """
         SettingsManager sınıfını başlatır.
         
         Args:
             config_file: Yapılandırma dosyası adı.
             buffs_file: Buff'lar için JSON dosyası adı.
+            timers_file: Son buff zamanları için JSON dosyası adı.
         """
         self.config_file = config_file
         self.buffs_file = buffs_file
+        self.timers_file = timers_file
         self.config = configparser.ConfigParser()
         
+        # [AutoHealBuff] bölümünün ayrıştırılmış hali (ilk istekte oluşturulur)
+        self._auto_heal_buff_settings = None
+        
+        # Etkin olmayan profillerin ayrıştırılmış halleri (profil adı -> AutoHealBuffSettings)
+        self._profile_settings = {}
+        
+        # Kaydedilmemiş değişiklik var mı? Değişiklik yoksa dosya yazılmaz.
+        self.dirty = False
+        
+        # Dosyanın en son okunan veya yazılan içeriği; dışarıdan yeniden yüklemede hangi anahtarların
+        # diskte değiştiği buna göre bulunur
+        self._disk_snapshot = {}
+        
+        # Arka planda kaydetme: config nesnesine erişim kilitle korunur
+        self._lock = threading.RLock()
+        self._save_timer = None
+        
+        # Son yazılan dosyanın (değişiklik zamanı, boyut) imzası; dosya izleyicisi kendi yazdıklarımızı ayırt eder
+        self.written_signature = None
+        
         # Yedek dosya adları
         self.backup_config_file = f"{config_file}.bak"
         self.backup_buffs_file = f"{buffs_file}.bak"
@@ -41,20 +109,25 @@ class SettingsManager:
         Returns:
             bool: Yükleme başarılı ise True, değilse False.
         """
+        self._auto_heal_buff_settings = None
+        self._profile_settings = {}
         try:
             if os.path.exists(self.config_file):
-                self.config.read(self.config_file)
+                self.config.read(self.config_file, encoding="utf-8")
                 logger.info(f"Yapılandırma dosyası başarıyla yüklendi: {self.config_file}")
                 
                 # AutoHealBuff bölümü yoksa oluştur
                 if not self.config.has_section('AutoHealBuff'):
                     self.config.add_section('AutoHealBuff')
                 
+                self._disk_snapshot = _snapshot(self.config)
+                self.dirty = False
                 return True
             else:
                 # İlk çalıştırma, yeni bir dosya oluştur
                 logger.info(f"Yapılandırma dosyası bulunamadı, yeni oluşturuluyor: {self.config_file}")
                 self.config.add_section('AutoHealBuff')
+                self.dirty = True
                 self.save_config()
                 return False
         except Exception as e:
@@ -63,7 +136,7 @@ class SettingsManager:
             # Yedek dosyayı deneme
             if os.path.exists(self.backup_config_file):
                 try:
-                    self.config.read(self.backup_config_file)
+                    self.config.read(self.backup_config_file, encoding="utf-8")
                     logger.info(f"Yedek yapılandırma dosyası başarıyla yüklendi: {self.backup_config_file}")
                     return True
                 except:
@@ -71,33 +144,146 @@ class SettingsManager:
             
             return False
     
-    def save_config(self) -> bool:
+    def reload_config(self) -> bool:
         """
-        Yapılandırma dosyasını kaydeder.
+        Yapılandırma dosyasını diskten yeniden okur (dışarıdan yapılan değişiklikler için).
+        
+        Dosya okunamazsa (ör. yazılırken bozuk görünüyorsa) mevcut ayarlar korunur. Henüz kaydedilmemiş
+        değişiklikler varsa dosya olduğu gibi alınmaz: yalnızca son okumadan veya yazmadan beri diskte
+        değişen anahtarlar uygulanır, diğer bekleyen değişiklikler korunur ve sonraki kayıtta yazılır.
+        Aynı anahtar iki tarafta da değiştiyse diskteki değer kullanılır.
         
         Returns:
-            bool: Kaydetme başarılı ise True, değilse False.
+            bool: Yeniden yükleme başarılı ise True, değilse False.
         """
+        config = configparser.ConfigParser()
         try:
-            # Önce yedek al (varsa)
-            if os.path.exists(self.config_file):
-                try:
-                    with open(self.config_file, 'r') as src, open(self.backup_config_file, 'w') as dst:
-                        dst.write(src.read())
-                    logger.info(f"Yapılandırma dosyası yedeklendi: {self.backup_config_file}")
-                except Exception as backup_err:
-                    logger.warning(f"Yapılandırma dosyası yedeklenirken hata: {backup_err}")
+            if not config.read(self.config_file, encoding="utf-8"):
+                logger.warning(f"Yapılandırma dosyası yeniden okunamadı: {self.config_file}")
+                return False
+        except configparser.Error as e:
+            logger.warning(f"Yapılandırma dosyası yeniden okunamadı, mevcut ayarlar korunuyor: {e}")
+            return False
+        
+        if not config.has_section('AutoHealBuff'):
+            config.add_section('AutoHealBuff')
+        disk = _snapshot(config)
+        
+        with self._lock:
+            if self.dirty:
+                merged = self._merge_disk_changes(self._disk_snapshot, disk)
+                logger.info(f"Yapılandırma dosyasındaki {merged} değişiklik kaydedilmemiş ayarlarla birleştirildi: "
+                            f"{self.config_file}")
+            else:
+                self.config = config
+                logger.info(f"Yapılandırma dosyası yeniden yüklendi: {self.config_file}")
+            self._disk_snapshot = disk
+            self._auto_heal_buff_settings = None
+            self._profile_settings = {}
+        return True
+    
+    def _merge_disk_changes(self, old, new) -> int:
+        """
+        Diskte değişen anahtarları bellekteki yapılandırmaya uygular (kilit tutulurken çağrılır).
+        
+        Args:
+            old: Dosyanın önceki içeriği (bölüm -> anahtar -> değer).
+            new: Dosyanın yeni içeriği.
+        
+        Returns:
+            int: Uygulanan değişiklik sayısı.
+        """
+        count = 0
+        for section in set(old) | set(new):
+            old_values = old.get(section, {})
+            new_values = new.get(section, {})
+            for key in set(old_values) | set(new_values):
+                if old_values.get(key) == new_values.get(key):
+                    continue
+                count += 1
+                if key in new_values:
+                    if not self.config.has_section(section):
+                        self.config.add_section(section)
+                    self.config[section][key] = new_values[key]
+                elif self.config.has_section(section):
+                    self.config.remove_option(section, key)
+            # Diskte silinen bölüm, bekleyen değişikliklerle yeniden eklenmediyse silinir
+            if section not in new and self.config.has_section(section) and not self.config[section]:
+                self.config.remove_section(section)
+        return count
+    
+    def save_config(self, force: bool = False) -> bool:
+        """
+        Yapılandırma dosyasını kaydeder.
+        
+        Kaydedilmemiş değişiklik yoksa dosya yazılmaz. Dosya geçici dosyaya yazılıp yer değiştirildiği için
+        yazma sırasında çökme mevcut dosyayı bozmaz; önceki sürüm .bak dosyasında tutulur.
+        
+        Args:
+            force: True ise değişiklik olmasa da yazılır.
+        
+        Returns:
+            bool: Kaydetme başarılı ise (veya kaydedilecek değişiklik yoksa) True, değilse False.
+        """
+        with self._lock:
+            if not self.dirty and not force:
+                logger.debug("Yapılandırmada değişiklik yok, kaydedilmedi.")
+                return True
             
-            # Yapılandırmayı kaydet
-            with open(self.config_file, 'w') as configfile:
-                self.config.write(configfile)
+            try:
+                buffer = io.StringIO()
+                self.config.write(buffer)
+                _atomic_write(self.config_file, buffer.getvalue(), self.backup_config_file)
+                
+                stat = os.stat(self.config_file)
+                self.written_signature = (stat.st_mtime_ns, stat.st_size)
+                self._disk_snapshot = _snapshot(self.config)
+                self.dirty = False
+                
+                logger.info(f"Yapılandırma dosyası başarıyla kaydedildi: {self.config_file}")
+                return True
             
-            logger.info(f"Yapılandırma dosyası başarıyla kaydedildi: {self.config_file}")
-            return True
+            except Exception as e:
+                logger.error(f"Yapılandırma dosyası kaydedilirken hata oluştu: {e}")
+                return False
+    
+    def schedule_save(self, delay: float = SAVE_DEBOUNCE_SECONDS) -> None:
+        """
+        Yapılandırmayı kısa bir gecikmeyle arka planda kaydeder.
         
-        except Exception as e:
-            logger.error(f"Yapılandırma dosyası kaydedilirken hata oluştu: {e}")
-            return False
+        Gecikme dolmadan gelen yeni istekler zamanlayıcıyı yeniden başlatır; böylece art arda yapılan
+        arayüz değişiklikleri (ör. bir tuşun harf harf yazılması) tek bir yazmada birleştirilir.
+        
+        Args:
+            delay: Son istekten sonra beklenecek süre (saniye).
+        """
+        with self._lock:
+            if not self.dirty:
+                return
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+            self._save_timer = threading.Timer(delay, self._background_save)
+            self._save_timer.name = "SettingsSaver"
+            self._save_timer.daemon = True
+            self._save_timer.start()
+    
+    def _background_save(self):
+        with self._lock:
+            self._save_timer = None
+        self.save_config()
+    
+    def flush(self) -> bool:
+        """
+        Bekleyen arka plan kaydını iptal eder ve değişiklik varsa hemen kaydeder.
+        
+        Returns:
+            bool: Kaydetme başarılı ise True.
+        """
+        with self._lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+        return self.save_config()
     
     def get_config_section(self, section: str) -> Dict[str, str]:
         """
@@ -109,10 +295,11 @@ class SettingsManager:
         Returns:
             Dict[str, str]: Bölüm ayarları.
         """
-        if not self.config.has_section(section):
-            self.config.add_section(section)
-        
-        return dict(self.config[section])
+        with self._lock:
+            if not self.config.has_section(section):
+                self.config.add_section(section)
+            
+            return dict(self.config[section])
     
     def update_config_section(self, section: str, settings: Dict[str, str]) -> None:
         """
@@ -122,12 +309,186 @@ class SettingsManager:
             section: Bölüm adı.
             settings: Yeni ayarlar.
         """
-        if not self.config.has_section(section):
-            self.config.add_section(section)
+        with self._lock:
+            if not self.config.has_section(section):
+                self.config.add_section(section)
+            
+            # Ayarları güncelle, yalnızca gerçekten değişen değerler kaydedilmemiş değişiklik sayılır
+            config_section = self.config[section]
+            for key, value in settings.items():
+                if config_section.get(key) != value:
+                    config_section[key] = value
+                    self.dirty = True
+            
+            if section == 'AutoHealBuff':
+                self._auto_heal_buff_settings = None
+    
+    def get_auto_heal_buff_settings(self) -> AutoHealBuffSettings:
+        """
+        [AutoHealBuff] bölümünü doğrulanmış ayar nesnesi olarak döndürür.
+        
+        Bölüm yalnızca yüklendikten veya güncellendikten sonraki ilk istekte ayrıştırılır.
+        
+        Returns:
+            AutoHealBuffSettings: Ayarlar.
+        """
+        with self._lock:
+            if self._auto_heal_buff_settings is None:
+                self._auto_heal_buff_settings = AutoHealBuffSettings.from_config(self.get_config_section('AutoHealBuff'))
+            return self._auto_heal_buff_settings
+    
+    def set_auto_heal_buff_settings(self, settings: AutoHealBuffSettings) -> None:
+        """
+        [AutoHealBuff] bölümünü verilen ayarlarla günceller (dosyaya yazmak için save_config çağrılır).
+        
+        Args:
+            settings: Yeni ayarlar.
+        """
+        with self._lock:
+            if settings == self._auto_heal_buff_settings:
+                return
+            self.update_config_section('AutoHealBuff', settings.to_config())
+            self._auto_heal_buff_settings = settings
+    
+    @property
+    def active_profile(self) -> str:
+        """Etkin profilin adı."""
+        with self._lock:
+            return self.config.get(PROFILES_SECTION, 'active', fallback=DEFAULT_PROFILE)
+    
+    def list_profiles(self) -> List[str]:
+        """
+        Kayıtlı profillerin adlarını döndürür (etkin profil dahil).
+        
+        Returns:
+            List[str]: Alfabetik sıralı profil adları.
+        """
+        with self._lock:
+            names = {section[len(PROFILE_SECTION_PREFIX):] for section in self.config.sections()
+                     if section.startswith(PROFILE_SECTION_PREFIX)}
+            names.add(self.active_profile)
+            return sorted(names, key=str.lower)
+    
+    def get_profile_settings(self, name: str) -> Optional[AutoHealBuffSettings]:
+        """
+        Bir profilin doğrulanmış ayarlarını döndürür.
+        
+        Her profil yalnızca ilk istekte ayrıştırılır; sonraki geçişlerde hazır nesne kullanılır.
         
-        # Ayarları güncelle
-        for key, value in settings.items():
-            self.config[section][key] = value
+        Args:
+            name: Profil adı.
+        
+        Returns:
+            AutoHealBuffSettings: Profil ayarları veya profil yoksa None.
+        """
+        with self._lock:
+            if name == self.active_profile:
+                return self.get_auto_heal_buff_settings()
+            
+            if name not in self._profile_settings:
+                section = f"{PROFILE_SECTION_PREFIX}{name}"
+                if not self.config.has_section(section):
+                    return None
+                self._profile_settings[name] = AutoHealBuffSettings.from_config(dict(self.config[section]))
+            return self._profile_settings[name]
+    
+    def _store_active_profile(self):
+        # Etkin profilin ayarlarını kendi bölümüne kopyalar (profil değiştirilmeden önce)
+        name = self.active_profile
+        self._profile_settings[name] = self.get_auto_heal_buff_settings()
+        self.config[f"{PROFILE_SECTION_PREFIX}{name}"] = dict(self.config['AutoHealBuff'])
+    
+    def _set_active_profile(self, name):
+        if not self.config.has_section(PROFILES_SECTION):
+            self.config.add_section(PROFILES_SECTION)
+        self.config[PROFILES_SECTION]['active'] = name
+        self.dirty = True
+    
+    def create_profile(self, name: str) -> bool:
+        """
+        Mevcut ayarları yeni bir profil olarak kaydeder ve onu etkin profil yapar.
+        
+        Önceki etkin profil kendi bölümünde değişmeden kalır.
+        
+        Args:
+            name: Yeni profil adı.
+        
+        Returns:
+            bool: Profil oluşturulduysa True, ad geçersizse veya zaten varsa False.
+        """
+        name = name.strip()
+        if not name or any(char in name for char in "[]\n"):
+            logger.warning(f"Geçersiz profil adı: {name!r}")
+            return False
+        
+        with self._lock:
+            if name in self.list_profiles():
+                logger.warning(f"Profil zaten var: {name}")
+                return False
+            
+            self._store_active_profile()
+            self._set_active_profile(name)
+        
+        logger.info(f"Profil oluşturuldu: {name}")
+        return True
+    
+    def switch_profile(self, name: str) -> Optional[AutoHealBuffSettings]:
+        """
+        Etkin profili değiştirir.
+        
+        Mevcut profilin ayarları kendi bölümüne kaydedilir, seçilen profil [AutoHealBuff] bölümüne
+        taşınır. Profil daha önce ayrıştırıldıysa metin yeniden ayrıştırılmaz.
+        
+        Args:
+            name: Geçilecek profil adı.
+        
+        Returns:
+            AutoHealBuffSettings: Yeni etkin ayarlar veya profil yoksa None.
+        """
+        with self._lock:
+            if name == self.active_profile:
+                return self.get_auto_heal_buff_settings()
+            
+            settings = self.get_profile_settings(name)
+            if settings is None:
+                logger.warning(f"Profil bulunamadı: {name}")
+                return None
+            
+            self._store_active_profile()
+            section = f"{PROFILE_SECTION_PREFIX}{name}"
+            self.config['AutoHealBuff'] = dict(self.config[section])
+            self.config.remove_section(section)
+            del self._profile_settings[name]
+            
+            self._auto_heal_buff_settings = settings
+            self._set_active_profile(name)
+        
+        logger.info(f"Profil değiştirildi: {name}")
+        return settings
+    
+    def delete_profile(self, name: str) -> bool:
+        """
+        Etkin olmayan bir profili siler.
+        
+        Args:
+            name: Profil adı.
+        
+        Returns:
+            bool: Profil silindiyse True.
+        """
+        with self._lock:
+            if name == self.active_profile:
+                logger.warning(f"Etkin profil silinemez: {name}")
+                return False
+            if not self.config.remove_section(f"{PROFILE_SECTION_PREFIX}{name}"):
+                logger.warning(f"Profil bulunamadı: {name}")
+                return False
+            
+            self._profile_settings.pop(name, None)
+            self.dirty = True
+        
+        logger.info(f"Profil silindi: {name}")
+        return True
     
     def load_buffs(self) -> List[Dict[str, Any]]:
         """
@@ -178,22 +539,55 @@ class SettingsManager:
             bool: Kaydetme başarılı ise True, değilse False.
         """
         try:
-            # Önce yedek al (varsa)
-            if os.path.exists(self.buffs_file):
-                try:
-                    with open(self.buffs_file, 'r', encoding="utf-8") as src, open(self.backup_buffs_file, 'w', encoding="utf-8") as dst:
-                        dst.write(src.read())
-                    logger.info(f"Buff dosyası yedeklendi: {self.backup_buffs_file}")
-                except Exception as backup_err:
-                    logger.warning(f"Buff dosyası yedeklenirken hata: {backup_err}")
-            
-            # Buff'ları kaydet
-            with open(self.buffs_file, 'w', encoding="utf-8") as f:
-                json.dump(buffs_data, f, ensure_ascii=False, indent=2)
+            # Buff'ları geçici dosya üzerinden kaydet, önceki sürüm yedeklenir
+            content = json.dumps(buffs_data, ensure_ascii=False, indent=2)
+            _atomic_write(self.buffs_file, content, self.backup_buffs_file)
             
             logger.info(f"Buff'lar başarıyla kaydedildi: {self.buffs_file}")
             return True
         
         except Exception as e:
             logger.error(f"Buff'lar kaydedilirken hata oluştu: {e}")
-            return False 
\ No newline at end of file
+            return False 
+    
+    def load_buff_timers(self) -> Dict[int, Dict[str, Any]]:
+        """
+        Son buff zamanlarını JSON dosyasından yükler.
+        
+        Returns:
+            Dict[int, Dict[str, Any]]: Buff indeksi -> kayıt (last_cast, duration, key).
+                Dosya yoksa veya okunamazsa boş sözlük.
+        """
+        if not os.path.exists(self.timers_file):
+            return {}
+        
+        try:
+            with open(self.timers_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("format") != BUFF_TIMERS_FORMAT_VERSION:
+                logger.warning(f"Desteklenmeyen buff zamanlayıcı dosyası biçimi: {data.get('format')}")
+                return {}
+            return {int(buff_index): timer for buff_index, timer in data["buffs"].items() if isinstance(timer, dict)}
+        except (OSError, ValueError, KeyError, AttributeError) as e:
+            logger.warning(f"Buff zamanlayıcıları yüklenemedi: {e}")
+            return {}
+    
+    def save_buff_timers(self, timers: Dict[int, Dict[str, Any]]) -> bool:
+        """
+        Son buff zamanlarını JSON dosyasına kaydeder.
+        
+        Args:
+            timers: Buff indeksi -> kayıt (BuffHelper.get_buff_timers() çıktısı).
+        
+        Returns:
+            bool: Kaydetme başarılı ise True, değilse False.
+        """
+        try:
+            content = json.dumps({"format": BUFF_TIMERS_FORMAT_VERSION,
+                                  "buffs": {str(buff_index): timer for buff_index, timer in timers.items()}}, indent=2)
+            _atomic_write(self.timers_file, content)
+            logger.debug(f"Buff zamanlayıcıları kaydedildi: {self.timers_file}")
+            return True
+        except Exception as e:
+            logger.error(f"Buff zamanlayıcıları kaydedilirken hata oluştu: {e}")
+            return False
@@ -0,0 +1,70 @@
+"""
+Knight Online Otomatik İyileştirme ve Buff Sistemi - Ayar Dosyası İzleyicisi
+Bu modül, ayar dosyasının dışarıdan (ör. betiklerle) değiştirilip değiştirilmediğini ucuz bir
+os.stat çağrısıyla (değişiklik zamanı ve boyut) denetler.
+"""
+
+import os
+import logging
+
+# Logging yapılandırması
+logger = logging.getLogger("SettingsWatcher")
+
+class SettingsWatcher:
+    """
+    Bir dosyanın değişikliklerini yoklama (polling) ile izleyen sınıf.
+    
+    Değişiklik, dosyanın imzası (değişiklik zamanı, boyut) art arda iki yoklamada aynı kaldığında
+    bildirilir; böylece yazılmakta olan bir dosya yarım haliyle okunmaz.
+    """
+    
+    def __init__(self, path):
+        """
+        SettingsWatcher sınıfını başlatır.
+        
+        Args:
+            path (str): İzlenecek dosya yolu.
+        """
+        self.path = path
+        self._applied = self._signature()
+        self._pending = None
+    
+    def _signature(self):
+        # Dosya yoksa None döndürür
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+    
+    @property
+    def signature(self):
+        """Son bildirilen (veya sync ile kaydedilen) dosya imzası: (değişiklik zamanı, boyut)."""
+        return self._applied
+    
+    def poll(self):
+        """
+        Dosyanın değişip değişmediğini denetler.
+        
+        Returns:
+            bool: Dosya son bildirimden sonra değiştiyse ve yazma tamamlandıysa True.
+        """
+        signature = self._signature()
+        if signature is None or signature == self._applied:
+            self._pending = None
+            return False
+        
+        # İlk görüşte bekle, sonraki yoklamada imza değişmediyse bildir
+        if signature != self._pending:
+            self._pending = signature
+            return False
+        
+        self._applied = signature
+        self._pending = None
+        logger.info(f"Ayar dosyası değişti: {self.path}")
+        return True
+    
+    def sync(self):
+        """Dosyanın mevcut halini bilinen hal olarak kaydeder (uygulamanın kendi yazdığı değişiklikler için)."""
+        self._applied = self._signature()
+        self._pending = None
@@ -9,6 +9,9 @@ import logging
 from typing import List, Dict, Any, Callable, Optional
 from datetime import datetime
 
+from core.utils.metrics import registry
+from core.utils.tracing import tracer
+
 # Logging yapılandırması
 logger = logging.getLogger("BuffLogic")
 
@@ -44,29 +47,42 @@ class BuffHelper:
                 "last_buff_time": datetime.now()
             })
         
+        # Döngü aralığı (saniye)
+        self.check_interval = 1.0
+        
+        # Buff yapıldığında buff indeksi ve Unix zamanıyla çağrılır (zamanlayıcıları kaydetmek için)
+        self.cast_callback = None
+        
         # Hata sayacı
         self.error_count = 0
         self.max_errors = 10
         
-        logging.info("BuffHelper başlatıldı.")
+        # Döngü ölçümleri (oturum boyunca ortak kayıt defterinde tutulur)
+        self.iteration_time = registry.histogram("buff_iteration_seconds", "Bir buff döngüsü adımının süresi")
+        self.cast_lateness = registry.histogram(
+            "buff_cast_lateness_seconds", "Buff'ın aralığı dolduktan sonra gönderilene kadar geçen gecikme")
+        self.cast_count = registry.counter("buff_casts_total", "Gönderilen buff")
+        self.loop_error_count = registry.counter("buff_errors_total", "Buff döngüsünde oluşan hata")
+        
+        logger.info("BuffHelper başlatıldı.")
     
     def start(self):
         """Buff sistemini başlatır."""
         if self.running:
-            logging.warning("BuffHelper zaten çalışıyor.")
+            logger.warning("BuffHelper zaten çalışıyor.")
             return
         
         self.running = True
-        self.thread = threading.Thread(target=self._run_loop, daemon=True)
+        self.thread = threading.Thread(target=self._run_loop, name="BuffHelper", daemon=True)
         self.thread.start()
-        logging.info("BuffHelper çalışma döngüsü başlatıldı.")
+        logger.info("BuffHelper çalışma döngüsü başlatıldı.")
     
     def stop(self):
         """Buff sistemini durdurur."""
         self.running = False
         if self.thread and self.thread.is_alive():
             self.thread.join(timeout=2.0)
-        logging.info("BuffHelper durduruldu.")
+        logger.info("BuffHelper durduruldu.")
     
     def set_active(self, active):
         """
@@ -76,7 +92,7 @@ class BuffHelper:
             active (bool): Aktif durumu.
         """
         self.active = active
-        logging.info(f"BuffHelper aktif durumu: {active}")
+        logger.info(f"BuffHelper aktif durumu: {active}")
     
     def set_buff_active(self, buff_index, active):
         """
@@ -88,7 +104,7 @@ class BuffHelper:
         """
         if 0 <= buff_index < len(self.buffs):
             self.buffs[buff_index]["active"] = active
-            logging.info(f"Buff {buff_index + 1} aktif durumu: {active}")
+            logger.info(f"Buff {buff_index + 1} aktif durumu: {active}")
     
     def set_buff_key(self, buff_index, key):
         """
@@ -100,7 +116,7 @@ class BuffHelper:
         """
         if 0 <= buff_index < len(self.buffs):
             self.buffs[buff_index]["key"] = key
-            logging.info(f"Buff {buff_index + 1} tuşu: {key}")
+            logger.info(f"Buff {buff_index + 1} tuşu: {key}")
     
     def set_buff_interval(self, buff_index, interval):
         """
@@ -112,7 +128,40 @@ class BuffHelper:
         """
         if 0 <= buff_index < len(self.buffs) and interval > 0:
             self.buffs[buff_index]["interval"] = interval
-            logging.info(f"Buff {buff_index + 1} aralığı: {interval} saniye")
+            logger.info(f"Buff {buff_index + 1} aralığı: {interval} saniye")
+    
+    def apply_settings(self, settings, changed=None):
+        """
+        Buff ayarlarını doğrulanmış ayar nesnesinden uygular.
+        
+        En az bir buff etkinse sistem aktifleştirilir. Son buff zamanları değiştirilmez,
+        çalışan döngüye uygulanabilir.
+        
+        Args:
+            settings (AutoHealBuffSettings): Ayarlar.
+            changed (dict, optional): AutoHealBuffSettings.changed_fields() çıktısı.
+                Verilirse yalnızca değişen alanlar uygulanır.
+        """
+        changed_buffs = changed.get("buffs", {}) if changed is not None else None
+        for buff_settings in settings.buffs:
+            if buff_settings.index >= len(self.buffs):
+                continue
+            if changed_buffs is not None and buff_settings.index not in changed_buffs:
+                continue
+            buff = self.buffs[buff_settings.index]
+            buff["key"] = buff_settings.chord or buff_settings.key
+            buff["interval"] = buff_settings.duration
+            buff["active"] = buff_settings.enabled
+        
+        if changed is None or "buff_check_interval" in changed:
+            self.check_interval = settings.buff_check_interval / 1000.0
+        self.active = bool(settings.active_buffs)
+        
+        if changed is None:
+            logger.info(f"Buff ayarları uygulandı: aktif buff'lar {[buff.index + 1 for buff in settings.active_buffs]}, "
+                        f"kontrol {self.check_interval * 1000:.0f} ms")
+        else:
+            logger.info(f"Buff ayarları güncellendi: {', '.join(sorted(changed))}")
     
     def reset_buff_timer(self, buff_index):
         """
@@ -123,7 +172,55 @@ class BuffHelper:
         """
         if 0 <= buff_index < len(self.buffs):
             self.buffs[buff_index]["last_buff_time"] = datetime.now()
-            logging.info(f"Buff {buff_index + 1} zamanlayıcısı sıfırlandı.")
+            logger.info(f"Buff {buff_index + 1} zamanlayıcısı sıfırlandı.")
+    
+    def get_buff_timers(self):
+        """
+        Aktif buff'ların son buff zamanlarını kaydedilebilir biçimde döndürür.
+        
+        Returns:
+            dict: Buff indeksi -> {"last_cast": Unix zamanı, "duration": saniye, "key": tuş}.
+        """
+        timers = {}
+        for buff_index, buff in enumerate(self.buffs):
+            if buff["active"] and buff["key"]:
+                timers[buff_index] = {
+                    "last_cast": buff["last_buff_time"].timestamp(),
+                    "duration": buff["interval"],
+                    "key": str(buff["key"])
+                }
+        return timers
+    
+    def restore_buff_timers(self, timers):
+        """
+        Kaydedilmiş son buff zamanlarını geri yükler; kalan süreler kaldığı yerden devam eder.
+        
+        Tuşu değişmiş buff'lar ve gelecekteki zamanlar (sistem saati geri alınmışsa) yok sayılır,
+        bu buff'lar yeni yapılmış kabul edilir.
+        
+        Args:
+            timers (dict): get_buff_timers() çıktısı.
+        
+        Returns:
+            dict: Geri yüklenen buff indeksi -> son buff zamanı (Unix zamanı).
+        """
+        now = time.time()
+        restored = {}
+        for buff_index, timer in timers.items():
+            if not 0 <= buff_index < len(self.buffs):
+                continue
+            buff = self.buffs[buff_index]
+            if not buff["active"] or str(buff["key"]) != timer.get("key"):
+                continue
+            last_cast = timer.get("last_cast")
+            if not isinstance(last_cast, (int, float)) or last_cast > now:
+                continue
+            
+            buff["last_buff_time"] = datetime.fromtimestamp(last_cast)
+            restored[buff_index] = last_cast
+            remaining = max(0.0, last_cast + buff["interval"] - now)
+            logger.info(f"Buff {buff_index + 1} zamanlayıcısı geri yüklendi, kalan süre: {remaining:.0f} saniye")
+        return restored
     
     def _run_loop(self):
         """Buff döngüsünü çalıştırır."""
@@ -136,6 +233,7 @@ class BuffHelper:
                     time.sleep(1.0)
                     continue
                 
+                iteration_start = time.monotonic()
                 current_time = datetime.now()
                 
                 # Her bir buff'ı kontrol et
@@ -149,29 +247,37 @@ class BuffHelper:
                     # Buff zamanı geldiyse buff yap
                     if time_diff >= buff["interval"]:
                         # Buff tuşuna bas
-                        self.key_press_callback(buff["key"])
+                        with tracer.span("buff_cast", "buff", {"buff": buff_index + 1, "key": str(buff["key"])}):
+                            self.key_press_callback(buff["key"])
                         
                         # Son buff zamanını güncelle
                         buff["last_buff_time"] = current_time
+                        self.cast_count.inc()
+                        self.cast_lateness.observe(time_diff - buff["interval"])
                         
-                        logging.info(f"Buff {buff_index + 1} yapıldı (tuş: {buff['key']}).")
+                        logger.info("Buff %d yapıldı (tuş: %s).", buff_index + 1, buff["key"])
                         
-                        # Bufflar arası bekleme süresi
-                        time.sleep(0.5)
+                        if self.cast_callback:
+                            self.cast_callback(buff_index, current_time.timestamp())
+                        
+                        # Bufflar arası bekleme girdi servisindeki hız denetleyicisi tarafından yapılır
+                
+                self.iteration_time.observe(time.monotonic() - iteration_start)
                 
                 # Hata sayacını sıfırla, başarılı işlem
                 self.error_count = 0
                 
-                # Döngü aralığı (1 saniye)
-                time.sleep(1.0)
+                # Döngü aralığı
+                time.sleep(self.check_interval)
                 
             except Exception as e:
                 self.error_count += 1
-                logging.error(f"Buff döngüsünde hata: {e}")
+                self.loop_error_count.inc()
+                logger.error("Buff döngüsünde hata: %s", e)
                 
                 # Çok fazla hata varsa durdur
                 if self.error_count >= self.max_errors:
-                    logging.critical(f"Çok fazla hata oluştu ({self.error_count}), döngü durduruluyor.")
+                    logger.critical("Çok fazla hata oluştu (%d), döngü durduruluyor.", self.error_count)
                     self.running = False
                     break
                 
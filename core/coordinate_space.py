@@ -0,0 +1,199 @@
+"""
+Knight Online Otomatik İyileştirme ve Buff Sistemi - Koordinat Uzayı
+Bu modül, satır koordinatlarını kaydedildikleri referans istemci alanından oyun penceresinin güncel
+konumuna ve çözünürlüğüne dönüştürür.
+
+Koordinatlar, referans alanı (koordinatlar alınırken oyun penceresinin ekrandaki istemci alanı) ile
+birlikte saklanır. Pencere taşınır veya boyutu değişirse ölçekleme ve öteleme bir kez hesaplanır;
+pencere değişmedikçe aynı dönüşüm nesnesi kullanılır ve kırpma dilimleri yeniden hesaplanmaz.
+"""
+
+import logging
+import numpy as np
+
+# Logging yapılandırması
+logger = logging.getLogger("CoordinateSpace")
+
+class CoordinateTransform:
+    """
+    Referans alanından güncel alana ölçekleme ve öteleme: x' = x * scale_x + offset_x.
+    Nesne değiştirilemez; pencere değiştiğinde yeni nesne oluşturulur.
+    """
+    
+    __slots__ = ("scale_x", "scale_y", "offset_x", "offset_y", "version")
+    
+    def __init__(self, scale_x=1.0, scale_y=1.0, offset_x=0.0, offset_y=0.0, version=0):
+        """
+        CoordinateTransform sınıfını başlatır.
+        
+        Args:
+            scale_x (float): Yatay ölçek.
+            scale_y (float): Dikey ölçek.
+            offset_x (float): Yatay öteleme (piksel).
+            offset_y (float): Dikey öteleme (piksel).
+            version (int): Dönüşüm sürümü, her değişiklikte artar.
+        """
+        self.scale_x = scale_x
+        self.scale_y = scale_y
+        self.offset_x = offset_x
+        self.offset_y = offset_y
+        self.version = version
+    
+    @classmethod
+    def between(cls, reference, current, version=0):
+        """
+        İki istemci alanı arasındaki dönüşümü hesaplar.
+        
+        Args:
+            reference (tuple): Koordinatların alındığı alan (sol, üst, genişlik, yükseklik).
+            current (tuple): Güncel alan (sol, üst, genişlik, yükseklik).
+            version (int): Dönüşüm sürümü.
+        
+        Returns:
+            CoordinateTransform: Dönüşüm.
+        """
+        ref_left, ref_top, ref_width, ref_height = reference
+        left, top, width, height = current
+        scale_x = width / ref_width
+        scale_y = height / ref_height
+        return cls(scale_x, scale_y, left - ref_left * scale_x, top - ref_top * scale_y, version)
+    
+    @property
+    def params(self):
+        """(scale_x, scale_y, offset_x, offset_y) dörtlüsü."""
+        return (self.scale_x, self.scale_y, self.offset_x, self.offset_y)
+    
+    @property
+    def is_identity(self):
+        """Dönüşüm koordinatları değiştirmiyorsa True."""
+        return self.params == (1.0, 1.0, 0.0, 0.0)
+    
+    def map_point(self, x, y):
+        """
+        Referans alanındaki bir noktayı ekran koordinatına dönüştürür.
+        
+        Returns:
+            tuple: (x, y) ekran koordinatı.
+        """
+        return (int(round(x * self.scale_x + self.offset_x)), int(round(y * self.scale_y + self.offset_y)))
+    
+    def to_reference(self, x, y):
+        """
+        Ekran koordinatındaki bir noktayı referans alanına dönüştürür (koordinat alırken kullanılır).
+        
+        Returns:
+            tuple: (x, y) referans koordinatı.
+        """
+        return (int(round((x - self.offset_x) / self.scale_x)), int(round((y - self.offset_y) / self.scale_y)))
+    
+    def map_rect(self, coords):
+        """
+        Referans alanındaki bir dikdörtgeni ekran koordinatına dönüştürür.
+        
+        Küçültmede bölge boş kalmasın diye en az 1 piksel genişlik ve yükseklik korunur.
+        
+        Args:
+            coords (tuple): (x1, y1, x2, y2).
+        
+        Returns:
+            tuple: (x1, y1, x2, y2) ekran koordinatı.
+        """
+        x1, y1 = self.map_point(coords[0], coords[1])
+        x2, y2 = self.map_point(coords[2], coords[3])
+        return (x1, y1, max(x2, x1 + 1), max(y2, y1 + 1))
+    
+    def map_rects(self, coords):
+        """
+        Birden çok dikdörtgeni tek seferde ekran koordinatına dönüştürür.
+        
+        Küçültmede bölge boş kalmasın diye en az 1 piksel genişlik ve yükseklik korunur; çoklu
+        monitörde ekran dışına taşan kısım kırpılır.
+        
+        Args:
+            coords (numpy.ndarray): (N, 4) boyutunda referans alanında (x1, y1, x2, y2) dizisi.
+        
+        Returns:
+            numpy.ndarray: (N, 4) boyutunda ekran koordinatı dizisi.
+        """
+        scale = np.array([self.scale_x, self.scale_y, self.scale_x, self.scale_y])
+        offset = np.array([self.offset_x, self.offset_y, self.offset_x, self.offset_y])
+        rects = np.rint(np.asarray(coords, dtype=np.float64).reshape(-1, 4) * scale + offset).astype(np.int64)
+        rects[:, :2] = np.maximum(rects[:, :2], 0)
+        rects[:, 2:] = np.maximum(rects[:, 2:], rects[:, :2] + 1)
+        return rects
+    
+    def __repr__(self):
+        return (f"CoordinateTransform(scale=({self.scale_x:.3f}, {self.scale_y:.3f}), "
+                f"offset=({self.offset_x:.0f}, {self.offset_y:.0f}), version={self.version})")
+
+# Pencere takibi yokken kullanılan birim dönüşüm
+IDENTITY_TRANSFORM = CoordinateTransform()
+
+class CoordinateSpace:
+    """
+    Oyun penceresinin konumunu izleyip güncel dönüşümü önbellekte tutan sınıf.
+    
+    probe() her iyileştirme döngüsü adımında çağrılır; pencere alanı değişmediyse önceki dönüşüm
+    nesnesini döndürür, böylece çağıran yalnızca nesne değiştiğinde kırpma dilimlerini yeniden hesaplar.
+    """
+    
+    def __init__(self, provider=None, reference=None):
+        """
+        CoordinateSpace sınıfını başlatır.
+        
+        Args:
+            provider (WindowRectProvider, optional): Pencere konumu sağlayıcısı; None ise koordinatlar
+                ekran koordinatı olarak kullanılır.
+            reference (tuple, optional): Koordinatların alındığı istemci alanı. None ise ilk görülen
+                pencere alanı referans kabul edilir.
+        """
+        self.provider = provider
+        self.reference = tuple(reference) if reference else None
+        self.transform = IDENTITY_TRANSFORM
+        self._rect = None
+        self._window_lost = False
+    
+    def probe(self):
+        """
+        Pencere alanını okur, değiştiyse dönüşümü yeniden hesaplar.
+        
+        Pencere bulunamazsa (kapalı veya simge durumunda) son dönüşüm kullanılmaya devam eder.
+        
+        Returns:
+            CoordinateTransform: Güncel dönüşüm.
+        """
+        if self.provider is None:
+            return self.transform
+        
+        rect = self.provider.get_rect()
+        if rect is None:
+            if not self._window_lost:
+                self._window_lost = True
+                logger.warning("Oyun penceresi bulunamadı, son bilinen konum kullanılıyor.")
+            return self.transform
+        self._window_lost = False
+        
+        if rect == self._rect:
+            return self.transform
+        self._rect = rect
+        
+        # Eski ayar dosyalarında referans yoktur: koordinatlar pencerenin şu anki konumunda alınmış sayılır
+        if self.reference is None:
+            self.reference = rect
+            logger.info(f"Koordinat referans alanı belirlendi: {list(rect)}")
+        
+        # Sonuç aynıysa (ör. pencere referans konumunda açıldıysa) önceki nesne korunur
+        transform = CoordinateTransform.between(self.reference, rect, self.transform.version + 1)
+        if transform.params != self.transform.params:
+            self.transform = transform
+        logger.info(f"Oyun penceresi alanı: {list(rect)}, {self.transform}")
+        return self.transform
+    
+    def to_reference(self, x, y):
+        """
+        Ekran koordinatını referans alanına dönüştürür (yeni koordinat alınırken).
+        
+        Returns:
+            tuple: (x, y) referans koordinatı.
+        """
+        return self.probe().to_reference(x, y)
@@ -11,6 +11,15 @@ from typing import List, Dict, Any, Tuple, Optional, Callable
 from datetime import datetime
 from PIL import Image
 
+from config.schema import ROW_COUNT
+from core.coordinate_space import IDENTITY_TRANSFORM
+from core.hp_analyzer import HpReading, read_hp
+from core.roi_tracker import RoiTracker, is_on_bar
+from core.row_table import RowTable
+from core.utils.metrics import registry
+from core.utils.tracing import tracer
+from services.common.frame import Frame
+
 # Logging yapılandırması
 logger = logging.getLogger("HealLogic")
 
@@ -24,6 +33,12 @@ HP_BAR_COLOR = {
 # Renk toleransı (renk farklılıklarını dikkate almak için)
 COLOR_TOLERANCE = 30
 
+# Bu güvenin altındaki HP okumalarına göre karar verilmez (bkz. core/hp_analyzer.py read_hp)
+MIN_READING_CONFIDENCE = 0.6
+
+# Bu değerden büyük HP değişimleri (gerçek hasar veya iyileştirme) yumuşatılmadan alınır (HP yüzdesi)
+HP_STEP = 15.0
+
 class HealHelper:
     """
     Knight Online oyununda otomatik iyileştirme işlemlerini yöneten sınıf.
@@ -58,15 +73,17 @@ class HealHelper:
         self.mass_heal_percentage = 60
         self.party_check_enabled = False
         
-        # Satır ayarları (en fazla 8 satır)
-        self.rows = []
-        for _ in range(8):
-            self.rows.append({
-                "active": False,
-                "coords": [],  # [x1, y1, x2, y2] - Sol üst köşe ve sağ alt köşe koordinatları
-                "last_hp_percentage": 100,
-                "last_heal_time": datetime.now()
-            })
+        # HP yumuşatma ve histerezis ayarları
+        self.hp_smoothing = 0.5  # Küçük değişimlerde yeni okumanın ağırlığı (1 ise yumuşatma yok)
+        self.hysteresis_band = 4.0  # HP yüzdesi, eşik çevresindeki bant genişliği
+        
+        # Satır durumları (satır sayısı ayarlardan gelir, bkz. apply_settings)
+        self.rows = RowTable(ROW_COUNT)
+        
+        # Tablo arayüz (ayarlar) ve döngü (bölge takibi, pencere dönüşümü) tarafından kopyalanıp değiştirilir.
+        # Değişiklikler bu kilitle sıralanır; döngü de bir adım boyunca kilidi tutar, böylece adımda yazılan
+        # durum (son HP, son iyileştirme zamanı) eski tabloda kalıp kaybolmaz.
+        self._rows_lock = threading.RLock()
         
         # Zamanlayıcı ayarları
         self.check_interval = 0.1  # saniye
@@ -75,29 +92,66 @@ class HealHelper:
         self.last_check_time = datetime.now()
         self.last_mass_heal_time = datetime.now()
         
+        # Satır koordinatlarını oyun penceresinin güncel konumuna çeviren koordinat uzayı (None ise ekran koordinatı)
+        self.coordinate_space = None
+        self.transform = IDENTITY_TRANSFORM
+        
+        # Parti paneli kaydığında satır bölgelerini yeniden HP barlarına oturtan takipçi
+        self.roi_tracking = True
+        self.roi_tracker = RoiTracker()
+        
+        # Üstü örtülen (ipucu kutusu, sohbet, imleç) barların okumaları bu güvenin altında kalır
+        self.min_confidence = MIN_READING_CONFIDENCE
+        
+        # Kare tazelik ayarları
+        self.max_frame_age = 0.25  # saniye, bu yaştan eski karelere göre işlem yapılmaz
+        self.stale_frame_count = 0
+        
+        # Henüz gönderilmemiş iyileştirmeler (satır indeksi -> Future); asenkron girdi servisi hız
+        # sınırına takıldığında aynı satır için kuyruğa ikinci bir iyileştirme eklenmez
+        self._pending_heals = {}
+        self._pending_mass_heal = None
+        
+        # Yakalamadan işleme kadar geçen süre (capture-to-action) histogramı
+        self.reaction_latency = registry.histogram(
+            "heal_reaction_seconds", "Kare yakalamadan iyileştirme tuşunun gönderilmesine kadar geçen süre")
+        
+        # Döngü ölçümleri (oturum boyunca ortak kayıt defterinde tutulur)
+        self.iteration_time = registry.histogram("heal_iteration_seconds", "Bir iyileştirme döngüsü adımının süresi")
+        self.analysis_time = registry.histogram("hp_analysis_seconds", "Bir HP barının kırpılıp analiz edilme süresi")
+        self.iteration_count = registry.counter("heal_iterations_total", "Tamamlanan iyileştirme döngüsü adımı")
+        self.heal_count = registry.counter("heal_casts_total", "Gönderilen tekli iyileştirme")
+        self.mass_heal_count = registry.counter("mass_heal_casts_total", "Gönderilen toplu iyileştirme")
+        self.stale_frame_counter = registry.counter("heal_stale_frames_total", "Eski olduğu için reddedilen kare")
+        self.loop_error_count = registry.counter("heal_errors_total", "İyileştirme döngüsünde oluşan hata")
+        self.low_confidence_counter = registry.counter("heal_low_confidence_total", "Güveni düşük olduğu için yok sayılan HP okuması")
+        self.lost_row_counter = registry.counter("heal_lost_rows_total", "Bölgesi HP barı üzerinde olmadığı için atlanan satır okuması")
+        self.relocation_counter = registry.counter("roi_relocations_total", "HP barına yeniden oturtulan satır bölgesi")
+        self.low_hp_rows_gauge = registry.gauge("heal_low_hp_rows", "Son adımda eşiğin altındaki satır sayısı")
+        
         # Hata sayacı
         self.error_count = 0
         self.max_errors = 10
         
-        logging.info("HealHelper başlatıldı.")
+        logger.info("HealHelper başlatıldı.")
     
     def start(self):
         """İyileştirme sistemini başlatır."""
         if self.running:
-            logging.warning("HealHelper zaten çalışıyor.")
+            logger.warning("HealHelper zaten çalışıyor.")
             return
         
         self.running = True
-        self.thread = threading.Thread(target=self._run_loop, daemon=True)
+        self.thread = threading.Thread(target=self._run_loop, name="HealHelper", daemon=True)
         self.thread.start()
-        logging.info("HealHelper çalışma döngüsü başlatıldı.")
+        logger.info("HealHelper çalışma döngüsü başlatıldı.")
     
     def stop(self):
         """İyileştirme sistemini durdurur."""
         self.running = False
         if self.thread and self.thread.is_alive():
             self.thread.join(timeout=2.0)
-        logging.info("HealHelper durduruldu.")
+        logger.info("HealHelper durduruldu.")
     
     def set_active(self, active):
         """
@@ -107,7 +161,7 @@ class HealHelper:
             active (bool): Aktif durumu.
         """
         self.active = active
-        logging.info(f"HealHelper aktif durumu: {active}")
+        logger.info(f"HealHelper aktif durumu: {active}")
     
     def set_heal_key(self, key):
         """
@@ -117,7 +171,7 @@ class HealHelper:
             key (str): İyileştirme tuşu.
         """
         self.heal_key = key
-        logging.info(f"İyileştirme tuşu: {key}")
+        logger.info(f"İyileştirme tuşu: {key}")
     
     def set_heal_percentage(self, percentage):
         """
@@ -127,7 +181,7 @@ class HealHelper:
             percentage (int): İyileştirme yapılacak HP yüzdesi eşiği.
         """
         self.heal_percentage = percentage
-        logging.info(f"İyileştirme yüzdesi: {percentage}")
+        logger.info(f"İyileştirme yüzdesi: {percentage}")
     
     def set_mass_heal_active(self, active):
         """
@@ -137,7 +191,7 @@ class HealHelper:
             active (bool): Aktif durumu.
         """
         self.mass_heal_active = active
-        logging.info(f"Toplu iyileştirme aktif durumu: {active}")
+        logger.info(f"Toplu iyileştirme aktif durumu: {active}")
     
     def set_mass_heal_key(self, key):
         """
@@ -147,7 +201,7 @@ class HealHelper:
             key (str): Toplu iyileştirme tuşu.
         """
         self.mass_heal_key = key
-        logging.info(f"Toplu iyileştirme tuşu: {key}")
+        logger.info(f"Toplu iyileştirme tuşu: {key}")
     
     def set_mass_heal_percentage(self, percentage):
         """
@@ -157,7 +211,7 @@ class HealHelper:
             percentage (int): Toplu iyileştirme yapılacak HP yüzdesi eşiği.
         """
         self.mass_heal_percentage = percentage
-        logging.info(f"Toplu iyileştirme yüzdesi: {percentage}")
+        logger.info(f"Toplu iyileştirme yüzdesi: {percentage}")
     
     def set_party_check_enabled(self, enabled):
         """
@@ -167,7 +221,7 @@ class HealHelper:
             enabled (bool): Aktif durumu.
         """
         self.party_check_enabled = enabled
-        logging.info(f"Parti kontrolü aktif durumu: {enabled}")
+        logger.info(f"Parti kontrolü aktif durumu: {enabled}")
     
     def set_row_active(self, row_index, active):
         """
@@ -177,9 +231,10 @@ class HealHelper:
             row_index (int): Satır indeksi.
             active (bool): Aktif durumu.
         """
-        if 0 <= row_index < len(self.rows):
-            self.rows[row_index]["active"] = active
-            logging.info(f"Satır {row_index + 1} aktif durumu: {active}")
+        with self._rows_lock:
+            if 0 <= row_index < self.rows.count:
+                self.rows.active[row_index] = active
+                logger.info(f"Satır {row_index + 1} aktif durumu: {active}")
     
     def set_row_coords(self, row_index, coords):
         """
@@ -189,9 +244,208 @@ class HealHelper:
             row_index (int): Satır indeksi.
             coords (list): [x1, y1, x2, y2] formatında koordinatlar.
         """
-        if 0 <= row_index < len(self.rows) and len(coords) == 4:
-            self.rows[row_index]["coords"] = coords
-            logging.info(f"Satır {row_index + 1} koordinatları ayarlandı: {coords}")
+        with self._rows_lock:
+            if 0 <= row_index < self.rows.count and len(coords) == 4:
+                rows = self.rows.copy()
+                rows.set_coords(row_index, coords)
+                rows.apply_transform(self.transform)
+                self.rows = rows
+                logger.info(f"Satır {row_index + 1} koordinatları ayarlandı: {coords}")
+    
+    def set_row_select_key(self, row_index, key):
+        """
+        Bir satırdaki parti üyesini seçmek için kullanılacak tuşu ayarlar.
+        
+        Tuş tanımlıysa hedef seçimi fare tıklaması yerine tek tuş basışıyla yapılır,
+        imleç oyuncunun elinden alınmaz. Boş bırakılırsa HP barına tıklanır.
+        
+        Args:
+            row_index (int): Satır indeksi.
+            key (str): Seçim tuşu (ör. "F2") veya boş.
+        """
+        with self._rows_lock:
+            if 0 <= row_index < self.rows.count:
+                self.rows.select_keys[row_index] = key or ""
+                logger.info(f"Satır {row_index + 1} seçim tuşu: {key or 'fare tıklaması'}")
+    
+    def set_max_frame_age(self, seconds):
+        """
+        Karar verirken kabul edilecek en eski kare yaşını ayarlar.
+        
+        Args:
+            seconds (float): Saniye cinsinden en büyük kare yaşı (0 ise kontrol kapalı).
+        """
+        self.max_frame_age = max(0.0, float(seconds))
+        logger.info(f"Maksimum kare yaşı: {self.max_frame_age * 1000:.0f} ms")
+    
+    def set_check_interval(self, seconds):
+        """
+        HP barlarının kontrol aralığını ayarlar.
+        
+        Args:
+            seconds (float): Saniye cinsinden kontrol aralığı.
+        """
+        self.check_interval = max(0.0, float(seconds))
+        logger.info(f"İyileştirme kontrol aralığı: {self.check_interval * 1000:.0f} ms")
+    
+    def apply_settings(self, settings, changed=None):
+        """
+        İyileştirme ayarlarını doğrulanmış ayar nesnesinden uygular.
+        
+        Tuşlar derlenmiş KeyChord olarak, satırlar önceden hesaplanmış kırpma dilimleriyle aktarılır.
+        Bekleme süreleri ve son iyileştirme zamanları değiştirilmez, çalışan döngüye uygulanabilir.
+        
+        Args:
+            settings (AutoHealBuffSettings): Ayarlar.
+            changed (dict, optional): AutoHealBuffSettings.changed_fields() çıktısı.
+                Verilirse yalnızca değişen alanlar uygulanır.
+        """
+        def wanted(name):
+            return changed is None or name in changed
+        
+        if wanted("heal_active"):
+            self.active = settings.heal_active
+        if wanted("heal_key"):
+            self.heal_key = settings.heal_chord or settings.heal_key
+        if wanted("heal_percentage"):
+            self.heal_percentage = settings.heal_percentage
+        if wanted("mass_heal_active"):
+            self.mass_heal_active = settings.mass_heal_active
+        if wanted("mass_heal_key"):
+            self.mass_heal_key = settings.mass_heal_chord or settings.mass_heal_key
+        if wanted("mass_heal_percentage"):
+            self.mass_heal_percentage = settings.mass_heal_percentage
+        if wanted("party_check_enabled"):
+            self.party_check_enabled = settings.party_check_enabled
+        if wanted("heal_check_interval"):
+            self.check_interval = settings.heal_check_interval / 1000.0
+        if wanted("max_frame_age"):
+            self.max_frame_age = settings.max_frame_age / 1000.0
+        if wanted("hp_smoothing"):
+            self.hp_smoothing = settings.hp_smoothing / 100.0
+        if wanted("hysteresis_band"):
+            self.hysteresis_band = float(settings.hysteresis_band)
+        
+        changed_rows = changed.get("rows", {}) if changed is not None else None
+        if changed_rows is None or changed_rows or wanted("row_count"):
+            # Döngü satırları yarım güncellenmiş görmesin: yeni tablo hazırlanıp tek atamayla değiştirilir.
+            # Son HP ve son iyileştirme zamanı korunur.
+            with self._rows_lock:
+                rows = self.rows.copy(settings.row_count)
+                for row_settings in settings.rows:
+                    if changed_rows is not None and row_settings.index not in changed_rows:
+                        continue
+                    if rows.set_row(row_settings.index, row_settings.enabled, row_settings.coords,
+                                    row_settings.select_chord, row_settings.heal_percentage):
+                        self.roi_tracker.forget(row_settings.index)
+                rows.apply_transform(self.transform)
+                self.rows = rows
+        
+        if changed is None:
+            logger.info(f"İyileştirme ayarları uygulandı: eşik %{self.heal_percentage}, tuş {self.heal_key}, "
+                        f"kontrol {self.check_interval * 1000:.0f} ms, aktif satırlar "
+                        f"{[row.index + 1 for row in settings.active_rows]}")
+        else:
+            logger.info(f"İyileştirme ayarları güncellendi: {', '.join(sorted(changed))}")
+    
+    def set_coordinate_space(self, coordinate_space):
+        """
+        Satır koordinatlarını oyun penceresinin güncel konumuna çevirecek koordinat uzayını ayarlar.
+        
+        Args:
+            coordinate_space (CoordinateSpace): Koordinat uzayı veya None (ekran koordinatı).
+        """
+        self.coordinate_space = coordinate_space
+        self._apply_transform(coordinate_space.probe() if coordinate_space else IDENTITY_TRANSFORM)
+    
+    def _apply_transform(self, transform):
+        """
+        Dönüşüm değiştiğinde tüm satırların kırpma dilimlerini ve tıklama noktalarını yeniden hesaplar.
+        
+        Args:
+            transform (CoordinateTransform): Yeni dönüşüm.
+        """
+        with self._rows_lock:
+            # Ölçek değiştiyse bar şablonları geçersizdir; yalnızca taşımada korunur
+            if (transform.scale_x, transform.scale_y) != (self.transform.scale_x, self.transform.scale_y):
+                self.roi_tracker.reset()
+            
+            rows = self.rows.copy()
+            rows.apply_transform(transform)
+            self.transform = transform
+            self.rows = rows
+        logger.info(f"Satır bölgeleri yeni pencere konumuna göre güncellendi: {transform}")
+    
+    def _relocate_rows(self, shifts):
+        """
+        Bölge takibinin bulduğu kaydırmaları satırlara uygular.
+        
+        Args:
+            shifts (dict): Satır indeksi -> (dx, dy) ek kaydırma (piksel).
+        """
+        with self._rows_lock:
+            rows = self.rows.copy()
+            for row_index, shift in shifts.items():
+                rows.shifts[row_index] += shift
+            rows.apply_transform(self.transform)
+            self.rows = rows
+        self.relocation_counter.inc(len(shifts))
+        logger.warning("Satır bölgeleri HP barlarına yeniden oturtuldu: %s",
+                       {row_index + 1: tuple(rows.shifts[row_index].tolist()) for row_index in shifts})
+    
+    def get_reaction_latency(self):
+        """
+        Yakalamadan işleme kadar geçen sürenin histogram özetini döndürür.
+        
+        Returns:
+            dict: Histogram anlık görüntüsü.
+        """
+        return self.reaction_latency.snapshot()
+    
+    def _capture_frame(self):
+        """
+        Ekran görüntüsü callback'ini çağırır ve sonucu zaman damgalı kareye dönüştürür.
+        
+        Returns:
+            Frame: Zaman damgalı kare veya yakalama başarısızsa None.
+        """
+        capture_start = time.monotonic()
+        result = self.screenshot_callback()
+        if result is None or isinstance(result, Frame):
+            return result
+        
+        # Düz görüntü döndüren callback'ler için zaman damgalarını burada ölç
+        return Frame(result, capture_start, time.monotonic())
+    
+    def _track_reaction(self, result, frame):
+        """
+        Yakalamadan işleme kadar geçen süreyi kaydeder.
+        
+        Asenkron girdi servisi Future döndürürse süre, tuş gerçekten gönderildiğinde ölçülür.
+        
+        Args:
+            result: Tuş basma callback'inin dönüş değeri (Future veya herhangi bir değer).
+            frame (Frame): Kararın dayandığı kare.
+        """
+        if hasattr(result, "add_done_callback"):
+            # Süresi dolup iptal edilen girdiler gönderilmemiştir
+            result.add_done_callback(
+                lambda future: future.cancelled() or self.reaction_latency.observe(frame.age()))
+        else:
+            self.reaction_latency.observe(frame.age())
+    
+    @staticmethod
+    def _is_pending(result):
+        """
+        Tuş basma callback'inin döndürdüğü işlemin hâlâ kuyrukta olup olmadığını döndürür.
+        
+        Args:
+            result: Callback'in dönüş değeri (Future veya herhangi bir değer).
+        
+        Returns:
+            bool: Asenkron işlem henüz tamamlanmadıysa True.
+        """
+        return hasattr(result, "done") and not result.done()
     
     def _run_loop(self):
         """İyileştirme döngüsünü çalıştırır."""
@@ -212,56 +466,120 @@ class HealHelper:
                     continue
                 
                 self.last_check_time = current_time
+                iteration_start = time.perf_counter()
+                
+                # Oyun penceresi taşındıysa veya boyutu değiştiyse satır bölgelerini yeniden hesapla
+                if self.coordinate_space is not None:
+                    transform = self.coordinate_space.probe()
+                    if transform is not self.transform:
+                        self._apply_transform(transform)
                 
                 # Ekran görüntüsü al
-                screenshot = self.screenshot_callback()
+                with tracer.span("capture", "heal"):
+                    frame = self._capture_frame()
+                if frame is None:
+                    raise RuntimeError("Ekran görüntüsü alınamadı")
                 
-                # Her satırı kontrol et
-                low_hp_rows = 0
-                for row_index, row in enumerate(self.rows):
-                    if not row["active"] or len(row["coords"]) != 4:
-                        continue
-                    
-                    # Satır koordinatlarını al
-                    x1, y1, x2, y2 = row["coords"]
-                    
-                    # HP barını kırp
-                    # NumPy dizisini direkt dilimleyerek kırpma işlemi yap
-                    hp_bar = screenshot[y1:y2, x1:x2]
-                    
-                    # Eğer gerekiyorsa PIL.Image'e dönüştür
-                    if not isinstance(hp_bar, Image.Image):
-                        hp_bar = Image.fromarray(hp_bar)
+                # Yakalama takıldıysa eski kareye göre karar verme
+                if frame.is_stale(self.max_frame_age):
+                    self.stale_frame_count += 1
+                    self.stale_frame_counter.inc()
+                    logger.debug("Eski kare reddedildi (yaş: %.0f ms).", frame.age() * 1000)
+                    continue
+                
+                screenshot = frame.image
+                
+                # Adım boyunca tablo değiştirilemez (bkz. _rows_lock)
+                with self._rows_lock:
+                    rows = self.rows
+                    now = time.monotonic()
                     
-                    # HP yüzdesini hesapla
-                    hp_percentage = self._calculate_hp_percentage(hp_bar)
+                    # Aktif satırların HP'sini oku
+                    lost_rows = []
+                    enabled_rows = np.flatnonzero(rows.enabled).tolist()
+                    readings = np.full(rows.count, np.nan)
+                    for row_index in enabled_rows:
+                        # HP barını kırp
+                        analysis_start = time.monotonic()
+                        with tracer.span("crop", "heal"):
+                            # NumPy dizisini önceden hesaplanmış dilimlerle kırp
+                            hp_bar = screenshot[rows.rois[row_index]]
+                            
+                            # Bölge bar üzerinde değilse (panel kaydı) HP %0 okunur: bu satır için karar verme
+                            if self.roi_tracking:
+                                if not is_on_bar(hp_bar, self.roi_tracker.empty_color):
+                                    lost_rows.append(row_index)
+                                    continue
+                                self.roi_tracker.remember(row_index, screenshot, rows.rects[row_index].tolist())
+                        
+                        # HP yüzdesini ve okumanın güvenini kırpılan NumPy görünümünden hesapla (PIL dönüşümü yok)
+                        with tracer.span("classify", "heal"):
+                            previous = rows.last_reading[row_index]
+                            reading = self._read_hp(hp_bar, None if np.isnan(previous) else previous)
+                        self.analysis_time.observe(time.monotonic() - analysis_start)
+                        rows.last_reading[row_index] = reading.percentage
+                        rows.confidence[row_index] = reading.confidence
+                        
+                        # Güveni düşük okumalar (örtülmüş bar) karar için kullanılmaz
+                        if reading.confidence < self.min_confidence:
+                            self.low_confidence_counter.inc()
+                            logger.debug("Satır %d okuması yok sayıldı: %s", row_index + 1, reading)
+                            continue
+                        readings[row_index] = reading.percentage
                     
-                    # Değerleri güncelle
-                    row["last_hp_percentage"] = hp_percentage
+                    # Okumaları tüm satırlar için birlikte yumuşat, eşik durumlarını histerezisle güncelle
+                    with tracer.span("decide", "heal"):
+                        valid = rows.update_hp(readings, self.hp_smoothing, HP_STEP)
+                        heal_thresholds = np.where(rows.heal_thresholds > 0, rows.heal_thresholds, self.heal_percentage)
+                        rows.low = rows.below(rows.low, heal_thresholds, self.hysteresis_band, valid)
+                        rows.mass_low = rows.below(rows.mass_low, self.mass_heal_percentage, self.hysteresis_band, valid)
+                        low_hp_rows = int(np.count_nonzero(valid & rows.mass_low))
+                        heal_rows = np.flatnonzero(valid & rows.low & (now - rows.last_heal_time >= self.heal_cooldown))
                     
-                    # Düşük HP kontrolü
-                    if hp_percentage <= self.heal_percentage:
-                        low_hp_rows += 1
-                        
-                        # Tek iyileştirme yapılacaksa
-                        if self.active:
-                            heal_time_diff = (current_time - row["last_heal_time"]).total_seconds()
+                    # Tek iyileştirme: eşiğin altında ve bekleme süresi dolmuş satırlar
+                    if self.active:
+                        for row_index in heal_rows.tolist():
+                            # Analiz sırasında kare eskidiyse işlem yapma
+                            if frame.is_stale(self.max_frame_age):
+                                self.stale_frame_count += 1
+                                self.stale_frame_counter.inc()
+                                logger.debug("Satır %d için eski kareye göre iyileştirme reddedildi.", row_index + 1)
+                                break
+                            
+                            # Önceki iyileştirme hâlâ kuyruktaysa ikincisini ekleme
+                            if self._is_pending(self._pending_heals.get(row_index)):
+                                logger.debug("Satır %d için önceki iyileştirme henüz gönderilmedi.", row_index + 1)
+                                continue
                             
-                            # Bekleme süresi dolmuşsa iyileştir
-                            if heal_time_diff >= self.heal_cooldown:
-                                # Ortaya tıkla
-                                center_x = (x1 + x2) // 2
-                                center_y = (y1 + y2) // 2
-                                self.click_callback(center_x, center_y)
-                                
-                                # İyileştirme tuşuna bas
-                                time.sleep(0.1)  # Biraz bekle
-                                self.key_press_callback(self.heal_key)
-                                
-                                # Son iyileştirme zamanını güncelle
-                                row["last_heal_time"] = current_time
-                                
-                                logging.info(f"Satır {row_index + 1} iyileştirildi (HP: %{hp_percentage}).")
+                            if rows.select_keys[row_index]:
+                                # Parti üyesini tuşla seç
+                                with tracer.span("key", "heal"):
+                                    self.key_press_callback(rows.select_keys[row_index])
+                            else:
+                                # Seçim tuşu yoksa ortaya tıkla
+                                center_x, center_y = rows.centers[row_index].tolist()
+                                with tracer.span("click", "heal"):
+                                    self.click_callback(center_x, center_y)
+                            
+                            # İyileştirme tuşuna bas (tıklama sonrası bekleme girdi servisinde yapılır)
+                            with tracer.span("key", "heal"):
+                                result = self.key_press_callback(self.heal_key)
+                            self._track_reaction(result, frame)
+                            self._pending_heals[row_index] = result
+                            
+                            # Son iyileştirme zamanını güncelle
+                            rows.last_heal_time[row_index] = now
+                            self.heal_count.inc()
+                            
+                            logger.info("Satır %d iyileştirildi (HP: %%%.1f).", row_index + 1, rows.last_hp[row_index])
+                    
+                    # Konumu kaybolan satırları arayıp sonraki adım için yeniden oturt
+                    if lost_rows:
+                        self.lost_row_counter.inc(len(lost_rows))
+                        with tracer.span("relocate", "heal"):
+                            shifts = self.roi_tracker.relocate(screenshot, rows.rects, enabled_rows, lost_rows, now)
+                        if shifts:
+                            self._relocate_rows(shifts)
                 
                 # Toplu iyileştirme kontrolü
                 if self.mass_heal_active and low_hp_rows > 0:
@@ -269,29 +587,42 @@ class HealHelper:
                     
                     # Parti kontrolü aktifse ve birden fazla düşük HP satırı varsa veya
                     # Parti kontrolü aktif değilse ve en az bir düşük HP satırı varsa
-                    if ((self.party_check_enabled and low_hp_rows >= 2) or 
+                    if ((self.party_check_enabled and low_hp_rows >= 2) or
                         (not self.party_check_enabled and low_hp_rows >= 1)):
                         
-                        # Bekleme süresi dolmuşsa toplu iyileştir
-                        if mass_heal_time_diff >= self.mass_heal_cooldown:
+                        # Bekleme süresi dolmuşsa ve kare hâlâ tazeyse toplu iyileştir
+                        if (mass_heal_time_diff >= self.mass_heal_cooldown and
+                                not frame.is_stale(self.max_frame_age) and
+                                not self._is_pending(self._pending_mass_heal)):
                             # Toplu iyileştirme tuşuna bas
-                            self.key_press_callback(self.mass_heal_key)
+                            with tracer.span("key", "heal"):
+                                result = self.key_press_callback(self.mass_heal_key)
+                            self._track_reaction(result, frame)
+                            self._pending_mass_heal = result
                             
                             # Son toplu iyileştirme zamanını güncelle
                             self.last_mass_heal_time = current_time
+                            self.mass_heal_count.inc()
                             
-                            logging.info(f"Toplu iyileştirme yapıldı ({low_hp_rows} satır düşük HP).")
+                            logger.info("Toplu iyileştirme yapıldı (%d satır düşük HP).", low_hp_rows)
+                
+                # Adım ölçümlerini kaydet (yakalama başlangıcından kararların sonuna kadar)
+                self.low_hp_rows_gauge.set(low_hp_rows)
+                self.iteration_time.observe(time.monotonic() - frame.capture_start)
+                self.iteration_count.inc()
+                tracer.add("iteration", iteration_start, category="heal")
                 
                 # Hata sayacını sıfırla, başarılı işlem
                 self.error_count = 0
-                
+            
             except Exception as e:
                 self.error_count += 1
-                logging.error(f"İyileştirme döngüsünde hata: {e}")
+                self.loop_error_count.inc()
+                logger.error("İyileştirme döngüsünde hata: %s", e)
                 
                 # Çok fazla hata varsa durdur
                 if self.error_count >= self.max_errors:
-                    logging.critical(f"Çok fazla hata oluştu ({self.error_count}), döngü durduruluyor.")
+                    logger.critical("Çok fazla hata oluştu (%d), döngü durduruluyor.", self.error_count)
                     self.running = False
                     break
                 
@@ -308,33 +639,26 @@ class HealHelper:
         Returns:
             float: HP yüzdesi (0-100 arası).
         """
+        # Eğer gelen görüntü PIL.Image ise NumPy dizisine dönüştür
+        if isinstance(hp_bar_image, Image.Image):
+            hp_bar_image = np.array(hp_bar_image)
+        return self._read_hp(hp_bar_image).percentage
+    
+    def _read_hp(self, hp_bar_image, previous=None):
+        """
+        HP barından HP yüzdesini ve okumanın güvenini hesaplar.
+        
+        Args:
+            hp_bar_image (numpy.ndarray): Ekran görüntüsünden kırpılan HP barı.
+            previous (float, optional): Aynı satırın önceki okuması (yüzde).
+        
+        Returns:
+            HpReading: Okuma; hata durumunda yüzde 100 ve güven 0 (karar verilmez).
+        """
         try:
-            # Eğer gelen görüntü PIL.Image ise NumPy dizisine dönüştür
-            if isinstance(hp_bar_image, Image.Image):
-                img_array = np.array(hp_bar_image)
-            else:
-                # Zaten NumPy dizisi
-                img_array = hp_bar_image
-            
-            # Kırmızı piksel maskeleme (HP barı genellikle kırmızıdır)
-            # RGB değerleri için eşik değerleri
-            red_mask = (img_array[:, :, 0] > 150) & (img_array[:, :, 1] < 100) & (img_array[:, :, 2] < 100)
-            
-            # Toplam piksel sayısı ve kırmızı piksel sayısı
-            total_pixels = red_mask.size
-            red_pixels = np.sum(red_mask)
-            
-            # HP yüzdesi hesapla
-            if total_pixels > 0:
-                hp_percentage = (red_pixels / total_pixels) * 100
-            else:
-                hp_percentage = 0
-            
-            # Sınırlandırma (0-100 arası)
-            hp_percentage = max(0, min(100, hp_percentage))
-            
-            return hp_percentage
-            
+            # Kırmızı piksel oranı (HP barı genellikle kırmızıdır) ve güven, bkz. core/hp_analyzer.py
+            return read_hp(hp_bar_image, previous)
+        
         except Exception as e:
-            logging.error(f"HP yüzdesi hesaplanırken hata: {e}")
-            return 100  # Hata durumunda güvenli değer 
\ No newline at end of file
+            logger.error("HP yüzdesi hesaplanırken hata: %s", e)
+            return HpReading(100.0, 0.0)  # Hata durumunda güvenli değer, güven 0
\ No newline at end of file
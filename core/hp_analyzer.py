@@ -0,0 +1,341 @@
+"""
+Knight Online Otomatik İyileştirme ve Buff Sistemi - HP Barı Analizcileri
+Bu modül, kırpılmış bir HP barı görüntüsünden HP yüzdesini hesaplayan alternatif yöntemleri içerir.
+Tüm analizciler RGB NumPy dizisi alır ve 0-100 arası yüzde döndürür.
+
+read_hp() yüzdeyle birlikte okumanın güvenini de hesaplar: bar üzerine gelen ipucu kutusu, sohbet
+penceresi veya imleç düşük HP gibi okunur, ancak güveni düşürür.
+"""
+
+import numpy as np
+from PIL import Image
+
+# Bir pikselin HP barına ait sayılması için eşikler
+RED_MIN = 150
+GREEN_MAX = 100
+BLUE_MAX = 100
+
+# Boş (kaybedilmiş HP) bar kısmı: rengi arayüze göre değişir (siyah, gri, koyu kırmızı), bu yüzden sabit
+# değil barın kendisinden örneklenir. Örneklenen renk en parlak kanalında bu değeri aşmamalı (ipucu kutusu,
+# kahverengi çerçeve gibi açık renkler boş bar sayılmaz).
+EMPTY_MAX_BRIGHTNESS = 100
+
+# Boş bar rengine kanal başına izin verilen fark; örnekteki gürültü daha büyükse ona göre genişletilir,
+# en fazla EMPTY_MAX_TOLERANCE
+EMPTY_TOLERANCE = 12
+EMPTY_MAX_TOLERANCE = 40
+
+# Okuma güveni: geçmişle tutarsızlığın güveni en fazla ne kadar düşürebileceği
+HISTORY_WEIGHT = 0.3
+
+# Boş bar rengi örneklenirken dolu kısmın sağında incelenen sütun sayısı
+BAR_END_COLUMNS = 2
+
+def _red_mask(img_array):
+    return (img_array[..., 0] > RED_MIN) & (img_array[..., 1] < GREEN_MAX) & (img_array[..., 2] < BLUE_MAX)
+
+def filled_mask(img_array):
+    """
+    Dolu HP rengindeki pikselleri işaretler.
+    
+    Args:
+        img_array (numpy.ndarray): RGB veya RGBA görüntü.
+    
+    Returns:
+        numpy.ndarray: Görüntüyle aynı yükseklik ve genişlikte bool maske.
+    """
+    return _red_mask(img_array)
+
+class EmptyColor:
+    """
+    Barın boş kısmının örneklenmiş rengi ve kabul toleransı.
+    
+    Tüm parti barları aynı boş rengi kullandığından bir kez örneklenen renk (ör. algılama sırasında)
+    satırlar arasında paylaşılabilir.
+    """
+    
+    __slots__ = ("color", "tolerance", "_low", "_span")
+    
+    def __init__(self, color, tolerance=EMPTY_TOLERANCE):
+        """
+        EmptyColor sınıfını başlatır.
+        
+        Args:
+            color (tuple): (R, G, B) boş bar rengi.
+            tolerance (int): Kanal başına izin verilen fark.
+        """
+        color = np.asarray(color, dtype=np.int16)[:3]
+        self.color = tuple(color.tolist())
+        self.tolerance = int(tolerance)
+        # Kanal başına [alt, alt + genişlik] aralığı; uint8 taşmasıyla tek karşılaştırmada denetlenir
+        low = np.maximum(color - self.tolerance, 0)
+        self._low = low.astype(np.uint8)
+        self._span = (np.minimum(color + self.tolerance, 255) - low).astype(np.uint8)
+    
+    @classmethod
+    def sample(cls, pixels):
+        """
+        Boş bar kısmından alınmış piksellerden rengi örnekler.
+        
+        Renk piksellerin ortancasıdır; tolerans en az örnekteki en büyük sapma (gürültü) kadardır.
+        
+        Args:
+            pixels (numpy.ndarray): (N, 3) veya (N, 4) boyutunda piksel dizisi.
+        
+        Returns:
+            EmptyColor: Örneklenen renk veya piksel yoksa ya da renk boş bar için fazla parlaksa None.
+        """
+        if len(pixels) == 0:
+            return None
+        pixels = np.sort(np.asarray(pixels)[:, :3].astype(np.int16), axis=0)
+        color = pixels[len(pixels) // 2]
+        if color.max() > EMPTY_MAX_BRIGHTNESS:
+            return None
+        spread = int(max((color - pixels[0]).max(), (pixels[-1] - color).max()))
+        return cls(color, min(max(EMPTY_TOLERANCE, spread), EMPTY_MAX_TOLERANCE))
+    
+    def mask(self, img_array):
+        """
+        Boş bar rengindeki pikselleri işaretler.
+        
+        Args:
+            img_array (numpy.ndarray): uint8 RGB veya RGBA görüntü.
+        
+        Returns:
+            numpy.ndarray: Görüntüyle aynı yükseklik ve genişlikte bool maske.
+        """
+        mask = img_array[..., 0] - self._low[0] <= self._span[0]
+        mask &= img_array[..., 1] - self._low[1] <= self._span[1]
+        mask &= img_array[..., 2] - self._low[2] <= self._span[2]
+        return mask
+    
+    def __eq__(self, other):
+        if isinstance(other, EmptyColor):
+            return self.color == other.color and self.tolerance == other.tolerance
+        return NotImplemented
+    
+    def __hash__(self):
+        return hash((self.color, self.tolerance))
+    
+    def __repr__(self):
+        return f"EmptyColor({self.color}, ±{self.tolerance})"
+
+def _sample_empty(img_array, filled, edge):
+    # Dolu kısmın bittiği sütundan itibaren BAR_END_COLUMNS sütundaki dolu olmayan pikselleri örnekler
+    if edge >= filled.shape[1]:
+        return None
+    window = slice(edge, edge + BAR_END_COLUMNS)
+    return EmptyColor.sample(img_array[:, window][~filled[:, window]])
+
+def empty_color_of(img_array, filled=None):
+    """
+    Kırpılmış bir HP barının boş rengini dolu kısmın hemen sağından örnekler.
+    
+    Barın sağ ucu yerine dolu kısmın bittiği yer örneklendiğinden sağ uca gelen imleç veya ipucu kutusu
+    boş renk sayılmaz (ve bar saflığını düşürür).
+    
+    Args:
+        img_array (numpy.ndarray): HP barı görüntüsü.
+        filled (numpy.ndarray, optional): Önceden hesaplanmış dolu piksel maskesi.
+    
+    Returns:
+        EmptyColor: Örneklenen renk veya bar tam doluysa (ya da dolu kısmın sağı boş bar rengi değilse) None.
+    """
+    if img_array.ndim != 3 or img_array.shape[0] == 0 or img_array.shape[1] == 0:
+        return None
+    if filled is None:
+        filled = _red_mask(img_array)
+    return _sample_empty(img_array, filled, int(round(np.count_nonzero(filled) / filled.shape[0])))
+
+def bar_mask(img_array, empty_color=None):
+    """
+    Bar rengindeki (dolu veya boş kısım) pikselleri işaretler.
+    
+    Args:
+        img_array (numpy.ndarray): RGB veya RGBA görüntü.
+        empty_color (EmptyColor, optional): Boş bar rengi; verilmezse yalnızca dolu kısım işaretlenir.
+    
+    Returns:
+        numpy.ndarray: Görüntüyle aynı yükseklik ve genişlikte bool maske.
+    """
+    if empty_color is None:
+        return _red_mask(img_array)
+    return _red_mask(img_array) | empty_color.mask(img_array)
+
+def bar_coverage(img_array, empty_color=None):
+    """
+    Bölgedeki bar rengindeki piksellerin oranını döndürür.
+    
+    Bölge bir HP barının üzerindeyse HP ne olursa olsun oran yüksektir (dolu ve boş kısım birlikte);
+    bar kaydıysa veya bölge başka bir şeyin üzerindeyse düşer.
+    
+    Args:
+        img_array (numpy.ndarray): Kırpılmış RGB veya RGBA görüntü.
+        empty_color (EmptyColor, optional): Boş bar rengi; verilmezse dolu kısmın sağından örneklenir.
+    
+    Returns:
+        float: 0-1 arası oran (boş bölge için 0).
+    """
+    if img_array.size == 0:
+        return 0.0
+    if empty_color is None:
+        empty_color = empty_color_of(img_array)
+    return float(np.count_nonzero(bar_mask(img_array, empty_color))) / (img_array.shape[0] * img_array.shape[1])
+
+def red_pixel_ratio(img_array):
+    """
+    Kırmızı piksellerin tüm piksellere oranını döndürür (iyileştirme döngüsünün kullandığı yöntem).
+    
+    Args:
+        img_array (numpy.ndarray): HP barı görüntüsü.
+    
+    Returns:
+        float: HP yüzdesi (0-100 arası).
+    """
+    red_mask = _red_mask(img_array)
+    total_pixels = red_mask.size
+    if total_pixels == 0:
+        return 0.0
+    return max(0.0, min(100.0, np.count_nonzero(red_mask) * 100.0 / total_pixels))
+
+def red_pixel_ratio_pil(img_array):
+    """
+    red_pixel_ratio ile aynı hesap, ancak kırpılan bölge önce PIL.Image'e dönüştürülüp geri alınır.
+    Eski iyileştirme döngüsündeki gidiş-dönüşün maliyetini ölçmek için tutulur.
+    
+    Args:
+        img_array (numpy.ndarray): HP barı görüntüsü.
+    
+    Returns:
+        float: HP yüzdesi (0-100 arası).
+    """
+    return red_pixel_ratio(np.array(Image.fromarray(img_array)))
+
+def middle_row_ratio(img_array):
+    """
+    Yalnızca barın orta satırındaki kırmızı piksellerin oranını döndürür.
+    HP barı soldan sağa dolduğu için tek satır yeterlidir; maliyet bar yüksekliğinden bağımsızdır.
+    
+    Args:
+        img_array (numpy.ndarray): HP barı görüntüsü.
+    
+    Returns:
+        float: HP yüzdesi (0-100 arası).
+    """
+    if img_array.shape[0] == 0 or img_array.shape[1] == 0:
+        return 0.0
+    row = img_array[img_array.shape[0] // 2]
+    return np.count_nonzero(_red_mask(row)) * 100.0 / row.shape[0]
+
+def fill_extent(img_array):
+    """
+    Orta satırdaki en sağdaki kırmızı pikselin konumundan doluluk oranını döndürür.
+    Bar içindeki tek tük bozuk pikseller sonucu etkilemez.
+    
+    Args:
+        img_array (numpy.ndarray): HP barı görüntüsü.
+    
+    Returns:
+        float: HP yüzdesi (0-100 arası).
+    """
+    if img_array.shape[0] == 0 or img_array.shape[1] == 0:
+        return 0.0
+    mask = _red_mask(img_array[img_array.shape[0] // 2])
+    red_columns = np.flatnonzero(mask)
+    if red_columns.size == 0:
+        return 0.0
+    return (red_columns[-1] + 1) * 100.0 / mask.shape[0]
+
+class HpReading:
+    """
+    Bir HP barı okuması: yüzde ve 0-1 arası güven.
+    
+    Güven üç ölçütün çarpımıdır:
+        purity: Bar rengindeki (dolu veya dolu kısmın sağından örneklenen boş renk) piksellerin oranı;
+            üstü örtülen bar düşük çıkar.
+        integrity: Dolu kısmın barın sol kenarından başlayan tek parça olması. Boş kısmın rengi
+            (siyah, gri, koyu kırmızı) bütünlüğü etkilemez.
+        consistency: Önceki okumaya yakınlık; büyük sıçramalar güveni en fazla HISTORY_WEIGHT kadar düşürür.
+    """
+    
+    __slots__ = ("percentage", "confidence", "purity", "integrity", "consistency")
+    
+    def __init__(self, percentage, confidence, purity=0.0, integrity=0.0, consistency=0.0):
+        self.percentage = percentage
+        self.confidence = confidence
+        self.purity = purity
+        self.integrity = integrity
+        self.consistency = consistency
+    
+    def __repr__(self):
+        return (f"HpReading(%{self.percentage:.1f}, güven {self.confidence:.2f}: saflık {self.purity:.2f}, "
+                f"bütünlük {self.integrity:.2f}, tutarlılık {self.consistency:.2f})")
+
+def read_hp(img_array, previous=None):
+    """
+    HP yüzdesini (red_pixel_ratio ile aynı) ve okumanın güvenini hesaplar.
+    
+    Args:
+        img_array (numpy.ndarray): HP barı görüntüsü.
+        previous (float, optional): Aynı barın önceki okuması (yüzde), yoksa None.
+    
+    Returns:
+        HpReading: Okuma; görüntü boşsa güven 0.
+    """
+    if img_array.ndim != 3 or img_array.shape[0] == 0 or img_array.shape[1] == 0:
+        return HpReading(0.0, 0.0)
+    
+    filled = _red_mask(img_array)
+    width = filled.shape[1]
+    bar_pixels = np.count_nonzero(filled)
+    percentage = bar_pixels * 100.0 / filled.size
+    
+    # Dolu kısım soldan başlayan tek parça olmalı: sütun doluluğu basamak işlevine ne kadar uyuyor?
+    columns = filled.mean(axis=0)
+    edge = int(round(columns.sum()))
+    step = (columns[:edge].sum() + (1.0 - columns[edge:]).sum()) / width
+    
+    # Boş kısım dolu kısmın sağındadır; dolu ve boş renk ayrık olduğundan sayılar toplanabilir
+    empty_color = _sample_empty(img_array, filled, edge)
+    if empty_color is not None:
+        bar_pixels += np.count_nonzero(empty_color.mask(img_array[:, edge:]))
+    purity = bar_pixels / filled.size
+    
+    # Sol uç: HP varsa ilk sütun dolu, HP %0 ise ilk sütun boş bar renginde olmalı
+    if edge > 0:
+        left = columns[0]
+    else:
+        left = empty_color.mask(img_array[:, :1]).mean() if empty_color is not None else 0.0
+    integrity = float(step * left)
+    
+    consistency = 1.0 if previous is None else 1.0 - min(1.0, abs(percentage - previous) / 100.0)
+    confidence = purity * integrity * (1.0 - HISTORY_WEIGHT * (1.0 - consistency))
+    return HpReading(percentage, confidence, purity, integrity, consistency)
+
+# Analizci adı -> işlev
+ANALYZERS = {
+    "red_pixel_ratio": red_pixel_ratio,
+    "red_pixel_ratio_pil": red_pixel_ratio_pil,
+    "middle_row_ratio": middle_row_ratio,
+    "fill_extent": fill_extent
+}
+
+# İyileştirme döngüsünde kullanılan analizci
+DEFAULT_ANALYZER = "red_pixel_ratio"
+
+def get_analyzer(name):
+    """
+    Adı verilen analizciyi döndürür.
+    
+    Args:
+        name (str): Analizci adı (ANALYZERS anahtarlarından biri).
+    
+    Returns:
+        function: Analizci işlevi.
+    
+    Raises:
+        ValueError: Analizci adı bilinmiyorsa.
+    """
+    if name not in ANALYZERS:
+        raise ValueError(f"Bilinmeyen HP analizcisi: {name}")
+    return ANALYZERS[name]
@@ -0,0 +1,226 @@
+"""
+Knight Online Otomatik İyileştirme ve Buff Sistemi - Parti HP Barı Algılayıcı
+Bu modül, tek bir ekran görüntüsünde parti üyelerinin HP barlarını bulur ve her satır için
+koordinat önerir; böylece koordinatlar satır satır elle alınmak zorunda kalmaz.
+
+Yöntem:
+    1. Görüntü adımlı görünümle (kopyasız) küçültülür. Boş bar rengi (siyah, gri, koyu kırmızı olabilir)
+       dolu kısmın bittiği kenarların sağından örneklenir ve her piksel bar rengi (dolu HP kırmızısı veya
+       boş bar rengi) olarak sınıflandırılır.
+    2. Her satırdaki yatay bar rengi dizileri (run-length) NumPy ile tek seferde çıkarılır.
+    3. Art arda satırlarda aynı aralıktaki diziler dikdörtgenlerde birleştirilir; kenarları bar
+       rengi olmayan piksellerle çevrili, geniş ve ince dikdörtgenler bar adayıdır.
+    4. Adaylar tam çözünürlükte kenarlarına oturtulur, aynı sütunda hizalanan en kalabalık grup
+       parti listesi kabul edilir ve yukarıdan aşağı sıralanır.
+"""
+
+import logging
+import numpy as np
+
+from config.schema import ROW_COUNT
+from core.hp_analyzer import EmptyColor, bar_mask, filled_mask
+
+# Logging yapılandırması
+logger = logging.getLogger("PartyDetector")
+
+# Bar boyut sınırları (tam çözünürlükte piksel)
+MIN_BAR_WIDTH = 40
+MIN_BAR_HEIGHT = 3
+MAX_BAR_HEIGHT = 40
+MIN_ASPECT_RATIO = 4.0
+
+# Küçültme adımı (piksel); en ince barda en az bir satır örneklenecek şekilde seçilir
+DEFAULT_STEP = 2
+
+# Aynı sütundaki barların sol ve sağ kenarları arasındaki izin verilen fark (piksel)
+COLUMN_TOLERANCE = 4
+
+# Gürültü veya kenar yumuşatması yüzünden bar içinde oluşan bu genişliğe kadar boşluklar doldurulur (küçültülmüş piksel)
+MAX_GAP = 2
+
+def estimate_empty_color(image, step=DEFAULT_STEP):
+    """
+    Ekrandaki kısmen dolu HP barlarından boş bar rengini örnekler.
+    
+    Dolu kısmın bittiği her kenarın sağındaki sütun aday örnektir. Kenar barın değil başka bir şeyin
+    sonuysa (tam dolu barın ucu, kırmızı yazı) sağındaki renk barın üstündeki ve altındaki zeminle
+    aynı renktedir; bu adaylar elenir, böylece zemin rengi boş bar sayılmaz.
+    
+    Args:
+        image (numpy.ndarray): RGB veya RGBA ekran görüntüsü.
+        step (int): Küçültme adımı (piksel).
+    
+    Returns:
+        EmptyColor: Örneklenen renk veya kısmen dolu bar yoksa None.
+    """
+    small = image[::step, ::step]
+    filled = filled_mask(small)
+    
+    # Dolu dizilerin üst satırındaki sağ kenarlar: sağındaki iki piksel dolu değil
+    edges = filled[:, :-2] & ~filled[:, 1:-1] & ~filled[:, 2:]
+    edges[1:] &= ~filled[:-1, :-2]
+    
+    samples = []
+    for top, column in zip(*np.nonzero(edges)):
+        run = filled[top:, column]
+        if top == 0 or run.all():
+            continue
+        bottom = top + int(np.argmin(run))
+        pixels = small[top:bottom, column + 2, :3]
+        candidate = EmptyColor.sample(pixels)
+        if candidate is not None and not candidate.mask(small[[top - 1, bottom], column + 2]).any():
+            samples.append(pixels)
+    return EmptyColor.sample(np.concatenate(samples)) if samples else None
+
+def _close_gaps(mask, max_gap=MAX_GAP):
+    """
+    Her satırda iki yanında max_gap mesafe içinde bar pikseli bulunan boşlukları doldurur.
+    
+    Returns:
+        numpy.ndarray: Boşlukları doldurulmuş maske.
+    """
+    counts = np.zeros((mask.shape[0], mask.shape[1] + 1), dtype=np.int32)
+    np.cumsum(mask, axis=1, out=counts[:, 1:])
+    width = mask.shape[1]
+    columns = np.arange(width)
+    
+    # Sütunun solundaki ve sağındaki max_gap genişliğinde pencerelerde bar pikseli var mı?
+    left_start = np.maximum(columns - max_gap, 0)
+    right_end = np.minimum(columns + max_gap + 1, width)
+    has_left = counts[:, columns] - counts[:, left_start] > 0
+    has_right = counts[:, right_end] - counts[:, columns + 1] > 0
+    return mask | (has_left & has_right)
+
+def _horizontal_runs(mask):
+    """
+    Maskedeki yatay dizileri çıkarır.
+    
+    Returns:
+        tuple: (satır, başlangıç sütunu, bitiş sütunu) dizileri; bitiş dahil değildir.
+    """
+    padded = np.zeros((mask.shape[0], mask.shape[1] + 2), dtype=np.int8)
+    padded[:, 1:-1] = mask
+    edges = np.diff(padded, axis=1)
+    # np.nonzero satır öncelikli sıralar: her başlangıcın ardından aynı satırdaki bitişi gelir
+    start_rows, starts = np.nonzero(edges == 1)
+    _, ends = np.nonzero(edges == -1)
+    return start_rows, starts, ends
+
+def _merge_runs(rows, starts, ends):
+    """
+    Art arda satırlarda aynı aralıktaki dizileri dikdörtgenlerde birleştirir.
+    
+    Returns:
+        list: [ilk satır, son satır, başlangıç, bitiş] listeleri (küçültülmüş koordinatlarda).
+    """
+    rects = []
+    open_rects = []
+    for row, start, end in zip(rows.tolist(), starts.tolist(), ends.tolist()):
+        # Önceki satırda bitmeyen dikdörtgenler kapanır
+        open_rects = [rect for rect in open_rects if rect[1] >= row - 1]
+        for rect in open_rects:
+            if rect[1] == row - 1 and abs(rect[2] - start) <= MAX_GAP and abs(rect[3] - end) <= MAX_GAP:
+                rect[1] = row
+                break
+        else:
+            rect = [row, row, start, end]
+            rects.append(rect)
+            open_rects.append(rect)
+    return rects
+
+def _refine(image, coords, step, empty_color):
+    """
+    Küçültülmüş görüntüde bulunan dikdörtgeni tam çözünürlükte bar kenarlarına oturtur.
+    
+    Returns:
+        tuple: (x1, y1, x2, y2) veya bar doğrulanamazsa None.
+    """
+    x1, y1, x2, y2 = coords
+    height, width = image.shape[:2]
+    wx1, wy1 = max(0, x1 - step), max(0, y1 - step)
+    wx2, wy2 = min(width, x2 + step), min(height, y2 + step)
+    mask = bar_mask(image[wy1:wy2, wx1:wx2], empty_color)
+    
+    # Bar satırları ve sütunları: bar genişliğinin / yüksekliğinin yarısından fazlası bar rengi
+    bar_rows = np.flatnonzero(mask.sum(axis=1) * 2 > (x2 - x1))
+    if bar_rows.size == 0:
+        return None
+    bar_columns = np.flatnonzero(mask[bar_rows[0]:bar_rows[-1] + 1].sum(axis=0) * 2 > bar_rows.size)
+    if bar_columns.size == 0:
+        return None
+    return (wx1 + int(bar_columns[0]), wy1 + int(bar_rows[0]),
+            wx1 + int(bar_columns[-1]) + 1, wy1 + int(bar_rows[-1]) + 1)
+
+def _is_bar(coords):
+    x1, y1, x2, y2 = coords
+    width, height = x2 - x1, y2 - y1
+    return (width >= MIN_BAR_WIDTH and MIN_BAR_HEIGHT <= height <= MAX_BAR_HEIGHT
+            and width >= height * MIN_ASPECT_RATIO)
+
+def detect_bars(image, step=DEFAULT_STEP, empty_color=None):
+    """
+    Görüntüdeki tüm HP barı adaylarını bulur.
+    
+    Args:
+        image (numpy.ndarray): RGB veya RGBA ekran görüntüsü.
+        step (int): Küçültme adımı (piksel).
+        empty_color (EmptyColor, optional): Boş bar rengi; verilmezse görüntüden örneklenir.
+    
+    Returns:
+        list: (x1, y1, x2, y2) bar koordinatları, yukarıdan aşağı sıralı.
+    """
+    if empty_color is None:
+        empty_color = estimate_empty_color(image, step)
+    mask = _close_gaps(bar_mask(image[::step, ::step], empty_color))
+    rows, starts, ends = _horizontal_runs(mask)
+    
+    # Bar olamayacak kadar kısa diziler birleştirmeden önce elenir
+    keep = (ends - starts) * step >= MIN_BAR_WIDTH
+    rects = _merge_runs(rows[keep], starts[keep], ends[keep])
+    
+    bars = []
+    for first_row, last_row, start, end in rects:
+        if (last_row - first_row + 1) * step > MAX_BAR_HEIGHT + 2 * step:
+            continue
+        coords = _refine(image, (start * step, first_row * step, end * step, (last_row + 1) * step), step, empty_color)
+        if coords is not None and _is_bar(coords) and coords not in bars:
+            bars.append(coords)
+    
+    bars.sort(key=lambda coords: (coords[1], coords[0]))
+    return bars
+
+def detect_party_rows(image, max_rows=ROW_COUNT, step=DEFAULT_STEP, empty_color=None):
+    """
+    Parti üyelerinin HP barlarını bulur.
+    
+    Aynı sütunda (sol ve sağ kenarı hizalı) en çok bar içeren grup parti listesi kabul edilir;
+    eşitlikte daha geniş barlar tercih edilir.
+    
+    Args:
+        image (numpy.ndarray): RGB veya RGBA ekran görüntüsü.
+        max_rows (int): En fazla satır sayısı.
+        step (int): Küçültme adımı (piksel).
+        empty_color (EmptyColor, optional): Boş bar rengi; verilmezse görüntüden örneklenir.
+    
+    Returns:
+        list: Yukarıdan aşağı sıralı (x1, y1, x2, y2) bar koordinatları.
+    """
+    bars = detect_bars(image, step, empty_color)
+    if not bars:
+        logger.info("Parti HP barı bulunamadı.")
+        return []
+    
+    groups = []
+    for bar in bars:
+        for group in groups:
+            if (abs(group[0][0] - bar[0]) <= COLUMN_TOLERANCE and
+                    abs(group[0][2] - bar[2]) <= COLUMN_TOLERANCE):
+                group.append(bar)
+                break
+        else:
+            groups.append([bar])
+    
+    party = max(groups, key=lambda group: (len(group), group[0][2] - group[0][0]))
+    party = party[:max_rows]
+    logger.info(f"{len(party)} parti HP barı bulundu ({len(bars)} aday).")
+    return party
@@ -0,0 +1,96 @@
+"""
+Knight Online Otomatik İyileştirme ve Buff Sistemi - Parti Düzeni
+Bu modül, eşit aralıklı parti HP barlarını tek bir şablondan üretir: ilk satırın koordinatları ve
+satırlar arası dikey aralık (pitch) bilindiğinde tüm satırların koordinatları hesaplanır.
+
+Şablon, kullanıcının ilk satırı elle alıp aralığı girmesiyle veya parti barı algılayıcısının
+bulduğu barlardan (bkz. core/party_detector.py) oluşturulur. Satır sayısı sabit değildir; parti ve
+raid boyutları için aynı şablon kullanılır.
+"""
+
+import logging
+import numpy as np
+
+# Logging yapılandırması
+logger = logging.getLogger("PartyLayout")
+
+# Algılanan barların aralıkları bu kadar farklıysa (piksel) barlar eşit aralıklı kabul edilmez
+PITCH_TOLERANCE = 3
+
+class PartyLayout:
+    """
+    İlk satır koordinatları ve satır aralığından oluşan parti düzeni şablonu.
+    """
+    
+    def __init__(self, first_coords, pitch, row_count):
+        """
+        PartyLayout sınıfını başlatır.
+        
+        Args:
+            first_coords (tuple): İlk satırın (x1, y1, x2, y2) koordinatları.
+            pitch (int): Ardışık satırların üst kenarları arasındaki dikey mesafe (piksel).
+            row_count (int): Üretilecek satır sayısı.
+        """
+        self.first_coords = tuple(int(value) for value in first_coords)
+        self.pitch = int(pitch)
+        self.row_count = int(row_count)
+    
+    @classmethod
+    def from_bars(cls, bars, row_count):
+        """
+        Algılanan barlardan şablon oluşturur.
+        
+        Aralık, ardışık barların üst kenarları arasındaki en küçük mesafedir. Listede eksik üye
+        varsa diğer mesafeler bu aralığın tam katı olur. Kesin aralık, mesafelerin toplamının kat
+        sayılarının toplamına bölünmesiyle bulunur ve her mesafe bu aralığın katına
+        PITCH_TOLERANCE piksel içinde uymalıdır.
+        
+        Args:
+            bars (list): Yukarıdan aşağı sıralı (x1, y1, x2, y2) bar koordinatları.
+            row_count (int): Üretilecek satır sayısı.
+        
+        Returns:
+            PartyLayout: Şablon veya aralık belirlenemiyorsa (tek bar, çakışan ya da en küçük
+                aralığın katlarına uymayan barlar) None.
+        """
+        if len(bars) < 2:
+            return None
+        
+        tops = np.array([bar[1] for bar in bars])
+        gaps = np.diff(tops)
+        min_gap = int(gaps.min())
+        if min_gap <= PITCH_TOLERANCE:
+            return None
+        
+        # Her mesafe en küçük aralığın kaç katı; sapma kesin aralığa göre ölçülür
+        multiples = np.maximum(np.rint(gaps / min_gap), 1)
+        pitch = gaps.sum() / multiples.sum()
+        if np.any(np.abs(gaps - multiples * pitch) > PITCH_TOLERANCE):
+            logger.warning(f"Parti barları ortak bir aralığa hizalanamadı: {gaps.tolist()}")
+            return None
+        pitch = int(round(pitch))
+        
+        # İlk barın genişliği ve yüksekliği tüm satırlarda kullanılır
+        return cls(bars[0], pitch, row_count)
+    
+    def row_coords(self):
+        """
+        Tüm satırların koordinatlarını hesaplar.
+        
+        Returns:
+            numpy.ndarray: (satır sayısı, 4) boyutunda (x1, y1, x2, y2) dizisi.
+        """
+        offsets = np.arange(self.row_count)[:, None] * np.array([0, self.pitch, 0, self.pitch])
+        return np.array(self.first_coords)[None, :] + offsets
+    
+    def rows(self):
+        """
+        Tüm satırların koordinatlarını demet listesi olarak döndürür.
+        
+        Returns:
+            list: (x1, y1, x2, y2) demetleri.
+        """
+        return [tuple(coords) for coords in self.row_coords().tolist()]
+    
+    def __repr__(self):
+        return f"PartyLayout(first={list(self.first_coords)}, pitch={self.pitch}, rows={self.row_count})"
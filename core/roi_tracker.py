@@ -0,0 +1,291 @@
+"""
+Knight Online Otomatik İyileştirme ve Buff Sistemi - HP Barı Bölge Takibi
+Bu modül, parti paneli birkaç piksel kaydığında (arayüz ölçeği, pencere taşıma) satır bölgelerini
+yeniden HP barlarının üzerine oturtur.
+
+Her satır için barın ve çevresindeki çerçevenin bar rengi maskesi şablon olarak saklanır; boş bar rengi
+bilindiğinde maske HP'den bağımsızdır (dolu ve boş kısım birlikte bar rengidir). Boş renk (siyah, gri,
+koyu kırmızı) sabit değildir, kısmen dolu bir satırdan örneklenir. Bir satırın bölgesi bar üzerinde değilse:
+    1. Eski konum çevresinde (±SEARCH_RADIUS piksel) tüm kaydırmalar için şablon farkı (SAD) tek
+       NumPy işlemiyle hesaplanır, en iyi eşleşme yeterince iyiyse bölge kaydırılır.
+    2. Yerel arama başarısızsa (şablon yok veya panel daha uzağa taşındıysa) tüm ekranda parti barları
+       yeniden algılanır ve tüm satırları en çok bara oturtan ortak kaydırma seçilir; yerinde duran
+       satırlar da oylamaya katıldığından tek bir örtülmüş satır komşu bara kaydırılmaz.
+Aramadan önce bölgenin şablonla yerinde eşleşip eşleşmediğine bakılır: HP %0 olan (ölü) satırın barı
+boş renktedir ve is_on_bar testini geçemez, ama bar ve çerçevesi şablonun beklediği yerde durduğu için
+satır izleniyor sayılır ve satır ölü kaldığı sürece tam ekran yeniden algılama yapılmaz.
+Konumu kaybolan satırlar için iyileştirme kararı verilmez, böylece kayan panel HP %0 okunup gereksiz
+iyileştirme yapılmaz.
+"""
+
+import logging
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from core.hp_analyzer import bar_mask, bar_coverage, empty_color_of, filled_mask
+from core.party_detector import detect_party_rows
+
+# Logging yapılandırması
+logger = logging.getLogger("RoiTracker")
+
+# Bölgedeki bar rengi piksel oranı veya sol kenar sütununun dolu oranı bunun altındaysa bölge bar üzerinde sayılmaz
+MIN_COVERAGE = 0.6
+
+# Şablona dahil edilen çerçeve genişliği (piksel); barın kenarları eşleşmeyi sabitler
+TEMPLATE_PADDING = 4
+
+# Yerel aramada denenecek en büyük kaydırma (piksel)
+SEARCH_RADIUS = 20
+
+# Yerel eşleşmenin kabul edilmesi için şablonla en büyük uyumsuz piksel oranı
+MAX_MISMATCH = 0.1
+
+# Tam ekran yeniden algılama en fazla bu sıklıkla yapılır (saniye)
+REDETECT_INTERVAL = 2.0
+
+# Yeniden algılamada satırın kaydırılmış konumu ile bar arasındaki izin verilen fark (piksel)
+MATCH_TOLERANCE = 4
+
+def is_on_bar(crop, empty_color=None):
+    """
+    Kırpılmış bölgenin bir HP barının üzerinde olup olmadığını döndürür.
+    
+    Karar geometriyle verilir: dolu kısım bölgenin sol kenarından başlamalı ve piksellerin çoğu dolu ya da
+    boş bar renginde olmalıdır. Boş kısmın rengi önemli olmadığından düşük HP'li satır kayıp sayılmaz.
+    HP %0 olan (ölü) satırda dolu kısım olmadığından bölge bar üzerinde sayılmaz; bu satır için zaten
+    iyileştirme yapılamaz. Ölü satırın barı yerinde duruyorsa RoiTracker.relocate onu kayıp saymaz.
+    
+    Args:
+        crop (numpy.ndarray): Satırın kırpılmış görüntüsü.
+        empty_color (EmptyColor, optional): Boş bar rengi; verilmezse bölgeden örneklenir.
+    
+    Returns:
+        bool: Bölge bar üzerindeyse True.
+    """
+    if crop.ndim != 3 or crop.shape[0] == 0 or crop.shape[1] == 0:
+        return False
+    filled = filled_mask(crop)
+    if filled[:, 0].mean() < MIN_COVERAGE:
+        return False
+    if empty_color is None:
+        empty_color = empty_color_of(crop, filled)
+    return bar_coverage(crop, empty_color) >= MIN_COVERAGE
+
+def _region_mask(image, rect, empty_color):
+    """
+    Görüntünün bir bölgesinin bar maskesini döndürür; görüntü dışına taşan kısımlar False doldurulur.
+    
+    Args:
+        image (numpy.ndarray): Ekran görüntüsü.
+        rect (tuple): (x1, y1, x2, y2), görüntü dışına taşabilir.
+        empty_color (EmptyColor): Boş bar rengi veya bilinmiyorsa None.
+    
+    Returns:
+        numpy.ndarray: (y2 - y1, x2 - x1) boyutunda bool maske.
+    """
+    x1, y1, x2, y2 = rect
+    height, width = image.shape[:2]
+    mask = np.zeros((y2 - y1, x2 - x1), dtype=bool)
+    cx1, cy1 = max(x1, 0), max(y1, 0)
+    cx2, cy2 = min(x2, width), min(y2, height)
+    if cx1 < cx2 and cy1 < cy2:
+        mask[cy1 - y1:cy2 - y1, cx1 - x1:cx2 - x1] = bar_mask(image[cy1:cy2, cx1:cx2], empty_color)
+    return mask
+
+class RoiTracker:
+    """
+    Satır bölgelerini HP barlarına kilitli tutan takipçi.
+    """
+    
+    def __init__(self, search_radius=SEARCH_RADIUS, redetect_interval=REDETECT_INTERVAL):
+        """
+        RoiTracker sınıfını başlatır.
+        
+        Args:
+            search_radius (int): Yerel aramada denenecek en büyük kaydırma (piksel).
+            redetect_interval (float): Tam ekran yeniden algılamalar arasındaki en kısa süre (saniye).
+        """
+        self.search_radius = search_radius
+        self.redetect_interval = redetect_interval
+        self.templates = {}  # Satır indeksi -> bar maskesi şablonu
+        self.empty_color = None  # Satırlardan örneklenen boş bar rengi (EmptyColor)
+        self.last_redetect = -np.inf
+    
+    def reset(self):
+        """Tüm şablonları siler (ör. ölçek değiştiğinde)."""
+        self.templates.clear()
+    
+    def forget(self, row_index):
+        """
+        Bir satırın şablonunu siler (ör. koordinatları değiştiğinde).
+        
+        Args:
+            row_index (int): Satır indeksi.
+        """
+        self.templates.pop(row_index, None)
+    
+    def remember(self, row_index, image, rect):
+        """
+        Bölgesi bar üzerinde olan satırın şablonunu (henüz yoksa) kaydeder.
+        
+        Boş bar rengi henüz bilinmiyorsa satırdan örneklenir; renk ilk kez öğrenildiğinde önceki
+        (yalnızca dolu kısmı içeren, HP'ye bağlı) şablonlar silinir.
+        
+        Args:
+            row_index (int): Satır indeksi.
+            image (numpy.ndarray): Ekran görüntüsü.
+            rect (tuple): Satırın ekrandaki (x1, y1, x2, y2) bölgesi.
+        """
+        x1, y1, x2, y2 = rect
+        if self.empty_color is None:
+            self.empty_color = empty_color_of(image[y1:y2, x1:x2])
+            if self.empty_color is not None:
+                logger.debug(f"Boş bar rengi örneklendi: {self.empty_color}")
+                self.templates.clear()
+        if row_index not in self.templates:
+            pad = TEMPLATE_PADDING
+            self.templates[row_index] = _region_mask(image, (x1 - pad, y1 - pad, x2 + pad, y2 + pad), self.empty_color)
+    
+    def relocate(self, image, rects, enabled, lost, now):
+        """
+        Konumu kaybolan satırların barlarını arar.
+        
+        Args:
+            image (numpy.ndarray): Ekran görüntüsü.
+            rects (numpy.ndarray): (satır sayısı, 4) boyutunda satırların ekrandaki bölgeleri.
+            enabled (list): İzlenen satır indeksleri.
+            lost (list): Bölgesi bar üzerinde olmayan satır indeksleri.
+            now (float): time.monotonic() zamanı.
+        
+        Returns:
+            dict: Bulunan satır indeksi -> (dx, dy) ek kaydırma (piksel). Barı yerinde duran satırlar
+                (ör. HP %0) için kaydırma döndürülmez.
+        """
+        # Barı şablonun beklediği yerde duran satırlar izleniyor sayılır, aranmaz
+        lost = [row_index for row_index in lost
+                if not self._in_place(image, rects[row_index], self.templates.get(row_index))]
+        if not lost:
+            return {}
+        
+        # Dikey arama komşu satırın barına ulaşmasın diye satır aralığının yarısıyla sınırlanır
+        tops = np.sort(np.asarray(rects)[enabled, 1])
+        gaps = np.diff(tops)
+        gaps = gaps[gaps > 0]
+        max_dy = min(self.search_radius, int(gaps.min()) // 2 - 1) if gaps.size else self.search_radius
+        
+        shifts = {}
+        for row_index in lost:
+            shift = self._local_search(image, rects[row_index], self.templates.get(row_index), max_dy)
+            if shift is not None:
+                shifts[row_index] = shift
+        
+        missing = [row_index for row_index in lost if row_index not in shifts]
+        if missing and now - self.last_redetect >= self.redetect_interval:
+            self.last_redetect = now
+            shifts.update(self._redetect(image, rects, enabled, missing))
+        return shifts
+    
+    def _in_place(self, image, rect, template):
+        """
+        Satırın bar maskesinin kaydırmasız konumda şablonla eşleşip eşleşmediğini döndürür.
+        
+        Boş bar rengi biliniyorsa maske HP'den bağımsızdır; bar ve çerçevesi yerindeyse HP %0 olan
+        satır da eşleşir.
+        
+        Args:
+            image (numpy.ndarray): Ekran görüntüsü.
+            rect (tuple): Satırın ekrandaki (x1, y1, x2, y2) bölgesi.
+            template (numpy.ndarray): Satırın bar maskesi şablonu veya None.
+        
+        Returns:
+            bool: Şablon varsa ve bölgeyle eşleşiyorsa True.
+        """
+        if template is None or self.empty_color is None:
+            return False
+        
+        x1, y1, x2, y2 = rect
+        pad = TEMPLATE_PADDING
+        region = _region_mask(image, (x1 - pad, y1 - pad, x2 + pad, y2 + pad), self.empty_color)
+        if region.shape != template.shape:
+            return False
+        return np.count_nonzero(region != template) / template.size <= MAX_MISMATCH
+    
+    def _local_search(self, image, rect, template, max_dy):
+        """
+        Şablonu eski konum çevresindeki tüm kaydırmalarda karşılaştırır (SAD).
+        
+        Args:
+            image (numpy.ndarray): Ekran görüntüsü.
+            rect (tuple): Satırın ekrandaki (x1, y1, x2, y2) bölgesi.
+            template (numpy.ndarray): Satırın bar maskesi şablonu veya None.
+            max_dy (int): Kabul edilecek en büyük dikey kaydırma (piksel).
+        
+        Returns:
+            tuple: (dx, dy) kaydırma veya eşleşme bulunamazsa ya da bar yerinde duruyorsa (örtülmüş) None.
+        """
+        if template is None:
+            return None
+        
+        x1, y1, x2, y2 = rect
+        margin = TEMPLATE_PADDING + self.search_radius
+        region = _region_mask(image, (x1 - margin, y1 - margin, x2 + margin, y2 + margin), self.empty_color)
+        if region.shape[0] < template.shape[0] or region.shape[1] < template.shape[1]:
+            # Ölçek değiştiyse şablon kullanılamaz, yeniden algılama devreye girer
+            return None
+        
+        # (2R+1, 2R+1) kaydırmanın hepsi için uyumsuz piksel sayısı
+        windows = sliding_window_view(region, template.shape)
+        mismatch = np.count_nonzero(windows != template, axis=(2, 3)) / template.size
+        
+        # Eşit eşleşmelerde en yakın kaydırma seçilir (komşu satırın barı yerine)
+        offsets = np.arange(mismatch.shape[0]) - self.search_radius
+        distance = np.abs(offsets)[:, None] + np.abs(offsets)[None, :]
+        mismatch[np.abs(offsets) > max_dy, :] = np.inf
+        best = np.unravel_index(np.argmin(mismatch + distance * 1e-6), mismatch.shape)
+        if mismatch[best] > MAX_MISMATCH:
+            return None
+        
+        dy, dx = int(offsets[best[0]]), int(offsets[best[1]])
+        if dx == 0 and dy == 0:
+            return None
+        return (dx, dy)
+    
+    def _redetect(self, image, rects, enabled, missing):
+        """
+        Parti barlarını tüm ekranda yeniden algılar ve satırlar için ortak kaydırmayı bulur.
+        
+        Panelin tamamı birlikte kaydığı için kayıp satırların bar eşleşmelerinin önerdiği
+        kaydırmalardan, izlenen tüm satırlardan en çoğunu bir bara oturtan seçilir. Yerinde duran
+        satırlar kaydırmasız durumu desteklediğinden örtülmüş tek satır başka bara taşınmaz.
+        
+        Returns:
+            dict: Satır indeksi -> (dx, dy).
+        """
+        bars = detect_party_rows(image, max_rows=len(rects), empty_color=self.empty_color)
+        if not bars:
+            return {}
+        
+        rects = np.asarray(rects)
+        corners = rects[enabled, :2]
+        bar_corners = np.asarray(bars)[:, :2]
+        
+        # Aday kaydırmalar: kayıp satırların her bara taşınması ve kaydırmasız durum
+        candidates = (bar_corners[None, :, :] - rects[missing, None, :2]).reshape(-1, 2)
+        candidates = np.vstack((np.zeros((1, 2), dtype=candidates.dtype), candidates))
+        
+        # Her aday için kaydırılmış satır köşelerinin en yakın bar köşesine uzaklığı
+        moved = corners[None, :, :] + candidates[:, None, :]
+        distance = np.abs(moved[:, :, None, :] - bar_corners[None, None, :, :]).max(axis=3)
+        matched = distance.min(axis=2) <= MATCH_TOLERANCE
+        
+        # En çok satırı eşleştiren, eşitlikte en küçük kaydırma
+        score = matched.sum(axis=1) - np.abs(candidates).sum(axis=1) * 1e-6
+        best = int(np.argmax(score))
+        dx, dy = candidates[best].tolist()
+        if dx == 0 and dy == 0:
+            return {}
+        matched_rows = dict(zip(enabled, matched[best].tolist()))
+        rows = [row_index for row_index in missing if matched_rows[row_index]]
+        logger.info(f"Parti barları yeniden algılandı: {len(bars)} bar, kaydırma ({dx}, {dy}), "
+                    f"satırlar {[row_index + 1 for row_index in rows]}")
+        return {row_index: (dx, dy) for row_index in rows}
@@ -0,0 +1,184 @@
+"""
+Knight Online Otomatik İyileştirme ve Buff Sistemi - Satır Tablosu
+Bu modül, iyileştirme döngüsünün izlediği HP barı satırlarının durumunu sözlük listesi yerine
+NumPy dizilerinde tutar.
+
+Koordinatlar, merkezler, son HP değerleri ve son iyileştirme zamanları satır başına bir eleman olan
+dizilerdedir; kırpma dilimleri dönüşüm değiştiğinde tüm satırlar için bir kez hesaplanır. Satır
+sayısı sabit değildir (parti veya raid boyutu).
+"""
+
+import logging
+import numpy as np
+
+from config.schema import roi_from_coords
+
+# Logging yapılandırması
+logger = logging.getLogger("RowTable")
+
+class RowTable:
+    """
+    HP barı satırlarının durum tablosu.
+    
+    Ayar değişikliklerinde tablo kopyalanıp güncellenir ve tek atamayla değiştirilir; döngü yalnızca
+    son HP ve son iyileştirme zamanı dizilerine yazar.
+    """
+    
+    def __init__(self, count):
+        """
+        RowTable sınıfını başlatır.
+        
+        Args:
+            count (int): Satır sayısı.
+        """
+        self.count = count
+        self.active = np.zeros(count, dtype=bool)
+        self.has_coords = np.zeros(count, dtype=bool)
+        self.coords = np.zeros((count, 4), dtype=np.int32)  # Referans alanında (x1, y1, x2, y2)
+        self.shifts = np.zeros((count, 2), dtype=np.int32)  # Bölge takibinin eklediği ekran kaydırması (dx, dy)
+        self.rects = np.zeros((count, 4), dtype=np.int64)  # Ekranda (x1, y1, x2, y2)
+        self.centers = np.zeros((count, 2), dtype=np.int32)  # Seçim tıklaması için barın ortası (ekran)
+        self.rois = [None] * count  # Kırpma dilimleri (ekran), koordinat yoksa None
+        self.select_keys = [""] * count  # Parti üyesini seçen tuş, boşsa HP barına tıklanır
+        self.heal_thresholds = np.zeros(count)  # Satıra özel iyileştirme eşiği, 0 ise genel eşik
+        self.last_hp = np.full(count, 100.0)  # Güvenilir okumaların yumuşatılmış değeri
+        self.low = np.zeros(count, dtype=bool)  # İyileştirme eşiğinin altında (histerezisli)
+        self.mass_low = np.zeros(count, dtype=bool)  # Toplu iyileştirme eşiğinin altında (histerezisli)
+        self.last_reading = np.full(count, np.nan)  # Son okuma (güvenden bağımsız), henüz yoksa NaN
+        self.confidence = np.zeros(count)  # Son okumanın güveni
+        self.last_heal_time = np.full(count, -np.inf)  # time.monotonic() zamanı
+    
+    @property
+    def enabled(self):
+        """Aktif ve koordinatları tanımlı satırların bool maskesi."""
+        return self.active & self.has_coords
+    
+    def copy(self, count=None):
+        """
+        Tablonun kopyasını döndürür; satır sayısı değişirse satırlar korunarak eklenir veya kırpılır.
+        
+        Args:
+            count (int, optional): Yeni satır sayısı (varsayılan: aynı).
+        
+        Returns:
+            RowTable: Kopya.
+        """
+        count = self.count if count is None else count
+        table = RowTable(count)
+        kept = min(count, self.count)
+        for name in ("active", "has_coords", "coords", "shifts", "rects", "centers", "heal_thresholds", "last_hp",
+                     "low", "mass_low", "last_reading", "confidence", "last_heal_time"):
+            getattr(table, name)[:kept] = getattr(self, name)[:kept]
+        table.rois[:kept] = self.rois[:kept]
+        table.select_keys[:kept] = self.select_keys[:kept]
+        return table
+    
+    def set_row(self, index, active, coords, select_key, heal_threshold=0):
+        """
+        Bir satırın ayarlarını günceller (kırpma dilimleri apply_transform ile hesaplanır).
+        
+        Args:
+            index (int): Satır indeksi.
+            active (bool): Aktif durumu.
+            coords (tuple): Referans alanında (x1, y1, x2, y2) veya tanımsızsa None.
+            select_key: Seçim tuşu (KeyChord veya dizge) veya boş.
+            heal_threshold (int): Satıra özel iyileştirme eşiği, 0 ise genel eşik.
+        
+        Returns:
+            bool: Koordinatlar değiştiyse True.
+        """
+        self.active[index] = active
+        self.select_keys[index] = select_key or ""
+        self.heal_thresholds[index] = heal_threshold
+        return self.set_coords(index, coords)
+    
+    def set_coords(self, index, coords):
+        """
+        Bir satırın koordinatlarını günceller; değiştiyse bölge takibinin eklediği kaydırma ve satırın
+        HP durumu sıfırlanır.
+        
+        Args:
+            index (int): Satır indeksi.
+            coords (tuple): (x1, y1, x2, y2) veya tanımsızsa None.
+        
+        Returns:
+            bool: Koordinatlar değiştiyse True.
+        """
+        if coords and self.has_coords[index] and tuple(self.coords[index].tolist()) == tuple(coords):
+            return False
+        if not coords and not self.has_coords[index]:
+            return False
+        
+        if coords:
+            self.coords[index] = coords
+            self.has_coords[index] = True
+        else:
+            self.coords[index] = 0
+            self.has_coords[index] = False
+        self.shifts[index] = 0
+        self.last_hp[index] = 100.0
+        self.low[index] = self.mass_low[index] = False
+        return True
+    
+    def get_coords(self, index):
+        """
+        Bir satırın koordinatlarını döndürür.
+        
+        Returns:
+            list: [x1, y1, x2, y2] veya tanımsızsa boş liste.
+        """
+        return self.coords[index].tolist() if self.has_coords[index] else []
+    
+    def update_hp(self, readings, alpha, step):
+        """
+        Güvenilir okumalarla tüm satırların HP değerini tek seferde günceller.
+        
+        Animasyon ve kenar yumuşatmasından kaynaklanan küçük dalgalanmalar üssel hareketli ortalamayla
+        bastırılır; step'ten büyük değişimler (gerçek hasar veya iyileştirme) gecikmesiz aynen alınır.
+        
+        Args:
+            readings (numpy.ndarray): Satır başına okuma, güvenilir okuma yoksa NaN.
+            alpha (float): Küçük değişimlerde yeni okumanın ağırlığı (0-1, 1 ise yumuşatma yok).
+            step (float): Doğrudan alınacak en küçük değişim (HP yüzdesi).
+        
+        Returns:
+            numpy.ndarray: Bu adımda güvenilir okuması olan satırların bool maskesi.
+        """
+        valid = ~np.isnan(readings)
+        delta = np.where(valid, readings - self.last_hp, 0.0)
+        self.last_hp = np.where(np.abs(delta) > step, readings, self.last_hp + alpha * delta)
+        return valid
+    
+    def below(self, state, thresholds, band, valid):
+        """
+        Eşik durumunu eşik çevresindeki histerezis bandıyla günceller: HP eşik - bant/2 değerine
+        düşünce düşük sayılır, eşik + bant/2 üstüne çıkana kadar düşük kalır; böylece eşik çevresinde
+        dalgalanan okuma durumu değiştirmez. Güvenilir okuması olmayan satırların durumu değişmez.
+        
+        Args:
+            state (numpy.ndarray): Önceki durum (bool).
+            thresholds: Satır başına eşik dizisi veya tek eşik (HP yüzdesi).
+            band (float): Histerezis bandı genişliği (HP yüzdesi).
+            valid (numpy.ndarray): Güvenilir okuması olan satırlar.
+        
+        Returns:
+            numpy.ndarray: Yeni durum (bool).
+        """
+        half = band / 2.0
+        low = np.where(state, self.last_hp < thresholds + half, self.last_hp <= thresholds - half)
+        return np.where(valid, low, state)
+    
+    def apply_transform(self, transform):
+        """
+        Tüm satırların ekran koordinatlarını, merkezlerini ve kırpma dilimlerini hesaplar.
+        
+        Args:
+            transform (CoordinateTransform): Referans alanından ekrana dönüşüm.
+        """
+        rects = transform.map_rects(self.coords) + np.tile(self.shifts, 2)
+        rects[:, :2] = np.maximum(rects[:, :2], 0)
+        rects[:, 2:] = np.maximum(rects[:, 2:], rects[:, :2] + 1)
+        self.rects = rects
+        self.centers = np.stack(((rects[:, 0] + rects[:, 2]) // 2, (rects[:, 1] + rects[:, 3]) // 2), axis=1)
+        self.rois = [roi_from_coords(rect) if has_coords else None
+                     for rect, has_coords in zip(rects.tolist(), self.has_coords.tolist())]
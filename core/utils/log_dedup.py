@@ -0,0 +1,185 @@
+"""
+Knight Online Otomatik İyileştirme ve Buff Sistemi - Tekrarlanan Log Filtresi
+Bu modül, aynı logger'dan gelen aynı mesajları zaman penceresi içinde tek satırda toplayan filtreyi içerir.
+"""
+
+import time
+import logging
+import threading
+
+class _RepeatState:
+    """Bir mesaj anahtarı için pencere durumu."""
+    
+    __slots__ = ("window_start", "passed", "suppressed", "record")
+    
+    def __init__(self, window_start, record):
+        self.window_start = window_start
+        self.passed = 0
+        self.suppressed = 0
+        self.record = record
+
+class DuplicateLogFilter(logging.Filter):
+    """
+    Aynı logger, seviye ve mesaja sahip kayıtları zaman penceresi başına sınırlar.
+    
+    Her anahtar için pencere başına en fazla `burst` kayıt geçer; geri kalanlar sayılıp bastırılır.
+    Pencere kapandığında bastırılan kayıtlar için sayı ve süre içeren tek bir özet satırı yazılır.
+    Böylece hata fırtınalarında log hacmi ve disk G/Ç'si sınırlı kalır.
+    """
+    
+    def __init__(self, window=10.0, burst=1, max_keys=1000):
+        """
+        DuplicateLogFilter sınıfını başlatır.
+        
+        Args:
+            window (float): Tekrarların toplandığı pencere süresi (saniye).
+            burst (int): Her pencerede geçmesine izin verilen kayıt sayısı.
+            max_keys (int): Takip edilecek en fazla farklı mesaj sayısı.
+        """
+        super().__init__()
+        self.window = window
+        self.burst = max(1, int(burst))
+        self.max_keys = max_keys
+        self.emit_callback = None
+        self._states = {}
+        self._lock = threading.Lock()
+        self._flush_thread = None
+        self._flush_stop = threading.Event()
+    
+    def attach(self, handler):
+        """
+        Filtreyi bir handler'a ekler; özet satırları bu handler üzerinden yazılır.
+        
+        Args:
+            handler (logging.Handler): Filtrenin ekleneceği handler.
+        """
+        handler.addFilter(self)
+        self.emit_callback = handler.handle
+    
+    @staticmethod
+    def _make_key(record):
+        args = record.args
+        if isinstance(args, tuple):
+            # İstisna gibi nesneler her seferinde farklı olduğundan metin olarak karşılaştırılır
+            args = tuple(
+                arg if isinstance(arg, (str, int, float, bool, type(None))) else str(arg)
+                for arg in args
+            )
+        elif args is not None:
+            args = str(args)
+        return (record.name, record.levelno, str(record.msg), args)
+    
+    def filter(self, record):
+        # Özet satırları tekrar filtrelenmez
+        if getattr(record, "dedup_summary", False):
+            return True
+        
+        key = self._make_key(record)
+        now = time.monotonic()
+        summaries = []
+        
+        with self._lock:
+            state = self._states.get(key)
+            if state is not None and now - state.window_start >= self.window:
+                # Pencere kapandı, bastırılanlar için özet yaz ve yeni pencere başlat
+                summaries.append(self._make_summary(state, now))
+                state = None
+            
+            if state is None:
+                if len(self._states) >= self.max_keys:
+                    summaries.append(self._evict_oldest(now))
+                state = _RepeatState(now, record)
+                self._states[key] = state
+            
+            if state.passed < self.burst:
+                state.passed += 1
+                allow = True
+            else:
+                state.suppressed += 1
+                state.record = record
+                allow = False
+        
+        for summary in summaries:
+            self._emit(summary)
+        return allow
+    
+    def _evict_oldest(self, now):
+        # Kilit altında çağrılır; en eski pencere kapatılır ve özeti döndürülür
+        oldest_key = min(self._states, key=lambda k: self._states[k].window_start)
+        return self._make_summary(self._states.pop(oldest_key), now)
+    
+    def _make_summary(self, state, now):
+        """
+        Bastırılan kayıtlar için özet kaydı oluşturur.
+        
+        Args:
+            state (_RepeatState): Pencere durumu.
+            now (float): Şu anki monotonic zaman.
+        
+        Returns:
+            logging.LogRecord: Özet kaydı veya bastırılan kayıt yoksa None.
+        """
+        if state.suppressed == 0:
+            return None
+        
+        record = state.record
+        message = (f"{record.getMessage()} [son {now - state.window_start:.1f} sn içinde "
+                   f"{state.suppressed} kez daha tekrarlandı]")
+        summary = logging.LogRecord(
+            record.name, record.levelno, record.pathname, record.lineno,
+            message, None, None, record.funcName
+        )
+        summary.dedup_summary = True
+        return summary
+    
+    def _emit(self, record):
+        if record is not None and self.emit_callback is not None:
+            self.emit_callback(record)
+    
+    def flush(self, force=False):
+        """
+        Penceresi kapanan mesajlar için özet satırlarını yazar.
+        
+        Args:
+            force (bool): True ise açık pencereler de kapatılır (kapanışta kullanılır).
+        """
+        now = time.monotonic()
+        summaries = []
+        
+        with self._lock:
+            for key in list(self._states):
+                state = self._states[key]
+                if force or now - state.window_start >= self.window:
+                    summaries.append(self._make_summary(state, now))
+                    del self._states[key]
+        
+        for summary in summaries:
+            self._emit(summary)
+    
+    def start_flusher(self, interval=None):
+        """
+        Özetleri düzenli aralıklarla yazan arka plan iş parçacığını başlatır.
+        
+        Args:
+            interval (float, optional): Kontrol aralığı (saniye), verilmezse pencere süresi kullanılır.
+        """
+        if self._flush_thread is not None:
+            return
+        
+        interval = interval or self.window
+        self._flush_stop.clear()
+        
+        def run():
+            while not self._flush_stop.wait(interval):
+                self.flush()
+        
+        self._flush_thread = threading.Thread(target=run, name="LogDedupFlusher", daemon=True)
+        self._flush_thread.start()
+    
+    def stop_flusher(self):
+        """Arka plan iş parçacığını durdurur ve kalan özetleri yazar."""
+        self._flush_stop.set()
+        if self._flush_thread is not None:
+            self._flush_thread.join(timeout=1.0)
+            self._flush_thread = None
+        self.flush(force=True)
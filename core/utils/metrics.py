@@ -0,0 +1,508 @@
+"""
+Knight Online Otomatik İyileştirme ve Buff Sistemi - Ölçüm Araçları
+Bu modül, motor aşamalarını ölçmek için sayaç, gösterge ve sabit kovalı histogramları,
+bunları toplayan kayıt defterini ve dosyaya periyodik dışa aktarımı içerir.
+"""
+
+import os
+import json
+import time
+import bisect
+import logging
+import weakref
+import threading
+
+# Logging yapılandırması
+logger = logging.getLogger("Metrics")
+
+# Varsayılan gecikme kovaları (saniye): 1 ms'den 2 sn'ye kadar
+DEFAULT_LATENCY_BUCKETS = (
+    0.001, 0.002, 0.005, 0.010, 0.020, 0.050,
+    0.100, 0.200, 0.500, 1.000, 2.000
+)
+
+class _ShardOwner:
+    """
+    İş parçacığının yerel deposunda parçayla birlikte tutulur. İş parçacığı bitince yerel depo
+    silinir, bu nesne çöp toplanır ve parçayı temel değere katlayan sonlandırıcı çalışır.
+    """
+    __slots__ = ("__weakref__",)
+
+def _retire_shard(metric_ref, shard):
+    metric = metric_ref()
+    if metric is not None:
+        metric._retire(shard)
+
+class _ShardedMetric:
+    """
+    İş parçacığı başına parçalara (shard) ayrılmış ölçüm için temel sınıf.
+    
+    Her iş parçacığı yalnızca kendi parçasına yazar, bu yüzden örnek kaydederken kilit alınmaz.
+    Kilit yalnızca yeni bir iş parçacığı ilk kez yazdığında, bir iş parçacığı bittiğinde ve okuma
+    sırasında kullanılır. Biten iş parçacığının parçası temel parçaya katlanıp listeden çıkarılır;
+    böylece kısa ömürlü iş parçacıkları (ör. buff zamanlayıcısı) parça listesini büyütmez.
+    """
+    
+    def __init__(self, name="", description=""):
+        self.name = name
+        self.description = description
+        self._local = threading.local()
+        # Biten iş parçacıklarının toplamı
+        self._base = self._new_shard()
+        self._shards = []
+        # Sonlandırıcı kilidi tutan iş parçacığında çalışabilir, bu yüzden yeniden girilebilir
+        self._lock = threading.RLock()
+    
+    def _new_shard(self):
+        raise NotImplementedError
+    
+    def _fold(self, base, shard):
+        raise NotImplementedError
+    
+    def _shard(self):
+        try:
+            return self._local.shard
+        except AttributeError:
+            shard = self._new_shard()
+            owner = _ShardOwner()
+            # Ölçüme zayıf referans: sonlandırıcı ölçümü canlı tutmaz
+            weakref.finalize(owner, _retire_shard, weakref.ref(self), shard).atexit = False
+            with self._lock:
+                self._shards.append(shard)
+            self._local.shard = shard
+            self._local.owner = owner
+            return shard
+    
+    def _retire(self, shard):
+        with self._lock:
+            self._fold(self._base, shard)
+            self._shards.remove(shard)
+    
+    def _all_shards(self):
+        # Kilit tutulurken çağrılır; aksi halde katlanan bir parça iki kez sayılabilir
+        return [self._base] + self._shards
+
+class _CounterShard:
+    __slots__ = ("value",)
+    
+    def __init__(self):
+        self.value = 0
+
+class Counter(_ShardedMetric):
+    """Yalnızca artan sayaç (ör. yapılan iyileştirme sayısı)."""
+    
+    def _new_shard(self):
+        return _CounterShard()
+    
+    def _fold(self, base, shard):
+        base.value += shard.value
+    
+    def inc(self, amount=1):
+        """
+        Sayacı artırır.
+        
+        Args:
+            amount (int): Artış miktarı.
+        """
+        self._shard().value += amount
+    
+    @property
+    def value(self):
+        """Tüm iş parçacıklarındaki toplam değer."""
+        with self._lock:
+            return sum(shard.value for shard in self._all_shards())
+    
+    def reset(self):
+        """Sayacı sıfırlar."""
+        with self._lock:
+            for shard in self._all_shards():
+                shard.value = 0
+    
+    def snapshot(self):
+        """Sayacın anlık değerini döndürür."""
+        return self.value
+
+class Gauge:
+    """
+    Anlık değer göstergesi (ör. düşük HP'li satır sayısı).
+    Değer atama tek bir işlem olduğundan kilit gerekmez.
+    """
+    
+    def __init__(self, name="", description=""):
+        """
+        Gauge sınıfını başlatır.
+        
+        Args:
+            name (str): Ölçüm adı.
+            description (str): Açıklama.
+        """
+        self.name = name
+        self.description = description
+        self.value = 0.0
+    
+    def set(self, value):
+        """
+        Gösterge değerini ayarlar.
+        
+        Args:
+            value (float): Yeni değer.
+        """
+        self.value = value
+    
+    def reset(self):
+        """Göstergeyi sıfırlar."""
+        self.value = 0.0
+    
+    def snapshot(self):
+        """Göstergenin anlık değerini döndürür."""
+        return self.value
+
+class _HistogramShard:
+    __slots__ = ("counts", "total", "count", "max")
+    
+    def __init__(self, size):
+        self.counts = [0] * size
+        self.total = 0.0
+        self.count = 0
+        self.max = 0.0
+    
+    def clear(self):
+        for index in range(len(self.counts)):
+            self.counts[index] = 0
+        self.total = 0.0
+        self.count = 0
+        self.max = 0.0
+
+class LatencyHistogram(_ShardedMetric):
+    """
+    Sabit kovalı gecikme histogramı.
+    Her örnek yalnızca kendi iş parçacığının kova sayacını artırır, örnek başına bellek ayrılmaz.
+    """
+    
+    def __init__(self, buckets=DEFAULT_LATENCY_BUCKETS, name="", description=""):
+        """
+        LatencyHistogram sınıfını başlatır.
+        
+        Args:
+            buckets (tuple): Artan sırada kova üst sınırları (saniye).
+            name (str): Ölçüm adı.
+            description (str): Açıklama.
+        """
+        # Temel parça oluşturulmadan önce kovalar bilinmeli
+        self.buckets = tuple(buckets)
+        super().__init__(name, description)
+    
+    def _new_shard(self):
+        # Son kova +Inf taşma kovasıdır
+        return _HistogramShard(len(self.buckets) + 1)
+    
+    def _fold(self, base, shard):
+        for index, bucket_count in enumerate(shard.counts):
+            base.counts[index] += bucket_count
+        base.total += shard.total
+        base.count += shard.count
+        base.max = max(base.max, shard.max)
+    
+    def observe(self, value):
+        """
+        Bir gecikme örneği kaydeder.
+        
+        Args:
+            value (float): Gecikme (saniye).
+        """
+        shard = self._shard()
+        shard.counts[bisect.bisect_left(self.buckets, value)] += 1
+        shard.total += value
+        shard.count += 1
+        if value > shard.max:
+            shard.max = value
+    
+    def _merge(self):
+        """
+        Tüm parçaları birleştirir.
+        
+        Returns:
+            tuple: (kova sayıları, toplam, örnek sayısı, en büyük değer).
+        """
+        counts = [0] * (len(self.buckets) + 1)
+        total = 0.0
+        count = 0
+        maximum = 0.0
+        with self._lock:
+            for shard in self._all_shards():
+                for index, bucket_count in enumerate(shard.counts):
+                    counts[index] += bucket_count
+                total += shard.total
+                count += shard.count
+                maximum = max(maximum, shard.max)
+        return counts, total, count, maximum
+    
+    @property
+    def count(self):
+        """Toplam örnek sayısı."""
+        with self._lock:
+            return sum(shard.count for shard in self._all_shards())
+    
+    def _percentile(self, counts, count, maximum, p):
+        if count == 0:
+            return 0.0
+        
+        target = max(1, int(round(count * p / 100.0)))
+        cumulative = 0
+        for index, bucket_count in enumerate(counts):
+            cumulative += bucket_count
+            if cumulative >= target:
+                if index < len(self.buckets):
+                    return min(self.buckets[index], maximum)
+                return maximum
+        return maximum
+    
+    def percentile(self, p):
+        """
+        Yaklaşık yüzdelik değeri döndürür (ilgili kovanın üst sınırı).
+        
+        Args:
+            p (float): 0-100 arası yüzdelik.
+        
+        Returns:
+            float: Yüzdelik değer (saniye), örnek yoksa 0.
+        """
+        counts, _, count, maximum = self._merge()
+        return self._percentile(counts, count, maximum, p)
+    
+    def reset(self):
+        """Tüm sayaçları sıfırlar."""
+        with self._lock:
+            for shard in self._all_shards():
+                shard.clear()
+    
+    def snapshot(self):
+        """
+        Histogramın anlık görüntüsünü döndürür.
+        
+        Returns:
+            dict: Kovalar, sayılar ve özet istatistikler.
+        """
+        counts, total, count, maximum = self._merge()
+        return {
+            "buckets": list(self.buckets),
+            "counts": counts,
+            "count": count,
+            "sum": total,
+            "mean": total / count if count else 0.0,
+            "max": maximum,
+            "p50": self._percentile(counts, count, maximum, 50),
+            "p99": self._percentile(counts, count, maximum, 99)
+        }
+
+class MetricsRegistry:
+    """
+    Uygulamadaki tüm ölçümleri adlarıyla tutan kayıt defteri.
+    Aynı adla tekrar istenen ölçüm için mevcut nesne döndürülür.
+    """
+    
+    def __init__(self):
+        """MetricsRegistry sınıfını başlatır."""
+        self._metrics = {}
+        self._lock = threading.Lock()
+        self.session_start = time.time()
+    
+    def _get_or_create(self, name, metric_type, factory):
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = factory()
+                self._metrics[name] = metric
+            elif not isinstance(metric, metric_type):
+                raise ValueError(f"'{name}' ölçümü farklı bir türle kayıtlı: {type(metric).__name__}")
+            return metric
+    
+    def counter(self, name, description=""):
+        """
+        Adı verilen sayacı döndürür, yoksa oluşturur.
+        
+        Args:
+            name (str): Ölçüm adı.
+            description (str): Açıklama.
+        
+        Returns:
+            Counter: Sayaç.
+        """
+        return self._get_or_create(name, Counter, lambda: Counter(name, description))
+    
+    def gauge(self, name, description=""):
+        """
+        Adı verilen göstergeyi döndürür, yoksa oluşturur.
+        
+        Args:
+            name (str): Ölçüm adı.
+            description (str): Açıklama.
+        
+        Returns:
+            Gauge: Gösterge.
+        """
+        return self._get_or_create(name, Gauge, lambda: Gauge(name, description))
+    
+    def histogram(self, name, description="", buckets=DEFAULT_LATENCY_BUCKETS):
+        """
+        Adı verilen histogramı döndürür, yoksa oluşturur.
+        
+        Args:
+            name (str): Ölçüm adı.
+            description (str): Açıklama.
+            buckets (tuple): Kova üst sınırları (yalnızca ilk oluşturmada kullanılır).
+        
+        Returns:
+            LatencyHistogram: Histogram.
+        """
+        return self._get_or_create(name, LatencyHistogram, lambda: LatencyHistogram(buckets, name, description))
+    
+    def get(self, name):
+        """
+        Adı verilen ölçümü döndürür.
+        
+        Args:
+            name (str): Ölçüm adı.
+        
+        Returns:
+            Ölçüm nesnesi veya kayıtlı değilse None.
+        """
+        with self._lock:
+            return self._metrics.get(name)
+    
+    def _items(self):
+        with self._lock:
+            return sorted(self._metrics.items())
+    
+    def reset(self):
+        """Tüm ölçümleri sıfırlar ve yeni bir oturum başlatır."""
+        for _, metric in self._items():
+            metric.reset()
+        self.session_start = time.time()
+    
+    def snapshot(self):
+        """
+        Tüm ölçümlerin anlık görüntüsünü döndürür.
+        
+        Returns:
+            dict: Zaman bilgisi ve türlerine göre gruplanmış ölçüm değerleri.
+        """
+        result = {
+            "timestamp": time.time(),
+            "session_start": self.session_start,
+            "counters": {},
+            "gauges": {},
+            "histograms": {}
+        }
+        for name, metric in self._items():
+            if isinstance(metric, Counter):
+                result["counters"][name] = metric.snapshot()
+            elif isinstance(metric, Gauge):
+                result["gauges"][name] = metric.snapshot()
+            else:
+                result["histograms"][name] = metric.snapshot()
+        return result
+    
+    def to_prometheus(self):
+        """
+        Ölçümleri Prometheus metin biçiminde döndürür.
+        
+        Returns:
+            str: Prometheus metin biçimi.
+        """
+        lines = []
+        for name, metric in self._items():
+            if metric.description:
+                lines.append(f"# HELP {name} {metric.description}")
+            
+            if isinstance(metric, Counter):
+                lines.append(f"# TYPE {name} counter")
+                lines.append(f"{name} {metric.snapshot()}")
+            elif isinstance(metric, Gauge):
+                lines.append(f"# TYPE {name} gauge")
+                lines.append(f"{name} {metric.snapshot()}")
+            else:
+                snapshot = metric.snapshot()
+                lines.append(f"# TYPE {name} histogram")
+                cumulative = 0
+                for bucket, bucket_count in zip(snapshot["buckets"], snapshot["counts"]):
+                    cumulative += bucket_count
+                    lines.append(f'{name}_bucket{{le="{bucket}"}} {cumulative}')
+                lines.append(f'{name}_bucket{{le="+Inf"}} {snapshot["count"]}')
+                lines.append(f"{name}_sum {snapshot['sum']}")
+                lines.append(f"{name}_count {snapshot['count']}")
+        return "\n".join(lines) + "\n"
+    
+    def write(self, path):
+        """
+        Ölçümleri dosyaya yazar.
+        
+        Dosya uzantısı .prom veya .txt ise Prometheus metin biçimi, aksi halde JSON kullanılır.
+        Okuyucular yarım dosya görmesin diye önce geçici dosyaya yazılıp yer değiştirilir.
+        
+        Args:
+            path (str): Hedef dosya yolu.
+        """
+        if path.endswith((".prom", ".txt")):
+            content = self.to_prometheus()
+        else:
+            content = json.dumps(self.snapshot(), indent=2)
+        
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        
+        temp_path = path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            f.write(content)
+        os.replace(temp_path, path)
+
+class MetricsExporter:
+    """Kayıt defterinin anlık görüntüsünü belirli aralıklarla dosyaya yazan arka plan iş parçacığı."""
+    
+    def __init__(self, registry, path, interval=10.0):
+        """
+        MetricsExporter sınıfını başlatır.
+        
+        Args:
+            registry (MetricsRegistry): Dışa aktarılacak kayıt defteri.
+            path (str): Hedef dosya (.json veya .prom).
+            interval (float): Yazma aralığı (saniye).
+        """
+        self.registry = registry
+        self.path = path
+        self.interval = interval
+        self.thread = None
+        self._stop_event = threading.Event()
+    
+    def start(self):
+        """Dışa aktarma iş parçacığını başlatır."""
+        if self.thread is not None:
+            return
+        
+        self._stop_event.clear()
+        self.thread = threading.Thread(target=self._run_loop, name="MetricsExporter", daemon=True)
+        self.thread.start()
+        logger.info(f"Ölçümler {self.interval:g} saniyede bir dışa aktarılacak: {self.path}")
+    
+    def stop(self):
+        """Dışa aktarma iş parçacığını durdurur ve son anlık görüntüyü yazar."""
+        self._stop_event.set()
+        if self.thread is not None:
+            self.thread.join(timeout=2.0)
+            self.thread = None
+        self.export()
+    
+    def export(self):
+        """Anlık görüntüyü hemen yazar."""
+        try:
+            self.registry.write(self.path)
+        except Exception as e:
+            logger.error("Ölçümler dışa aktarılırken hata: %s", e)
+    
+    def _run_loop(self):
+        while not self._stop_event.wait(self.interval):
+            self.export()
+
+# Uygulama genelinde paylaşılan kayıt defteri
+registry = MetricsRegistry()
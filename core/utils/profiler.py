@@ -0,0 +1,145 @@
+"""
+Knight Online Otomatik İyileştirme ve Buff Sistemi - Örnekleyici Profilleyici
+Bu modül, çalışan motor iş parçacıklarının yığınlarını sys._current_frames ile belirli aralıklarla
+örnekleyen ve sonucu collapsed-stack (flame graph) biçiminde yazan profilleyiciyi içerir.
+"""
+
+import os
+import sys
+import time
+import logging
+import threading
+
+# Logging yapılandırması
+logger = logging.getLogger("Profiler")
+
+# Varsayılan olarak profillenen motor iş parçacıkları
+ENGINE_THREAD_NAMES = ("HealHelper", "BuffHelper")
+
+class SamplingProfiler:
+    """
+    Yalnızca adı verilen iş parçacıklarını örnekleyen profilleyici.
+    
+    Uygulama yeniden başlatılmadan, gerçek yük altında belirli bir süre çalıştırılır.
+    Her örnekte hedef iş parçacıklarının yığını "iş parçacığı;modül:işlev;..." biçiminde
+    sayılır; sonuç flamegraph.pl, speedscope veya benzeri araçlarla açılabilir.
+    """
+    
+    def __init__(self, thread_names=ENGINE_THREAD_NAMES, interval=0.005):
+        """
+        SamplingProfiler sınıfını başlatır.
+        
+        Args:
+            thread_names (tuple): Profillenecek iş parçacığı adları.
+            interval (float): Örnekleme aralığı (saniye).
+        """
+        self.thread_names = tuple(thread_names)
+        self.interval = interval
+        self.stacks = {}
+        self.sample_count = 0
+        self.output_path = None
+        self.thread = None
+        self._stop_event = threading.Event()
+    
+    @property
+    def running(self):
+        """Profilleme devam ediyorsa True."""
+        return self.thread is not None and self.thread.is_alive()
+    
+    def start(self, duration, output_path):
+        """
+        Profillemeyi arka planda başlatır; süre dolunca sonuç dosyaya yazılır.
+        
+        Args:
+            duration (float): Profilleme süresi (saniye).
+            output_path (str): Collapsed-stack çıktı dosyası.
+        
+        Returns:
+            bool: Profilleme başlatıldıysa True, zaten çalışıyorsa False.
+        """
+        if self.running:
+            logger.warning("Profilleyici zaten çalışıyor.")
+            return False
+        
+        self.stacks = {}
+        self.sample_count = 0
+        self.output_path = output_path
+        self._stop_event.clear()
+        self.thread = threading.Thread(target=self._run, args=(duration,), name="Profiler", daemon=True)
+        self.thread.start()
+        logger.info(f"Profilleme başlatıldı: {', '.join(self.thread_names)} ({duration:g} sn)")
+        return True
+    
+    def stop(self):
+        """Profillemeyi erken durdurur (toplanan örnekler yine de yazılır)."""
+        self._stop_event.set()
+        if self.thread is not None:
+            self.thread.join(timeout=2.0)
+    
+    def _target_threads(self):
+        return {
+            thread.ident: thread.name
+            for thread in threading.enumerate()
+            if thread.name in self.thread_names
+        }
+    
+    @staticmethod
+    def _frame_label(frame):
+        code = frame.f_code
+        module = os.path.splitext(os.path.basename(code.co_filename))[0]
+        return f"{module}:{code.co_name}"
+    
+    def sample(self):
+        """Hedef iş parçacıklarının yığınlarını bir kez örnekler."""
+        targets = self._target_threads()
+        if not targets:
+            return
+        
+        frames = sys._current_frames()
+        for ident, name in targets.items():
+            frame = frames.get(ident)
+            if frame is None:
+                continue
+            
+            # En içteki çerçeve satır numarasıyla yazılır, böylece bekleme (sleep) ile iş ayırt edilir
+            labels = [f"{self._frame_label(frame)}:{frame.f_lineno}"]
+            frame = frame.f_back
+            while frame is not None:
+                labels.append(self._frame_label(frame))
+                frame = frame.f_back
+            labels.append(name)
+            labels.reverse()
+            
+            stack = ";".join(labels)
+            self.stacks[stack] = self.stacks.get(stack, 0) + 1
+        self.sample_count += 1
+    
+    def _run(self, duration):
+        end_time = time.monotonic() + duration
+        while not self._stop_event.is_set() and time.monotonic() < end_time:
+            self.sample()
+            self._stop_event.wait(self.interval)
+        
+        try:
+            self.write(self.output_path)
+        except Exception as e:
+            logger.error("Profil sonucu yazılırken hata: %s", e)
+    
+    def write(self, path):
+        """
+        Toplanan yığınları collapsed-stack biçiminde yazar (her satır: "yığın sayı").
+        
+        Args:
+            path (str): Hedef dosya yolu.
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        
+        with open(path, "w", encoding="utf-8") as f:
+            for stack, count in sorted(self.stacks.items(), key=lambda item: -item[1]):
+                f.write(f"{stack} {count}\n")
+        
+        if not self.stacks:
+            logger.warning(f"Profil örneği alınamadı, {', '.join(self.thread_names)} iş parçacıkları çalışmıyor olabilir.")
+        logger.info(f"Profil sonucu yazıldı: {path} ({self.sample_count} örnek)")
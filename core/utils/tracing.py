@@ -0,0 +1,213 @@
+"""
+Knight Online Otomatik İyileştirme ve Buff Sistemi - Olay İzleyici
+Bu modül, motor döngülerinin adımlarını önceden ayrılmış bir halka tampona kaydeden ve
+Chrome trace-event JSON biçiminde (Perfetto / chrome://tracing) dışa aktaran izleyiciyi içerir.
+"""
+
+import os
+import json
+import time
+import itertools
+import logging
+import threading
+
+# Logging yapılandırması
+logger = logging.getLogger("Tracing")
+
+# Varsayılan tampon kapasitesi (olay sayısı)
+DEFAULT_TRACE_CAPACITY = 200000
+
+class _NullSpan:
+    """İzleyici kapalıyken kullanılan, hiçbir şey yapmayan span."""
+    
+    __slots__ = ()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+_NULL_SPAN = _NullSpan()
+
+class _Span:
+    """with bloğunun süresini izleyiciye kaydeden span."""
+    
+    __slots__ = ("tracer", "name", "category", "args", "start")
+    
+    def __init__(self, tracer, name, category, args):
+        self.tracer = tracer
+        self.name = name
+        self.category = category
+        self.args = args
+        self.start = 0.0
+    
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.tracer.add(self.name, self.start, time.perf_counter(), self.category, self.args)
+        return False
+
+class Tracer:
+    """
+    Adım sürelerini (span) kaydeden izleyici.
+    
+    Olaylar etkinleştirme sırasında bir kez ayrılan paralel listelere yazılır; tampon dolunca
+    en eski olayların üzerine yazılır. Kapalıyken span() paylaşılan boş bir nesne döndürür,
+    bu yüzden motor döngülerinde bırakılan izleme çağrılarının maliyeti ihmal edilebilir.
+    """
+    
+    def __init__(self, capacity=DEFAULT_TRACE_CAPACITY):
+        """
+        Tracer sınıfını başlatır.
+        
+        Args:
+            capacity (int): Tamponda tutulacak en fazla olay sayısı.
+        """
+        self.capacity = capacity
+        self.enabled = False
+        # Tampon ilk etkinleştirmede ayrılır, izleme hiç kullanılmazsa bellek harcanmaz
+        self._names = None
+        self.clear()
+    
+    def _allocate(self):
+        capacity = self.capacity
+        self._names = [None] * capacity
+        self._categories = [None] * capacity
+        self._starts = [0.0] * capacity
+        self._ends = [0.0] * capacity
+        self._threads = [0] * capacity
+        self._args = [None] * capacity
+    
+    def enable(self):
+        """Tamponu temizler ve kaydı başlatır."""
+        if self._names is None:
+            self._allocate()
+        self.clear()
+        self.enabled = True
+        logger.info(f"İzleme başlatıldı (kapasite: {self.capacity} olay).")
+    
+    def disable(self):
+        """Kaydı durdurur (tampon korunur)."""
+        self.enabled = False
+        logger.info(f"İzleme durduruldu ({self.event_count} olay).")
+    
+    def clear(self):
+        """Kaydedilen olayları siler."""
+        self._index = itertools.count()
+        self._thread_names = {}
+        self._origin = time.perf_counter()
+        self._total = 0
+    
+    @property
+    def event_count(self):
+        """Tamponda bulunan olay sayısı."""
+        return min(self._total, self.capacity)
+    
+    def span(self, name, category="engine", args=None):
+        """
+        with bloğunun süresini kaydeden span döndürür.
+        
+        Args:
+            name (str): Adım adı (ör. "capture").
+            category (str): Olay kategorisi (ör. "heal", "buff").
+            args (dict, optional): Olayla birlikte yazılacak ek bilgiler.
+        
+        Returns:
+            Context manager: Span nesnesi.
+        """
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Span(self, name, category, args)
+    
+    def add(self, name, start, end=None, category="engine", args=None):
+        """
+        Tamamlanmış bir adımı kaydeder.
+        
+        Args:
+            name (str): Adım adı.
+            start (float): Başlangıç zamanı (time.perf_counter).
+            end (float, optional): Bitiş zamanı, verilmezse şu an.
+            category (str): Olay kategorisi.
+            args (dict, optional): Ek bilgiler.
+        """
+        if not self.enabled:
+            return
+        if end is None:
+            end = time.perf_counter()
+        
+        # itertools.count GIL altında atomiktir, her iş parçacığı farklı bir yuva alır
+        index = next(self._index)
+        slot = index % self.capacity
+        thread_id = threading.get_ident()
+        if thread_id not in self._thread_names:
+            self._thread_names[thread_id] = threading.current_thread().name
+        
+        self._names[slot] = name
+        self._categories[slot] = category
+        self._starts[slot] = start
+        self._ends[slot] = end
+        self._threads[slot] = thread_id
+        self._args[slot] = args
+        self._total = index + 1
+    
+    def events(self):
+        """
+        Kaydedilen olayları Chrome trace-event biçiminde döndürür.
+        
+        Returns:
+            list: Eskiden yeniye sıralı olay sözlükleri (iş parçacığı adları dahil).
+        """
+        total = self._total
+        count = min(total, self.capacity)
+        first = total - count
+        pid = os.getpid()
+        
+        events = []
+        for thread_id, thread_name in list(self._thread_names.items()):
+            events.append({
+                "name": "thread_name", "ph": "M", "pid": pid, "tid": thread_id,
+                "args": {"name": thread_name}
+            })
+        
+        for index in range(first, total):
+            slot = index % self.capacity
+            event = {
+                "name": self._names[slot],
+                "cat": self._categories[slot],
+                "ph": "X",
+                "ts": (self._starts[slot] - self._origin) * 1e6,
+                "dur": (self._ends[slot] - self._starts[slot]) * 1e6,
+                "pid": pid,
+                "tid": self._threads[slot]
+            }
+            if self._args[slot]:
+                event["args"] = self._args[slot]
+            events.append(event)
+        return events
+    
+    def dump(self, path):
+        """
+        Olayları Chrome trace-event JSON dosyasına yazar.
+        
+        Args:
+            path (str): Hedef dosya yolu.
+        
+        Returns:
+            int: Yazılan olay sayısı.
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        
+        events = self.events()
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+        
+        logger.info(f"İzleme kaydı yazıldı: {path} ({self.event_count} olay)")
+        return self.event_count
+
+# Uygulama genelinde paylaşılan izleyici (varsayılan olarak kapalı)
+tracer = Tracer()
@@ -5,35 +5,172 @@ Bu modül, Knight Online Otomatik İyileştirme ve Buff Sistemini başlatır.
 
 import sys
 import os
+import copy
 import logging
 import logging.handlers
 import time
+import queue
+import atexit
 import threading
-from PyQt5.QtWidgets import QApplication, QMainWindow, QAction, QMenu, QMessageBox, QStatusBar
-from PyQt5.QtCore import QTimer, Qt, QSettings
+import functools
+import configparser
+from PyQt5.QtWidgets import (QApplication, QMainWindow, QAction, QActionGroup, QMenu, QMessageBox, QStatusBar,
+                             QInputDialog)
+from PyQt5.QtCore import QTimer, Qt, QSettings, pyqtSignal
 from PyQt5.QtGui import QCursor
 import qdarkstyle
 
 # Modülleri import et
 from ui.components.auto_heal_buff_widget import AutoHealBuffWidget
-from services.keyboard_mouse_service import KeyboardMouseService
+from services.keyboard_mouse_service import KeyboardMouseService, InputTimingProfile
+from services.input_sender import InputSender
+from services.common.keycodes import InvalidKeyError
+from services.common.rate_governor import InputRateGovernor, PRIORITY_HEAL, PRIORITY_BUFF
 from services.screen_service import ScreenService
 from core.heal_logic import HealHelper
+from core.coordinate_space import CoordinateSpace
+from core.party_detector import detect_party_rows
+from core.party_layout import PartyLayout
 from core.buff_logic import BuffHelper
 from config.settings_manager import SettingsManager
+from config.settings_watcher import SettingsWatcher
+from config.schema import parse_coords, SettingsError
+from services.window_rect import create_window_rect_provider
+from core.utils.log_dedup import DuplicateLogFilter
+from core.utils.metrics import registry as metrics_registry, MetricsExporter
+from core.utils.tracing import tracer
+from core.utils.profiler import SamplingProfiler
+
+# Log kayıtlarını disk ve konsola yazan arka plan dinleyicisi
+_log_listener = None
+
+# Tekrarlanan log kayıtlarını toplayan filtre
+_dedup_filter = None
+
+# Parti barı algılamadan önce kullanıcının oyun penceresine geçmesi için beklenen süre
+PARTY_DETECTION_DELAY_MS = 3000
+
+# Log formatı
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+class DeferredQueueHandler(logging.handlers.QueueHandler):
+    """
+    Log kayıtlarını biçimlendiriciyi çalıştırmadan kuyruğa ekleyen QueueHandler.
+    
+    Standart QueueHandler kaydı kuyruğa eklemeden önce çağıran iş parçacığında tam olarak biçimlendirir.
+    Burada yalnızca mesaj argümanlarla birleştirilir ve istisna bilgisi metne çevrilir: değiştirilebilir
+    argümanlar kayıt yazılmadan önce değişemez, traceback ve çerçeveleri kuyrukta canlı tutulmaz.
+    Biçimlendirici (zaman damgası, düzen) dinleyici iş parçacığında çalışır, böylece motor döngüleri
+    yalnızca mesaj birleştirme ve kuyruğa ekleme maliyetini öder.
+    """
+    
+    # İstisna metni için biçimlendirici (handler'ın kendi biçimlendiricisi yoktur)
+    _exception_formatter = logging.Formatter()
+    
+    def prepare(self, record):
+        # Aynı kayıt başka handler'lara da gider, kopyası değiştirilir
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = self._exception_formatter.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+def _parse_log_level(value, default=logging.INFO):
+    """
+    Log seviyesi adını (ör. "WARNING") sayısal değere dönüştürür.
+    
+    Args:
+        value (str): Seviye adı.
+        default (int): Geçersiz değerde kullanılacak seviye.
+        
+    Returns:
+        int: Log seviyesi.
+    """
+    level = logging.getLevelName(value.strip().upper())
+    return level if isinstance(level, int) else default
+
+def _load_logging_config(config_file):
+    """
+    Ayar dosyasındaki [Logging] bölümünü okur.
+    
+    Biçim:
+        level = INFO
+        logger_levels = HealLogic:WARNING, InputSender:DEBUG
+        dedup_window = 10
+        dedup_burst = 1
+    
+    Logger adları büyük/küçük harf duyarlı olduğundan seviyeler anahtar yerine değer olarak yazılır.
+    dedup_window 0 ise tekrar filtresi kapatılır.
+    
+    Args:
+        config_file (str): Ayar dosyası yolu.
+        
+    Returns:
+        dict: level, logger_levels, dedup_window ve dedup_burst değerleri.
+    """
+    settings = {
+        "level": logging.INFO,
+        "logger_levels": {},
+        "dedup_window": 10.0,
+        "dedup_burst": 1
+    }
+    
+    config = configparser.ConfigParser()
+    try:
+        config.read(config_file, encoding="utf-8")
+    except configparser.Error:
+        return settings
+    
+    if not config.has_section('Logging'):
+        return settings
+    
+    section = config['Logging']
+    settings["level"] = _parse_log_level(section.get('level', 'INFO'))
+    for item in section.get('logger_levels', '').split(','):
+        if ':' not in item:
+            continue
+        name, level = item.split(':', 1)
+        settings["logger_levels"][name.strip()] = _parse_log_level(level, settings["level"])
+    
+    try:
+        settings["dedup_window"] = max(0.0, section.getfloat('dedup_window', settings["dedup_window"]))
+        settings["dedup_burst"] = max(1, section.getint('dedup_burst', settings["dedup_burst"]))
+    except ValueError:
+        pass
+    
+    return settings
 
 # Logging yapılandırması
-def configure_logging():
+def configure_logging(config_file="settings.ini"):
     """
     Uygulama için loglamayı yapılandırır.
+    
+    Kök logger'a yalnızca bir kuyruk handler'ı eklenir; dosya ve konsol yazımı
+    QueueListener iş parçacığında yapılır. Böylece iyileştirme döngüsü log yazarken
+    disk veya konsol G/Ç'si için beklemez. Aynı mesajın tekrarları kuyruğa girmeden
+    DuplicateLogFilter ile toplanır.
+    
+    Args:
+        config_file (str): Logger seviyelerinin okunacağı ayar dosyası.
     """
+    global _log_listener, _dedup_filter
+    
     # Logs klasörünü oluştur
     if not os.path.exists("logs"):
         os.makedirs("logs")
     
+    settings = _load_logging_config(config_file)
+    
     # Kök logger yapılandırması
     logger = logging.getLogger()
-    logger.setLevel(logging.INFO)
+    logger.setLevel(settings["level"])
+    
+    # Logger bazında seviyeler
+    for name, level in settings["logger_levels"].items():
+        logging.getLogger(name).setLevel(level)
     
     # Handler'lar
     # Dosya handler (günlük bazında dönen log dosyaları)
@@ -43,31 +180,76 @@ def configure_logging():
         interval=1, 
         backupCount=7
     )
-    file_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+    file_handler.setFormatter(logging.Formatter(LOG_FORMAT))
     
     # Konsol handler
     console_handler = logging.StreamHandler()
-    console_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+    console_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+    
+    # Dosya ve konsol handler'ları arka plan dinleyicisinde çalışır
+    log_queue = queue.SimpleQueue()
+    _log_listener = logging.handlers.QueueListener(
+        log_queue, file_handler, console_handler, respect_handler_level=True
+    )
+    _log_listener.start()
+    atexit.register(shutdown_logging)
+    
+    # Kök logger'a yalnızca kuyruk handler'ını ekle
+    queue_handler = DeferredQueueHandler(log_queue)
+    logger.addHandler(queue_handler)
     
-    # Handler'ları logger'a ekle
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
+    # Tekrarlanan mesajları pencere başına sınırla ve özetleri düzenli olarak yaz
+    if settings["dedup_window"] > 0:
+        _dedup_filter = DuplicateLogFilter(settings["dedup_window"], settings["dedup_burst"])
+        _dedup_filter.attach(queue_handler)
+        _dedup_filter.start_flusher()
     
     return logger
 
+def shutdown_logging():
+    """Bekleyen tekrar özetlerini ve kuyruktaki log kayıtlarını yazar, dinleyiciyi durdurur."""
+    global _log_listener, _dedup_filter
+    
+    if _dedup_filter is not None:
+        _dedup_filter.stop_flusher()
+        _dedup_filter = None
+    
+    if _log_listener is not None:
+        _log_listener.stop()
+        _log_listener = None
+
 # Ana pencere sınıfı
 class MainWindow(QMainWindow):
     """Ana uygulama penceresi"""
     
+    # BuffHelper iş parçacığından buff yapıldığında yayınlanır: (buff indeksi, Unix zamanı)
+    buff_cast = pyqtSignal(int, float)
+    
     def __init__(self):
         super().__init__()
         
+        # Ayarlar yöneticisi
+        self.settings_manager = SettingsManager()
+        
         # Servisler
-        self.keyboard_mouse_service = KeyboardMouseService()
+        timing = InputTimingProfile.from_config(self.settings_manager.get_config_section('InputTiming'))
+        self.keyboard_mouse_service = KeyboardMouseService(timing)
         self.screen_service = ScreenService()
         
-        # Ayarlar yöneticisi
-        self.settings_manager = SettingsManager()
+        # Girdiler ayrı bir iş parçacığından gönderilir, motor döngüleri girdi için beklemez.
+        # Tüm üreticiler (iyileştirme, toplu iyileştirme, buff) aynı hız denetleyicisini paylaşır.
+        governor = InputRateGovernor.from_config(self.settings_manager.get_config_section('InputRate'))
+        self.input_sender = InputSender(self.keyboard_mouse_service, governor)
+        self.input_sender.start()
+        
+        # Ölçümler belirli aralıklarla dosyaya yazılır
+        self.metrics_exporter = self._create_metrics_exporter()
+        
+        # Satır koordinatlarını oyun penceresinin konumuna ve çözünürlüğüne göre çeviren koordinat uzayı
+        self.coordinate_space = self._create_coordinate_space()
+        
+        # Motor iş parçacıkları için isteğe bağlı profilleyici
+        self.profiler = SamplingProfiler()
         
         # Ana UI bileşeni
         self.main_widget = AutoHealBuffWidget(self)
@@ -87,10 +269,185 @@ class MainWindow(QMainWindow):
         # Ayarları yükle
         self.load_settings()
         
+        # Arayüzdeki değişiklikler kısa bir gecikmeyle arka planda kaydedilir
+        self.main_widget.settings_changed.connect(self._on_settings_edited)
+        
+        # Motorun yaptığı buff'lar arayüz iş parçacığında işlenir
+        self.buff_cast.connect(self._on_buff_cast)
+        
+        # Ayar dosyası dışarıdan değiştirilirse yeniden başlatmadan uygula
+        self.settings_watcher = None
+        self._start_settings_watcher()
+        
         # Logla
         logging.info("Knight Online Otomatik İyileştirme ve Buff Sistemi başlatıldı.")
         self.statusBar().showMessage("Knight Online Otomatik İyileştirme ve Buff Sistemi hazır!", 5000)
         
+    def _create_metrics_exporter(self):
+        """
+        [Metrics] bölümüne göre ölçüm dışa aktarıcısını oluşturur ve başlatır.
+        
+        export_interval 0 ise dışa aktarma kapalıdır.
+        
+        Returns:
+            MetricsExporter: Başlatılan dışa aktarıcı veya kapalıysa None.
+        """
+        config = self.settings_manager.get_config_section('Metrics')
+        path = config.get('export_path', 'logs/metrics.json')
+        try:
+            interval = float(config.get('export_interval', 10))
+        except ValueError:
+            logging.warning(f"Geçersiz ölçüm aralığı: {config.get('export_interval')}")
+            interval = 10.0
+        
+        if interval <= 0 or not path:
+            return None
+        
+        exporter = MetricsExporter(metrics_registry, path, interval)
+        exporter.start()
+        return exporter
+    
+    def _create_coordinate_space(self):
+        """
+        [Window] bölümüne göre koordinat uzayını oluşturur.
+        
+        title boşsa pencere takip edilmez ve koordinatlar ekran koordinatı olarak kullanılır.
+        reference, koordinatların alındığı istemci alanıdır ([sol, üst, genişlik, yükseklik]).
+        
+        Returns:
+            CoordinateSpace: Koordinat uzayı.
+        """
+        config = self.settings_manager.get_config_section('Window')
+        try:
+            reference = parse_coords(config.get('reference', '[]'))
+            if reference and (reference[2] <= 0 or reference[3] <= 0):
+                raise SettingsError(f"genişlik ve yükseklik pozitif olmalı: {list(reference)}")
+        except SettingsError as e:
+            logging.warning(f"Geçersiz pencere referans alanı: {e}")
+            reference = None
+        
+        return CoordinateSpace(create_window_rect_provider(config.get('title', '').strip()), reference)
+    
+    def _store_window_reference(self):
+        """Koordinat uzayının referans alanı yeni belirlendiyse [Window] bölümüne kaydeder."""
+        reference = self.coordinate_space.reference
+        if reference is None:
+            return
+        
+        self.settings_manager.update_config_section('Window', {'reference': str(list(reference))})
+        self.settings_manager.schedule_save()
+    
+    def _to_reference(self, x, y):
+        """
+        Yakalanan ekran koordinatını satır koordinatlarının saklandığı referans alanına çevirir.
+        
+        Args:
+            x: Ekran X koordinatı.
+            y: Ekran Y koordinatı.
+        
+        Returns:
+            tuple: (x, y) referans koordinatı.
+        """
+        x, y = self.coordinate_space.to_reference(x, y)
+        self._store_window_reference()
+        return x, y
+    
+    def _start_settings_watcher(self):
+        """
+        [SettingsWatcher] bölümüne göre ayar dosyası izleyicisini başlatır.
+        
+        interval 0 ise izleme kapalıdır.
+        """
+        config = self.settings_manager.get_config_section('SettingsWatcher')
+        try:
+            interval = float(config.get('interval', 1))
+        except ValueError:
+            logging.warning(f"Geçersiz ayar izleme aralığı: {config.get('interval')}")
+            interval = 1.0
+        
+        if interval <= 0:
+            return
+        
+        self.settings_watcher = SettingsWatcher(self.settings_manager.config_file)
+        self.settings_watch_timer = QTimer(self)
+        self.settings_watch_timer.timeout.connect(self._check_settings_file)
+        self.settings_watch_timer.start(int(interval * 1000))
+    
+    def _check_settings_file(self):
+        """
+        Ayar dosyası değiştiyse yeniden okur ve yalnızca değişen alanları arayüze ve çalışan motora aktarır.
+        
+        Motor yeniden başlatılmadığı için bekleme süreleri ve buff zamanlayıcıları korunur.
+        """
+        try:
+            if not self.settings_watcher.poll():
+                return
+            
+            # Arka planda kaydettiğimiz dosya dışarıdan yapılmış değişiklik sayılmaz
+            if self.settings_watcher.signature == self.settings_manager.written_signature:
+                return
+            
+            # Kaydedilmemiş arayüz değişiklikleri atılmaz: yalnızca diskte değişen anahtarlar birleştirilir
+            previous = self.settings_manager.get_auto_heal_buff_settings()
+            if not self.settings_manager.reload_config():
+                return
+            self.settings_manager.schedule_save()
+            current = self.settings_manager.get_auto_heal_buff_settings()
+            self._rebuild_profiles_menu()
+            
+            changes = previous.changed_fields(current)
+            if not changes:
+                return
+            
+            logging.info(f"Ayar dosyasından güncellenen alanlar: {', '.join(sorted(changes))}")
+            self.main_widget.load_config(current, changes)
+            
+            if self.is_running:
+                self._apply_running_settings(current, changes)
+            
+            self.statusBar().showMessage("Ayar dosyasındaki değişiklikler uygulandı.", 5000)
+        
+        except Exception as e:
+            logging.error(f"Ayar dosyası değişiklikleri uygulanırken hata: {e}")
+    
+    def _apply_running_settings(self, settings, changes):
+        """
+        Değişen ayarları çalışan motora aktarır.
+        
+        Args:
+            settings: Yeni AutoHealBuffSettings nesnesi.
+            changes: settings.changed_fields() çıktısı.
+        """
+        try:
+            self._compile_keys(settings)
+        except InvalidKeyError as e:
+            logging.error(f"Ayar değişiklikleri motora uygulanmadı, geçersiz tuş: {e}")
+            self.statusBar().showMessage(f"Geçersiz tuş: {e}", 5000)
+            return
+        
+        self.heal_helper.apply_settings(settings, changes)
+        self.buff_helper.apply_settings(settings, changes)
+        if "max_frame_age" in changes:
+            self.input_sender.set_max_age(PRIORITY_HEAL, settings.max_frame_age / 1000.0)
+        
+        # Yeni etkinleşen satır veya buff varsa ilgili döngüyü başlat
+        if settings.active_rows and not self.heal_helper.running:
+            self.heal_helper.start()
+        if settings.active_buffs and not self.buff_helper.running:
+            self.buff_helper.start()
+    
+    def _log_session_metrics(self):
+        """Oturum boyunca ölçülen yakalama, analiz ve tepki gecikmelerinin p50/p99 değerlerini loglar."""
+        for name, label in (("screen_capture_seconds", "Yakalama"),
+                            ("hp_analysis_seconds", "Analiz"),
+                            ("heal_reaction_seconds", "Tepki")):
+            histogram = metrics_registry.get(name)
+            if histogram is None or histogram.count == 0:
+                continue
+            snapshot = histogram.snapshot()
+            logging.info(f"{label} gecikmesi: p50={snapshot['p50'] * 1000:.1f} ms, "
+                         f"p99={snapshot['p99'] * 1000:.1f} ms ({snapshot['count']} örnek)")
+    
     def setup_ui(self):
         """UI bileşenlerini oluşturur"""
         self.setWindowTitle("Knight Online Otomatik İyileştirme ve Buff Sistemi")
@@ -144,16 +501,35 @@ class MainWindow(QMainWindow):
         # Ayır
         control_menu.addSeparator()
         
-        # Koordinat eylem menüsü
-        coords_menu = QMenu("Koordinat Al", self)
+        # Koordinat eylem menüsü (satır sayısı değişebildiği için her açılışta yeniden oluşturulur)
+        self.coords_menu = QMenu("Koordinat Al", self)
+        self.coords_menu.aboutToShow.connect(self._rebuild_coords_menu)
+        control_menu.addMenu(self.coords_menu)
         
-        # Satır için koordinat eylemleri
-        for i in range(8):
-            action = QAction(f"Satır {i+1} Koordinatları", self)
-            action.triggered.connect(lambda checked, idx=i: self.start_coordinate_capture(idx))
-            coords_menu.addAction(action)
+        # Parti barlarını otomatik algılama eylemi
+        detect_action = QAction("Parti Barlarını Algıla", self)
+        detect_action.setShortcut("Ctrl+D")
+        detect_action.triggered.connect(self.start_party_detection)
+        control_menu.addAction(detect_action)
+        
+        # Profiller menüsü (profil listesi değiştikçe yeniden oluşturulur)
+        self.profiles_menu = menubar.addMenu("Profiller")
+        self._rebuild_profiles_menu()
         
-        control_menu.addMenu(coords_menu)
+        # Tanılama menüsü
+        diagnostics_menu = menubar.addMenu("Tanılama")
+        
+        # İzleme (Chrome trace) eylemi
+        self.trace_action = QAction("İzlemeyi Başlat", self)
+        self.trace_action.setShortcut("Ctrl+T")
+        self.trace_action.triggered.connect(self.toggle_tracing)
+        diagnostics_menu.addAction(self.trace_action)
+        
+        # Profilleme eylemi
+        self.profile_action = QAction("Motoru Profille", self)
+        self.profile_action.setShortcut("Ctrl+P")
+        self.profile_action.triggered.connect(self.start_profiling)
+        diagnostics_menu.addAction(self.profile_action)
         
         # Yardım menüsü
         help_menu = menubar.addMenu("Yardım")
@@ -163,6 +539,68 @@ class MainWindow(QMainWindow):
         about_action.triggered.connect(self.show_about)
         help_menu.addAction(about_action)
     
+    def toggle_tracing(self):
+        """
+        Motor döngülerinin izlenmesini başlatır veya durdurur.
+        
+        Durdurulduğunda kayıt logs klasörüne Chrome trace-event JSON olarak yazılır
+        (Perfetto veya chrome://tracing ile açılabilir).
+        """
+        if not tracer.enabled:
+            tracer.enable()
+            self.trace_action.setText("İzlemeyi Durdur ve Kaydet")
+            self.statusBar().showMessage("İzleme başlatıldı.", 5000)
+            return
+        
+        tracer.disable()
+        self.trace_action.setText("İzlemeyi Başlat")
+        try:
+            path = os.path.join("logs", f"trace_{time.strftime('%Y%m%d_%H%M%S')}.json")
+            count = tracer.dump(path)
+            self.statusBar().showMessage(f"İzleme kaydedildi: {path} ({count} olay)", 10000)
+        except Exception as e:
+            logging.error(f"İzleme kaydı yazılırken hata: {e}")
+            self.statusBar().showMessage(f"Hata: {e}", 5000)
+    
+    def start_profiling(self):
+        """
+        HealHelper ve BuffHelper iş parçacıklarını [Profiler] duration saniye boyunca profiller.
+        
+        Sonuç logs klasörüne collapsed-stack dosyası olarak yazılır.
+        """
+        if not self.is_running:
+            self.statusBar().showMessage("Profilleme için önce sistemi başlatın.", 5000)
+            return
+        if self.profiler.running:
+            self.statusBar().showMessage("Profilleme zaten devam ediyor.", 5000)
+            return
+        
+        config = self.settings_manager.get_config_section('Profiler')
+        try:
+            duration = float(config.get('duration', 10))
+            self.profiler.interval = float(config.get('sample_interval', 0.005))
+        except ValueError:
+            logging.warning("Geçersiz profilleme ayarı, varsayılanlar kullanılacak.")
+            duration = 10.0
+            self.profiler.interval = 0.005
+        
+        path = os.path.join("logs", f"profile_{time.strftime('%Y%m%d_%H%M%S')}.collapsed")
+        if self.profiler.start(duration, path):
+            self.profile_action.setEnabled(False)
+            self.statusBar().showMessage(f"Profilleme başladı ({duration:g} sn)...", int(duration * 1000))
+            QTimer.singleShot(int(duration * 1000) + 500, self._on_profiling_finished)
+    
+    def _on_profiling_finished(self):
+        """Profilleme bittiğinde sonucu durum çubuğunda gösterir."""
+        if self.profiler.running:
+            # Yazma henüz bitmediyse kısa süre sonra tekrar kontrol et
+            QTimer.singleShot(250, self._on_profiling_finished)
+            return
+        
+        self.profile_action.setEnabled(True)
+        self.statusBar().showMessage(
+            f"Profil kaydedildi: {self.profiler.output_path} ({self.profiler.sample_count} örnek)", 10000)
+    
     def setup_shortcuts(self):
         """Kısayol tuşlarını ayarlar"""
         # F10 - Başlat/Durdur
@@ -170,17 +608,26 @@ class MainWindow(QMainWindow):
         self.shortcut_start_stop.setSingleShot(True)
         self.shortcut_start_stop.timeout.connect(self.toggle_start_stop)
     
+    def _on_settings_edited(self):
+        """Arayüzde bir ayar değiştiğinde ayarları günceller ve gecikmeli kaydetmeyi planlar."""
+        try:
+            self.settings_manager.set_auto_heal_buff_settings(self.main_widget.to_settings())
+            self.settings_manager.schedule_save()
+        except Exception as e:
+            logging.error(f"Ayar değişikliği işlenirken hata: {e}")
+    
     def save_settings(self):
-        """Ayarları kaydeder"""
+        """Ayarları kaydeder (değişiklik yoksa dosya yazılmaz)"""
         try:
-            # UI bileşeninden ayarları al
-            ui_config = self.main_widget.save_config(self.settings_manager.get_config_section('AutoHealBuff'))
+            # UI bileşeninden ayarları al ve ayarlar yöneticisine aktar
+            self.settings_manager.set_auto_heal_buff_settings(self.main_widget.to_settings())
             
-            # Ayarlar yöneticisine aktar
-            self.settings_manager.update_config_section('AutoHealBuff', ui_config)
+            # Bekleyen gecikmeli kaydı iptal edip hemen kaydet
+            saved = self.settings_manager.flush()
             
-            # Kaydet
-            saved = self.settings_manager.save_config()
+            # Kendi yazdığımız değişiklik dosya izleyicisi tarafından yeniden uygulanmasın
+            if self.settings_watcher:
+                self.settings_watcher.sync()
             
             # Başarılı mesajı
             if saved:
@@ -197,8 +644,8 @@ class MainWindow(QMainWindow):
     def load_settings(self):
         """Ayarları yükler"""
         try:
-            # UI bileşenine ayarları yükle
-            self.main_widget.load_config(self.settings_manager.get_config_section('AutoHealBuff'))
+            # UI bileşenine doğrulanmış ayarları yükle
+            self.main_widget.load_config(self.settings_manager.get_auto_heal_buff_settings())
             
             # Başarılı mesajı
             self.statusBar().showMessage("Ayarlar başarıyla yüklendi!", 5000)
@@ -221,59 +668,66 @@ class MainWindow(QMainWindow):
             if self.is_running:
                 return
             
-            # UI bileşeninden yapılandırmayı al
-            rows_data, heal_data, buffs_data = self.main_widget.start_working()
+            # UI bileşeninden ayarların anlık görüntüsünü al
+            settings = self.main_widget.start_working()
+            
+            # Tuşları başlamadan önce doğrula ve derle, geçersiz tuşla sistem başlatılmaz
+            try:
+                self._compile_keys(settings)
+            except InvalidKeyError as e:
+                self.main_widget.stop_working()
+                logging.error(f"Sistem başlatılamadı, geçersiz tuş: {e}")
+                QMessageBox.warning(self, "Geçersiz Tuş", f"Sistem başlatılamadı.\n\n{e}")
+                return
+            
+            # Çalışırken profil değişimi yalnızca hazır nesneleri aktarsın
+            self._precompile_profiles()
             
             logging.info("Sistem başlatılıyor... HealHelper oluşturuluyor.")
             
+            # Her oturumun gecikmeleri ayrı ölçülür
+            metrics_registry.reset()
+            
             # HealHelper'ı oluştur
             self.heal_helper = HealHelper(
-                self.keyboard_mouse_service.click,
-                self.keyboard_mouse_service.press_key,
-                self.screen_service.take_screenshot,
+                self.input_sender.click,
+                self.input_sender.press_key,
+                self.screen_service.capture_frame,
                 None  # Pencere referansı gerekirse buraya eklenir
             )
             
-            # HealHelper ayarları
-            self.heal_helper.set_heal_percentage(heal_data.get("heal_percentage", 80))
-            self.heal_helper.set_heal_key(heal_data.get("heal_key", "1"))
-            self.heal_helper.set_active(heal_data.get("heal_active", False))
+            # HealHelper ayarları (tuşlar, eşikler, kontrol aralığı ve satırlar)
+            self.heal_helper.apply_settings(settings)
             
-            # Toplu heal ayarları
-            self.heal_helper.set_mass_heal_percentage(heal_data.get("mass_heal_percentage", 60))
-            self.heal_helper.set_mass_heal_key(heal_data.get("mass_heal_key", "2"))
-            self.heal_helper.set_mass_heal_active(heal_data.get("mass_heal_active", False))
-            self.heal_helper.set_party_check_enabled(heal_data.get("mass_heal_party_check", False))
+            # İyileştirmeler kuyrukta kararın dayandığı kareden daha uzun beklemez
+            self.input_sender.set_max_age(PRIORITY_HEAL, settings.max_frame_age / 1000.0)
             
-            # Aktif satırları ayarla
-            for idx, row_data in enumerate(rows_data):
-                if row_data["active"] and len(row_data["coords"]) == 4:
-                    logging.info(f"Aktif satır ayarlanıyor: {idx+1}, Koordinatlar: {row_data['coords']}")
-                    self.heal_helper.set_row_active(idx, True)
-                    self.heal_helper.set_row_coords(idx, row_data["coords"])
+            # Satır bölgeleri oyun penceresinin güncel konumuna göre hesaplanır, döngü her adımda pencereyi yoklar
+            self.heal_helper.set_coordinate_space(self.coordinate_space)
+            self._store_window_reference()
             
             logging.info("BuffHelper oluşturuluyor.")
             
             # BuffHelper'ı oluştur
             self.buff_helper = BuffHelper(
-                self.keyboard_mouse_service.press_key
+                functools.partial(self.input_sender.press_key, priority=PRIORITY_BUFF)
             )
             
             # BuffHelper ayarları
-            for buff_id, buff_data in buffs_data.items():
-                if buff_data["active"]:
-                    self.buff_helper.set_buff_active(int(buff_id), True)
-                    self.buff_helper.set_buff_key(int(buff_id), buff_data["key"])
-                    self.buff_helper.set_buff_duration(int(buff_id), buff_data["duration"])
+            self.buff_helper.apply_settings(settings)
+            
+            # Önceki oturumdan kalan buff süreleri kaldığı yerden devam eder
+            self._restore_buff_timers()
+            self.buff_helper.cast_callback = self.buff_cast.emit
             
             # HealHelper'ı başlat
-            if any(row_data["active"] for row_data in rows_data):
+            if settings.active_rows:
                 logging.info("HealHelper başlatılıyor...")
                 self.heal_helper.start()
                 logging.info("HealHelper başlatıldı!")
             
             # BuffHelper'ı başlat
-            if any(buff_data["active"] for buff_id, buff_data in buffs_data.items()):
+            if settings.active_buffs:
                 logging.info("BuffHelper başlatılıyor...")
                 self.buff_helper.start()
                 logging.info("BuffHelper başlatıldı!")
@@ -290,6 +744,157 @@ class MainWindow(QMainWindow):
             logging.error(f"Sistem başlatılırken hata: {e}")
             self.statusBar().showMessage(f"Hata: {e}", 5000)
     
+    def _precompile_profiles(self):
+        """Etkin olmayan profilleri ayrıştırır ve tuşlarını önceden derler (geçersiz tuşlar geçişte raporlanır)."""
+        for name in self.settings_manager.list_profiles():
+            settings = self.settings_manager.get_profile_settings(name)
+            try:
+                self._compile_keys(settings)
+            except InvalidKeyError as e:
+                logging.debug(f"'{name}' profilinde geçersiz tuş: {e}")
+    
+    def _rebuild_profiles_menu(self):
+        """Profiller menüsünü kayıtlı profillere göre yeniden oluşturur."""
+        self.profiles_menu.clear()
+        active = self.settings_manager.active_profile
+        
+        # Profil seçimi (ilk dokuz profil Ctrl+1..9 ile seçilebilir)
+        group = QActionGroup(self.profiles_menu)
+        for index, name in enumerate(self.settings_manager.list_profiles()):
+            action = QAction(name, self.profiles_menu, checkable=True)
+            action.setChecked(name == active)
+            if index < 9:
+                action.setShortcut(f"Ctrl+{index + 1}")
+            action.triggered.connect(lambda checked, profile=name: self.switch_profile(profile))
+            group.addAction(action)
+            self.profiles_menu.addAction(action)
+        
+        self.profiles_menu.addSeparator()
+        
+        # Yeni profil eylemi
+        new_action = QAction("Farklı Profil Olarak Kaydet...", self.profiles_menu)
+        new_action.triggered.connect(self.create_profile)
+        self.profiles_menu.addAction(new_action)
+        
+        # Profil silme eylemi
+        delete_action = QAction("Profil Sil...", self.profiles_menu)
+        delete_action.setEnabled(len(group.actions()) > 1)
+        delete_action.triggered.connect(self.delete_profile)
+        self.profiles_menu.addAction(delete_action)
+    
+    def switch_profile(self, name):
+        """
+        Etkin profili değiştirir.
+        
+        Yalnızca profiller arasında farklı olan alanlar arayüze ve çalışan motora aktarılır;
+        yardımcılar yeniden oluşturulmaz, bekleme süreleri ve buff zamanlayıcıları korunur.
+        
+        Args:
+            name: Geçilecek profil adı.
+        """
+        try:
+            # Kaydedilmemiş arayüz değişiklikleri mevcut profilde kalsın
+            self.settings_manager.set_auto_heal_buff_settings(self.main_widget.to_settings())
+            previous = self.settings_manager.get_auto_heal_buff_settings()
+            
+            settings = self.settings_manager.switch_profile(name)
+            if settings is None:
+                self.statusBar().showMessage(f"Profil bulunamadı: {name}", 5000)
+                self._rebuild_profiles_menu()
+                return
+            
+            changes = previous.changed_fields(settings)
+            if changes:
+                self.main_widget.load_config(settings, changes)
+                if self.is_running:
+                    self._apply_running_settings(settings, changes)
+            
+            self.settings_manager.schedule_save()
+            self._rebuild_profiles_menu()
+            self.statusBar().showMessage(f"Profil: {name}", 5000)
+        
+        except Exception as e:
+            logging.error(f"Profil değiştirilirken hata: {e}")
+            self.statusBar().showMessage(f"Hata: {e}", 5000)
+    
+    def create_profile(self):
+        """Mevcut ayarları kullanıcının verdiği adla yeni profil olarak kaydeder."""
+        name, ok = QInputDialog.getText(self, "Yeni Profil", "Profil adı:")
+        if not ok:
+            return
+        
+        self.settings_manager.set_auto_heal_buff_settings(self.main_widget.to_settings())
+        if not self.settings_manager.create_profile(name):
+            QMessageBox.warning(self, "Profil", f"Profil oluşturulamadı: '{name}' geçersiz veya zaten var.")
+            return
+        
+        self.settings_manager.schedule_save()
+        self._rebuild_profiles_menu()
+        self.statusBar().showMessage(f"Profil: {name.strip()}", 5000)
+    
+    def delete_profile(self):
+        """Kullanıcının seçtiği etkin olmayan profili siler."""
+        active = self.settings_manager.active_profile
+        names = [name for name in self.settings_manager.list_profiles() if name != active]
+        if not names:
+            return
+        
+        name, ok = QInputDialog.getItem(self, "Profil Sil", "Silinecek profil:", names, 0, False)
+        if not ok or not self.settings_manager.delete_profile(name):
+            return
+        
+        self.settings_manager.schedule_save()
+        self._rebuild_profiles_menu()
+        self.statusBar().showMessage(f"Profil silindi: {name}", 5000)
+    
+    def _restore_buff_timers(self):
+        """Kaydedilmiş son buff zamanlarını BuffHelper'a yükler ve arayüzü motorla eşitler."""
+        self.buff_helper.restore_buff_timers(self.settings_manager.load_buff_timers())
+        
+        # Geri yüklenmeyen buff'lar yeni yapılmış sayılır; çökme olursa bu varsayım korunur
+        timers = self.buff_helper.get_buff_timers()
+        for buff_index, timer in timers.items():
+            self.main_widget.set_buff_last_used(buff_index, timer["last_cast"])
+        self.settings_manager.save_buff_timers(timers)
+    
+    def _save_buff_timers(self):
+        """BuffHelper'daki son buff zamanlarını dosyaya kaydeder."""
+        if self.buff_helper:
+            self.settings_manager.save_buff_timers(self.buff_helper.get_buff_timers())
+    
+    def _on_buff_cast(self, buff_index, wall_time):
+        """
+        Motor bir buff yaptığında arayüzdeki kalan süreyi günceller ve zamanı kaydeder.
+        
+        Args:
+            buff_index: Buff indeksi.
+            wall_time: Buff zamanı (Unix zamanı).
+        """
+        self.main_widget.set_buff_last_used(buff_index, wall_time)
+        self._save_buff_timers()
+    
+    def _compile_keys(self, settings):
+        """
+        Kullanılacak tüm tuşları doğrular ve girdi arka ucu için önceden derler.
+        
+        Ayar nesnesindeki KeyChord nesneleri yerinde hazırlanır, motor aynı nesneleri kullanır.
+        
+        Args:
+            settings: AutoHealBuffSettings nesnesi.
+            
+        Raises:
+            InvalidKeyError: Etkin bir özellikte geçersiz tuş varsa (mesaj tuşun yerini belirtir).
+        """
+        settings.validate_keys()
+        
+        chords = [settings.heal_chord if settings.heal_active else None,
+                  settings.mass_heal_chord if settings.mass_heal_active else None]
+        chords.extend(row.select_chord for row in settings.active_rows)
+        chords.extend(buff.chord for buff in settings.active_buffs)
+        for chord in chords:
+            if chord is not None:
+                self.keyboard_mouse_service.compile_key(chord)
+    
     def stop_system(self):
         """Heal ve buff sistemini durdurur"""
         try:
@@ -301,11 +906,23 @@ class MainWindow(QMainWindow):
                 self.heal_helper.stop()
                 self.heal_helper = None
             
-            # BuffHelper'ı durdur
+            # Pencere referans alanı döngü sırasında belirlendiyse kaydet
+            self._store_window_reference()
+            
+            # BuffHelper'ı durdur, son buff zamanlarını kaydet
             if self.buff_helper:
                 self.buff_helper.stop()
+                self._save_buff_timers()
                 self.buff_helper = None
             
+            # Henüz gönderilmemiş girdileri iptal et
+            self.input_sender.clear()
+            
+            # Oturum ölçümlerini logla ve dosyaya yaz
+            self._log_session_metrics()
+            if self.metrics_exporter:
+                self.metrics_exporter.export()
+            
             # UI bileşeni durumunu güncelle
             self.main_widget.stop_working()
             
@@ -342,6 +959,61 @@ class MainWindow(QMainWindow):
         logging.info(f"Satır {row_index + 1} için koordinat alma modu başlatıldı.")
         self.statusBar().showMessage(f"Satır {row_index + 1} için koordinat alma modu aktif! İlk koordinat için CTRL tuşuna basın.", 0)
     
+    def _rebuild_coords_menu(self):
+        """Koordinat Al menüsünü güncel satır sayısına göre yeniden oluşturur."""
+        self.coords_menu.clear()
+        for i in range(len(self.main_widget.heal_rows)):
+            action = QAction(f"Satır {i+1} Koordinatları", self)
+            action.triggered.connect(lambda checked, idx=i: self.start_coordinate_capture(idx))
+            self.coords_menu.addAction(action)
+    
+    def start_party_detection(self):
+        """Kullanıcının oyun penceresine geçmesi için kısa bir süre bekleyip parti barlarını algılar."""
+        if self.is_running:
+            QMessageBox.warning(self, "Uyarı", "Parti barlarını algılamak için önce sistemi durdurun!")
+            return
+        
+        self.statusBar().showMessage(
+            f"Parti barları {PARTY_DETECTION_DELAY_MS // 1000} saniye sonra algılanacak, oyun penceresine geçin...", 0)
+        QTimer.singleShot(PARTY_DETECTION_DELAY_MS, self.detect_party_bars)
+    
+    def detect_party_bars(self):
+        """
+        Tek bir ekran görüntüsünde parti HP barlarını bulur ve satır koordinatlarını ayarlar.
+        
+        Barlar eşit aralıklıysa ilk bar ve aralıktan parti düzeni şablonu oluşturulup tüm satırlara
+        uygulanır; aralık belirlenemezse (tek bar) yalnızca bulunan barlar satır 1, 2, ... olarak atanır.
+        """
+        try:
+            frame = self.screen_service.capture_frame()
+            if frame is None:
+                self.statusBar().showMessage("Parti barları algılanamadı: ekran görüntüsü alınamadı.", 5000)
+                return
+            
+            detection_start = time.perf_counter()
+            bars = detect_party_rows(frame.image, len(self.main_widget.heal_rows))
+            elapsed_ms = (time.perf_counter() - detection_start) * 1000
+            
+            if not bars:
+                self.statusBar().showMessage("Parti HP barı bulunamadı.", 5000)
+                return
+            
+            # Koordinatlar referans alanında saklanır
+            bars = [(*self._to_reference(x1, y1), *self._to_reference(x2, y2)) for x1, y1, x2, y2 in bars]
+            layout = PartyLayout.from_bars(bars, len(self.main_widget.heal_rows))
+            if layout is not None:
+                self.main_widget.apply_layout(layout)
+            else:
+                for row_widget, coords in zip(self.main_widget.heal_rows, bars):
+                    row_widget.set_coordinates(list(coords))
+            
+            logging.info(f"{len(bars)} parti HP barı algılandı ({elapsed_ms:.0f} ms): {bars}")
+            self.statusBar().showMessage(f"{len(bars)} parti HP barı algılandı, satır koordinatları ayarlandı.", 5000)
+        
+        except Exception as e:
+            logging.error(f"Parti barları algılanırken hata: {e}")
+            self.statusBar().showMessage(f"Hata: {e}", 5000)
+    
     def keyPressEvent(self, event):
         """Tuş basma olaylarını yakalar"""
         # Esc tuşu ile koordinat alma modunu iptal et
@@ -355,7 +1027,7 @@ class MainWindow(QMainWindow):
         elif event.key() == Qt.Key_Control and self.coordinate_capture_mode and self.selected_row_index >= 0:
             # Fare pozisyonunu al
             cursor_pos = QCursor.pos()
-            x, y = cursor_pos.x(), cursor_pos.y()
+            x, y = self._to_reference(cursor_pos.x(), cursor_pos.y())
             
             # Seçilen satır için koordinatları ayarla
             self.main_widget.set_row_coordinates(self.selected_row_index, x, y)
@@ -384,7 +1056,7 @@ class MainWindow(QMainWindow):
         # Koordinat alma modu aktifse
         if self.coordinate_capture_mode and self.selected_row_index >= 0:
             if event.button() == Qt.LeftButton:
-                x, y = event.globalX(), event.globalY()
+                x, y = self._to_reference(event.globalX(), event.globalY())
                 
                 # Seçilen satır için koordinatları ayarla
                 self.main_widget.set_row_coordinates(self.selected_row_index, x, y)
@@ -419,9 +1091,23 @@ class MainWindow(QMainWindow):
             if self.is_running:
                 self.stop_system()
             
-            # Ayarları kaydet
+            # Kaydedilmemiş değişiklik varsa kaydet
             self.save_settings()
             
+            # Girdi göndericisini durdur
+            self.input_sender.stop()
+            
+            # Devam eden profillemeyi sonlandır
+            self.profiler.stop()
+            
+            # Ayar dosyası izlemeyi durdur
+            if self.settings_watcher:
+                self.settings_watch_timer.stop()
+            
+            # Ölçüm dışa aktarıcısını durdur (son anlık görüntü yazılır)
+            if self.metrics_exporter:
+                self.metrics_exporter.stop()
+            
             # Event'i kabul et
             event.accept()
             
@@ -0,0 +1,66 @@
+"""
+Knight Online Otomatik İyileştirme ve Buff Sistemi - Zaman Damgalı Kare
+Bu modül, ekran görüntülerini yakalama zamanlarıyla birlikte taşıyan Frame sınıfını içerir.
+"""
+
+import time
+
+class Frame:
+    """
+    Yakalama başlangıç ve bitiş zamanlarını (time.monotonic) taşıyan ekran görüntüsü.
+    Karar mantığı, karenin yaşını bu zaman damgalarından hesaplar.
+    """
+    
+    __slots__ = ("image", "capture_start", "capture_end", "region")
+    
+    def __init__(self, image, capture_start, capture_end, region=None):
+        """
+        Frame sınıfını başlatır.
+        
+        Args:
+            image (numpy.ndarray): Yakalanan görüntü.
+            capture_start (float): Yakalamanın başladığı monotonic zaman (saniye).
+            capture_end (float): Yakalamanın bittiği monotonic zaman (saniye).
+            region (tuple, optional): (x1, y1, x2, y2) formatında yakalanan bölge.
+        """
+        self.image = image
+        self.capture_start = capture_start
+        self.capture_end = capture_end
+        self.region = region
+    
+    @property
+    def capture_duration(self):
+        """Yakalama işleminin sürdüğü süre (saniye)."""
+        return self.capture_end - self.capture_start
+    
+    def age(self, now=None):
+        """
+        Karenin yaşını döndürür.
+        
+        Görüntü içeriği yakalama başladığı andan itibaren eskimeye başlar,
+        bu yüzden yaş capture_start'tan hesaplanır.
+        
+        Args:
+            now (float, optional): Karşılaştırılacak monotonic zaman.
+        
+        Returns:
+            float: Karenin yaşı (saniye).
+        """
+        if now is None:
+            now = time.monotonic()
+        return now - self.capture_start
+    
+    def is_stale(self, max_age, now=None):
+        """
+        Karenin belirtilen yaştan eski olup olmadığını döndürür.
+        
+        Args:
+            max_age (float): İzin verilen en büyük yaş (saniye). 0 veya daha küçükse kontrol yapılmaz.
+            now (float, optional): Karşılaştırılacak monotonic zaman.
+        
+        Returns:
+            bool: Kare eskiyse True.
+        """
+        if max_age is None or max_age <= 0:
+            return False
+        return self.age(now) > max_age
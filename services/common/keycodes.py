@@ -0,0 +1,242 @@
+"""
+Knight Online Otomatik İyileştirme ve Buff Sistemi - Tuş Kodları
+Bu modül, tuş tanımlarını (ör. "F1", "CTRL+2", "NUM5") doğrulayıp tarama kodlarına (scan code set 1) dönüştürür.
+"""
+
+class InvalidKeyError(ValueError):
+    """Tanınmayan veya geçersiz tuş tanımı için fırlatılan hata."""
+
+class KeyDef:
+    """Tek bir fiziksel tuşun tarama kodu ve yedek (PyAutoGUI) adı."""
+    
+    __slots__ = ("name", "scancode", "extended", "pyautogui_name")
+    
+    def __init__(self, name, scancode, extended, pyautogui_name):
+        """
+        KeyDef sınıfını başlatır.
+        
+        Args:
+            name (str): Normalleştirilmiş tuş adı (ör. "F1").
+            scancode (int): Set 1 tarama kodu.
+            extended (bool): Tuş E0 önekli (genişletilmiş) ise True.
+            pyautogui_name (str): PyAutoGUI için tuş adı.
+        """
+        self.name = name
+        self.scancode = scancode
+        self.extended = extended
+        self.pyautogui_name = pyautogui_name
+    
+    def __repr__(self):
+        return f"KeyDef({self.name}, 0x{self.scancode:02X}{', E0' if self.extended else ''})"
+
+class KeyChord:
+    """
+    Doğrulanmış bir tuş veya tuş kombinasyonu (ör. "CTRL+SHIFT+F1").
+    Tuşlar sırayla basılır ve ters sırayla bırakılır.
+    """
+    
+    __slots__ = ("spec", "keys", "strokes")
+    
+    def __init__(self, spec, keys):
+        """
+        KeyChord sınıfını başlatır.
+        
+        Args:
+            spec (str): Normalleştirilmiş tuş tanımı.
+            keys (tuple): KeyDef nesneleri.
+        """
+        self.spec = spec
+        self.keys = keys
+        # Girdi servisi tarafından önceden derlenen (down, up) stroke listeleri
+        self.strokes = None
+    
+    @property
+    def pyautogui_names(self):
+        """PyAutoGUI için tuş adları."""
+        return [key.pyautogui_name for key in self.keys]
+    
+    def __str__(self):
+        return self.spec
+    
+    def __repr__(self):
+        return f"KeyChord({self.spec!r})"
+    
+    def __eq__(self, other):
+        if isinstance(other, KeyChord):
+            return self.spec == other.spec
+        return NotImplemented
+    
+    def __hash__(self):
+        return hash(self.spec)
+
+def _key(scancode, pyautogui_name, extended=False):
+    return (scancode, extended, pyautogui_name)
+
+# Tuş adı -> (tarama kodu, genişletilmiş mi, PyAutoGUI adı)
+KEY_TABLE = {
+    # Fonksiyon tuşları
+    "F1": _key(0x3B, "f1"), "F2": _key(0x3C, "f2"), "F3": _key(0x3D, "f3"),
+    "F4": _key(0x3E, "f4"), "F5": _key(0x3F, "f5"), "F6": _key(0x40, "f6"),
+    "F7": _key(0x41, "f7"), "F8": _key(0x42, "f8"), "F9": _key(0x43, "f9"),
+    "F10": _key(0x44, "f10"), "F11": _key(0x57, "f11"), "F12": _key(0x58, "f12"),
+    "F13": _key(0x64, "f13"), "F14": _key(0x65, "f14"), "F15": _key(0x66, "f15"),
+    
+    # Üst sıra rakamlar
+    "1": _key(0x02, "1"), "2": _key(0x03, "2"), "3": _key(0x04, "3"),
+    "4": _key(0x05, "4"), "5": _key(0x06, "5"), "6": _key(0x07, "6"),
+    "7": _key(0x08, "7"), "8": _key(0x09, "8"), "9": _key(0x0A, "9"),
+    "0": _key(0x0B, "0"),
+    
+    # Harfler
+    "A": _key(0x1E, "a"), "B": _key(0x30, "b"), "C": _key(0x2E, "c"),
+    "D": _key(0x20, "d"), "E": _key(0x12, "e"), "F": _key(0x21, "f"),
+    "G": _key(0x22, "g"), "H": _key(0x23, "h"), "I": _key(0x17, "i"),
+    "J": _key(0x24, "j"), "K": _key(0x25, "k"), "L": _key(0x26, "l"),
+    "M": _key(0x32, "m"), "N": _key(0x31, "n"), "O": _key(0x18, "o"),
+    "P": _key(0x19, "p"), "Q": _key(0x10, "q"), "R": _key(0x13, "r"),
+    "S": _key(0x1F, "s"), "T": _key(0x14, "t"), "U": _key(0x16, "u"),
+    "V": _key(0x2F, "v"), "W": _key(0x11, "w"), "X": _key(0x2D, "x"),
+    "Y": _key(0x15, "y"), "Z": _key(0x2C, "z"),
+    
+    # Noktalama
+    "-": _key(0x0C, "-"), "=": _key(0x0D, "="), "[": _key(0x1A, "["),
+    "]": _key(0x1B, "]"), ";": _key(0x27, ";"), "'": _key(0x28, "'"),
+    "`": _key(0x29, "`"), "\\": _key(0x2B, "\\"), ",": _key(0x33, ","),
+    ".": _key(0x34, "."), "/": _key(0x35, "/"),
+    
+    # Kontrol tuşları
+    "ESC": _key(0x01, "esc"), "BACKSPACE": _key(0x0E, "backspace"),
+    "TAB": _key(0x0F, "tab"), "ENTER": _key(0x1C, "enter"),
+    "SPACE": _key(0x39, "space"), "CAPSLOCK": _key(0x3A, "capslock"),
+    "NUMLOCK": _key(0x45, "numlock"), "SCROLLLOCK": _key(0x46, "scrolllock"),
+    
+    # Değiştirici tuşlar
+    "CTRL": _key(0x1D, "ctrl"), "SHIFT": _key(0x2A, "shift"),
+    "ALT": _key(0x38, "alt"), "RSHIFT": _key(0x36, "shiftright"),
+    "RCTRL": _key(0x1D, "ctrlright", True), "RALT": _key(0x38, "altright", True),
+    
+    # Sayısal tuş takımı
+    "NUM0": _key(0x52, "num0"), "NUM1": _key(0x4F, "num1"), "NUM2": _key(0x50, "num2"),
+    "NUM3": _key(0x51, "num3"), "NUM4": _key(0x4B, "num4"), "NUM5": _key(0x4C, "num5"),
+    "NUM6": _key(0x4D, "num6"), "NUM7": _key(0x47, "num7"), "NUM8": _key(0x48, "num8"),
+    "NUM9": _key(0x49, "num9"), "NUMMUL": _key(0x37, "multiply"),
+    "NUMSUB": _key(0x4A, "subtract"), "NUMADD": _key(0x4E, "add"),
+    "NUMDEC": _key(0x53, "decimal"), "NUMDIV": _key(0x35, "divide", True),
+    "NUMENTER": _key(0x1C, "enter", True),
+    
+    # Gezinme tuşları (E0 önekli)
+    "INSERT": _key(0x52, "insert", True), "DELETE": _key(0x53, "delete", True),
+    "HOME": _key(0x47, "home", True), "END": _key(0x4F, "end", True),
+    "PAGEUP": _key(0x49, "pageup", True), "PAGEDOWN": _key(0x51, "pagedown", True),
+    "UP": _key(0x48, "up", True), "DOWN": _key(0x50, "down", True),
+    "LEFT": _key(0x4B, "left", True), "RIGHT": _key(0x4D, "right", True)
+}
+
+# Alternatif yazımlar
+KEY_ALIASES = {
+    "CONTROL": "CTRL", "LCTRL": "CTRL", "LSHIFT": "SHIFT", "LALT": "ALT",
+    "ESCAPE": "ESC", "RETURN": "ENTER", "SPACEBAR": "SPACE", "BACK": "BACKSPACE",
+    "INS": "INSERT", "DEL": "DELETE", "PGUP": "PAGEUP", "PGDN": "PAGEDOWN",
+    "NUMPLUS": "NUMADD", "NUMMINUS": "NUMSUB", "NUMSTAR": "NUMMUL",
+    "NUMSLASH": "NUMDIV", "NUMDOT": "NUMDEC", "NUMDECIMAL": "NUMDEC"
+}
+
+# Windows sanal tuş kodu -> tuş adı; eski settings.ini dosyalarındaki sayısal değerlerin taşınması için
+VK_NAMES = {
+    0x08: "BACKSPACE", 0x09: "TAB", 0x0D: "ENTER", 0x10: "SHIFT", 0x11: "CTRL", 0x12: "ALT",
+    0x14: "CAPSLOCK", 0x1B: "ESC", 0x20: "SPACE", 0x21: "PAGEUP", 0x22: "PAGEDOWN",
+    0x23: "END", 0x24: "HOME", 0x25: "LEFT", 0x26: "UP", 0x27: "RIGHT", 0x28: "DOWN",
+    0x2D: "INSERT", 0x2E: "DELETE", 0x6A: "NUMMUL", 0x6B: "NUMADD", 0x6D: "NUMSUB",
+    0x6E: "NUMDEC", 0x6F: "NUMDIV", 0x90: "NUMLOCK", 0x91: "SCROLLLOCK",
+    0xA0: "SHIFT", 0xA1: "RSHIFT", 0xA2: "CTRL", 0xA3: "RCTRL", 0xA4: "ALT", 0xA5: "RALT",
+    0xBA: ";", 0xBB: "=", 0xBC: ",", 0xBD: "-", 0xBE: ".", 0xBF: "/", 0xC0: "`",
+    0xDB: "[", 0xDC: "\\", 0xDD: "]", 0xDE: "'",
+    **{0x30 + i: str(i) for i in range(10)},
+    **{0x41 + i: chr(ord("A") + i) for i in range(26)},
+    **{0x60 + i: f"NUM{i}" for i in range(10)},
+    **{0x70 + i: f"F{i + 1}" for i in range(15)}
+}
+
+# Tanımlar önbelleği: aynı tanım bir kez ayrıştırılır
+_chord_cache = {}
+
+def parse_key(spec):
+    """
+    Tuş tanımını doğrular ve KeyChord nesnesine dönüştürür.
+    
+    Kombinasyonlar "+" ile yazılır (ör. "CTRL+F1", "SHIFT+NUM5").
+    Sonuç önbelleğe alınır; aynı tanım için aynı nesne döndürülür.
+    
+    Args:
+        spec (str): Tuş tanımı.
+    
+    Returns:
+        KeyChord: Doğrulanmış tuş kombinasyonu.
+    
+    Raises:
+        InvalidKeyError: Tanım boşsa veya tanınmayan bir tuş içeriyorsa.
+    """
+    if isinstance(spec, KeyChord):
+        return spec
+    if not isinstance(spec, str) or not spec.strip():
+        raise InvalidKeyError("Tuş tanımı boş")
+    
+    cached = _chord_cache.get(spec)
+    if cached is not None:
+        return cached
+    
+    names = [part.strip().upper() for part in spec.strip().split("+")]
+    keys = []
+    for name in names:
+        name = KEY_ALIASES.get(name, name)
+        if name not in KEY_TABLE:
+            if name.isdigit():
+                raise InvalidKeyError(f"'{name}' geçerli bir tuş değil (sanal tuş kodları desteklenmiyor, ör. F11 yazın)")
+            raise InvalidKeyError(f"Tanınmayan tuş: '{name}'")
+        scancode, extended, pyautogui_name = KEY_TABLE[name]
+        if any(key.name == name for key in keys):
+            raise InvalidKeyError(f"Tuş kombinasyonunda '{name}' birden fazla kez kullanılmış")
+        keys.append(KeyDef(name, scancode, extended, pyautogui_name))
+    
+    chord = KeyChord("+".join(key.name for key in keys), tuple(keys))
+    _chord_cache[spec] = chord
+    return chord
+
+def is_valid_key(spec):
+    """
+    Tuş tanımının geçerli olup olmadığını döndürür.
+    
+    Args:
+        spec (str): Tuş tanımı.
+    
+    Returns:
+        bool: Geçerliyse True.
+    """
+    try:
+        parse_key(spec)
+        return True
+    except InvalidKeyError:
+        return False
+
+def migrate_key(spec):
+    """
+    Eski sürümlerin kaydettiği sayısal sanal tuş kodlarını tuş adına çevirir (ör. "122" -> "F11").
+    
+    Tek haneli değerler ("1", "2") rakam tuşlarıdır ve olduğu gibi bırakılır; diğer tanımlar değiştirilmez.
+    
+    Args:
+        spec (str): Ayar dosyasındaki tuş değeri.
+    
+    Returns:
+        str: Tuş tanımı.
+    
+    Raises:
+        InvalidKeyError: Değer tanınmayan bir sanal tuş koduysa.
+    """
+    text = spec.strip()
+    if len(text) < 2 or not text.isdigit():
+        return spec
+    name = VK_NAMES.get(int(text))
+    if name is None:
+        raise InvalidKeyError(f"'{text}' tanınan bir sanal tuş kodu değil")
+    return name
@@ -0,0 +1,184 @@
+"""
+Knight Online Otomatik İyileştirme ve Buff Sistemi - Girdi Hız Denetleyicisi
+Bu modül, oyuna gönderilen tuş ve tıklamaları token bucket (jeton kovası) yöntemiyle sınırlar.
+"""
+
+import time
+import logging
+
+# Logging yapılandırması
+logger = logging.getLogger("RateGovernor")
+
+# Öncelik seviyeleri (küçük değer daha önceliklidir)
+PRIORITY_HEAL = 0
+PRIORITY_BUFF = 1
+
+class TokenBucket:
+    """
+    Jeton kovası: saniyede `rate` jeton dolar, en fazla `burst` jeton birikir.
+    Her işlem bir jeton harcar.
+    """
+    
+    __slots__ = ("rate", "burst", "tokens", "last_refill")
+    
+    def __init__(self, rate, burst, now=None):
+        """
+        TokenBucket sınıfını başlatır.
+        
+        Args:
+            rate (float): Saniyede eklenen jeton sayısı (sürekli hız).
+            burst (float): Biriktirilebilecek en fazla jeton (ani yük kapasitesi).
+            now (float, optional): Başlangıç monotonic zamanı.
+        """
+        if rate <= 0 or burst < 1:
+            raise ValueError(f"Geçersiz kova ayarı: rate={rate}, burst={burst}")
+        self.rate = float(rate)
+        self.burst = float(burst)
+        self.tokens = float(burst)
+        self.last_refill = time.monotonic() if now is None else now
+    
+    def _refill(self, now):
+        elapsed = now - self.last_refill
+        if elapsed > 0:
+            self.tokens = min(self.burst, self.tokens + elapsed * self.rate)
+            self.last_refill = now
+    
+    def wait_time(self, now, reserve=0.0):
+        """
+        Bir jeton harcanabilmesi için beklenmesi gereken süreyi döndürür.
+        
+        Args:
+            now (float): Şu anki monotonic zaman.
+            reserve (float): Harcamadan sonra kovada kalması gereken jeton sayısı.
+        
+        Returns:
+            float: Bekleme süresi (saniye), hemen harcanabiliyorsa 0.
+        """
+        self._refill(now)
+        needed = 1.0 + min(reserve, self.burst - 1.0)
+        if self.tokens >= needed:
+            return 0.0
+        return (needed - self.tokens) / self.rate
+    
+    def consume(self, now):
+        """
+        Bir jeton harcar.
+        
+        Args:
+            now (float): Şu anki monotonic zaman.
+        """
+        self._refill(now)
+        self.tokens -= 1.0
+
+class InputRateGovernor:
+    """
+    Tüm girdi üreticileri (iyileştirme, toplu iyileştirme, buff) için ortak hız denetleyicisi.
+    
+    Genel bir kova tüm işlemleri, tuş başına kovalar aynı tuşun art arda basılmasını sınırlar.
+    Düşük öncelikli işlemler genel kovada ayrılmış jetonlara dokunamaz, böylece
+    buff'lar iyileştirmeleri hiçbir zaman aç bırakmaz.
+    """
+    
+    # Ayar anahtarı -> varsayılan değer
+    DEFAULTS = {
+        "global_rate": 20.0,   # Saniyede en fazla işlem (tüm tuşlar ve tıklamalar)
+        "global_burst": 6.0,   # Art arda gönderilebilecek en fazla işlem
+        "key_rate": 5.0,       # Aynı tuş için saniyede en fazla basış
+        "key_burst": 2.0,      # Aynı tuş için art arda en fazla basış
+        "buff_reserve": 2.0    # Buff'ların genel kovada iyileştirmeler için bırakması gereken jeton
+    }
+    
+    # Kova kapasitesi olan ayarlar (en az 1)
+    BURST_FIELDS = ("global_burst", "key_burst")
+    
+    def __init__(self, **values):
+        """
+        InputRateGovernor sınıfını başlatır.
+        
+        Args:
+            **values: DEFAULTS içindeki anahtarlar için özel değerler.
+        """
+        for name, default in self.DEFAULTS.items():
+            setattr(self, name, float(values.get(name, default)))
+        
+        self.global_bucket = TokenBucket(self.global_rate, self.global_burst)
+        self.key_buckets = {}
+        
+        # Öncelik -> genel kovada ayrılmış jeton sayısı
+        self.reserves = {
+            PRIORITY_HEAL: 0.0,
+            PRIORITY_BUFF: self.buff_reserve
+        }
+        
+        # Gönderilmesine izin verilen işlem sayısı
+        self.admitted = 0
+    
+    @classmethod
+    def from_config(cls, config_section):
+        """
+        Yapılandırma bölümünden hız denetleyicisi oluşturur.
+        
+        Geçersiz değerler loglanır ve varsayılan değerle değiştirilir.
+        
+        Args:
+            config_section: Anahtarları DEFAULTS ile aynı olan sözlük.
+        
+        Returns:
+            InputRateGovernor: Oluşturulan denetleyici.
+        """
+        values = {}
+        for name in cls.DEFAULTS:
+            if name not in config_section:
+                continue
+            try:
+                value = float(config_section[name])
+                if value < 0 or (name != "buff_reserve" and value <= 0):
+                    raise ValueError("geçersiz değer")
+                # Kova en az bir jeton tutabilmeli, yoksa TokenBucket oluşturulamaz
+                if name in cls.BURST_FIELDS and value < 1:
+                    raise ValueError("en az 1 olmalı")
+                values[name] = value
+            except ValueError as e:
+                logger.warning(f"Geçersiz hız ayarı '{name}': {config_section[name]} ({e})")
+        return cls(**values)
+    
+    def _key_bucket(self, rate_key, now):
+        bucket = self.key_buckets.get(rate_key)
+        if bucket is None:
+            bucket = TokenBucket(self.key_rate, self.key_burst, now)
+            self.key_buckets[rate_key] = bucket
+        return bucket
+    
+    def wait_time(self, rate_key, priority, now=None):
+        """
+        Bir işlemin gönderilebilmesi için beklenmesi gereken süreyi döndürür.
+        
+        Args:
+            rate_key: Tuş başına kova anahtarı (ör. tuş tanımı veya "click").
+            priority (int): İşlemin önceliği.
+            now (float, optional): Şu anki monotonic zaman.
+        
+        Returns:
+            float: Bekleme süresi (saniye), hemen gönderilebiliyorsa 0.
+        """
+        if now is None:
+            now = time.monotonic()
+        reserve = self.reserves.get(priority, 0.0)
+        return max(
+            self.global_bucket.wait_time(now, reserve),
+            self._key_bucket(rate_key, now).wait_time(now)
+        )
+    
+    def acquire(self, rate_key, now=None):
+        """
+        Bir işlem için genel ve tuş başına kovadan jeton harcar.
+        
+        Args:
+            rate_key: Tuş başına kova anahtarı.
+            now (float, optional): Şu anki monotonic zaman.
+        """
+        if now is None:
+            now = time.monotonic()
+        self.global_bucket.consume(now)
+        self._key_bucket(rate_key, now).consume(now)
+        self.admitted += 1
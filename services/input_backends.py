@@ -0,0 +1,348 @@
+"""
+Knight Online Otomatik İyileştirme ve Buff Sistemi - Girdi Arka Uçları
+Bu modül, fare ve klavye işlemlerini gerçekten gönderen arka uçları (Win32, Interception,
+PyAutoGUI, kayıt ve boş arka uç) içerir.
+"""
+
+import time
+import logging
+from collections import deque
+
+# Logging yapılandırması
+logger = logging.getLogger("InputBackends")
+
+# Win32api için içe aktarma
+try:
+    import win32api
+    import win32con
+    win32api_available = True
+    logger.info("Win32API başarıyla içe aktarıldı.")
+except ImportError:
+    win32api_available = False
+    logger.warning("Win32API bulunamadı, PyAutoGUI kullanılacak.")
+
+# Tuş basma için interception kütüphanesini içe aktar (varsa)
+try:
+    from interception import *
+    from stroke import *
+    from consts import *
+    interception_available = True
+    logger.info("Interception kütüphanesi başarıyla içe aktarıldı.")
+except ImportError:
+    interception_available = False
+    logger.warning("Interception kütüphanesi bulunamadı, standart yöntemler kullanılacak.")
+
+# PyAutoGUI ekran bağlantısı olmayan ortamlarda (ör. Linux CI) içe aktarılırken hata verebilir
+try:
+    import pyautogui
+    pyautogui_available = True
+except Exception as e:
+    pyautogui_available = False
+    logger.warning(f"PyAutoGUI kullanılamıyor: {e}")
+
+class InputBackend:
+    """
+    Girdi arka uçları için temel sınıf.
+    Arka uçlar yalnızca temel işlemleri gönderir; bekleme süreleri KeyboardMouseService'te uygulanır.
+    """
+    
+    name = "base"
+    supports_mouse = True
+    supports_keyboard = True
+    
+    def prepare_key(self, chord):
+        """
+        Bir tuş kombinasyonunu bu arka uç için önceden derler.
+        
+        Args:
+            chord (KeyChord): Doğrulanmış tuş kombinasyonu.
+        """
+    
+    def move(self, x, y):
+        """İmleci belirtilen konuma taşır."""
+        raise NotImplementedError
+    
+    def mouse_down(self, button):
+        """Fare tuşuna basar ("left" veya "right")."""
+        raise NotImplementedError
+    
+    def mouse_up(self, button):
+        """Fare tuşunu bırakır ("left" veya "right")."""
+        raise NotImplementedError
+    
+    def key_down(self, chord):
+        """Tuş kombinasyonundaki tuşlara sırayla basar."""
+        raise NotImplementedError
+    
+    def key_up(self, chord):
+        """Tuş kombinasyonundaki tuşları ters sırayla bırakır."""
+        raise NotImplementedError
+
+class Win32Backend(InputBackend):
+    """Win32API ile donanım düzeyinde fare işlemleri gönderen arka uç."""
+    
+    name = "win32"
+    supports_keyboard = False
+    
+    def __init__(self):
+        """Win32Backend sınıfını başlatır."""
+        if not win32api_available:
+            raise RuntimeError("Win32API kullanılamıyor")
+        self._button_events = {
+            "left": (win32con.MOUSEEVENTF_LEFTDOWN, win32con.MOUSEEVENTF_LEFTUP),
+            "right": (win32con.MOUSEEVENTF_RIGHTDOWN, win32con.MOUSEEVENTF_RIGHTUP)
+        }
+        self._position = (0, 0)
+    
+    def move(self, x, y):
+        win32api.SetCursorPos((x, y))
+        self._position = (x, y)
+    
+    def mouse_down(self, button):
+        x, y = self._position
+        win32api.mouse_event(self._button_events[button][0], x, y, 0, 0)
+    
+    def mouse_up(self, button):
+        x, y = self._position
+        win32api.mouse_event(self._button_events[button][1], x, y, 0, 0)
+
+class InterceptionBackend(InputBackend):
+    """Interception sürücüsü ile tarama kodu düzeyinde tuş gönderen arka uç."""
+    
+    name = "interception"
+    supports_mouse = False
+    
+    def __init__(self):
+        """
+        InterceptionBackend sınıfını başlatır ve klavye aygıtını bulur.
+        
+        Raises:
+            RuntimeError: Sürücü yüklenemezse veya klavye bulunamazsa.
+        """
+        if not interception_available:
+            raise RuntimeError("Interception kütüphanesi kullanılamıyor")
+        
+        self.driver = interception()
+        self.keyboard = None
+        for i in range(MAX_DEVICES):
+            if interception.is_keyboard(i):
+                self.keyboard = i
+                logger.info(f"Klavye bulundu: {i}")
+                break
+        if self.keyboard is None:
+            raise RuntimeError("Klavye bulunamadı")
+        
+        self._key_down = interception_key_state.INTERCEPTION_KEY_DOWN.value
+        self._key_up = interception_key_state.INTERCEPTION_KEY_UP.value
+        self._key_e0 = interception_key_state.INTERCEPTION_KEY_E0.value
+    
+    def prepare_key(self, chord):
+        """
+        Basma ve bırakma stroke nesnelerini bir kez oluşturup KeyChord üzerinde saklar.
+        
+        Args:
+            chord (KeyChord): Doğrulanmış tuş kombinasyonu.
+        """
+        if chord.strokes is not None:
+            return
+        
+        down_strokes = []
+        up_strokes = []
+        for key in chord.keys:
+            flags = self._key_e0 if key.extended else 0
+            down_strokes.append(key_stroke(key.scancode, self._key_down | flags, 0))
+            up_strokes.append(key_stroke(key.scancode, self._key_up | flags, 0))
+        up_strokes.reverse()
+        chord.strokes = (down_strokes, up_strokes)
+    
+    def key_down(self, chord):
+        self.prepare_key(chord)
+        for stroke in chord.strokes[0]:
+            self.driver.send(self.keyboard, stroke)
+    
+    def key_up(self, chord):
+        self.prepare_key(chord)
+        for stroke in chord.strokes[1]:
+            self.driver.send(self.keyboard, stroke)
+
+class PyAutoGUIBackend(InputBackend):
+    """PyAutoGUI ile işletim sistemi düzeyinde fare ve klavye işlemleri gönderen arka uç."""
+    
+    name = "pyautogui"
+    
+    def __init__(self):
+        """PyAutoGUIBackend sınıfını başlatır."""
+        if not pyautogui_available:
+            raise RuntimeError("PyAutoGUI kullanılamıyor")
+    
+    def move(self, x, y):
+        pyautogui.moveTo(x, y)
+    
+    def mouse_down(self, button):
+        pyautogui.mouseDown(button=button)
+    
+    def mouse_up(self, button):
+        pyautogui.mouseUp(button=button)
+    
+    def key_down(self, chord):
+        for name in chord.pyautogui_names:
+            pyautogui.keyDown(name)
+    
+    def key_up(self, chord):
+        for name in reversed(chord.pyautogui_names):
+            pyautogui.keyUp(name)
+
+class InputEvent:
+    """RecordingBackend tarafından kaydedilen tek bir girdi olayı."""
+    
+    __slots__ = ("timestamp", "action", "detail", "duration")
+    
+    def __init__(self, timestamp, action, detail, duration):
+        """
+        InputEvent sınıfını başlatır.
+        
+        Args:
+            timestamp (float): Olayın başladığı monotonic zaman (saniye).
+            action (str): İşlem adı ("move", "mouse_down", "key_down" ...).
+            detail: İşlem ayrıntısı (koordinat, fare tuşu veya tuş tanımı).
+            duration (float): İşlemin sürdüğü süre (saniye).
+        """
+        self.timestamp = timestamp
+        self.action = action
+        self.detail = detail
+        self.duration = duration
+    
+    def to_dict(self):
+        """Olayı sözlük olarak döndürür."""
+        return {
+            "timestamp": self.timestamp,
+            "action": self.action,
+            "detail": self.detail,
+            "duration": self.duration
+        }
+    
+    def __repr__(self):
+        return f"InputEvent({self.action}, {self.detail!r}, t={self.timestamp:.6f})"
+
+class RecordingBackend(InputBackend):
+    """
+    Hiçbir girdi göndermeden her işlemi monotonic zaman damgasıyla kaydeden arka uç.
+    İsteğe bağlı simüle gecikme ile motor, ekran ve sürücü olmadan (ör. Linux CI) ölçülebilir.
+    """
+    
+    name = "recording"
+    
+    def __init__(self, simulated_latency=0.0, max_events=100000):
+        """
+        RecordingBackend sınıfını başlatır.
+        
+        Args:
+            simulated_latency (float): Her temel işlem için beklenecek süre (saniye).
+            max_events (int): Saklanacak en fazla olay sayısı, aşılırsa en eski olaylar atılır.
+        """
+        self.simulated_latency = simulated_latency
+        self.events = deque(maxlen=max_events)
+    
+    def _record(self, action, detail):
+        start_time = time.monotonic()
+        if self.simulated_latency > 0:
+            time.sleep(self.simulated_latency)
+        self.events.append(InputEvent(start_time, action, detail, time.monotonic() - start_time))
+    
+    def move(self, x, y):
+        self._record("move", (x, y))
+    
+    def mouse_down(self, button):
+        self._record("mouse_down", button)
+    
+    def mouse_up(self, button):
+        self._record("mouse_up", button)
+    
+    def key_down(self, chord):
+        self._record("key_down", str(chord))
+    
+    def key_up(self, chord):
+        self._record("key_up", str(chord))
+    
+    def clear(self):
+        """Kaydedilen tüm olayları siler."""
+        self.events.clear()
+
+class NullBackend(InputBackend):
+    """Hiçbir şey yapmayan arka uç (girdi yolunun ek yükünü ölçmek için)."""
+    
+    name = "null"
+    
+    def move(self, x, y):
+        pass
+    
+    def mouse_down(self, button):
+        pass
+    
+    def mouse_up(self, button):
+        pass
+    
+    def key_down(self, chord):
+        pass
+    
+    def key_up(self, chord):
+        pass
+
+# Arka uç adı -> sınıf
+BACKENDS = {
+    "win32": Win32Backend,
+    "interception": InterceptionBackend,
+    "pyautogui": PyAutoGUIBackend,
+    "recording": RecordingBackend,
+    "null": NullBackend
+}
+
+def create_backend(name, **kwargs):
+    """
+    Adı verilen arka ucu oluşturur.
+    
+    Args:
+        name (str): Arka uç adı (BACKENDS anahtarlarından biri).
+        **kwargs: Arka uç sınıfına aktarılacak argümanlar.
+    
+    Returns:
+        InputBackend: Oluşturulan arka uç.
+    
+    Raises:
+        ValueError: Arka uç adı bilinmiyorsa.
+        RuntimeError: Arka uç bu sistemde kullanılamıyorsa.
+    """
+    if name not in BACKENDS:
+        raise ValueError(f"Bilinmeyen girdi arka ucu: {name}")
+    return BACKENDS[name](**kwargs)
+
+def create_default_backends():
+    """
+    Sistemde kullanılabilen en iyi fare ve klavye arka uçlarını seçer.
+    
+    Fare için Win32, klavye için Interception tercih edilir; kullanılamazlarsa PyAutoGUI,
+    o da yoksa boş arka uç kullanılır.
+    
+    Returns:
+        tuple: (fare arka ucu, klavye arka ucu).
+    """
+    fallback = None
+    try:
+        fallback = PyAutoGUIBackend()
+    except RuntimeError as e:
+        logger.warning(f"PyAutoGUI arka ucu kullanılamıyor, boş arka uç kullanılacak: {e}")
+        fallback = NullBackend()
+    
+    mouse_backend = fallback
+    if win32api_available:
+        mouse_backend = Win32Backend()
+    
+    key_backend = fallback
+    if interception_available:
+        try:
+            key_backend = InterceptionBackend()
+        except Exception as e:
+            logger.error(f"Interception sürücüsü yüklenirken hata: {e}")
+    
+    logger.info(f"Girdi arka uçları: fare={mouse_backend.name}, klavye={key_backend.name}")
+    return mouse_backend, key_backend
@@ -0,0 +1,283 @@
+"""
+Knight Online Otomatik İyileştirme ve Buff Sistemi - Asenkron Girdi Gönderici
+Bu modül, fare ve klavye işlemlerini ayrı bir gönderici iş parçacığında sıraya alarak çalıştırır.
+"""
+
+import time
+import heapq
+import itertools
+import threading
+import logging
+from concurrent.futures import Future
+
+from core.utils.metrics import registry
+from core.utils.tracing import tracer
+from services.common.keycodes import InvalidKeyError
+from services.common.rate_governor import InputRateGovernor, PRIORITY_HEAL
+
+# Logging yapılandırması
+logger = logging.getLogger("InputSender")
+
+class InputSender:
+    """
+    Fare ve klavye işlemlerini kuyruğa alıp ayrı bir iş parçacığında gönderen sınıf.
+    Çağıran taraf hiçbir zaman girdi beklemeleri için uyumaz; her işlem bir Future döndürür.
+    
+    Kuyruk önceliğe göre sıralanır (aynı öncelikte gönderim sırası korunur) ve her işlem
+    gönderilmeden önce ortak hız denetleyicisinden (InputRateGovernor) izin alır. Hız denetleyicisi
+    yalnızca geciktirdiği için talep kovaları aştığında kuyruk büyür; önceliğe göre ayarlanan en
+    büyük yaştan (bkz. set_max_age) uzun bekleyen işlemler gönderilmeden iptal edilir.
+    """
+    
+    def __init__(self, service, governor=None):
+        """
+        InputSender sınıfını başlatır.
+        
+        Args:
+            service (KeyboardMouseService): İşlemleri gerçekten gönderen servis.
+                Bekleme süreleri servisin zamanlama profilinden (service.timing) okunur.
+            governor (InputRateGovernor, optional): Hız denetleyicisi. Verilmezse varsayılan ayarlarla oluşturulur.
+        """
+        self.service = service
+        self.governor = governor or InputRateGovernor()
+        
+        # (öncelik, sıra no, kuyruğa eklenme zamanı, future, tür, işlev, argümanlar, hız anahtarı, son geçerlilik)
+        self._heap = []
+        # Öncelik -> kuyrukta en fazla bekleme süresi (saniye); tanımsızsa işlem süresiz bekler
+        self._max_age = {}
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+        self.running = False
+        self.thread = None
+        
+        # İşlem türüne göre gönderme süreleri ve kuyrukta bekleme süreleri
+        self.send_durations = {
+            "click": registry.histogram("input_sender_click_seconds", "Gönderici iş parçacığında tıklama süresi"),
+            "key": registry.histogram("input_sender_key_seconds", "Gönderici iş parçacığında tuş basma süresi")
+        }
+        self.queue_delay = registry.histogram("input_queue_delay_seconds", "Girdinin kuyrukta bekleme süresi")
+        self.expired_count = registry.counter("input_expired_total", "Kuyrukta çok beklediği için gönderilmeden iptal edilen girdi")
+        
+        logger.info("InputSender başlatıldı.")
+    
+    def start(self):
+        """Gönderici iş parçacığını başlatır."""
+        if self.running:
+            logger.warning("InputSender zaten çalışıyor.")
+            return
+        
+        self.running = True
+        self.thread = threading.Thread(target=self._run_loop, name="InputSender", daemon=True)
+        self.thread.start()
+        logger.info("InputSender gönderici iş parçacığı başlatıldı.")
+    
+    def stop(self):
+        """Gönderici iş parçacığını durdurur ve bekleyen işlemleri iptal eder."""
+        with self._condition:
+            self.running = False
+            self._condition.notify_all()
+        self.clear()
+        if self.thread and self.thread.is_alive():
+            self.thread.join(timeout=2.0)
+        logger.info("InputSender durduruldu.")
+    
+    def clear(self):
+        """
+        Henüz gönderilmemiş tüm işlemleri iptal eder.
+        
+        Returns:
+            int: İptal edilen işlem sayısı.
+        """
+        with self._condition:
+            pending = self._heap
+            self._heap = []
+        
+        cancelled = 0
+        for item in pending:
+            if item[3].cancel():
+                cancelled += 1
+        
+        if cancelled:
+            logger.info(f"{cancelled} bekleyen girdi işlemi iptal edildi.")
+        return cancelled
+    
+    def set_max_age(self, priority, seconds):
+        """
+        Verilen öncelikteki işlemlerin kuyrukta bekleyebileceği en uzun süreyi ayarlar.
+        
+        İyileştirmeler kararın dayandığı kare kadar geçerlidir; daha uzun bekleyen bir iyileştirme
+        artık güncel olmayan bir HP okumasına göre gönderilmiş olur.
+        
+        Args:
+            priority (int): İşlem önceliği.
+            seconds (float): En uzun bekleme süresi; 0 ise süre sınırı yok. Yalnızca bundan sonra
+                kuyruğa eklenen işlemlere uygulanır.
+        """
+        with self._condition:
+            if seconds > 0:
+                self._max_age[priority] = float(seconds)
+            else:
+                self._max_age.pop(priority, None)
+    
+    def pending_count(self):
+        """
+        Kuyrukta bekleyen işlem sayısını döndürür.
+        
+        Returns:
+            int: Bekleyen (iptal edilenler dahil) işlem sayısı.
+        """
+        with self._condition:
+            return len(self._heap)
+    
+    def click(self, x, y, callback=None, priority=PRIORITY_HEAL):
+        """
+        Sol tıklama işlemini kuyruğa ekler.
+        
+        Args:
+            x: X koordinatı.
+            y: Y koordinatı.
+            callback (function, optional): İşlem tamamlandığında Future ile çağrılır.
+            priority (int): İşlemin önceliği (küçük değer daha önceliklidir).
+        
+        Returns:
+            Future: Tıklama sonucunu (bool) taşıyan Future.
+        """
+        return self._submit("click", self.service.click, (x, y), callback, priority, "click")
+    
+    def press_key(self, key, callback=None, priority=PRIORITY_HEAL):
+        """
+        Tuş basma işlemini kuyruğa ekler.
+        
+        Tuş kuyruğa eklenmeden önce derlenir; geçersiz tuşlar gönderici iş parçacığına
+        ulaşmadan Future üzerinde InvalidKeyError ile reddedilir.
+        
+        Args:
+            key: Basılacak tuş.
+            callback (function, optional): İşlem tamamlandığında Future ile çağrılır.
+            priority (int): İşlemin önceliği (küçük değer daha önceliklidir).
+        
+        Returns:
+            Future: Tuş basma işleminin Future nesnesi.
+        """
+        try:
+            chord = self.service.compile_key(key)
+        except InvalidKeyError as e:
+            future = Future()
+            if callback is not None:
+                future.add_done_callback(callback)
+            future.set_exception(e)
+            return future
+        
+        return self._submit("key", self.service.press_key, (chord,), callback, priority, chord.spec)
+    
+    def get_send_durations(self):
+        """
+        İşlem türüne göre gönderme süresi histogramlarının özetini döndürür.
+        
+        Returns:
+            dict: İşlem türü -> histogram anlık görüntüsü.
+        """
+        return {kind: histogram.snapshot() for kind, histogram in self.send_durations.items()}
+    
+    def _submit(self, kind, func, args, callback, priority, rate_key):
+        """
+        Bir işlemi kuyruğa ekler.
+        
+        Args:
+            kind (str): İşlem türü ("click" veya "key").
+            func (function): Gönderici iş parçacığında çağrılacak işlev.
+            args (tuple): İşlev argümanları.
+            callback (function, optional): Tamamlanma callback'i.
+            priority (int): İşlemin önceliği.
+            rate_key: Tuş başına hız kovası anahtarı.
+        
+        Returns:
+            Future: İşlemin Future nesnesi.
+        """
+        future = Future()
+        if callback is not None:
+            future.add_done_callback(callback)
+        
+        with self._condition:
+            if not self.running:
+                future.set_exception(RuntimeError("InputSender çalışmıyor"))
+                return future
+            
+            now = time.monotonic()
+            max_age = self._max_age.get(priority)
+            expires_at = now + max_age if max_age is not None else None
+            item = (priority, next(self._sequence), now, future, kind, func, args, rate_key, expires_at)
+            heapq.heappush(self._heap, item)
+            self._condition.notify()
+        return future
+    
+    def _next_item(self):
+        """
+        Hız denetleyicisinin izin verdiği en öncelikli işlemi kuyruktan alır.
+        
+        İşlem beklerken daha öncelikli bir işlem eklenirse o işlem öne geçer. Son geçerlilik
+        zamanı geçmiş işlemler iptal edilip atlanır.
+        
+        Returns:
+            tuple: Kuyruk öğesi veya gönderici durdurulduysa None.
+        """
+        with self._condition:
+            while self.running:
+                if not self._heap:
+                    self._condition.wait(0.1)
+                    continue
+                
+                priority, _, _, future, kind, _, _, rate_key, expires_at = self._heap[0]
+                if future.cancelled():
+                    heapq.heappop(self._heap)
+                    continue
+                
+                now = time.monotonic()
+                if expires_at is not None and now > expires_at:
+                    heapq.heappop(self._heap)
+                    if future.cancel():
+                        self.expired_count.inc()
+                        logger.debug("Süresi dolan girdi işlemi atlandı (%s, %s).", kind, rate_key)
+                    continue
+                
+                wait = self.governor.wait_time(rate_key, priority, now)
+                if wait > 0:
+                    # Beklerken süresi dolarsa işlem hemen atlanır
+                    if expires_at is not None:
+                        wait = min(wait, expires_at - now)
+                    self._condition.wait(wait)
+                    continue
+                
+                self.governor.acquire(rate_key, now)
+                return heapq.heappop(self._heap)
+        return None
+    
+    def _run_loop(self):
+        """Gönderici döngüsünü çalıştırır."""
+        while self.running:
+            item = self._next_item()
+            if item is None:
+                break
+            
+            _, _, enqueued_at, future, kind, func, args, _, _ = item
+            if not future.set_running_or_notify_cancel():
+                continue
+            
+            start_time = time.monotonic()
+            self.queue_delay.observe(start_time - enqueued_at)
+            
+            try:
+                with tracer.span(kind, "input"):
+                    result = func(*args)
+            except Exception as e:
+                logger.error("Girdi işlemi başarısız (%s): %s", kind, e)
+                future.set_exception(e)
+                continue
+            finally:
+                self.send_durations[kind].observe(time.monotonic() - start_time)
+            
+            future.set_result(result)
+            
+            # Tıklamadan sonra oyunun hedefi seçmesi için bekle (sadece gönderici iş parçacığında)
+            if kind == "click":
+                time.sleep(self.service.timing.post_click_delay)
@@ -3,81 +3,133 @@ Knight Online Otomatik İyileştirme ve Buff Sistemi - Klavye ve Fare Servisi
 Bu modül, klavye ve fare işlemlerini yönetir.
 """
 
-import os
 import time
 import logging
-import pyautogui
+
+from core.utils.metrics import registry
+from services.common.keycodes import parse_key, InvalidKeyError, KeyChord
+from services.input_backends import InputBackend, create_backend, create_default_backends
 
 # Logging yapılandırması
 logger = logging.getLogger("KeyboardMouseService")
 
-# Win32api için içe aktarma
-try:
-    import win32api
-    import win32con
-    win32api_available = True
-    logger.info("Win32API başarıyla içe aktarıldı.")
-except ImportError:
-    win32api_available = False
-    logger.warning("Win32API bulunamadı, PyAutoGUI kullanılacak.")
-
-# Tuş basma için interception kütüphanesini içe aktar (varsa)
-try:
-    from interception import *
-    from stroke import *
-    from consts import *
-    interception_available = True
-    logger.info("Interception kütüphanesi başarıyla içe aktarıldı.")
-except ImportError:
-    interception_available = False
-    logger.warning("Interception kütüphanesi bulunamadı, standart yöntemler kullanılacak.")
+class InputTimingProfile:
+    """
+    Fare ve klavye işlemlerinde kullanılan bekleme sürelerini tutan zamanlama profili.
+    Tüm süreler saniye cinsindendir.
+    """
+    
+    # Ayar anahtarı -> varsayılan değer
+    DEFAULTS = {
+        "click_move_delay": 0.05,   # İmleç konumlandıktan sonra tıklamadan önce bekleme
+        "click_hold": 0.1,          # Fare tuşunu basılı tutma süresi
+        "key_hold": 0.01,           # Klavye tuşunu basılı tutma süresi
+        "key_release_gap": 0.01,    # Tuş bırakıldıktan sonra sonraki işleme kadar bekleme
+        "post_click_delay": 0.1     # Tıklamadan sonra sonraki işleme kadar bekleme
+    }
+    
+    def __init__(self, **values):
+        """
+        InputTimingProfile sınıfını başlatır.
+        
+        Args:
+            **values: DEFAULTS içindeki anahtarlar için özel değerler.
+        """
+        for name, default in self.DEFAULTS.items():
+            value = float(values.get(name, default))
+            if value < 0:
+                raise ValueError(f"{name} negatif olamaz: {value}")
+            setattr(self, name, value)
+    
+    @classmethod
+    def from_config(cls, config_section):
+        """
+        Yapılandırma bölümünden zamanlama profili oluşturur.
+        
+        Geçersiz değerler loglanır ve varsayılan değerle değiştirilir.
+        
+        Args:
+            config_section: Anahtarları DEFAULTS ile aynı olan sözlük (değerler saniye).
+            
+        Returns:
+            InputTimingProfile: Oluşturulan profil.
+        """
+        values = {}
+        for name in cls.DEFAULTS:
+            if name not in config_section:
+                continue
+            try:
+                value = float(config_section[name])
+                if value < 0:
+                    raise ValueError("negatif değer")
+                values[name] = value
+            except ValueError:
+                logger.warning(f"Geçersiz zamanlama değeri '{name}': {config_section[name]}")
+        return cls(**values)
+    
+    @classmethod
+    def immediate(cls):
+        """
+        Hiç beklemeyen bir profil döndürür (kayıt/boş arka uçla ölçüm yaparken kullanılır).
+        
+        Returns:
+            InputTimingProfile: Tüm süreleri sıfır olan profil.
+        """
+        return cls(**{name: 0.0 for name in cls.DEFAULTS})
+    
+    def to_dict(self):
+        """
+        Profili sözlük olarak döndürür.
+        
+        Returns:
+            dict: Ayar anahtarı -> değer.
+        """
+        return {name: getattr(self, name) for name in self.DEFAULTS}
 
 class KeyboardMouseService:
     """Klavye ve fare işlemlerini yöneten servis."""
     
-    def __init__(self):
+    def __init__(self, timing=None, backend=None):
         """
         KeyboardMouseService sınıfını başlatır.
-        Klavye ve fare işlemleri için gereken bileşenleri hazırlar.
-        """
-        self.keyboard = None
-        self.driver = None
-        self.keycodes = {
-            "F1": 0x3B, "F2": 0x3C, "F3": 0x3D, "F4": 0x3E, "F5": 0x3F, 
-            "F6": 0x40, "F7": 0x41, "F8": 0x42, "F9": 0x43, "F10": 0x44, 
-            "F11": 0x57, "F12": 0x58, "F13": 0x64, "F14": 0x65, "F15": 0x66, 
-            "0": 0x0B, "1": 0x02, "2": 0x03, "3": 0x04, "4": 0x05, 
-            "5": 0x06, "6": 0x07, "7": 0x08, "8": 0x09, "9": 0x0A, 
-            "A": 0x1E, "B": 0x30, "C": 0x2E, "D": 0x20, "E": 0x12,
-            "F": 0x21, "G": 0x22, "H": 0x23, "I": 0x17, "J": 0x24, 
-            "K": 0x25, "L": 0x26, "M": 0x32, "N": 0x31, "O": 0x18, 
-            "P": 0x19, "Q": 0x10, "R": 0x13, "S": 0x1F, "T": 0x14, 
-            "U": 0x16, "V": 0x2F, "W": 0x11, "X": 0x2D, "Y": 0x15, "Z": 0x2C
-        }
-        
-        # Interception kütüphanesi kullanılabilir ise, başlat
-        if interception_available:
+        Klavye ve fare işlemleri için gereken arka uçları hazırlar.
+        
+        Args:
+            timing (InputTimingProfile, optional): Bekleme süreleri profili.
+            backend (str or InputBackend, optional): Hem fare hem klavye için kullanılacak arka uç
+                ("win32", "interception", "pyautogui", "recording", "null" veya bir nesne).
+                Verilmezse sistemde kullanılabilen en iyi arka uçlar seçilir.
+        """
+        self.timing = timing or InputTimingProfile()
+        
+        if backend is None:
+            self.mouse_backend, self.key_backend = create_default_backends()
+        else:
+            if not isinstance(backend, InputBackend):
+                backend = create_backend(backend)
+            self.mouse_backend = backend
+            self.key_backend = backend
+        
+        # Birincil arka uç hata verirse kullanılacak yedek arka uç (varsa)
+        self.fallback_backend = None
+        if backend is None and self.mouse_backend.name != "pyautogui":
             try:
-                self.driver = interception()
-                for i in range(MAX_DEVICES):
-                    if interception.is_keyboard(i):
-                        self.keyboard = i
-                        logger.info(f"Klavye bulundu: {i}")
-                        break
-                if self.keyboard is None:
-                    logger.warning("Klavye bulunamadı.")
-            except Exception as e:
-                logger.error(f"Interception sürücüsü yüklenirken hata: {e}")
-                self.driver = None
-                self.keyboard = None
+                self.fallback_backend = create_backend("pyautogui")
+            except RuntimeError:
+                self.fallback_backend = None
+        
+        # Derlenmiş tuş önbelleği: tanım -> KeyChord (stroke nesneleri önceden oluşturulmuş)
+        self._compiled_keys = {}
+        
+        # Gönderme ölçümleri (bekleme süreleri dahil)
+        self.click_time = registry.histogram("input_click_seconds", "Bir tıklamanın gönderilme süresi")
+        self.key_time = registry.histogram("input_key_seconds", "Bir tuş basışının gönderilme süresi")
+        self.input_failures = registry.counter("input_failures_total", "Birincil arka uçta başarısız olan girdi")
     
     def click(self, x, y):
         """
         Belirtilen konuma tıklar.
         
-        Win32API kullanılabilirse donanım düzeyinde gerçek tıklama yapar,
-        yoksa PyAutoGUI kullanır.
-        
         Args:
             x: X koordinatı.
             y: Y koordinatı.
@@ -85,26 +137,12 @@ class KeyboardMouseService:
         Returns:
             bool: İşlemin başarılı olup olmadığı.
         """
-        try:
-            if win32api_available:
-                # Donanım düzeyinde gerçek tıklama yapma (Win32API)
-                self.leftclick_win32(x, y)
-            else:
-                # PyAutoGUI ile tıklama
-                pyautogui.click(x, y)
-            logger.debug(f"Sol tıklama: ({x}, {y})")
-            return True
-        except Exception as e:
-            logger.error(f"Sol tıklama işlemi başarısız: {e}")
-            return False
+        return self._click(x, y, "left")
     
     def right_click(self, x, y):
         """
         Belirtilen konuma sağ tıklar.
         
-        Win32API kullanılabilirse donanım düzeyinde gerçek tıklama yapar,
-        yoksa PyAutoGUI kullanır.
-        
         Args:
             x: X koordinatı.
             y: Y koordinatı.
@@ -112,136 +150,140 @@ class KeyboardMouseService:
         Returns:
             bool: İşlemin başarılı olup olmadığı.
         """
-        try:
-            if win32api_available:
-                # Donanım düzeyinde gerçek sağ tıklama yapma (Win32API)
-                self.rightclick_win32(x, y)
-            else:
-                # PyAutoGUI ile sağ tıklama
-                pyautogui.rightClick(x, y)
-            logger.debug(f"Sağ tıklama: ({x}, {y})")
-            return True
-        except Exception as e:
-            logger.error(f"Sağ tıklama işlemi başarısız: {e}")
-            return False
+        return self._click(x, y, "right")
     
-    def leftclick_win32(self, x, y):
+    def _click(self, x, y, button):
         """
-        Win32API kullanarak belirtilen koordinatlarda sol fare tıklaması gerçekleştirir.
+        Fare arka ucuyla tıklama yapar, hata olursa yedek arka ucu dener.
         
         Args:
-            x: Tıklama x koordinatı
-            y: Tıklama y koordinatı
-        
+            x: X koordinatı.
+            y: Y koordinatı.
+            button (str): "left" veya "right".
+            
         Returns:
             bool: İşlemin başarılı olup olmadığı.
         """
+        start_time = time.monotonic()
         try:
-            # Fare imlecini konumlandır
-            win32api.SetCursorPos((x, y))
-            # Kısa bekleme
-            time.sleep(0.05)
-            # Sol tuşa basma olayı
-            win32api.mouse_event(win32con.MOUSEEVENTF_LEFTDOWN, x, y, 0, 0)
-            # Basma ve bırakma arasında bekleme
-            time.sleep(0.1)
-            # Sol tuşu bırakma olayı
-            win32api.mouse_event(win32con.MOUSEEVENTF_LEFTUP, x, y, 0, 0)
+            self._send_click(self.mouse_backend, x, y, button)
+            self.click_time.observe(time.monotonic() - start_time)
+            logger.debug("Tıklama (%s, %s): (%d, %d)", button, self.mouse_backend.name, x, y)
             return True
         except Exception as e:
-            logger.error(f"Win32API sol tıklama hatası: {e}")
-            # Hata durumunda PyAutoGUI ile dene
-            pyautogui.click(x, y)
-            return False
+            self.input_failures.inc()
+            logger.error("%s ile tıklama hatası: %s", self.mouse_backend.name, e)
+        
+        # Hata durumunda yedek arka uçla dene
+        if self.fallback_backend is not None:
+            try:
+                self._send_click(self.fallback_backend, x, y, button)
+            except Exception as e:
+                logger.error(f"Tıklama işlemi başarısız: {e}")
+        return False
     
-    def rightclick_win32(self, x, y):
+    def _send_click(self, backend, x, y, button):
         """
-        Win32API kullanarak belirtilen koordinatlarda sağ fare tıklaması gerçekleştirir.
+        İmleci konumlandırır ve zamanlama profiline göre tıklar.
         
         Args:
-            x: Tıklama x koordinatı
-            y: Tıklama y koordinatı
-            
-        Returns:
-            bool: İşlemin başarılı olup olmadığı.
+            backend (InputBackend): Kullanılacak arka uç.
+            x: X koordinatı.
+            y: Y koordinatı.
+            button (str): "left" veya "right".
         """
-        try:
-            # Fare imlecini konumlandır
-            win32api.SetCursorPos((x, y))
-            # Kısa bekleme
-            time.sleep(0.05)
-            # Sağ tuşa basma olayı
-            win32api.mouse_event(win32con.MOUSEEVENTF_RIGHTDOWN, x, y, 0, 0)
-            # Basma ve bırakma arasında bekleme
-            time.sleep(0.1)
-            # Sağ tuşu bırakma olayı
-            win32api.mouse_event(win32con.MOUSEEVENTF_RIGHTUP, x, y, 0, 0)
-            return True
-        except Exception as e:
-            logger.error(f"Win32API sağ tıklama hatası: {e}")
-            # Hata durumunda PyAutoGUI ile dene
-            pyautogui.rightClick(x, y)
-            return False
+        # Fare imlecini konumlandır
+        backend.move(x, y)
+        # Kısa bekleme
+        time.sleep(self.timing.click_move_delay)
+        # Tuşa basma olayı
+        backend.mouse_down(button)
+        # Basma ve bırakma arasında bekleme
+        time.sleep(self.timing.click_hold)
+        # Tuşu bırakma olayı
+        backend.mouse_up(button)
     
-    def press_key(self, key, duration=0.01):
+    def compile_key(self, key):
         """
-        Belirtilen tuşa basar.
+        Tuş tanımını doğrular ve gönderime hazır hale getirir.
+        
+        Klavye arka ucu tuşu önceden derleyebiliyorsa (ör. Interception stroke nesneleri)
+        bu işlem bir kez yapılır ve her basışta yeniden kullanılır. Sonuç önbelleğe alınır.
         
         Args:
-            key: Basılacak tuş.
-            duration: Tuşa basılı tutma süresi (saniye).
+            key (str or KeyChord): Tuş tanımı (ör. "F1", "CTRL+2", "NUM5").
             
         Returns:
-            None
+            KeyChord: Derlenmiş tuş kombinasyonu.
+            
+        Raises:
+            InvalidKeyError: Tuş tanımı geçersizse.
         """
-        try:
-            # İnterception kütüphanesi kullanılabilir ve sürücü başlatıldı ise
-            if interception_available and self.driver is not None and self.keyboard is not None:
-                keycode = self.keycodes.get(key.upper(), None)
-                if keycode:
-                    logger.debug(f"Interception kullanarak tuş basılıyor: {key}")
-                    self.tusbas(keycode, duration)
-                else:
-                    # Keycode bulunamadı, pyautogui kullan
-                    logger.debug(f"PyAutoGUI kullanarak tuş basılıyor: {key}")
-                    pyautogui.press(key)
-            else:
-                # Interception yoksa, pyautogui kullan
-                logger.debug(f"PyAutoGUI kullanarak tuş basılıyor: {key}")
-                pyautogui.press(key)
-        except Exception as e:
-            logger.error(f"Tuş basma işlemi başarısız: {e}")
+        cache_key = key.spec if isinstance(key, KeyChord) else key
+        compiled = self._compiled_keys.get(cache_key)
+        if compiled is not None:
+            return compiled
+        
+        chord = parse_key(key)
+        self.key_backend.prepare_key(chord)
+        
+        self._compiled_keys[cache_key] = chord
+        logger.debug(f"Tuş derlendi: {chord.spec}")
+        return chord
     
-    def tusbas(self, key, gecikme):
+    def press_key(self, key, duration=None):
         """
-        Belirlenen tuşa basma ve bırakma işlemini gerçekleştiren fonksiyon.
+        Belirtilen tuşa (veya tuş kombinasyonuna) basar.
         
         Args:
-            key (int): Basılacak tuşun keycode değeri
-            gecikme (float): Tuşa basılı tutma süresi (saniye cinsinden)
+            key: Basılacak tuş tanımı veya compile_key ile derlenmiş KeyChord.
+            duration: Tuşa basılı tutma süresi (saniye). Verilmezse zamanlama profili kullanılır.
             
         Returns:
             None
         """
-        if not interception_available or self.driver is None or self.keyboard is None:
-            logger.error("Interception kullanılamıyor, tuş basılamadı.")
+        if duration is None:
+            duration = self.timing.key_hold
+        try:
+            chord = self.compile_key(key)
+        except InvalidKeyError as e:
+            logger.error(f"Geçersiz tuş, basılmadı: {e}")
             return
-            
+        
+        start_time = time.monotonic()
         try:
-            # Tuşa basma (key down) işlemi
-            interception_press = key_stroke(key, interception_key_state.INTERCEPTION_KEY_DOWN.value, 0)
-            self.driver.send(self.keyboard, interception_press)
-            
-            # Tuşa basılı tutma süresi
-            time.sleep(gecikme)
-            
-            # Tuşu bırakma (key up) işlemi
-            interception_press.state = interception_key_state.INTERCEPTION_KEY_UP.value
-            self.driver.send(self.keyboard, interception_press)
-            
-            # İki tuş basma arasında minimum bekleme süresi (tuş bırakıldıktan sonra)
-            time.sleep(0.01)  # 10ms
-            
-            logger.debug(f"Interception kullanarak tuş basma başarılı: {key}")
+            logger.debug("%s kullanarak tuş basılıyor: %s", self.key_backend.name, chord)
+            self._send_key(self.key_backend, chord, duration)
+            self.key_time.observe(time.monotonic() - start_time)
+            return
         except Exception as e:
-            logger.error(f"Interception ile tuş basma hatası: {e}") 
\ No newline at end of file
+            self.input_failures.inc()
+            logger.error("%s ile tuş basma hatası: %s", self.key_backend.name, e)
+        
+        # Hata durumunda yedek arka uçla dene
+        if self.fallback_backend is not None and self.fallback_backend is not self.key_backend:
+            try:
+                self._send_key(self.fallback_backend, chord, duration)
+            except Exception as e:
+                logger.error(f"Tuş basma işlemi başarısız: {e}")
+    
+    def _send_key(self, backend, chord, gecikme):
+        """
+        Tuş basma ve bırakma işlemini gerçekleştirir.
+        
+        Args:
+            backend (InputBackend): Kullanılacak arka uç.
+            chord (KeyChord): Basılacak tuş kombinasyonu.
+            gecikme (float): Tuşa basılı tutma süresi (saniye cinsinden)
+        """
+        # Tuşa basma (key down) işlemi
+        backend.key_down(chord)
+        
+        # Tuşa basılı tutma süresi
+        time.sleep(gecikme)
+        
+        # Tuşu bırakma (key up) işlemi
+        backend.key_up(chord)
+        
+        # İki tuş basma arasında minimum bekleme süresi (tuş bırakıldıktan sonra)
+        time.sleep(self.timing.key_release_gap)
@@ -7,11 +7,21 @@ import os
 import time
 import logging
 import numpy as np
-import pyautogui
+
+from core.utils.metrics import registry
+from services.common.frame import Frame
 
 # Logging yapılandırması
 logger = logging.getLogger("ScreenService")
 
+# PyAutoGUI ekran bağlantısı olmayan ortamlarda (ör. Linux CI) içe aktarılırken hata verebilir
+try:
+    import pyautogui
+    pyautogui_available = True
+except Exception as e:
+    pyautogui_available = False
+    logger.warning(f"PyAutoGUI kullanılamıyor: {e}")
+
 # MSS kütüphanesini dikkatli bir şekilde içe aktar
 try:
     import mss.tools
@@ -40,25 +50,31 @@ except Exception as e:
 class ScreenService:
     """Ekran görüntüsü alma işlemlerini yöneten servis."""
     
-    def __init__(self, debug_mode=False):
+    def __init__(self, debug_mode=False, backend=None):
         """
         ScreenService sınıfını başlatır.
         
         Args:
             debug_mode: Hata ayıklama modu etkin mi? (Varsayılan: False)
+            backend: grab(region) metoduna sahip yakalama arka ucu (ör. SyntheticScreen).
+                Verilirse MSS ve PyAutoGUI kullanılmaz.
         """
         self.mss_available = False
         self.sct = None
         self.current_screenshot = None
+        self.current_frame = None
         self.use_mss = False
         self.debug_mode = debug_mode
+        self.backend = backend
         
         # Debug klasörü oluştur
         if self.debug_mode:
             os.makedirs('images', exist_ok=True)
         
         # MSS kütüphanesini başlatmayı dene
-        if mss_available and mss_recommended:
+        if self.backend is not None:
+            logger.info(f"Özel yakalama arka ucu kullanılacak: {type(self.backend).__name__}")
+        elif mss_available and mss_recommended:
             try:
                 logger.info("MSS kütüphanesi başlatılıyor...")
                 self.sct = mss.mss()
@@ -74,12 +90,16 @@ class ScreenService:
                 logger.error(f"MSS başlatılırken hata: {e}")
                 self.sct = None
                 
-        if not self.mss_available:
+        if self.backend is None and not self.mss_available:
             logger.info("PyAutoGUI ekran görüntüsü alma servisi kullanılacak.")
         
+        # Yakalama ölçümleri
+        self.capture_time = registry.histogram("screen_capture_seconds", "Ekran görüntüsü alma süresi")
+        self.capture_failures = registry.counter("screen_capture_failures_total", "Başarısız ekran görüntüsü alma")
+        
     def take_screenshot(self, region=None, target_id=None):
         """
-        Belirtilen bölgenin ekran görüntüsünü alır.
+        Belirtilen bölgenin ekran görüntüsünü alır ve süresini ölçer.
         
         Args:
             region: (x, y, width, height) formatında bölge bilgisi.
@@ -88,6 +108,37 @@ class ScreenService:
         Returns:
             numpy.ndarray: Alınan ekran görüntüsü.
         """
+        start_time = time.monotonic()
+        img = self._grab_screenshot(region, target_id)
+        self.capture_time.observe(time.monotonic() - start_time)
+        if img is None:
+            self.capture_failures.inc()
+        return img
+    
+    def _grab_screenshot(self, region, target_id):
+        """
+        Ekran görüntüsünü MSS veya PyAutoGUI ile alır.
+        
+        Args:
+            region: (x, y, width, height) formatında bölge bilgisi.
+            target_id: Hedef kimliği (opsiyonel).
+            
+        Returns:
+            numpy.ndarray: Alınan ekran görüntüsü veya hata durumunda None.
+        """
+        # Önceki çağrıdan kalan görüntü yanlışlıkla kullanılmasın
+        self.current_screenshot = None
+        
+        # Özel arka uç (ör. sentetik ekran) varsa doğrudan kullan
+        if self.backend is not None:
+            try:
+                img = self.backend.grab(region)
+                self.current_screenshot = img
+                return img
+            except Exception as e:
+                logger.error(f"Yakalama arka ucu hatası: {e}")
+                return None
+        
         # PyAutoGUI ile ekran görüntüsü alma (varsayılan ve güvenli yöntem)
         try:
             # MSS kütüphanesi kullanma seçeneği etkin ve kullanılabilir değilse
@@ -184,6 +235,30 @@ class ScreenService:
             self.current_screenshot = None
             return None
             
+    def capture_frame(self, region=None, target_id=None):
+        """
+        Ekran görüntüsünü yakalama zamanlarıyla birlikte alır.
+        
+        Args:
+            region: (x1, y1, x2, y2) formatında bölge bilgisi.
+            target_id: Hedef kimliği (opsiyonel).
+            
+        Returns:
+            Frame: Zaman damgalı kare veya yakalama başarısızsa None.
+        """
+        self.current_frame = None
+        
+        capture_start = time.monotonic()
+        img = self.take_screenshot(region, target_id)
+        capture_end = time.monotonic()
+        
+        if img is None:
+            return None
+        
+        frame = Frame(img, capture_start, capture_end, region)
+        self.current_frame = frame
+        return frame
+            
     def _save_debug_image(self, img, target_id, source):
         """
         Debug modu aktifse ekran görüntüsünü kaydeder.
@@ -0,0 +1,102 @@
+"""
+Knight Online Otomatik İyileştirme ve Buff Sistemi - Sentetik Ekran
+Bu modül, oyun ekranı olmadan (ör. Linux CI, benchmark) HP barlarını çizen sahte yakalama arka ucunu içerir.
+"""
+
+import time
+import threading
+import numpy as np
+
+# Oyundaki HP barı rengi (#AE0000) ve boş bar rengi
+SYNTHETIC_HP_COLOR = (0xAE, 0x00, 0x00)
+SYNTHETIC_EMPTY_COLOR = (0x28, 0x08, 0x08)
+SYNTHETIC_BACKGROUND_COLOR = (0x20, 0x20, 0x20)
+
+class SyntheticScreen:
+    """
+    HP barlarını bellekteki bir tuvale çizen yakalama arka ucu.
+    ScreenService(backend=SyntheticScreen(...)) ile gerçek ekran yerine kullanılabilir.
+    """
+    
+    def __init__(self, width=1920, height=1080, latency=0.0, noise=0, seed=0, empty_color=SYNTHETIC_EMPTY_COLOR):
+        """
+        SyntheticScreen sınıfını başlatır.
+        
+        Args:
+            width (int): Tuval genişliği.
+            height (int): Tuval yüksekliği.
+            latency (float): Her yakalamada beklenecek süre (saniye), gerçek yakalamayı taklit eder.
+            noise (int): Bar piksellerine eklenecek en büyük renk sapması (0 ise gürültü yok).
+            seed (int): Gürültü için rastgele sayı tohumu.
+            empty_color (tuple): Barların boş kısmının (R, G, B) rengi.
+        """
+        self.width = width
+        self.height = height
+        self.latency = latency
+        self.noise = noise
+        self.empty_color = tuple(empty_color)
+        self.canvas = np.empty((height, width, 3), dtype=np.uint8)
+        self.canvas[:] = SYNTHETIC_BACKGROUND_COLOR
+        self.bars = []
+        self.grab_count = 0
+        self._rng = np.random.default_rng(seed)
+        self._lock = threading.Lock()
+    
+    def add_bar(self, coords, hp=100.0):
+        """
+        Tuvale bir HP barı ekler.
+        
+        Args:
+            coords (list): [x1, y1, x2, y2] formatında bar koordinatları.
+            hp (float): Başlangıç HP yüzdesi.
+        
+        Returns:
+            int: Bar indeksi.
+        """
+        x1, y1, x2, y2 = coords
+        if not (0 <= x1 < x2 <= self.width and 0 <= y1 < y2 <= self.height):
+            raise ValueError(f"Bar koordinatları tuval dışında: {coords}")
+        self.bars.append([x1, y1, x2, y2])
+        index = len(self.bars) - 1
+        self.set_hp(index, hp)
+        return index
+    
+    def set_hp(self, index, hp):
+        """
+        Bir barın doluluk oranını değiştirir.
+        
+        Args:
+            index (int): Bar indeksi.
+            hp (float): HP yüzdesi (0-100).
+        """
+        x1, y1, x2, y2 = self.bars[index]
+        hp = max(0.0, min(100.0, float(hp)))
+        fill_x = x1 + int(round((x2 - x1) * hp / 100.0))
+        
+        with self._lock:
+            self.canvas[y1:y2, x1:fill_x] = SYNTHETIC_HP_COLOR
+            self.canvas[y1:y2, fill_x:x2] = self.empty_color
+            if self.noise > 0:
+                bar = self.canvas[y1:y2, x1:x2].astype(np.int16)
+                bar += self._rng.integers(-self.noise, self.noise + 1, bar.shape, dtype=np.int16)
+                self.canvas[y1:y2, x1:x2] = np.clip(bar, 0, 255)
+    
+    def grab(self, region=None):
+        """
+        Tuvalin bir bölgesinin kopyasını döndürür.
+        
+        Args:
+            region: (x1, y1, x2, y2) formatında bölge, verilmezse tüm tuval.
+        
+        Returns:
+            numpy.ndarray: RGB görüntü.
+        """
+        if self.latency > 0:
+            time.sleep(self.latency)
+        
+        with self._lock:
+            self.grab_count += 1
+            if region:
+                x1, y1, x2, y2 = region
+                return self.canvas[y1:y2, x1:x2].copy()
+            return self.canvas.copy()
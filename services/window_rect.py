@@ -0,0 +1,118 @@
+"""
+Knight Online Otomatik İyileştirme ve Buff Sistemi - Pencere Konumu Sağlayıcıları
+Bu modül, oyun istemcisinin ekrandaki istemci alanını (sol, üst, genişlik, yükseklik) bildiren
+sağlayıcıları içerir. Win32 sağlayıcısı pencereyi başlığından bulur; sabit sağlayıcı testler ve
+tam ekran kullanım için sabit bir alan döndürür.
+"""
+
+import logging
+
+# Logging yapılandırması
+logger = logging.getLogger("WindowRect")
+
+# Win32 pencere işlevleri için içe aktarma
+try:
+    import win32gui
+    win32gui_available = True
+except ImportError:
+    win32gui_available = False
+
+class WindowRectProvider:
+    """
+    Pencere konumu sağlayıcıları için temel sınıf.
+    get_rect() her iyileştirme döngüsü adımında çağrılır, ucuz olmalıdır.
+    """
+    
+    name = "base"
+    
+    def get_rect(self):
+        """
+        Oyun penceresinin istemci alanını döndürür.
+        
+        Returns:
+            tuple: (sol, üst, genişlik, yükseklik) veya pencere bulunamazsa None.
+        """
+        raise NotImplementedError
+
+class StaticWindowRect(WindowRectProvider):
+    """Sabit bir istemci alanı döndüren sağlayıcı (testler ve pencere takibi istenmeyen kurulumlar için)."""
+    
+    name = "static"
+    
+    def __init__(self, rect=None):
+        """
+        StaticWindowRect sınıfını başlatır.
+        
+        Args:
+            rect (tuple, optional): (sol, üst, genişlik, yükseklik).
+        """
+        self.rect = tuple(rect) if rect else None
+    
+    def set_rect(self, rect):
+        """
+        Döndürülecek alanı değiştirir (pencere taşınmasını taklit etmek için).
+        
+        Args:
+            rect (tuple): (sol, üst, genişlik, yükseklik) veya None.
+        """
+        self.rect = tuple(rect) if rect else None
+    
+    def get_rect(self):
+        return self.rect
+
+class Win32WindowRect(WindowRectProvider):
+    """Pencereyi başlığından bulup istemci alanını Win32 API ile okuyan sağlayıcı."""
+    
+    name = "win32"
+    
+    def __init__(self, title):
+        """
+        Win32WindowRect sınıfını başlatır.
+        
+        Args:
+            title (str): Oyun penceresinin başlığı.
+        """
+        self.title = title
+        self.hwnd = None
+    
+    def get_rect(self):
+        try:
+            # Pencere tanıtıcısı yalnızca pencere kapanıp açıldığında yeniden aranır
+            if not self.hwnd or not win32gui.IsWindow(self.hwnd):
+                self.hwnd = win32gui.FindWindow(None, self.title) or None
+                if not self.hwnd:
+                    return None
+            
+            # Simge durumundaki pencerenin konumu anlamsızdır
+            if win32gui.IsIconic(self.hwnd):
+                return None
+            
+            left, top = win32gui.ClientToScreen(self.hwnd, (0, 0))
+            _, _, width, height = win32gui.GetClientRect(self.hwnd)
+        except Exception as e:
+            logger.debug(f"Pencere konumu okunamadı: {e}")
+            self.hwnd = None
+            return None
+        
+        if width <= 0 or height <= 0:
+            return None
+        return (left, top, width, height)
+
+def create_window_rect_provider(title):
+    """
+    Pencere başlığına göre uygun sağlayıcıyı oluşturur.
+    
+    Args:
+        title (str): Oyun penceresinin başlığı; boşsa pencere takibi yapılmaz.
+    
+    Returns:
+        WindowRectProvider: Sağlayıcı veya pencere takibi kullanılamıyorsa None.
+    """
+    if not title:
+        return None
+    if not win32gui_available:
+        logger.warning("win32gui bulunamadı, oyun penceresi takip edilmeyecek; koordinatlar ekran koordinatı olarak kullanılacak.")
+        return None
+    
+    logger.info(f"Oyun penceresi takip edilecek: {title}")
+    return Win32WindowRect(title)
@@ -0,0 +1,11 @@
+"""
+Knight Online Otomatik İyileştirme ve Buff Sistemi - Test Yapılandırması
+Bu modül, testlerin proje kök dizinindeki paketleri içe aktarabilmesini sağlar.
+"""
+
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
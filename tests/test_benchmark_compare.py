@@ -0,0 +1,58 @@
+"""
+Knight Online Otomatik İyileştirme ve Buff Sistemi - Benchmark Karşılaştırma Testleri
+Bu modül, paketle gelen tolerans dosyasının tam ve --quick sonuçlara uygulanmasını test eder.
+"""
+
+from benchmarks.common import BenchmarkResults
+from benchmarks.compare import DEFAULT_TOLERANCES_FILE, load_tolerances, compare
+
+def _results(quick, values):
+    # Ölçüm adı -> (değer, birim); hepsinde düşük değer daha iyidir
+    results = BenchmarkResults(quick)
+    for name, (value, unit) in values.items():
+        results.metrics[name] = {"value": value, "unit": unit, "better": "lower"}
+    return results.to_dict()
+
+def _statuses(quick, base, now):
+    patterns, default = load_tolerances(DEFAULT_TOLERANCES_FILE, quick)
+    return {row[0]: row[5] for row in compare(base, now, patterns, default)}
+
+def test_full_run_allows_noise_but_catches_large_regressions():
+    base = _results(False, {
+        "heal.row_path.us": (100.0, "us"),
+        "accuracy.heal_loop.mae": (7.0, "pp")
+    })
+    noisy = _results(False, {
+        "heal.row_path.us": (160.0, "us"),
+        "accuracy.heal_loop.mae": (7.05, "pp")
+    })
+    slow = _results(False, {
+        "heal.row_path.us": (250.0, "us"),
+        "accuracy.heal_loop.mae": (7.5, "pp")
+    })
+    
+    assert set(_statuses(False, base, noisy).values()) == {"OK"}
+    assert set(_statuses(False, base, slow).values()) == {"REGRESSION"}
+
+def test_quick_run_ignores_timings_but_keeps_accuracy_strict():
+    base = _results(True, {
+        "heal.row_path.us": (100.0, "us"),
+        "accuracy.heal_loop.us_per_crop": (50.0, "us"),
+        "accuracy.heal_loop.mae": (7.0, "pp"),
+        "reaction.missed": (0.0, "count")
+    })
+    now = _results(True, {
+        "heal.row_path.us": (300.0, "us"),
+        "accuracy.heal_loop.us_per_crop": (150.0, "us"),
+        "accuracy.heal_loop.mae": (7.5, "pp"),
+        "reaction.missed": (1.0, "count")
+    })
+    
+    statuses = _statuses(True, base, now)
+    assert statuses["heal.row_path.us"] == "IGNORED"
+    assert statuses["accuracy.heal_loop.us_per_crop"] == "IGNORED"
+    assert statuses["accuracy.heal_loop.mae"] == "REGRESSION"
+    assert statuses["reaction.missed"] == "REGRESSION"
+    
+    # Tam çalıştırmada aynı ölçümler karşılaştırılır
+    assert _statuses(False, base, now)["heal.row_path.us"] == "REGRESSION"
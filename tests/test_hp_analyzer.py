@@ -0,0 +1,64 @@
+"""
+Knight Online Otomatik İyileştirme ve Buff Sistemi - HP Barı Analizcisi Testleri
+Bu modül, read_hp() okumasının ve güveninin farklı boş bar renklerinde doğruluğunu test eder.
+"""
+
+import numpy as np
+import pytest
+
+from core.heal_logic import MIN_READING_CONFIDENCE
+from core.hp_analyzer import read_hp
+from services.synthetic_screen import SyntheticScreen, SYNTHETIC_EMPTY_COLOR
+
+EMPTY_COLORS = [SYNTHETIC_EMPTY_COLOR, (0, 0, 0), (32, 32, 32), (48, 48, 48), (60, 60, 60)]
+
+def _bar(hp, empty_color, width=120, height=10, noise=0):
+    screen = SyntheticScreen(width, height, noise=noise, empty_color=empty_color)
+    screen.add_bar([0, 0, width, height], hp)
+    return screen.grab()
+
+@pytest.mark.parametrize("empty_color", EMPTY_COLORS)
+@pytest.mark.parametrize("hp", [0, 5, 10, 50, 79, 100])
+def test_reading_is_confident_for_any_empty_color(empty_color, hp):
+    reading = read_hp(_bar(hp, empty_color))
+    
+    assert reading.percentage == pytest.approx(hp, abs=1)
+    assert reading.confidence >= MIN_READING_CONFIDENCE
+
+@pytest.mark.parametrize("empty_color", EMPTY_COLORS)
+def test_reading_with_noise(empty_color):
+    reading = read_hp(_bar(40, empty_color, noise=10))
+    
+    assert reading.percentage == pytest.approx(40, abs=2)
+    assert reading.confidence >= MIN_READING_CONFIDENCE
+
+@pytest.mark.parametrize("empty_color", [SYNTHETIC_EMPTY_COLOR, (0, 0, 0)])
+def test_tooltip_over_bar_lowers_confidence(empty_color):
+    image = _bar(90, empty_color)
+    image[:, 40:100] = (230, 220, 180)
+    
+    assert read_hp(image).confidence < MIN_READING_CONFIDENCE
+
+def test_fill_not_starting_at_left_edge_lowers_confidence():
+    # Bölge sağa kaymış: sol uçta dolu kısım yok
+    image = _bar(50, (0, 0, 0))
+    image[:, :30] = (0, 0, 0)
+    
+    assert read_hp(image).confidence < MIN_READING_CONFIDENCE
+
+def test_jump_from_history_lowers_confidence():
+    image = _bar(50, (0, 0, 0))
+    
+    assert read_hp(image, previous=95).confidence < read_hp(image, previous=52).confidence
+
+def test_empty_image_has_no_confidence():
+    assert read_hp(np.zeros((0, 0, 3), dtype=np.uint8)).confidence == 0.0
+
+def test_cursor_on_right_end_keeps_low_hp_reading():
+    # Boş renk sağ uçtan değil dolu kısmın sağından örneklenir; uçtaki küçük imleç okumayı engellemez
+    image = _bar(10, (0, 0, 0))
+    image[2:8, -4:] = (250, 250, 250)
+    reading = read_hp(image)
+    
+    assert reading.percentage == pytest.approx(10, abs=1)
+    assert reading.confidence >= MIN_READING_CONFIDENCE
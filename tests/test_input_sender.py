@@ -0,0 +1,58 @@
+"""
+Knight Online Otomatik İyileştirme ve Buff Sistemi - Asenkron Girdi Gönderici Testleri
+Bu modül, hız sınırını aşan talepte kuyruğun süresi dolan işlemleri düşürmesini test eder.
+"""
+
+import time
+
+import pytest
+
+from services.input_backends import RecordingBackend
+from services.input_sender import InputSender
+from services.keyboard_mouse_service import KeyboardMouseService, InputTimingProfile
+from services.common.rate_governor import InputRateGovernor, PRIORITY_HEAL, PRIORITY_BUFF
+
+MAX_AGE = 0.05
+
+@pytest.fixture
+def sender():
+    backend = RecordingBackend()
+    service = KeyboardMouseService(InputTimingProfile.immediate(), backend=backend)
+    # Saniyede bir işlem: ilk tuştan sonrakiler hız denetleyicisinde bekler
+    sender = InputSender(service, InputRateGovernor(global_rate=1.0, global_burst=1.0))
+    sender.backend = backend
+    sender.start()
+    yield sender
+    sender.stop()
+
+def _key_downs(backend):
+    return [event.detail for event in backend.events if event.action == "key_down"]
+
+def test_expired_heals_are_dropped(sender):
+    sender.set_max_age(PRIORITY_HEAL, MAX_AGE)
+    futures = [sender.press_key("F11") for _ in range(5)]
+    
+    deadline = time.monotonic() + 2.0
+    while sender.pending_count() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    
+    # Yalnızca hemen gönderilebilen ilk tuş basılır, diğerleri beklemek yerine düşürülür
+    assert sender.pending_count() == 0
+    assert futures[0].result(timeout=1.0) is not False
+    assert all(future.cancelled() for future in futures[1:])
+    assert len(_key_downs(sender.backend)) == 1
+
+def test_max_age_applies_per_priority(sender):
+    sender.set_max_age(PRIORITY_HEAL, MAX_AGE)
+    sender.press_key("F11")
+    buff = sender.press_key("F2", priority=PRIORITY_BUFF)
+    
+    # Süre sınırı olmayan buff kuyrukta kalır ve hız denetleyicisi izin verince gönderilir
+    time.sleep(3 * MAX_AGE)
+    assert not buff.cancelled()
+    assert sender.pending_count() == 1
+    
+    sender.set_max_age(PRIORITY_HEAL, 0)
+    late = sender.press_key("F11")
+    time.sleep(3 * MAX_AGE)
+    assert not late.cancelled()
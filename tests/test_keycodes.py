@@ -0,0 +1,58 @@
+"""
+Knight Online Otomatik İyileştirme ve Buff Sistemi - Tuş Kodları Testleri
+Bu modül, tuş adı eşlemelerini, kombinasyon ayrıştırmayı, geçersiz tanımların reddini ve
+sayısal sanal tuş kodlarının taşınmasını test eder.
+"""
+
+import pytest
+
+from services.common.keycodes import (
+    KeyChord, InvalidKeyError, KEY_ALIASES, KEY_TABLE, parse_key, is_valid_key, migrate_key
+)
+
+def test_single_key_scancodes():
+    chord = parse_key("F11")
+    assert chord.spec == "F11"
+    assert [(key.scancode, key.extended) for key in chord.keys] == [(0x57, False)]
+    assert parse_key("up").keys[0].extended
+    assert parse_key("NUM5").pyautogui_names == ["num5"]
+
+def test_aliases_resolve_to_table_names():
+    for alias, name in KEY_ALIASES.items():
+        assert name in KEY_TABLE
+        assert parse_key(alias).spec == name
+    assert parse_key("control+escape") == parse_key("CTRL+ESC")
+
+def test_chord_is_normalized_and_ordered():
+    chord = parse_key(" ctrl + Shift+f1 ")
+    assert chord.spec == "CTRL+SHIFT+F1"
+    assert [key.name for key in chord.keys] == ["CTRL", "SHIFT", "F1"]
+    assert chord.pyautogui_names == ["ctrl", "shift", "f1"]
+    assert str(chord) == "CTRL+SHIFT+F1"
+    assert hash(chord) == hash(parse_key("CTRL+SHIFT+F1"))
+
+def test_parse_is_cached_and_accepts_chords():
+    chord = parse_key("ALT+2")
+    assert parse_key("ALT+2") is chord
+    assert parse_key(chord) is chord
+    assert isinstance(chord, KeyChord)
+
+@pytest.mark.parametrize("spec", ["", "   ", None, 5, "F16", "CTRL+", "CTRL++F1", "FOO+F1", "F1+f1", "CTRL+CONTROL"])
+def test_invalid_specs_are_rejected(spec):
+    with pytest.raises(InvalidKeyError):
+        parse_key(spec)
+    assert not is_valid_key(spec)
+
+def test_numeric_codes_are_rejected_with_hint():
+    with pytest.raises(InvalidKeyError, match="F11"):
+        parse_key("122")
+
+def test_migrate_key():
+    assert migrate_key("122") == "F11"
+    assert migrate_key(" 65 ") == "A"
+    assert migrate_key("97") == "NUM1"
+    # Tek haneli değerler ve tuş adları değişmez
+    assert migrate_key("2") == "2"
+    assert migrate_key("CTRL+F1") == "CTRL+F1"
+    with pytest.raises(InvalidKeyError):
+        migrate_key("232")
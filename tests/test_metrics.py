@@ -0,0 +1,63 @@
+"""
+Knight Online Otomatik İyileştirme ve Buff Sistemi - Ölçüm Testleri
+Bu modül, iş parçacığı başına parçaların biten iş parçacıklarında temel değere katlanmasını test eder.
+"""
+
+import gc
+import weakref
+import threading
+
+from core.utils.metrics import Counter, LatencyHistogram
+
+THREADS = 50
+
+def _run_threads(target):
+    threads = [threading.Thread(target=target) for _ in range(THREADS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+def test_counter_folds_finished_threads():
+    counter = Counter("test")
+    counter.inc(5)
+    _run_threads(lambda: counter.inc(2))
+    
+    assert counter.value == 5 + 2 * THREADS
+    # Yalnızca ana iş parçacığının parçası kalır
+    assert len(counter._shards) == 1
+    
+    counter.reset()
+    assert counter.value == 0
+
+def test_histogram_folds_finished_threads():
+    histogram = LatencyHistogram(name="test")
+    
+    def observe():
+        histogram.observe(0.003)
+        histogram.observe(0.030)
+    
+    _run_threads(observe)
+    histogram.observe(5.0)
+    
+    snapshot = histogram.snapshot()
+    assert len(histogram._shards) == 1
+    assert snapshot["count"] == 2 * THREADS + 1
+    assert snapshot["max"] == 5.0
+    assert abs(snapshot["sum"] - (0.033 * THREADS + 5.0)) < 1e-9
+    assert snapshot["counts"][histogram.buckets.index(0.005)] == THREADS
+    assert snapshot["counts"][-1] == 1
+    
+    histogram.reset()
+    assert histogram.count == 0
+
+def test_finalizer_does_not_keep_metric_alive():
+    counter = Counter("test")
+    thread = threading.Thread(target=counter.inc)
+    thread.start()
+    thread.join()
+    counter.inc()
+    ref = weakref.ref(counter)
+    del counter
+    gc.collect()
+    assert ref() is None
@@ -0,0 +1,41 @@
+"""
+Knight Online Otomatik İyileştirme ve Buff Sistemi - Parti HP Barı Algılayıcı Testleri
+Bu modül, parti barlarının farklı boş bar renklerinde algılanmasını test eder.
+"""
+
+import pytest
+
+from core.party_detector import detect_party_rows, estimate_empty_color
+from services.synthetic_screen import SyntheticScreen, SYNTHETIC_EMPTY_COLOR
+
+PARTY_HP = [100, 10, 50, 5, 80, 30, 60, 90]
+
+def _party_screen(empty_color, noise=0):
+    screen = SyntheticScreen(800, 600, noise=noise, empty_color=empty_color)
+    bars = [(600, 100 + i * 45, 750, 112 + i * 45) for i in range(len(PARTY_HP))]
+    for coords, hp in zip(bars, PARTY_HP):
+        screen.add_bar(list(coords), hp)
+    return screen, bars
+
+@pytest.mark.parametrize("empty_color", [SYNTHETIC_EMPTY_COLOR, (0, 0, 0), (56, 56, 56)])
+@pytest.mark.parametrize("noise", [0, 10])
+def test_low_hp_bars_are_detected_at_full_width(empty_color, noise):
+    screen, bars = _party_screen(empty_color, noise)
+    
+    assert detect_party_rows(screen.grab()) == bars
+
+def test_empty_color_is_sampled_from_partial_bars():
+    screen, _ = _party_screen((0, 0, 0))
+    
+    empty_color = estimate_empty_color(screen.grab())
+    assert empty_color is not None
+    assert empty_color.color == (0, 0, 0)
+
+def test_full_bars_do_not_calibrate_background():
+    # Tam dolu barların sağındaki zemin boş bar rengi sayılmamalı
+    screen = SyntheticScreen(400, 300)
+    screen.add_bar([100, 100, 250, 112], 100)
+    screen.add_bar([100, 145, 250, 157], 100)
+    
+    assert estimate_empty_color(screen.grab()) is None
+    assert detect_party_rows(screen.grab()) == [(100, 100, 250, 112), (100, 145, 250, 157)]
@@ -0,0 +1,38 @@
+"""
+Knight Online Otomatik İyileştirme ve Buff Sistemi - Parti Düzeni Testleri
+Bu modül, algılanan barlardan satır aralığının (pitch) bulunmasını test eder.
+"""
+
+from core.party_layout import PartyLayout
+
+def _bars(*tops, height=8):
+    return [(0, top, 50, top + height) for top in tops]
+
+def test_evenly_spaced_bars():
+    layout = PartyLayout.from_bars(_bars(100, 130, 160, 190), 8)
+    assert layout.pitch == 30
+    assert layout.rows()[:4] == _bars(100, 130, 160, 190)
+    assert len(layout.rows()) == 8
+
+def test_missing_member_aligns_to_smallest_gap():
+    # Eksik üye ortadayken medyan 45 verirdi
+    layout = PartyLayout.from_bars(_bars(100, 160, 190), 4)
+    assert layout.pitch == 30
+    assert layout.rows() == _bars(100, 130, 160, 190)
+    
+    layout = PartyLayout.from_bars(_bars(100, 130, 220), 4)
+    assert layout.pitch == 30
+
+def test_small_jitter_is_averaged():
+    layout = PartyLayout.from_bars(_bars(100, 131, 159, 221), 5)
+    assert layout.pitch == 30
+
+def test_gaps_off_the_pitch_grid_are_rejected():
+    # 45, 30'un katı değil
+    assert PartyLayout.from_bars(_bars(100, 130, 175), 4) is None
+    # 70 en yakın kat olan 60'tan fazla sapıyor
+    assert PartyLayout.from_bars(_bars(100, 130, 200), 4) is None
+
+def test_too_few_or_overlapping_bars():
+    assert PartyLayout.from_bars(_bars(100), 4) is None
+    assert PartyLayout.from_bars(_bars(100, 101, 130), 4) is None
@@ -0,0 +1,94 @@
+"""
+Knight Online Otomatik İyileştirme ve Buff Sistemi - Girdi Hız Denetleyicisi Testleri
+Bu modül, jeton kovasının dolumunu ve ani yük kapasitesini, buff rezervini ve tuş başına
+sınırları test eder.
+"""
+
+import pytest
+
+from services.common.rate_governor import (
+    TokenBucket, InputRateGovernor, PRIORITY_HEAL, PRIORITY_BUFF
+)
+
+def test_bucket_starts_full_and_allows_burst():
+    bucket = TokenBucket(rate=10.0, burst=3, now=0.0)
+    for _ in range(3):
+        assert bucket.wait_time(0.0) == 0.0
+        bucket.consume(0.0)
+    # Bir jeton 1/rate saniyede dolar
+    assert bucket.wait_time(0.0) == pytest.approx(0.1)
+
+def test_bucket_refills_at_rate_up_to_burst():
+    bucket = TokenBucket(rate=10.0, burst=3, now=0.0)
+    for _ in range(3):
+        bucket.consume(0.0)
+    
+    assert bucket.wait_time(0.05) == pytest.approx(0.05)
+    assert bucket.wait_time(0.1) == 0.0
+    
+    # Uzun beklemede kova burst'ün üzerine dolmaz
+    bucket.wait_time(100.0)
+    assert bucket.tokens == 3.0
+
+def test_bucket_reserve_is_capped_by_burst():
+    bucket = TokenBucket(rate=10.0, burst=2, now=0.0)
+    # Rezerv, kovada en az bir jetonun harcanabilmesi için burst - 1 ile sınırlanır
+    assert bucket.wait_time(0.0, reserve=5.0) == 0.0
+    bucket.consume(0.0)
+    assert bucket.wait_time(0.0, reserve=5.0) == pytest.approx(0.1)
+
+@pytest.mark.parametrize("rate, burst", [(0, 2), (-1, 2), (5, 0.5)])
+def test_bucket_rejects_invalid_settings(rate, burst):
+    with pytest.raises(ValueError):
+        TokenBucket(rate, burst)
+
+def test_buff_reserve_keeps_tokens_for_heals():
+    governor = InputRateGovernor(global_rate=10.0, global_burst=4.0, key_rate=100.0,
+                                 key_burst=10.0, buff_reserve=2.0)
+    governor.global_bucket = TokenBucket(10.0, 4.0, now=0.0)
+    
+    # Buff'lar yalnızca rezervin üzerindeki jetonları harcayabilir
+    for key in ("b1", "b2"):
+        assert governor.wait_time(key, PRIORITY_BUFF, now=0.0) == 0.0
+        governor.acquire(key, now=0.0)
+    assert governor.wait_time("b3", PRIORITY_BUFF, now=0.0) > 0.0
+    
+    # İyileştirmeler rezervi kullanır
+    for key in ("h1", "h2"):
+        assert governor.wait_time(key, PRIORITY_HEAL, now=0.0) == 0.0
+        governor.acquire(key, now=0.0)
+    assert governor.wait_time("h3", PRIORITY_HEAL, now=0.0) == pytest.approx(0.1)
+    assert governor.admitted == 4
+
+def test_per_key_limit_is_independent_of_other_keys():
+    governor = InputRateGovernor(global_rate=100.0, global_burst=50.0, key_rate=5.0, key_burst=2.0)
+    for _ in range(2):
+        assert governor.wait_time("F1", PRIORITY_HEAL, now=0.0) == 0.0
+        governor.acquire("F1", now=0.0)
+    
+    # Aynı tuş kendi kovasının dolmasını bekler, diğer tuşlar etkilenmez
+    assert governor.wait_time("F1", PRIORITY_HEAL, now=0.0) == pytest.approx(0.2)
+    assert governor.wait_time("F2", PRIORITY_HEAL, now=0.0) == 0.0
+    assert governor.wait_time("F1", PRIORITY_HEAL, now=0.2) == 0.0
+
+def test_from_config_replaces_invalid_values():
+    governor = InputRateGovernor.from_config({
+        "global_rate": "abc",
+        "key_rate": "0",
+        "key_burst": "3",
+        "buff_reserve": "0"
+    })
+    assert governor.global_rate == InputRateGovernor.DEFAULTS["global_rate"]
+    assert governor.key_rate == InputRateGovernor.DEFAULTS["key_rate"]
+    assert governor.key_burst == 3.0
+    # Rezerv sıfır olabilir
+    assert governor.buff_reserve == 0.0
+    assert governor.reserves[PRIORITY_BUFF] == 0.0
+
+@pytest.mark.parametrize("name", ["global_burst", "key_burst"])
+@pytest.mark.parametrize("text", ["0.5", "0.99", "0"])
+def test_from_config_rejects_burst_below_one(name, text):
+    # Aksi halde TokenBucket uygulama açılırken ValueError fırlatır
+    governor = InputRateGovernor.from_config({name: text})
+    assert getattr(governor, name) == InputRateGovernor.DEFAULTS[name]
+    governor.wait_time("F1", PRIORITY_HEAL, now=0.0)
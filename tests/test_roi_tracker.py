@@ -0,0 +1,84 @@
+"""
+Knight Online Otomatik İyileştirme ve Buff Sistemi - HP Barı Bölge Takibi Testleri
+Bu modül, satır bölgesinin bar üzerinde olup olmadığının kararını ve kayan panelin yeniden bulunmasını test eder.
+"""
+
+import numpy as np
+import pytest
+
+from core.roi_tracker import RoiTracker, is_on_bar
+from services.synthetic_screen import SyntheticScreen, SYNTHETIC_EMPTY_COLOR
+
+EMPTY_COLORS = [SYNTHETIC_EMPTY_COLOR, (0, 0, 0), (32, 32, 32), (48, 48, 48), (60, 60, 60)]
+
+def _crop(image, rect):
+    x1, y1, x2, y2 = rect
+    return image[y1:y2, x1:x2]
+
+def _party(empty_color, hps, offset=(0, 0)):
+    screen = SyntheticScreen(600, 500, empty_color=empty_color)
+    dx, dy = offset
+    rects = [(300 + dx, 100 + dy + i * 40, 420 + dx, 110 + dy + i * 40) for i in range(len(hps))]
+    for rect, hp in zip(rects, hps):
+        screen.add_bar(list(rect), hp)
+    return screen, rects
+
+@pytest.mark.parametrize("empty_color", EMPTY_COLORS)
+@pytest.mark.parametrize("hp", [10, 50])
+def test_low_hp_row_is_on_bar(empty_color, hp):
+    screen, rects = _party(empty_color, [hp])
+    
+    assert is_on_bar(_crop(screen.grab(), rects[0]))
+
+@pytest.mark.parametrize("empty_color", EMPTY_COLORS)
+def test_row_off_the_bar_is_lost(empty_color):
+    screen, rects = _party(empty_color, [50])
+    x1, y1, x2, y2 = rects[0]
+    image = screen.grab()
+    
+    # Panel sağa kaydı: bölgenin sol kenarı zeminde
+    assert not is_on_bar(_crop(image, (x1 - 10, y1, x2 - 10, y2)))
+    # Panel aşağı kaydı: bölge zeminde
+    assert not is_on_bar(_crop(image, (x1, y1 - 20, x2, y2 - 20)))
+
+@pytest.mark.parametrize("empty_color", [SYNTHETIC_EMPTY_COLOR, (0, 0, 0), (48, 48, 48)])
+def test_moved_panel_is_relocated(empty_color):
+    hps = [100, 10, 50, 80]
+    screen, rects = _party(empty_color, hps)
+    tracker = RoiTracker()
+    image = screen.grab()
+    for row_index, rect in enumerate(rects):
+        assert is_on_bar(_crop(image, rect), tracker.empty_color)
+        tracker.remember(row_index, image, rect)
+    assert tracker.empty_color is not None
+    
+    moved, _ = _party(empty_color, hps, offset=(6, 9))
+    image = moved.grab()
+    lost = [i for i, rect in enumerate(rects) if not is_on_bar(_crop(image, rect), tracker.empty_color)]
+    assert lost == [0, 1, 2, 3]
+    
+    shifts = tracker.relocate(image, np.array(rects), list(range(len(rects))), lost, now=0.0)
+    assert shifts == {i: (6, 9) for i in lost}
+
+@pytest.mark.parametrize("empty_color", [SYNTHETIC_EMPTY_COLOR, (0, 0, 0), (48, 48, 48)])
+def test_dead_row_in_place_is_not_redetected(empty_color, monkeypatch):
+    screen, rects = _party(empty_color, [50, 80])
+    tracker = RoiTracker()
+    image = screen.grab()
+    for row_index, rect in enumerate(rects):
+        tracker.remember(row_index, image, rect)
+    
+    # Satır ölür: bar boş renkte ama yerinde
+    screen.set_hp(0, 0)
+    image = screen.grab()
+    assert not is_on_bar(_crop(image, rects[0]), tracker.empty_color)
+    
+    calls = []
+    monkeypatch.setattr(tracker, "_redetect", lambda *args: calls.append(args) or {})
+    for tick in range(5):
+        assert tracker.relocate(image, np.array(rects), [0, 1], [0], now=tick * 10.0) == {}
+    assert calls == []
+    
+    # Panel kayarsa ölü satır yerinde sayılmaz ve şablonla yeniden bulunur
+    moved, _ = _party(empty_color, [0, 80], offset=(6, 9))
+    assert tracker.relocate(moved.grab(), np.array(rects), [0, 1], [0], now=100.0) == {0: (6, 9)}
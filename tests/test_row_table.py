@@ -0,0 +1,104 @@
+"""
+Knight Online Otomatik İyileştirme ve Buff Sistemi - Satır Tablosu Testleri
+Bu modül, HP yumuşatmasını (update_hp) ve eşik histerezisini (below) test eder.
+"""
+
+import numpy as np
+import pytest
+
+from core.heal_logic import HP_STEP
+from core.row_table import RowTable
+
+ALPHA = 0.5
+BAND = 4.0
+THRESHOLD = 80.0
+
+def _table(hp):
+    rows = RowTable(len(hp))
+    rows.last_hp = np.array(hp, dtype=float)
+    return rows
+
+def _readings(*values):
+    return np.array(values, dtype=float)
+
+def test_small_jitter_is_smoothed():
+    rows = _table([80.0])
+    for reading in (83.0, 77.0, 83.0, 77.0, 83.0, 77.0):
+        rows.update_hp(_readings(reading), ALPHA, HP_STEP)
+        assert abs(rows.last_hp[0] - 80.0) < 3.0
+    
+    rows = _table([80.0])
+    rows.update_hp(_readings(86.0), ALPHA, HP_STEP)
+    assert rows.last_hp[0] == pytest.approx(83.0)
+
+def test_step_larger_than_hp_step_passes_through():
+    rows = _table([90.0, 90.0])
+    rows.update_hp(_readings(90.0 - HP_STEP - 1, 90.0 + 5), ALPHA, HP_STEP)
+    
+    assert rows.last_hp[0] == pytest.approx(90.0 - HP_STEP - 1)
+    assert rows.last_hp[1] == pytest.approx(92.5)
+
+def test_alpha_one_disables_smoothing():
+    rows = _table([80.0])
+    rows.update_hp(_readings(77.0), 1.0, HP_STEP)
+    
+    assert rows.last_hp[0] == pytest.approx(77.0)
+
+def test_nan_reading_keeps_hp():
+    rows = _table([55.0, 90.0])
+    valid = rows.update_hp(_readings(np.nan, 60.0), ALPHA, HP_STEP)
+    
+    assert valid.tolist() == [False, True]
+    assert rows.last_hp[0] == 55.0
+
+def _below(rows, state, valid=None):
+    if valid is None:
+        valid = np.ones(rows.count, dtype=bool)
+    return rows.below(np.array(state), THRESHOLD, BAND, valid)
+
+@pytest.mark.parametrize("hp, low", [(78.0, True), (78.5, False), (80.0, False), (85.0, False)])
+def test_band_is_entered_at_threshold_minus_half_band(hp, low):
+    rows = _table([hp])
+    
+    assert _below(rows, [False]).tolist() == [low]
+
+@pytest.mark.parametrize("hp, low", [(78.0, True), (80.0, True), (81.9, True), (82.0, False)])
+def test_band_is_left_at_threshold_plus_half_band(hp, low):
+    rows = _table([hp])
+    
+    assert _below(rows, [True]).tolist() == [low]
+
+def test_jitter_around_threshold_does_not_toggle_state():
+    rows = _table([THRESHOLD])
+    state = np.array([False])
+    states = []
+    for reading in (70.0, 81.0, 79.0, 81.5, 78.5, 86.0):
+        rows.last_hp[0] = reading
+        state = _below(rows, state)
+        states.append(bool(state[0]))
+    
+    assert states == [True, True, True, True, True, False]
+
+def test_invalid_rows_keep_their_state():
+    rows = _table([10.0, 95.0])
+    state = rows.below(np.array([False, True]), THRESHOLD, BAND, np.array([False, False]))
+    
+    assert state.tolist() == [False, True]
+
+def test_per_row_thresholds():
+    rows = _table([70.0, 70.0])
+    state = rows.below(np.array([False, False]), np.array([60.0, 90.0]), BAND, np.ones(2, dtype=bool))
+    
+    assert state.tolist() == [False, True]
+
+def test_smoothing_and_hysteresis_together():
+    # Eşiğin hemen altında dalgalanan okumalar tek bir düşük durumu üretir, NaN adımları durumu korur
+    rows = _table([80.0])
+    state = np.array([False])
+    states = []
+    for reading in (77.0, 76.0, np.nan, 79.0, 81.0, np.nan, 99.0):
+        valid = rows.update_hp(_readings(reading), ALPHA, HP_STEP)
+        state = rows.below(state, THRESHOLD, BAND, valid)
+        states.append(bool(state[0]))
+    
+    assert states == [False, True, True, True, True, True, False]
@@ -0,0 +1,86 @@
+"""
+Knight Online Otomatik İyileştirme ve Buff Sistemi - Ayarlar Yöneticisi Testleri
+Bu modül, dışarıdan değişen ayar dosyasının kaydedilmemiş değişikliklerle birleştirilmesini test eder.
+"""
+
+import configparser
+
+import pytest
+
+from config.settings_manager import SettingsManager
+
+INITIAL = """[AutoHealBuff]
+heal_percentage = 80
+heal_key = F1
+mass_heal_key = F2
+
+[InputRate]
+key_rate = 5
+"""
+
+@pytest.fixture
+def manager(tmp_path):
+    path = tmp_path / "settings.ini"
+    path.write_text(INITIAL, encoding="utf-8")
+    manager = SettingsManager(str(path), str(tmp_path / "buffs.json"), str(tmp_path / "timers.json"))
+    yield manager
+    manager.flush()
+
+def _edit_file(manager, section, key, value):
+    config = configparser.ConfigParser()
+    config.read(manager.config_file, encoding="utf-8")
+    config[section][key] = value
+    with open(manager.config_file, "w", encoding="utf-8") as f:
+        config.write(f)
+
+def _read_file(manager):
+    config = configparser.ConfigParser()
+    config.read(manager.config_file, encoding="utf-8")
+    return config
+
+def test_reload_keeps_unsaved_edits(manager):
+    manager.update_config_section("AutoHealBuff", {"heal_key": "F5"})
+    assert manager.dirty
+    
+    _edit_file(manager, "AutoHealBuff", "heal_percentage", "70")
+    _edit_file(manager, "InputRate", "key_rate", "8")
+    assert manager.reload_config()
+    
+    settings = manager.get_auto_heal_buff_settings()
+    assert settings.heal_key == "F5"
+    assert settings.heal_percentage == 70
+    assert manager.get_config_section("InputRate")["key_rate"] == "8"
+    assert manager.dirty
+    
+    # Sonraki kayıt iki tarafın değişikliklerini birlikte yazar
+    assert manager.flush()
+    config = _read_file(manager)
+    assert config["AutoHealBuff"]["heal_key"] == "F5"
+    assert config["AutoHealBuff"]["heal_percentage"] == "70"
+
+def test_disk_wins_when_both_sides_changed_the_same_key(manager):
+    manager.update_config_section("AutoHealBuff", {"heal_key": "F5", "mass_heal_key": "F6"})
+    _edit_file(manager, "AutoHealBuff", "heal_key", "F9")
+    assert manager.reload_config()
+    
+    settings = manager.get_auto_heal_buff_settings()
+    assert settings.heal_key == "F9"
+    assert settings.mass_heal_key == "F6"
+
+def test_clean_reload_takes_the_file(manager):
+    _edit_file(manager, "AutoHealBuff", "heal_key", "F9")
+    assert manager.reload_config()
+    
+    assert manager.get_auto_heal_buff_settings().heal_key == "F9"
+    assert not manager.dirty
+
+def test_changes_after_save_are_detected(manager):
+    # Kayıttan sonra yalnızca o andan beri diskte değişenler uygulanır
+    manager.update_config_section("AutoHealBuff", {"heal_key": "F5"})
+    assert manager.flush()
+    manager.update_config_section("AutoHealBuff", {"mass_heal_key": "F6"})
+    _edit_file(manager, "AutoHealBuff", "heal_percentage", "60")
+    assert manager.reload_config()
+    
+    settings = manager.get_auto_heal_buff_settings()
+    assert (settings.heal_key, settings.mass_heal_key, settings.heal_percentage) == ("F5", "F6", 60)
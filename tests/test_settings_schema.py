@@ -0,0 +1,63 @@
+"""
+Knight Online Otomatik İyileştirme ve Buff Sistemi - Ayar Şeması Testleri
+Bu modül, settings.ini ayrıştırmasını ve eski tuş değerlerinin taşınmasını test eder.
+"""
+
+import os
+
+import pytest
+
+from config.schema import AutoHealBuffSettings
+from config.settings_manager import SettingsManager
+from services.common.keycodes import InvalidKeyError
+from tests.conftest import ROOT
+
+def test_shipped_settings_load_and_validate():
+    # Depodaki settings.ini eski sayısal tuş kodları içerir: bilinen kodlar taşınır,
+    # bilinmeyen kod (232) korunur ve start_system başlamayı reddeder
+    manager = SettingsManager(os.path.join(ROOT, "settings.ini"))
+    settings = manager.get_auto_heal_buff_settings()
+    
+    assert settings.heal_key == "F11"
+    assert settings.heal_chord is not None
+    assert settings.mass_heal_key == "232"
+    assert settings.mass_heal_chord is None
+    assert settings.mass_heal_active
+    with pytest.raises(InvalidKeyError, match="Toplu iyileştirme tuşu"):
+        settings.validate_keys()
+
+def test_numeric_keys_are_migrated():
+    settings = AutoHealBuffSettings.from_config({
+        "heal_key": "122", "heal_active": "True",
+        "row_0_select_key": "112", "buff_0_key": "65"})
+    
+    assert settings.heal_key == "F11"
+    assert settings.rows[0].select_key == "F1"
+    assert settings.buffs[0].key == "A"
+    assert settings.to_config()["heal_key"] == "F11"
+
+def test_single_digits_stay_digit_keys():
+    settings = AutoHealBuffSettings.from_config({"heal_key": "1", "mass_heal_key": "2"})
+    
+    assert settings.heal_key == "1"
+    assert settings.mass_heal_key == "2"
+
+def test_unknown_numeric_key_is_kept_and_rejected():
+    settings = AutoHealBuffSettings.from_config({
+        "mass_heal_key": "232", "mass_heal_active": "True",
+        "row_0_select_key": "232", "buff_0_key": "232"})
+    
+    # Varsayılan "2" tuşu oyunda basılacağı için asla yerine konmaz
+    assert settings.mass_heal_key == "232"
+    assert settings.rows[0].select_key == "232"
+    assert settings.buffs[0].key == "232"
+    assert settings.to_config()["mass_heal_key"] == "232"
+    with pytest.raises(InvalidKeyError):
+        settings.validate_keys()
+
+def test_heal_polling_defaults_to_baseline_latency():
+    # Eski sürüm HP barlarını 100 ms'de bir yokluyordu; varsayılan ve dağıtılan ayar daha yavaş olmamalı
+    manager = SettingsManager(os.path.join(ROOT, "settings.ini"))
+    
+    assert AutoHealBuffSettings().heal_check_interval <= 100
+    assert manager.get_auto_heal_buff_settings().heal_check_interval <= 100
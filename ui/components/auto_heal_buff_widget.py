@@ -6,22 +6,32 @@ Bu modül, iyileştirme ve buff sistemi için ana kullanıcı arayüzü bileşen
 import logging
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QGridLayout, 
                            QGroupBox, QLabel, QLineEdit, QSpinBox, QCheckBox, 
-                           QSlider, QScrollArea)
-from PyQt5.QtCore import Qt
+                           QSlider, QScrollArea, QPushButton)
+from PyQt5.QtCore import Qt, pyqtSignal
 
 # Kendi modüllerimizi içe aktar
 from ui.components.heal_row_widget import HealRowWidget
 from ui.components.buff_widget import BuffWidget
+from ui.components.key_validation import validate_key_input, KEY_INPUT_MAX_LENGTH
+from config.schema import (AutoHealBuffSettings, RowSettings, BuffSettings, SettingsError,
+                           ROW_COUNT, ROW_COUNT_RANGE, ROW_PITCH_RANGE, CHECK_INTERVAL_RANGE)
+from core.party_layout import PartyLayout
 
 # Logging yapılandırması
 logger = logging.getLogger("AutoHealBuffWidget")
 
+# İyileştirme kontrol aralığı kaydırıcısının adımı (milisaniye)
+HEAL_INTERVAL_STEP = 50
+
 class AutoHealBuffWidget(QWidget):
     """
     Auto Heal ve Buff sistemini içeren ana widget.
     - Tüm satırlar için ortak heal tuşu kullanır
     - Buff ve AC için zamanlayıcı bazlı çalışır
     """
+    # Kullanıcı arayüzde bir ayarı değiştirdiğinde yayınlanır
+    settings_changed = pyqtSignal()
+    
     def __init__(self, parent=None):
         """
         AutoHealBuffWidget sınıfını başlatır.
@@ -41,6 +51,9 @@ class AutoHealBuffWidget(QWidget):
         self.heal_rows = []
         self.buff_widgets = []
         
+        # Satırlar arası dikey aralık (piksel), 0 ise şablon tanımsız
+        self.row_pitch = 0
+        
         # HP yüzdesi ve heal tuşları
         self.heal_percentage = 80
         self.heal_key = "1"
@@ -53,12 +66,22 @@ class AutoHealBuffWidget(QWidget):
         self.party_check_enabled = False
         
         # Kontrol frekansı ayarları (milisaniye)
-        self.heal_check_interval = 500  # 500ms varsayılan değer
+        self.heal_check_interval = 100  # 100ms varsayılan değer
         self.buff_check_interval = 500  # 500ms varsayılan değer
         
+        # Bu yaştan eski ekran görüntülerine göre işlem yapılmaz (milisaniye)
+        self.max_frame_age = 250
+        
+        # HP yumuşatma (yeni okumanın yüzde ağırlığı) ve histerezis bandı (HP yüzdesi)
+        self.hp_smoothing = 50
+        self.hysteresis_band = 4
+        
         # Çalışma durumu
         self.working = False
         
+        # Ayarlar yüklenirken değişiklik bildirimi yapılmaz
+        self._loading = False
+        
         # UI oluştur
         self.setup_ui()
         
@@ -85,21 +108,41 @@ class AutoHealBuffWidget(QWidget):
         settings_group = QGroupBox("Heal Satırları")
         settings_layout = QVBoxLayout(settings_group)
         
+        # Parti düzeni: satır sayısı ve satır aralığı
+        layout_layout = QHBoxLayout()
+        layout_layout.addWidget(QLabel("Satır sayısı:"))
+        self.row_count_spin = QSpinBox()
+        self.row_count_spin.setRange(*ROW_COUNT_RANGE)
+        self.row_count_spin.setValue(ROW_COUNT)
+        self.row_count_spin.valueChanged.connect(self.on_row_count_changed)
+        self.row_count_spin.setToolTip("İzlenecek HP barı satırı sayısı (parti veya raid boyutu)")
+        layout_layout.addWidget(self.row_count_spin)
+        
+        layout_layout.addWidget(QLabel("Satır aralığı:"))
+        self.row_pitch_spin = QSpinBox()
+        self.row_pitch_spin.setRange(*ROW_PITCH_RANGE)
+        self.row_pitch_spin.setSuffix(" px")
+        self.row_pitch_spin.setValue(self.row_pitch)
+        self.row_pitch_spin.valueChanged.connect(self.on_row_pitch_changed)
+        self.row_pitch_spin.setToolTip("Ardışık HP barlarının üst kenarları arasındaki dikey mesafe")
+        layout_layout.addWidget(self.row_pitch_spin)
+        
+        self.layout_button = QPushButton("Satır 1'den Oluştur")
+        self.layout_button.clicked.connect(self.apply_row_template)
+        self.layout_button.setToolTip("Satır 1 koordinatlarını satır aralığı kadar kaydırarak tüm satırları doldurur")
+        layout_layout.addWidget(self.layout_button)
+        layout_layout.addStretch()
+        settings_layout.addLayout(layout_layout)
+        
         # HP bar satırları bölümü
-        rows_grid = QGridLayout()
-        rows_grid.setContentsMargins(5, 10, 5, 10)
-        rows_grid.setVerticalSpacing(10)
+        self.rows_grid = QGridLayout()
+        self.rows_grid.setContentsMargins(5, 10, 5, 10)
+        self.rows_grid.setVerticalSpacing(10)
         
         # HP barı satırlarını oluştur
-        for i in range(8):
-            row_widget = HealRowWidget(self, i)
-            self.heal_rows.append(row_widget)
-            rows_grid.addWidget(row_widget, i, 0)
-            
-            # Koordinat alma butonuna tıklama işlemini bağla
-            row_widget.button.clicked.connect(lambda checked, idx=i: self.take_row_coordinates(idx))
+        self.set_row_count(ROW_COUNT)
         
-        settings_layout.addLayout(rows_grid)
+        settings_layout.addLayout(self.rows_grid)
         
         # Heal ayarları bölümü
         heal_group = QGroupBox("İyileştirme Ayarları")
@@ -116,10 +159,11 @@ class AutoHealBuffWidget(QWidget):
         # Heal tuşu girişi
         heal_key_label = QLabel("İyileştirme Tuşu:")
         self.heal_key_input = QLineEdit(self.heal_key)
-        self.heal_key_input.setMaxLength(3)
+        self.heal_key_input.setMaxLength(KEY_INPUT_MAX_LENGTH)
         self.heal_key_input.setFixedWidth(50)
         self.heal_key_input.textChanged.connect(self.on_heal_key_changed)
         self.heal_key_input.setToolTip("İyileştirme için kullanılacak tuş")
+        self.heal_key_input.setProperty("default_tooltip", self.heal_key_input.toolTip())
         
         # İyileştirme aktif/pasif
         self.heal_active_checkbox = QCheckBox("İyileştirme Aktif")
@@ -137,10 +181,11 @@ class AutoHealBuffWidget(QWidget):
         # Toplu iyileştirme tuşu
         mass_heal_key_label = QLabel("Tuş:")
         self.mass_heal_key_input = QLineEdit(self.mass_heal_key)
-        self.mass_heal_key_input.setMaxLength(3)
+        self.mass_heal_key_input.setMaxLength(KEY_INPUT_MAX_LENGTH)
         self.mass_heal_key_input.setFixedWidth(50)
         self.mass_heal_key_input.textChanged.connect(self.on_mass_heal_key_changed)
         self.mass_heal_key_input.setToolTip("Toplu iyileştirme için kullanılacak tuş")
+        self.mass_heal_key_input.setProperty("default_tooltip", self.mass_heal_key_input.toolTip())
         
         # Toplu iyileştirme yüzdesi
         mass_heal_pct_label = QLabel("HP %:")
@@ -156,6 +201,25 @@ class AutoHealBuffWidget(QWidget):
         self.party_check_checkbox.stateChanged.connect(self.on_mass_heal_party_check_changed)
         self.party_check_checkbox.setToolTip("Gruptan önce parti seçimini kontrol eder")
         
+        # HP yumuşatma
+        smoothing_label = QLabel("Yumuşatma:")
+        self.smoothing_spin = QSpinBox()
+        self.smoothing_spin.setRange(10, 100)
+        self.smoothing_spin.setSuffix(" %")
+        self.smoothing_spin.setValue(self.hp_smoothing)
+        self.smoothing_spin.valueChanged.connect(self.on_hp_smoothing_changed)
+        self.smoothing_spin.setToolTip("Küçük HP dalgalanmalarında yeni okumanın ağırlığı (100: yumuşatma yok). "
+                                       "Büyük değişimler her zaman gecikmesiz alınır")
+        
+        # Histerezis bandı
+        hysteresis_label = QLabel("Histerezis:")
+        self.hysteresis_spin = QSpinBox()
+        self.hysteresis_spin.setRange(0, 20)
+        self.hysteresis_spin.setSuffix(" %")
+        self.hysteresis_spin.setValue(self.hysteresis_band)
+        self.hysteresis_spin.valueChanged.connect(self.on_hysteresis_band_changed)
+        self.hysteresis_spin.setToolTip("Eşik çevresindeki bant: HP eşik - bant/2 altına düşünce iyileştirilir, eşik + bant/2 üstüne çıkana kadar düşük sayılır")
+        
         # Grid layout'a widget'ları ekle
         # 1. satır
         heal_layout.addWidget(hp_pct_label, 0, 0)
@@ -175,6 +239,12 @@ class AutoHealBuffWidget(QWidget):
         heal_layout.addWidget(self.mass_heal_pct_slider, 2, 1)
         heal_layout.addWidget(self.party_check_checkbox, 2, 2, 1, 2)
         
+        # 4. satır
+        heal_layout.addWidget(smoothing_label, 3, 0)
+        heal_layout.addWidget(self.smoothing_spin, 3, 1)
+        heal_layout.addWidget(hysteresis_label, 3, 2)
+        heal_layout.addWidget(self.hysteresis_spin, 3, 3)
+        
         settings_layout.addWidget(heal_group)
         
         # Kontrol frekansı grup kutusu
@@ -185,8 +255,10 @@ class AutoHealBuffWidget(QWidget):
         heal_freq_layout = QHBoxLayout()
         heal_freq_layout.addWidget(QLabel("İyileştirme kontrol frekansı:"))
         self.heal_freq_slider = QSlider(Qt.Horizontal)
-        self.heal_freq_slider.setMinimum(100)
-        self.heal_freq_slider.setMaximum(1000)
+        self.heal_freq_slider.setMinimum(CHECK_INTERVAL_RANGE[0])
+        self.heal_freq_slider.setMaximum(CHECK_INTERVAL_RANGE[1])
+        self.heal_freq_slider.setSingleStep(HEAL_INTERVAL_STEP)
+        self.heal_freq_slider.setPageStep(100)
         self.heal_freq_slider.setValue(self.heal_check_interval)
         self.heal_freq_slider.valueChanged.connect(self.on_heal_freq_changed)
         self.heal_freq_slider.setToolTip("HP barı kontrol frekansı (milisaniye)")
@@ -209,6 +281,20 @@ class AutoHealBuffWidget(QWidget):
         buff_freq_layout.addWidget(self.buff_freq_label)
         freq_layout.addLayout(buff_freq_layout)
         
+        # Maksimum kare yaşı
+        frame_age_layout = QHBoxLayout()
+        frame_age_layout.addWidget(QLabel("Maksimum kare yaşı:"))
+        self.frame_age_spin = QSpinBox()
+        self.frame_age_spin.setRange(0, 2000)
+        self.frame_age_spin.setSingleStep(50)
+        self.frame_age_spin.setSuffix(" ms")
+        self.frame_age_spin.setValue(self.max_frame_age)
+        self.frame_age_spin.valueChanged.connect(self.on_max_frame_age_changed)
+        self.frame_age_spin.setToolTip("Bu süreden eski ekran görüntülerine göre iyileştirme yapılmaz (0: kapalı)")
+        frame_age_layout.addWidget(self.frame_age_spin)
+        frame_age_layout.addStretch()
+        freq_layout.addLayout(frame_age_layout)
+        
         settings_layout.addWidget(freq_group)
         scroll_layout.addWidget(settings_group)
         
@@ -249,6 +335,8 @@ class AutoHealBuffWidget(QWidget):
         # Statusbar mesajını göster
         if self.statusbar:
             self.statusbar.showMessage(f"İyileştirme {'aktif' if self.heal_active else 'pasif'} duruma getirildi", 3000)
+        
+        self.mark_changed()
     
     def on_heal_key_changed(self, text):
         """
@@ -258,11 +346,17 @@ class AutoHealBuffWidget(QWidget):
             text: Yeni tuş değeri.
         """
         self.heal_key = text
-        logger.info(f"İyileştirme tuşu '{text}' olarak ayarlandı")
+        error = validate_key_input(self.heal_key_input, text)
+        if error:
+            logger.debug(f"Geçersiz iyileştirme tuşu: {error}")
+        else:
+            logger.debug(f"İyileştirme tuşu '{text}' olarak ayarlandı")
         
         # Statusbar mesajını göster
         if self.statusbar:
-            self.statusbar.showMessage(f"İyileştirme tuşu '{text}' olarak ayarlandı", 3000)
+            self.statusbar.showMessage(f"Geçersiz iyileştirme tuşu: {error}" if error else f"İyileştirme tuşu '{text}' olarak ayarlandı", 3000)
+        
+        self.mark_changed()
     
     def on_mass_heal_active_changed(self, state):
         """
@@ -277,6 +371,8 @@ class AutoHealBuffWidget(QWidget):
         # Statusbar mesajını göster
         if self.statusbar:
             self.statusbar.showMessage(f"Toplu iyileştirme {'aktif' if self.mass_heal_active else 'pasif'} duruma getirildi", 3000)
+        
+        self.mark_changed()
     
     def on_mass_heal_key_changed(self, text):
         """
@@ -286,11 +382,17 @@ class AutoHealBuffWidget(QWidget):
             text: Yeni tuş değeri.
         """
         self.mass_heal_key = text
-        logger.info(f"Toplu iyileştirme tuşu '{text}' olarak ayarlandı")
+        error = validate_key_input(self.mass_heal_key_input, text)
+        if error:
+            logger.debug(f"Geçersiz toplu iyileştirme tuşu: {error}")
+        else:
+            logger.debug(f"Toplu iyileştirme tuşu '{text}' olarak ayarlandı")
         
         # Statusbar mesajını göster
         if self.statusbar:
-            self.statusbar.showMessage(f"Toplu iyileştirme tuşu '{text}' olarak ayarlandı", 3000)
+            self.statusbar.showMessage(f"Geçersiz toplu iyileştirme tuşu: {error}" if error else f"Toplu iyileştirme tuşu '{text}' olarak ayarlandı", 3000)
+        
+        self.mark_changed()
     
     def on_mass_heal_percentage_changed(self, value):
         """
@@ -300,11 +402,13 @@ class AutoHealBuffWidget(QWidget):
             value: Yeni yüzde değeri.
         """
         self.mass_heal_percentage = value
-        logger.info(f"Toplu iyileştirme yüzdesi %{value} olarak ayarlandı")
+        logger.debug(f"Toplu iyileştirme yüzdesi %{value} olarak ayarlandı")
         
         # Statusbar mesajını göster
         if self.statusbar:
             self.statusbar.showMessage(f"Toplu iyileştirme yüzdesi %{value} olarak ayarlandı", 3000)
+        
+        self.mark_changed()
     
     def on_mass_heal_party_check_changed(self, state):
         """
@@ -319,6 +423,8 @@ class AutoHealBuffWidget(QWidget):
         # Statusbar mesajını göster
         if self.statusbar:
             self.statusbar.showMessage(f"Parti kontrolü {'aktif' if self.party_check_enabled else 'pasif'} olarak ayarlandı", 3000)
+        
+        self.mark_changed()
     
     def on_hp_percentage_changed(self, value):
         """
@@ -328,11 +434,13 @@ class AutoHealBuffWidget(QWidget):
             value: Yeni yüzde değeri.
         """
         self.heal_percentage = value
-        logger.info(f"İyileştirme yüzdesi %{value} olarak ayarlandı")
+        logger.debug(f"İyileştirme yüzdesi %{value} olarak ayarlandı")
         
         # Statusbar mesajını göster
         if self.statusbar:
             self.statusbar.showMessage(f"İyileştirme yüzdesi %{value} olarak ayarlandı", 3000)
+        
+        self.mark_changed()
     
     def on_heal_freq_changed(self, value):
         """
@@ -341,22 +449,21 @@ class AutoHealBuffWidget(QWidget):
         Args:
             value: Yeni frekans değeri (milisaniye).
         """
-        # Değeri 100'e yuvarla
-        value = (value // 100) * 100
-        if value < 300:
-            value = 300
-        elif value > 900:
-            value = 900
-            
+        # Değeri 50 ms adımlara yuvarla ve şemadaki aralıkta tut (en düşük değer en hızlı tepkidir)
+        value = int(round(value / HEAL_INTERVAL_STEP)) * HEAL_INTERVAL_STEP
+        value = max(CHECK_INTERVAL_RANGE[0], min(CHECK_INTERVAL_RANGE[1], value))
+        
         self.heal_check_interval = value
         if hasattr(self, 'heal_freq_label'):
             self.heal_freq_label.setText(f"{value} ms")
         
-        logger.info(f"İyileştirme kontrol frekansı {value} ms olarak ayarlandı")
+        logger.debug(f"İyileştirme kontrol frekansı {value} ms olarak ayarlandı")
         
         # Statusbar mesajını göster
         if self.statusbar:
             self.statusbar.showMessage(f"İyileştirme kontrol frekansı {value} ms olarak ayarlandı", 3000)
+        
+        self.mark_changed()
     
     def on_buff_freq_changed(self, value):
         """
@@ -376,103 +483,250 @@ class AutoHealBuffWidget(QWidget):
         if hasattr(self, 'buff_freq_label'):
             self.buff_freq_label.setText(f"{value} ms")
         
-        logger.info(f"Buff kontrol frekansı {value} ms olarak ayarlandı")
+        logger.debug(f"Buff kontrol frekansı {value} ms olarak ayarlandı")
         
         # Statusbar mesajını göster
         if self.statusbar:
             self.statusbar.showMessage(f"Buff kontrol frekansı {value} ms olarak ayarlandı", 3000)
+        
+        self.mark_changed()
+
+    def on_max_frame_age_changed(self, value):
+        """
+        Maksimum kare yaşı değiştiğinde çağrılır
+        
+        Args:
+            value: Yeni kare yaşı (milisaniye).
+        """
+        self.max_frame_age = value
+        logger.debug(f"Maksimum kare yaşı {value} ms olarak ayarlandı")
+        
+        # Statusbar mesajını göster
+        if self.statusbar:
+            self.statusbar.showMessage(f"Maksimum kare yaşı {value} ms olarak ayarlandı", 3000)
+        
+        self.mark_changed()
 
-    def load_config(self, config_section):
+    def on_hp_smoothing_changed(self, value):
+        """
+        HP yumuşatma değeri değiştiğinde çağrılır
+        
+        Args:
+            value: Yeni okumanın yüzde ağırlığı.
+        """
+        self.hp_smoothing = value
+        logger.debug(f"HP yumuşatma %{value} olarak ayarlandı")
+        self.mark_changed()
+    
+    def on_hysteresis_band_changed(self, value):
+        """
+        Histerezis bandı değiştiğinde çağrılır
+        
+        Args:
+            value: Yeni bant (HP yüzdesi).
+        """
+        self.hysteresis_band = value
+        logger.debug(f"Histerezis bandı %{value} olarak ayarlandı")
+        self.mark_changed()
+    
+    def on_row_count_changed(self, value):
+        """
+        Satır sayısı değiştiğinde çağrılır
+        
+        Args:
+            value: Yeni satır sayısı.
+        """
+        self.set_row_count(value)
+        
+        # Statusbar mesajını göster
+        if self.statusbar:
+            self.statusbar.showMessage(f"Satır sayısı {value} olarak ayarlandı", 3000)
+        
+        self.mark_changed()
+    
+    def on_row_pitch_changed(self, value):
+        """
+        Satır aralığı değiştiğinde çağrılır
+        
+        Args:
+            value: Yeni satır aralığı (piksel).
+        """
+        self.row_pitch = value
+        logger.debug(f"Satır aralığı {value} piksel olarak ayarlandı")
+        self.mark_changed()
+    
+    def set_row_count(self, count):
+        """
+        Satır widget'larını verilen sayıya tamamlar veya fazlalarını kaldırır
+        
+        Kaldırılan satırların ayarları kaybolur; mevcut satırlar değişmez.
+        
+        Args:
+            count: Satır sayısı.
+        """
+        while len(self.heal_rows) < count:
+            index = len(self.heal_rows)
+            row_widget = HealRowWidget(self, index)
+            self.heal_rows.append(row_widget)
+            self.rows_grid.addWidget(row_widget, index, 0)
+            
+            # Koordinat alma butonuna tıklama işlemini bağla
+            row_widget.button.clicked.connect(lambda checked, idx=index: self.take_row_coordinates(idx))
+        
+        while len(self.heal_rows) > count:
+            row_widget = self.heal_rows.pop()
+            self.rows_grid.removeWidget(row_widget)
+            row_widget.deleteLater()
+        
+        if self.row_count_spin.value() != count:
+            self.row_count_spin.blockSignals(True)
+            self.row_count_spin.setValue(count)
+            self.row_count_spin.blockSignals(False)
+    
+    def apply_layout(self, layout):
+        """
+        Parti düzeni şablonundaki koordinatları tüm satırlara uygular
+        
+        Args:
+            layout: PartyLayout nesnesi.
+        """
+        if layout.row_count != len(self.heal_rows):
+            self.set_row_count(layout.row_count)
+        if layout.pitch != self.row_pitch:
+            self.row_pitch = layout.pitch
+            self.row_pitch_spin.blockSignals(True)
+            self.row_pitch_spin.setValue(layout.pitch)
+            self.row_pitch_spin.blockSignals(False)
+        
+        for row_widget, coords in zip(self.heal_rows, layout.rows()):
+            row_widget.set_coordinates(list(coords))
+        
+        logger.info(f"Parti düzeni uygulandı: {layout}")
+        self.mark_changed()
+    
+    def apply_row_template(self):
+        """
+        Satır 1 koordinatları ve satır aralığından tüm satırların koordinatlarını oluşturur
+        """
+        first_row = self.heal_rows[0]
+        if len(first_row.coords) != 4:
+            if self.statusbar:
+                self.statusbar.showMessage("Önce Satır 1 koordinatlarını alın.", 3000)
+            return
+        if self.row_pitch <= 0:
+            if self.statusbar:
+                self.statusbar.showMessage("Satır aralığını girin.", 3000)
+            return
+        
+        self.apply_layout(PartyLayout(first_row.coords, self.row_pitch, len(self.heal_rows)))
+        
+        # Statusbar mesajını göster
+        if self.statusbar:
+            self.statusbar.showMessage(f"{len(self.heal_rows)} satırın koordinatları Satır 1'den oluşturuldu.", 3000)
+    
+    def mark_changed(self):
+        """
+        Kullanıcının bir ayarı değiştirdiğini bildirir (ayarlar yüklenirken yapılan değişiklikler hariç).
+        """
+        if not self._loading:
+            self.settings_changed.emit()
+    
+    def load_config(self, settings, changed=None):
         """
-        Konfigürasyon bölümünden ayarları yükler
+        Doğrulanmış ayarları arayüze yükler
         
         Args:
-            config_section: ConfigParser bölümü
+            settings: AutoHealBuffSettings nesnesi
+            changed: AutoHealBuffSettings.changed_fields() çıktısı; verilirse yalnızca değişen alanlar yüklenir
         """
+        def wanted(name):
+            return changed is None or name in changed
+        
+        self._loading = True
         try:
             # HP yüzdesi
-            if 'heal_percentage' in config_section:
-                self.heal_percentage = int(config_section['heal_percentage'])
+            if wanted("heal_percentage"):
+                self.heal_percentage = settings.heal_percentage
                 self.hp_pct_slider.setValue(self.heal_percentage)
             
             # Heal tuşu ve aktiflik
-            if 'heal_key' in config_section:
-                self.heal_key = config_section['heal_key']
+            if wanted("heal_key"):
+                self.heal_key = settings.heal_key
                 self.heal_key_input.setText(self.heal_key)
-                
-            if 'heal_active' in config_section:
-                self.heal_active = config_section['heal_active'].lower() == 'true'
+            if wanted("heal_active"):
+                self.heal_active = settings.heal_active
                 self.heal_active_checkbox.setChecked(self.heal_active)
             
             # Toplu heal yüzdesi, tuşu ve aktiflik
-            if 'mass_heal_percentage' in config_section:
-                self.mass_heal_percentage = int(config_section['mass_heal_percentage'])
+            if wanted("mass_heal_percentage"):
+                self.mass_heal_percentage = settings.mass_heal_percentage
                 self.mass_heal_pct_slider.setValue(self.mass_heal_percentage)
-                
-            if 'mass_heal_key' in config_section:
-                self.mass_heal_key = config_section['mass_heal_key']
+            if wanted("mass_heal_key"):
+                self.mass_heal_key = settings.mass_heal_key
                 self.mass_heal_key_input.setText(self.mass_heal_key)
-                
-            if 'mass_heal_active' in config_section:
-                self.mass_heal_active = config_section['mass_heal_active'].lower() == 'true'
+            if wanted("mass_heal_active"):
+                self.mass_heal_active = settings.mass_heal_active
                 self.mass_heal_active_checkbox.setChecked(self.mass_heal_active)
             
             # Parti kontrolü
-            if 'party_check_enabled' in config_section:
-                self.party_check_enabled = config_section['party_check_enabled'].lower() == 'true'
+            if wanted("party_check_enabled"):
+                self.party_check_enabled = settings.party_check_enabled
                 self.party_check_checkbox.setChecked(self.party_check_enabled)
             
             # Kontrol aralıkları
-            if 'heal_check_interval' in config_section:
-                self.heal_check_interval = int(config_section['heal_check_interval'])
+            if wanted("heal_check_interval"):
+                self.heal_check_interval = settings.heal_check_interval
                 self.heal_freq_slider.setValue(self.heal_check_interval)
-                
-            if 'buff_check_interval' in config_section:
-                self.buff_check_interval = int(config_section['buff_check_interval'])
+            if wanted("buff_check_interval"):
+                self.buff_check_interval = settings.buff_check_interval
                 self.buff_freq_slider.setValue(self.buff_check_interval)
             
+            # Maksimum kare yaşı
+            if wanted("max_frame_age"):
+                self.max_frame_age = settings.max_frame_age
+                self.frame_age_spin.setValue(self.max_frame_age)
+            
+            # HP yumuşatma ve histerezis
+            if wanted("hp_smoothing"):
+                self.hp_smoothing = settings.hp_smoothing
+                self.smoothing_spin.setValue(self.hp_smoothing)
+            if wanted("hysteresis_band"):
+                self.hysteresis_band = settings.hysteresis_band
+                self.hysteresis_spin.setValue(self.hysteresis_band)
+            
+            # Satır sayısı ve aralığı
+            if wanted("row_count"):
+                self.set_row_count(settings.row_count)
+            if wanted("row_pitch"):
+                self.row_pitch = settings.row_pitch
+                self.row_pitch_spin.setValue(self.row_pitch)
+            
             # Satır ayarları
-            for i, row in enumerate(self.heal_rows):
-                # Eğer yapılandırma bölümü içinde bu satır için ayar varsa
-                if f'row_{i}_active' in config_section:
-                    row_active = config_section[f'row_{i}_active'].lower() == 'true'
-                    row.active = row_active
-                    row.active_checkbox.setChecked(row_active)
-                
-                if f'row_{i}_coords' in config_section:
-                    coord_text = config_section[f'row_{i}_coords']
-                    try:
-                        # '[]' karakterlerini temizle
-                        coord_text = coord_text.strip('[]')
-                        # Virgüllerle ayır
-                        coords = [int(x.strip()) for x in coord_text.split(',')]
-                        if len(coords) == 4:
-                            row.coords = coords
-                            row.coord_label.setText(f"({coords[0]},{coords[1]})-({coords[2]}, {coords[3]})")
-                    except:
-                        logger.warning(f"Satır {i+1} için geçersiz koordinat formatı")
+            changed_rows = changed.get("rows", {}) if changed is not None else None
+            for row, row_settings in zip(self.heal_rows, settings.rows):
+                if changed_rows is not None and row_settings.index not in changed_rows:
+                    continue
+                row.active = row_settings.active
+                row.active_checkbox.setChecked(row_settings.active)
+                row.coords = list(row_settings.coords) if row_settings.coords else []
+                row.update_coord_label()
+                row.select_key = row_settings.select_key
+                row.select_key_input.setText(row.select_key)
+                row.heal_percentage = row_settings.heal_percentage
+                row.heal_pct_spin.setValue(row.heal_percentage)
             
             # Buff widget ayarları
-            for i, buff in enumerate(self.buff_widgets):
-                # Eğer yapılandırma bölümü içinde bu buff için ayar varsa
-                if f'buff_{i}_active' in config_section:
-                    buff_active = config_section[f'buff_{i}_active'].lower() == 'true'
-                    buff.active = buff_active
-                    buff.active_checkbox.setChecked(buff_active)
-                
-                if f'buff_{i}_key' in config_section:
-                    buff.key = config_section[f'buff_{i}_key']
-                    buff.key_input.setText(buff.key)
-                
-                if f'buff_{i}_duration' in config_section:
-                    try:
-                        buff.duration = int(config_section[f'buff_{i}_duration'])
-                        buff.duration_input.setValue(buff.duration)
-                    except:
-                        logger.warning(f"Buff {i+1} için geçersiz süre formatı")
-                
-                if f'buff_{i}_name' in config_section:
-                    buff.buff_name = config_section[f'buff_{i}_name']
+            changed_buffs = changed.get("buffs", {}) if changed is not None else None
+            for buff, buff_settings in zip(self.buff_widgets, settings.buffs):
+                if changed_buffs is not None and buff_settings.index not in changed_buffs:
+                    continue
+                buff.active = buff_settings.active
+                buff.active_checkbox.setChecked(buff_settings.active)
+                buff.key = buff_settings.key
+                buff.key_input.setText(buff.key)
+                buff.duration = buff_settings.duration
+                buff.duration_input.setValue(buff.duration)
+                buff.buff_name = buff_settings.name
             
             # Log mesajı
             logger.info("Ayarlar başarıyla yüklendi.")
@@ -483,61 +737,49 @@ class AutoHealBuffWidget(QWidget):
             logger.error(f"Ayarlar yüklenirken hata: {e}")
             if self.statusbar:
                 self.statusbar.showMessage(f"Ayarlar yüklenirken hata: {e}", 3000)
-                
-    def save_config(self, config_section):
+        finally:
+            self._loading = False
+    
+    def to_settings(self):
         """
-        Konfigürasyon bölümüne ayarları kaydeder
+        Arayüzdeki değerlerden doğrulanmış ayar nesnesi oluşturur
+        
+        Tamamlanmamış koordinatlar (yalnızca sol nokta alınmışsa) tanımsız sayılır.
         
-        Args:
-            config_section: ConfigParser bölümü
-            
         Returns:
-            Güncellenen config_section
+            AutoHealBuffSettings: Ayarlar
         """
-        try:
-            # HP yüzdesi
-            config_section['heal_percentage'] = str(self.heal_percentage)
-            
-            # Heal tuşu ve aktiflik
-            config_section['heal_key'] = self.heal_key
-            config_section['heal_active'] = str(self.heal_active)
-            
-            # Toplu heal yüzdesi, tuşu ve aktiflik
-            config_section['mass_heal_percentage'] = str(self.mass_heal_percentage)
-            config_section['mass_heal_key'] = self.mass_heal_key
-            config_section['mass_heal_active'] = str(self.mass_heal_active)
-            
-            # Parti kontrolü
-            config_section['party_check_enabled'] = str(self.party_check_enabled)
-            
-            # Kontrol aralıkları
-            config_section['heal_check_interval'] = str(self.heal_check_interval)
-            config_section['buff_check_interval'] = str(self.buff_check_interval)
-            
-            # Satır ayarları
-            for i, row in enumerate(self.heal_rows):
-                config_section[f'row_{i}_active'] = str(row.active)
-                config_section[f'row_{i}_coords'] = str(row.coords)
-            
-            # Buff widget ayarları
-            for i, buff in enumerate(self.buff_widgets):
-                config_section[f'buff_{i}_active'] = str(buff.active)
-                config_section[f'buff_{i}_key'] = buff.key
-                config_section[f'buff_{i}_duration'] = str(buff.duration)
-                config_section[f'buff_{i}_name'] = buff.buff_name
-            
-            # Log mesajı
-            logger.info("Ayarlar başarıyla kaydedildi.")
-            if self.statusbar:
-                self.statusbar.showMessage("Ayarlar başarıyla kaydedildi.", 3000)
-            
-            return config_section
-        
-        except Exception as e:
-            logger.error(f"Ayarlar kaydedilirken hata: {e}")
-            if self.statusbar:
-                self.statusbar.showMessage(f"Ayarlar kaydedilirken hata: {e}", 3000)
-            return config_section
+        rows = []
+        for row in self.heal_rows:
+            coords = tuple(row.coords) if len(row.coords) == 4 else None
+            try:
+                rows.append(RowSettings(row.row_index, row.active, coords, row.select_key, row.heal_percentage))
+            except SettingsError as e:
+                logger.warning(f"Satır {row.row_index + 1} koordinatları kullanılamıyor: {e}")
+                rows.append(RowSettings(row.row_index, row.active, None, row.select_key, row.heal_percentage))
+        
+        buffs = tuple(
+            BuffSettings(buff.buff_index, buff.buff_name, buff.active, buff.get_key(), buff.get_duration())
+            for buff in self.buff_widgets
+        )
+        return AutoHealBuffSettings(
+            heal_percentage=self.heal_percentage,
+            heal_key=self.heal_key,
+            heal_active=self.heal_active,
+            mass_heal_percentage=self.mass_heal_percentage,
+            mass_heal_key=self.mass_heal_key,
+            mass_heal_active=self.mass_heal_active,
+            party_check_enabled=self.party_check_enabled,
+            heal_check_interval=self.heal_check_interval,
+            buff_check_interval=self.buff_check_interval,
+            max_frame_age=self.max_frame_age,
+            row_count=len(self.heal_rows),
+            row_pitch=self.row_pitch,
+            hp_smoothing=self.hp_smoothing,
+            hysteresis_band=self.hysteresis_band,
+            rows=tuple(rows),
+            buffs=buffs
+        )
             
     def take_row_coordinates(self, row_index):
         """
@@ -583,46 +825,32 @@ class AutoHealBuffWidget(QWidget):
             if self.statusbar:
                 self.statusbar.showMessage(f"Satır {row_index + 1} koordinatları: {coords_str}", 3000)
                 
+    def set_buff_last_used(self, buff_index, wall_time):
+        """
+        Bir buff'ın son kullanıldığı zamanı ayarlar (motor buff yaptığında veya zamanlayıcı geri yüklendiğinde)
+        
+        Args:
+            buff_index: Buff indeksi.
+            wall_time: Son kullanım zamanı (Unix zamanı).
+        """
+        for buff_widget in self.buff_widgets:
+            if buff_widget.buff_index == buff_index:
+                buff_widget.set_last_used(wall_time)
+    
     def start_working(self):
         """
-        Heal ve buff işlemi için gerekli değerleri toplayıp çalıştırır.
+        Heal ve buff işlemi için ayarların anlık görüntüsünü alıp çalışma durumuna geçer.
         
         Returns:
-            (rows_data, heal_data, buffs_data) üçlüsü.
+            AutoHealBuffSettings: Motorun kullanacağı ayarlar.
         """
         # Çalışma durumunu aktif yap
         self.working = True
         
-        # HP satırlarından veri topla
-        rows_data = []
-        for row in self.heal_rows:
-            row_data = {
-                "active": row.active,
-                "coords": row.coords
-            }
-            rows_data.append(row_data)
-        
-        # Heal ayarlarını topla
-        heal_data = {
-            "heal_active": self.heal_active,
-            "heal_key": self.heal_key,
-            "mass_heal_active": self.mass_heal_active,
-            "mass_heal_key": self.mass_heal_key,
-            "mass_heal_percentage": self.mass_heal_percentage,
-            "mass_heal_party_check": self.party_check_enabled
-        }
-        
-        # Buff ayarlarını topla
-        buffs_data = {}
-        for i, buff_widget in enumerate(self.buff_widgets):
-            buffs_data[str(i)] = {
-                "name": buff_widget.buff_name,
-                "key": buff_widget.get_key(),
-                "active": buff_widget.active,
-                "duration": buff_widget.get_duration()
-            }
-            
-            # Buff zamanlayıcısını başlat
+        settings = self.to_settings()
+        
+        # Buff zamanlayıcılarını başlat
+        for buff_widget in self.buff_widgets:
             if buff_widget.active:
                 buff_widget.start_timer()
         
@@ -632,7 +860,7 @@ class AutoHealBuffWidget(QWidget):
         
         logger.info("AutoHealBuffWidget çalışma durumu: Aktif")
         
-        return rows_data, heal_data, buffs_data
+        return settings
     
     def stop_working(self):
         """
@@ -8,6 +8,8 @@ from PyQt5.QtCore import Qt, QTimer
 import logging
 import time
 
+from ui.components.key_validation import validate_key_input, KEY_INPUT_MAX_LENGTH
+
 # Logging yapılandırması
 logger = logging.getLogger("BuffWidget")
 
@@ -83,10 +85,11 @@ class BuffWidget(QWidget):
         # Tuş etiketi ve giriş alanı
         key_label = QLabel("Tuş:")
         self.key_input = QLineEdit("F1")
-        self.key_input.setMaxLength(3)
+        self.key_input.setMaxLength(KEY_INPUT_MAX_LENGTH)
         self.key_input.setFixedWidth(50)
         self.key_input.textChanged.connect(self.on_key_changed)
         self.key_input.setToolTip(f"{self.buff_name} için kullanılacak tuş")
+        self.key_input.setProperty("default_tooltip", self.key_input.toolTip())
         
         # Süre etiketi ve ayar alanı
         duration_label = QLabel("Süre:")
@@ -131,6 +134,10 @@ class BuffWidget(QWidget):
         """
         self.active = (state == Qt.Checked)
         logger.info(f"{self.buff_name} aktif durumu değişti: {self.active}")
+        
+        # Ana widget'a değişikliği bildir (gecikmeli kaydetme için)
+        if hasattr(self.parent, 'mark_changed'):
+            self.parent.mark_changed()
     
     def on_key_changed(self, text):
         """
@@ -140,7 +147,15 @@ class BuffWidget(QWidget):
             text: Yeni tuş değeri.
         """
         self.key = text
-        logger.info(f"{self.buff_name} tuşu '{text}' olarak ayarlandı")
+        error = validate_key_input(self.key_input, text, allow_empty=True)
+        if error:
+            logger.debug(f"{self.buff_name} için geçersiz tuş: {error}")
+        else:
+            logger.debug(f"{self.buff_name} tuşu '{text}' olarak ayarlandı")
+        
+        # Ana widget'a değişikliği bildir (gecikmeli kaydetme için)
+        if hasattr(self.parent, 'mark_changed'):
+            self.parent.mark_changed()
     
     def on_duration_changed(self, value):
         """
@@ -150,7 +165,11 @@ class BuffWidget(QWidget):
             value: Yeni süre değeri (saniye).
         """
         self.duration = value
-        logger.info(f"{self.buff_name} süresi {value} saniye olarak ayarlandı")
+        logger.debug(f"{self.buff_name} süresi {value} saniye olarak ayarlandı")
+        
+        # Ana widget'a değişikliği bildir (gecikmeli kaydetme için)
+        if hasattr(self.parent, 'mark_changed'):
+            self.parent.mark_changed()
     
     def update_timer(self):
         """
@@ -205,6 +224,16 @@ class BuffWidget(QWidget):
             # Son güncellemeyi yap
             self.update_timer()
     
+    def set_last_used(self, wall_time):
+        """
+        Buff'ın son kullanıldığı zamanı ayarlar ve kalan süreyi günceller.
+        
+        Args:
+            wall_time: Son kullanım zamanı (Unix zamanı).
+        """
+        self.last_used = wall_time
+        self.update_timer()
+    
     def get_key(self):
         """Buff tuşunu döndürür."""
         return self.key
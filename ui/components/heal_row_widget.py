@@ -3,10 +3,12 @@ Knight Online Otomatik İyileştirme ve Buff Sistemi - HP Satırı Widget'ı
 Bu modül, HP satırları için kullanıcı arayüzü bileşenini içerir.
 """
 
-from PyQt5.QtWidgets import QWidget, QHBoxLayout, QCheckBox, QLabel, QPushButton
+from PyQt5.QtWidgets import QWidget, QHBoxLayout, QCheckBox, QLabel, QPushButton, QLineEdit, QSpinBox
 from PyQt5.QtCore import Qt
 import logging
 
+from ui.components.key_validation import validate_key_input, KEY_INPUT_MAX_LENGTH
+
 # Logging yapılandırması
 logger = logging.getLogger("HealRowWidget")
 
@@ -21,13 +23,15 @@ class HealRowWidget(QWidget):
         
         Args:
             parent: Üst widget (varsayılan: None).
-            row_index: Satır indeksi (0-7).
+            row_index: Satır indeksi (0'dan başlar).
         """
         super().__init__(parent)
         self.parent = parent
         self.row_index = row_index
         self.coords = []  # [x1, y1, x2, y2] - HP barının başlangıç ve bitiş koordinatları
         self.active = False
+        self.select_key = ""  # Parti üyesini seçen tuş (ör. F1-F8), boşsa fare ile tıklanır
+        self.heal_percentage = 0  # Satıra özel iyileştirme eşiği, 0 ise genel eşik
         self.setup_ui()
         
     def setup_ui(self):
@@ -45,6 +49,24 @@ class HealRowWidget(QWidget):
         self.coord_label = QLabel("Tanımlanmadı")
         self.coord_label.setToolTip("HP barının başlangıç ve bitiş koordinatları")
         
+        # Parti seçim tuşu
+        self.select_key_input = QLineEdit(self.select_key)
+        self.select_key_input.setMaxLength(KEY_INPUT_MAX_LENGTH)
+        self.select_key_input.setFixedWidth(50)
+        self.select_key_input.setPlaceholderText("Fare")
+        self.select_key_input.textChanged.connect(self.on_select_key_changed)
+        self.select_key_input.setToolTip("Parti üyesini seçmek için basılacak tuş (ör. F2). Boş bırakılırsa HP barına tıklanır")
+        self.select_key_input.setProperty("default_tooltip", self.select_key_input.toolTip())
+        
+        # Satıra özel iyileştirme eşiği
+        self.heal_pct_spin = QSpinBox()
+        self.heal_pct_spin.setRange(0, 99)
+        self.heal_pct_spin.setSpecialValueText("Genel")
+        self.heal_pct_spin.setPrefix("%")
+        self.heal_pct_spin.setValue(self.heal_percentage)
+        self.heal_pct_spin.valueChanged.connect(self.on_heal_percentage_changed)
+        self.heal_pct_spin.setToolTip("Bu satır için iyileştirme eşiği (Genel: İyileştirme Ayarları'ndaki HP %)")
+        
         # Koordinat alma butonu
         self.button = QPushButton("Koordinat Al")
         self.button.setFixedWidth(100)
@@ -53,6 +75,10 @@ class HealRowWidget(QWidget):
         # Bileşenleri yerleştir
         layout.addWidget(self.active_checkbox)
         layout.addWidget(self.coord_label)
+        layout.addWidget(QLabel("Seçim Tuşu:"))
+        layout.addWidget(self.select_key_input)
+        layout.addWidget(QLabel("Eşik:"))
+        layout.addWidget(self.heal_pct_spin)
         layout.addWidget(self.button)
     
     def on_active_changed(self, state):
@@ -64,6 +90,42 @@ class HealRowWidget(QWidget):
         """
         self.active = (state == Qt.Checked)
         logger.info(f"Satır {self.row_index + 1} {'aktif' if self.active else 'pasif'} olarak ayarlandı")
+        
+        # Ana widget'a değişikliği bildir (gecikmeli kaydetme için)
+        if hasattr(self.parent, 'mark_changed'):
+            self.parent.mark_changed()
+    
+    def on_select_key_changed(self, text):
+        """
+        Parti seçim tuşu değiştiğinde çağrılır.
+        
+        Args:
+            text: Yeni tuş değeri.
+        """
+        self.select_key = text.strip()
+        error = validate_key_input(self.select_key_input, text, allow_empty=True)
+        if error:
+            logger.debug(f"Satır {self.row_index + 1} için geçersiz seçim tuşu: {error}")
+        else:
+            logger.debug(f"Satır {self.row_index + 1} seçim tuşu '{self.select_key}' olarak ayarlandı")
+        
+        # Ana widget'a değişikliği bildir (gecikmeli kaydetme için)
+        if hasattr(self.parent, 'mark_changed'):
+            self.parent.mark_changed()
+    
+    def on_heal_percentage_changed(self, value):
+        """
+        Satıra özel iyileştirme eşiği değiştiğinde çağrılır.
+        
+        Args:
+            value: Yeni eşik (0 ise genel eşik).
+        """
+        self.heal_percentage = value
+        logger.debug(f"Satır {self.row_index + 1} iyileştirme eşiği: {value or 'genel'}")
+        
+        # Ana widget'a değişikliği bildir (gecikmeli kaydetme için)
+        if hasattr(self.parent, 'mark_changed'):
+            self.parent.mark_changed()
     
     def set_coordinates(self, coords):
         """
@@ -72,7 +134,10 @@ class HealRowWidget(QWidget):
         Args:
             coords: Koordinatlar [x1, y1, x2, y2] veya [x, y] (tek bir nokta).
         """
-        if not self.coords:
+        if len(coords) == 4:
+            # Tam koordinatlar (ör. otomatik algılamadan)
+            self.coords = list(coords)
+        elif not self.coords:
             # İlk nokta
             self.coords = [coords[0], coords[1]]
         elif len(self.coords) == 2:
@@ -82,7 +147,14 @@ class HealRowWidget(QWidget):
             # Koordinatlar zaten tam, sıfırla ve ilk noktayı ayarla
             self.coords = [coords[0], coords[1]]
         
-        # Koordinat etiketini güncelle
+        self.update_coord_label()
+        
+        # Ana widget'a değişikliği bildir (gecikmeli kaydetme için)
+        if hasattr(self.parent, 'mark_changed'):
+            self.parent.mark_changed()
+    
+    def update_coord_label(self):
+        """Koordinat etiketini mevcut koordinatlara göre günceller."""
         if len(self.coords) == 4:
             self.coord_label.setText(f"({self.coords[0]},{self.coords[1]})-({self.coords[2]},{self.coords[3]})")
         elif len(self.coords) == 2:
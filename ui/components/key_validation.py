@@ -0,0 +1,35 @@
+"""
+Knight Online Otomatik İyileştirme ve Buff Sistemi - Tuş Girişi Doğrulama
+Bu modül, tuş giriş alanlarını yazım sırasında doğrulayan yardımcı işlevi içerir.
+"""
+
+from services.common.keycodes import parse_key, InvalidKeyError
+
+# Geçersiz tuş girişleri için stil
+INVALID_KEY_STYLE = "border: 1px solid #e74c3c;"
+
+# Tuş kombinasyonları için (ör. "CTRL+SHIFT+F1") izin verilen en büyük uzunluk
+KEY_INPUT_MAX_LENGTH = 20
+
+def validate_key_input(line_edit, text, allow_empty=False):
+    """
+    Tuş giriş alanındaki değeri doğrular ve alanı geçersizse işaretler.
+    
+    Args:
+        line_edit (QLineEdit): Doğrulanan giriş alanı.
+        text (str): Girilen tuş tanımı.
+        allow_empty (bool): Boş değer geçerli sayılsın mı?
+    
+    Returns:
+        str: Geçersizse hata mesajı, geçerliyse None.
+    """
+    error = None
+    if text.strip() or not allow_empty:
+        try:
+            parse_key(text)
+        except InvalidKeyError as e:
+            error = str(e)
+    
+    line_edit.setStyleSheet(INVALID_KEY_STYLE if error else "")
+    line_edit.setToolTip(error or line_edit.property("default_tooltip") or "")
+    return error